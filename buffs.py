@@ -5,6 +5,8 @@ This module holds information about all kinds of buffs that are applied to an en
 - DoTs
 etc
 """
+from collections.abc import MutableMapping, Mapping
+
 from damage import Damage
 from constants import KEY_ARMOR_ATTRIBUTE, KEY_STRENGTH_ATTRIBUTE, KEY_HEALTH_ATTRIBUTE, KEY_MANA_ATTRIBUTE
 from exceptions import InvalidBuffError
@@ -14,6 +16,21 @@ class StatusEffect:
     def __init__(self, name: str, duration: int):
         self.name = name
         self.duration = duration  # measured in turns
+        self._hash = None  # computed on the first hash() call, see _compute_hash
+
+    def __hash__(self):
+        # the hash is built from strings, which is too slow to repeat on every lookup in a LivingThing's buffs.
+        # Like any dictionary key, an effect should not be changed while it is applied to something
+        if self._hash is None:
+            self._hash = self._compute_hash()
+        return self._hash
+
+    def __getstate__(self):
+        # string hashes differ between processes, so a copied or unpickled effect computes its own
+        return dict(self.__dict__, _hash=None)
+
+    def _compute_hash(self) -> int:
+        return hash((self.name, self.duration))
 
     def __str__(self):
         return "Default Status Effect"
@@ -53,7 +70,9 @@ class BeneficialBuff(StatusEffect):
 
         return self.name == other.name and self.buff_amounts == other.buff_amounts and self.duration == other.duration
 
-    def __hash__(self):
+    __hash__ = StatusEffect.__hash__  # defining __eq__ would otherwise unset it
+
+    def _compute_hash(self) -> int:
         return hash(self.name + str(self.buff_amounts) + str(self.duration))
 
     def _manage_buff_types(self, buff_list: [(str, int)]):
@@ -102,8 +121,109 @@ class DoT(StatusEffect):
     def __eq__(self, other):
         return self.name == other.name and self.damage == other.damage and self.duration == other.duration
 
-    def __hash__(self):
+    __hash__ = StatusEffect.__hash__  # defining __eq__ would otherwise unset it
+
+    def _compute_hash(self) -> int:
         return hash(self.name + str(self.damage) + str(self.duration))
 
     def update_caster_level(self, level: int):
         self.level = level
+
+
+class _StatusEffectLane:
+    """
+    The status effects of a single type on an entity, indexed by the turn they expire on.
+    Passing a turn only moves the lane's turn counter forward, so it costs nothing for the effects that do not expire.
+        turn - the count of turns passed in this lane
+        _expiry_turns - Key: status effect, Value: the turn it expires on
+        _expiring_effects - Key: turn, Value: the effects that expire on it, as an ordered set (a dict of None values)
+    """
+    def __init__(self):
+        self.turn = 0
+        self._expiry_turns: {StatusEffect: int} = {}
+        self._expiring_effects: {int: {StatusEffect: None}} = {}
+
+    def __len__(self):
+        return len(self._expiry_turns)
+
+    def __iter__(self):
+        return iter(self._expiry_turns)
+
+    def __contains__(self, effect):
+        return effect in self._expiry_turns
+
+    def get_turns_left(self, effect) -> int:
+        return self._expiry_turns[effect] - self.turn
+
+    def set_turns_left(self, effect, turns_left: int):
+        if effect in self._expiry_turns:
+            self._unindex(effect)
+        expiry_turn = self.turn + turns_left
+        self._expiry_turns[effect] = expiry_turn
+        self._expiring_effects.setdefault(expiry_turn, {})[effect] = None
+
+    def remove(self, effect):
+        self._unindex(effect)
+        del self._expiry_turns[effect]
+
+    def _unindex(self, effect):
+        expiry_turn = self._expiry_turns[effect]
+        expiring_effects = self._expiring_effects[expiry_turn]
+        del expiring_effects[effect]
+        if not expiring_effects:
+            del self._expiring_effects[expiry_turn]
+
+    def pass_turn(self) -> list:
+        """
+        Reduce the turns left of every effect in the lane by one
+        :return: the effects which have no turns left. They stay in the lane until they are removed
+        """
+        self.turn += 1
+        return list(self._expiring_effects.get(self.turn, ()))
+
+
+class StatusEffects(MutableMapping):
+    """
+    The status effects applied to an entity, used as a dictionary Key: status effect, Value: the turns it has left.
+    DoTs and buffs are kept in separate lanes, so that each kind can be updated without looking at the other,
+    and only the effects that expire in a turn are touched when it passes (see _StatusEffectLane).
+    """
+    def __init__(self):
+        self.buffs = _StatusEffectLane()  # BeneficialBuffs and anything else which is not a DoT
+        self.dots = _StatusEffectLane()
+
+    def _get_lane(self, effect) -> _StatusEffectLane:
+        return self.dots if isinstance(effect, DoT) else self.buffs
+
+    def __getitem__(self, effect) -> int:
+        lane = self._get_lane(effect)
+        if effect not in lane:
+            raise KeyError(effect)
+        return lane.get_turns_left(effect)
+
+    def __setitem__(self, effect, turns_left: int):
+        self._get_lane(effect).set_turns_left(effect, turns_left)
+
+    def __delitem__(self, effect):
+        lane = self._get_lane(effect)
+        if effect not in lane:
+            raise KeyError(effect)
+        lane.remove(effect)
+
+    def __contains__(self, effect):
+        return effect in self._get_lane(effect)
+
+    def __iter__(self):
+        yield from self.buffs
+        yield from self.dots
+
+    def __len__(self):
+        return len(self.buffs) + len(self.dots)
+
+    def __eq__(self, other):
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return dict(self.items()) == dict(other.items())
+
+    def __repr__(self):
+        return f'{type(self).__name__}({dict(self.items())})'
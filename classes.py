@@ -1,8 +1,9 @@
-import random
-
+from constants import SEAL_OF_RIGHTEOUSNESS_ATTACKS
 from damage import Damage
 from decorators import cast_spell
 from entities import Character, Monster, CHARACTER_DEFAULT_EQUIPMENT
+from events import (get_event_bus, DamageDealt, SpellDamageDealt, Healed, SpellActivated, SpellFaded, CastFailed,
+                    SpellLearned, SpellRankedUp)
 from heal import HolyHeal
 from models.spells.loader import load_paladin_spells_for_level
 from spells import PaladinSpell
@@ -26,10 +27,12 @@ class Paladin(Character):
 
     def __init__(self, name: str, level: int = 1, health: int = 12, mana: int = 15, strength: int = 4,
                  loaded_scripts: set=set(), killed_monsters: set=set(), completed_quests: set=(),
-                 saved_inventory: dict={"gold": 0}, saved_equipment: dict=CHARACTER_DEFAULT_EQUIPMENT):
+                 saved_inventory: dict={"gold": 0}, saved_equipment: dict=CHARACTER_DEFAULT_EQUIPMENT,
+                 random_service: 'RandomService'=None):
         super().__init__(name=name, level=level, health=health, mana=mana, strength=strength, loaded_scripts=loaded_scripts,
                          killed_monsters=killed_monsters, completed_quests=completed_quests,
-                         saved_inventory=saved_inventory, saved_equipment=saved_equipment)
+                         saved_inventory=saved_inventory, saved_equipment=saved_equipment,
+                         random_service=random_service)
         # TODO: Equip items AFTER level up
         self.min_damage = 1
         self.max_damage = 3
@@ -39,7 +42,7 @@ class Paladin(Character):
         super().end_turn_update()
         if self.SOR_TURNS == 0:  # fade spell
             self.SOR_ACTIVE = False
-            print(f'{self.KEY_SEAL_OF_RIGHTEOUSNESS} has faded from {self.name}')
+            get_event_bus().emit(SpellFaded, self.name, self.KEY_SEAL_OF_RIGHTEOUSNESS)
 
     def leave_combat(self):
         super().leave_combat()
@@ -80,7 +83,7 @@ class Paladin(Character):
                 self.learn_new_spell(spell=available_spell)
 
     def learn_new_spell(self, spell: PaladinSpell):
-        print(f"You have learned a new spell - {spell.name}")
+        get_event_bus().emit(SpellLearned, spell.name)
 
         self.learned_spells[spell.name] = spell
 
@@ -93,8 +96,7 @@ class Paladin(Character):
     def update_spell(self, spell: PaladinSpell):
         spell_name = spell.name
         self.learned_spells[spell_name] = spell
-        print(f'Spell {spell.name} has been updated to rank {spell.rank}!')
-        print("*" * 20)
+        get_event_bus().emit(SpellRankedUp, spell.name, spell.rank)
 
     def spell_handler(self, command: str, target: Monster) -> bool:
         """
@@ -109,7 +111,7 @@ class Paladin(Character):
         elif command == 'ms':
             return self.spell_melting_strike(spell=self.learned_spells[self.KEY_MELTING_STRIKE], target=target)
 
-        print("Unsuccessful cast")
+        get_event_bus().emit(CastFailed, self.name, command)
         return False  # if we do not go into any spell
 
     @cast_spell
@@ -123,8 +125,8 @@ class Paladin(Character):
         self.mana -= mana_cost
 
         self.SOR_ACTIVE = True
-        self.SOR_TURNS = 3
-        print(f'{self.name} activates {self.KEY_SEAL_OF_RIGHTEOUSNESS}!')
+        self.SOR_TURNS = SEAL_OF_RIGHTEOUSNESS_ATTACKS
+        get_event_bus().emit(SpellActivated, self.name, self.KEY_SEAL_OF_RIGHTEOUSNESS)
         return True
 
     def _spell_seal_of_righteousness_attack(self):
@@ -138,16 +140,16 @@ class Paladin(Character):
         :return successful cast or not
         """
         mana_cost = spell.mana_cost
-        heal = HolyHeal(heal_amount=spell.heal1)
+        heal = HolyHeal(heal_amount=spell.heal1, random_service=self.random_service)
 
         self.health += heal
         self.mana -= mana_cost
 
         if self.health > self.max_health:  # check for overheal
             overheal = self._handle_overheal()
-            print(f'{spell.name} healed {self.name} for {heal-overheal:.2f} ({overheal:.2f} Overheal).')
+            get_event_bus().emit(Healed, spell.name, self.name, heal, overheal)
         else:
-            print(f'{spell.name} healed {self.name} for {heal}.')
+            get_event_bus().emit(Healed, spell.name, self.name, heal)
 
         return True
 
@@ -162,7 +164,7 @@ class Paladin(Character):
 
         self.mana -= mana_cost
         # damage the target and add the DoT
-        print(f'{spell.name} damages {target.name} for {damage}!')
+        get_event_bus().emit(SpellDamageDealt, spell.name, target.name, damage)
         target.take_attack(damage, self.level)
         target.add_buff(dot)
 
@@ -175,7 +177,7 @@ class Paladin(Character):
         percentage_mod = (abs(level_difference) * 0.1)  # calculates by how many % we're going to increase/decrease dmg
 
         sor_damage = 0
-        damage_to_deal = random.randint(int(self.min_damage), int(self.max_damage))
+        damage_to_deal = self.random_service.combat.randint(int(self.min_damage), int(self.max_damage))
 
         if self.SOR_ACTIVE:
             sor_damage = self._spell_seal_of_righteousness_attack()
@@ -198,10 +200,8 @@ class Paladin(Character):
         sor_damage: int = attacker_swing[1]  # if the seal isn't active the damage will be 0
 
         auto_attack_print = victim.get_take_attack_damage_repr(auto_attack, self.level)
-        if sor_damage:
-            print(f'{self.name} attacks {victim.name} for {auto_attack_print} from {self.KEY_SEAL_OF_RIGHTEOUSNESS}!')
-        else:
-            print(f'{self.name} attacks {victim.name} for {auto_attack_print}!')
+        get_event_bus().emit(DamageDealt, self.name, victim.name, auto_attack_print,
+                             self.KEY_SEAL_OF_RIGHTEOUSNESS if sor_damage else None)
 
         victim.take_attack(auto_attack, self.level)
 
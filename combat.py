@@ -1,13 +1,15 @@
-from time import sleep
-
+from command_dispatcher import CommandSet, UNKNOWN_COMMAND, CLOSE_CONTEXT
 from command_router import route_in_combat_non_ending_turn_commands
 from commands import pac_looting, get_available_paladin_abilities
 from command_handler import prompt_revive
 from entities import Character, Monster
+from events import (get_event_bus, MonsterSlain, CharacterSlain, GoldLooted, ItemLooted, InvalidCommand,
+                    LootWindowClosed)
+from game_clock import get_game_clock
 from information_printer import print_loot_table
 
 
-def engage_combat(character: Character, monster: Monster, alive_monsters: dict, guid_name_set: set, monster_GUID: int):
+def engage_combat(character: Character, monster: Monster, alive_monsters: dict, monster_GUID: int):
     """
     This is where we handle the turn based combat of the game
     available_spells - set of string commands that enable our character to use the spells he has available.
@@ -18,41 +20,44 @@ def engage_combat(character: Character, monster: Monster, alive_monsters: dict,
     information about the fight) we enter an inner loop handling such commands and
     which continues to take commands until it gets one that does end the turn.
     We handle the command (which is most likely a spell or auto attack) and check if the monster is dead.
+    The events of each half of the turn - before and after the command - reach the terminal in a single write.
     :param character: the player
     :param monster: the monster that the player has attacked
-    Parameters below are used solely to delete the monster from the dict & set once he's dead
-    :param alive_monsters: Dictionary with the alive monsters in the subzone the player is in
-    :param guid_name_set: Set which holds the name of each monster_GUID
+    Parameters below are used solely to delete the monster from the alive monsters once he's dead
+    :param alive_monsters: EntityIndex with the alive monsters in the subzone the player is in
     :param monster_GUID: The monster GUID
     """
     # Load all of the currently available spells for our character
     available_spells: set() = get_available_spells(character)
+    event_bus = get_event_bus()
     will_end_turn = True  # Dictates if we are going to count the iteration of the loop as a turn
 
     character.enter_combat()
     monster.enter_combat()
     if monster.gossip:  # if the monster has gossip
         monster.say_gossip()
-        sleep(2)
+        get_game_clock().sleep(2)
 
     while character.is_in_combat():
-        # We start off the combat with the monster dealing the first blow
-        if not will_end_turn:  # skip attack if the turn has not ended
-            # skip turn based things
-            will_end_turn = True
-        else:
-            monster.start_turn_update()
-            character.start_turn_update()
-
-            if monster.is_alive():
-                monster.attack(character)
-            else:  # monster has died, most probably from a DoT
-                handle_monster_death(character, monster, alive_monsters, guid_name_set, monster_GUID)
-                break
+        with event_bus.batch():
+            # We start off the combat with the monster dealing the first blow
+            if not will_end_turn:  # skip attack if the turn has not ended
+                # skip turn based things
+                will_end_turn = True
+            else:
+                monster.start_turn_update()
+                character.start_turn_update()
+
+                if monster.is_alive():
+                    monster.attack(character)
+
+        if not monster.is_alive():  # monster has died, most probably from a DoT
+            handle_monster_death(character, monster, alive_monsters, monster_GUID)
+            break
 
         if not character.is_alive():
             monster.leave_combat()
-            print(f'{monster.name} has slain character {character.name}')
+            event_bus.emit(CharacterSlain, monster.name, character.name)
 
             prompt_revive(character)
             break
@@ -61,42 +66,78 @@ def engage_combat(character: Character, monster: Monster, alive_monsters: dict,
         # check if the command does not end the turn, if it doesn't the same command gets returned
         command = route_in_combat_non_ending_turn_commands(command, character, monster)
 
-        if command == 'attack':
-            character.attack(monster)
-        elif command in available_spells:
-            # try to execute the spell and return if it managed to or not
-            successful_cast = character.spell_handler(command, monster)
-            if not successful_cast:
-                # skip the next attack, don't count this iteration as a turn and load a command again
-                will_end_turn = False
+        with event_bus.batch():
+            if command == 'attack':
+                character.attack(monster)
+            elif command in available_spells:
+                # try to execute the spell and return if it managed to or not
+                successful_cast = character.spell_handler(command, monster)
+                if not successful_cast:
+                    # skip the next attack, don't count this iteration as a turn and load a command again
+                    will_end_turn = False
 
-        if will_end_turn:
-            monster.end_turn_update()
-            character.end_turn_update()
+            if will_end_turn:
+                monster.end_turn_update()
+                character.end_turn_update()
 
         if not monster.is_alive():
-            handle_monster_death(character, monster, alive_monsters, guid_name_set, monster_GUID)
+            handle_monster_death(character, monster, alive_monsters, monster_GUID)
             break
 
 
-def handle_monster_death(character: Character, monster: Monster, alive_monsters: dict, guid_name_set: set, monster_GUID: int):
+def handle_monster_death(character: Character, monster: Monster, alive_monsters: dict, monster_GUID: int,
+                         to_loot: bool=True):
     """
     This function is called when a monster has just died
     :param character: the player's character
     :param monster_GUID: the unique GUID of the monster
     :param monster: the monster that has died
-    :param alive_monsters:Dictionary with the alive monsters in the subzone the player is in
-    :param guid_name_set: Set which holds the name of each monster_GUID
+    :param alive_monsters: EntityIndex with the alive monsters in the subzone the player is in,
+                           which updates its name index along with it
+    :param to_loot: A boolean indicating if we want to let the player loot the monster
     """
-    print(f'{character.name} has slain {monster.name}!')
+    get_event_bus().emit(MonsterSlain, character.name, monster.name)
 
     character.award_monster_kill(monster=monster, monster_guid=monster_GUID)
     character.leave_combat()  # will exit the combat loop on next iter
 
     del alive_monsters[monster_GUID]  # removes the monster from the dictionary
-    guid_name_set.remove((monster_GUID, monster.name))  # remove it from the set used for looking up
 
-    handle_loot(character, monster)
+    if to_loot:
+        handle_loot(character, monster)
+
+
+def handle_take_all_command(character: Character, monster: Monster):
+    """ takes everything """
+    handle_take_command('gold', character, monster)
+
+    monster_loot = list(monster.loot.keys())  # list of strings, the item's names
+    for item_name in monster_loot:
+        # loop through them and get every one
+        handle_take_command(item_name, character, monster)
+
+
+def handle_take_command(item_name: str, character: Character, monster: Monster):
+    if item_name == "gold":
+        gold = monster.give_loot("gold")
+
+        if gold:  # if it's successful
+            character.award_gold(gold)
+            get_event_bus().emit(GoldLooted, character.name, gold)
+    else:  # if we want to take an item
+        item: 'Item' = monster.give_loot(item_name=item_name)
+
+        if item:  # if the loot is successful
+            character.award_item(item=item)
+            get_event_bus().emit(ItemLooted, character.name, item_name)
+
+
+# the commands in the loot window, every handler is called with the character and the looted monster
+LOOT_COMMANDS = CommandSet('loot')
+LOOT_COMMANDS.register('take all', handle_take_all_command)
+LOOT_COMMANDS.register('take', handle_take_command, takes_argument=True)
+LOOT_COMMANDS.register('?', lambda character, monster: pac_looting())
+LOOT_COMMANDS.register('exit', lambda character, monster: CLOSE_CONTEXT)  # end the looting process
 
 
 def handle_loot(character: Character, monster: Monster):
@@ -104,49 +145,13 @@ def handle_loot(character: Character, monster: Monster):
     print_loot_table(monster.loot)
     while True:
         command = input()
+        result = LOOT_COMMANDS.dispatch(command, character, monster)
 
-        if command == 'take all':
-            # takes everything
-
-            gold = monster.give_loot('gold')
-            if gold:  # if it's successful
-                character.award_gold(gold)
-                print(f'{character.name} has looted {gold} gold.')
-
-            monster_loot = list(monster.loot.keys())  # list of strings, the item's names
-            for item_name in monster_loot:
-                # loop through them and get every one
-                item: 'Item' = monster.give_loot(item_name=item_name)
-
-                if item:  # if the loot is successful
-                    character.award_item(item=item)
-                    print(f'{character.name} has looted {item_name}.')
-
-        elif "take" in command:
-            item_name = command[5:]
-
-            if item_name == "gold":
-                gold = monster.give_loot("gold")
-
-                if gold:  # if it's successful
-                    character.award_gold(gold)
-                    print(f'{character.name} has looted {gold} gold.')
-            else:  # if we want to take an item
-                item = monster.give_loot(item_name=item_name)
-
-                if item:  # if the loot is successful
-                    character.award_item(item=item)
-                    print(f'{character.name} has looted {item_name}.')
-        elif command == "?":
-            pac_looting()
-        elif command == "exit":  # end the looting process
-            print('-' * 40)
-            break
-        else:
-            print("Invalid command.")
+        if result is UNKNOWN_COMMAND:
+            get_event_bus().emit(InvalidCommand, command)
 
-        if not monster.loot:  # if the loot is empty, exit the loot window
-            print('-' * 40)
+        if result == CLOSE_CONTEXT or not monster.loot:  # if the loot is empty, exit the loot window
+            get_event_bus().emit(LootWindowClosed, monster.name)
             break
 
         print_loot_table(monster.loot)  # print the updated table each time we take something
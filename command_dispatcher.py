@@ -0,0 +1,133 @@
+"""
+This module holds the command dispatcher. Every context the player types commands in (out of combat, in combat,
+at a vendor, in the loot window, in the inventory) has a CommandSet, in which each command is registered with its
+verb (ex: 'talk to'), its aliases (ex: 'pam' for 'print alive monsters') and the function handling it.
+
+The verbs are kept in a trie, so finding the command a line starts with takes as long as the verb is,
+no matter how many commands the context has. The longest verb wins, so 'go to ?' and 'go to [Sub Zone]'
+or 'take all' and 'take [Item Name]' do not get mixed up. Whatever follows the verb is the command's argument.
+
+Usage:
+    VENDOR_COMMANDS = CommandSet('vendor')
+    VENDOR_COMMANDS.register('buy', handle_buy, takes_argument=True)  # handle_buy(item_name, character, vendor)
+    VENDOR_COMMANDS.register('info', handle_info, takes_argument=True, argument_first=True)  # '[Item Name] info'
+    VENDOR_COMMANDS.dispatch('buy Wolf Meat', character, vendor)
+"""
+from typing import NamedTuple, Callable
+
+UNKNOWN_COMMAND = object()  # returned by CommandSet.dispatch when the line is not a command of the context
+CLOSE_CONTEXT = 'close'  # returned by the handlers of commands which leave their context, ex: 'exit'
+
+
+class Command(NamedTuple):
+    """
+    A command of a context
+        verb - the words the command is typed with, in lowercase
+        handler - the function handling the command. It is called with the command's argument first (if it takes
+                  one), then with the arguments given to CommandSet.dispatch
+        takes_argument - A boolean indicating if the command is followed by an argument, ex: the name of a monster
+        argument_first - A boolean indicating if the argument comes before the verb, ex: '[Item Name] info'
+    """
+    verb: str
+    handler: Callable
+    takes_argument: bool = False
+    argument_first: bool = False
+
+
+class _TrieNode:
+    __slots__ = ('children', 'command')
+
+    def __init__(self):
+        self.children: {str: '_TrieNode'} = {}
+        self.command: Command = None  # the command whose verb (or alias) ends at this node
+
+
+class CommandSet:
+    """ The commands of a single context, looked up by the verb the typed line starts with """
+    def __init__(self, name: str):
+        self.name = name
+        self.commands: {str: Command} = {}  # Key: verb, Value: the command
+        self._root = _TrieNode()
+        # the commands whose argument comes first, Key: verb or alias (a single word), Value: the command
+        self._suffix_commands: {str: Command} = {}
+
+    def __contains__(self, verb: str) -> bool:
+        return verb in self.commands
+
+    def __len__(self):
+        return len(self.commands)
+
+    def register(self, verb: str, handler: Callable, aliases: [str]=(), takes_argument: bool=False,
+                 argument_first: bool=False) -> Command:
+        """
+        :param verb: the words the command is typed with, matched case insensitively
+        :param aliases: other words the command can be typed with, ex: 'pam' for 'print alive monsters'
+        """
+        command = Command(verb.lower(), handler, takes_argument, argument_first)
+        if command.verb in self.commands:
+            raise Exception(f'{verb} is already a command in the {self.name} context!')
+        self.commands[command.verb] = command
+
+        for words in (command.verb, *(alias.lower() for alias in aliases)):
+            if argument_first:
+                if ' ' in words:
+                    raise Exception(f'A command whose argument comes first must be a single word, not {words}!')
+                self._suffix_commands[words] = command
+                continue
+
+            node = self._root
+            for character in words:
+                node = node.children.setdefault(character, _TrieNode())
+            if node.command is not None:
+                raise Exception(f'{words} is already a command in the {self.name} context!')
+            node.command = command
+
+        return command
+
+    def match(self, line: str) -> (Command, str):
+        """
+        :return: A Tuple(1,2)
+            1 - the command the line is, None if it is not one of this context
+            2 - the argument of the command, an empty string if it has none
+        """
+        line = line.strip()
+        lowered_line = line.lower()
+        if len(lowered_line) != len(line):  # lowering some characters changes their length, match those as typed
+            lowered_line = line
+
+        matched_command, matched_argument = None, ''
+        node = self._root
+        line_length = len(line)
+        for position, character in enumerate(lowered_line):
+            node = node.children.get(character)
+            if node is None:
+                break
+            command = node.command
+            if command is None:
+                continue
+            end = position + 1
+            if end == line_length:
+                matched_command, matched_argument = command, ''
+            elif command.takes_argument and line[end] == ' ':
+                # a longer verb can still match, ex: 'go to ?' after 'go to'
+                matched_command, matched_argument = command, line[end + 1:].lstrip()
+
+        if matched_command is None and self._suffix_commands:
+            argument, separator, last_word = lowered_line.rpartition(' ')
+            matched_command = self._suffix_commands.get(last_word) if separator else None
+            if matched_command is not None:
+                matched_argument = line[:len(argument)].rstrip()
+
+        return matched_command, matched_argument
+
+    def dispatch(self, line: str, *args):
+        """
+        Run the command the line is, passing it its argument (if it takes one) and the given arguments
+        :return: what the command's handler returns, UNKNOWN_COMMAND if the line is not a command of this context
+        """
+        command, argument = self.match(line)
+        if command is None:
+            return UNKNOWN_COMMAND
+        if command.takes_argument:
+            return command.handler(argument, *args)
+        return command.handler(*args)
@@ -8,18 +8,17 @@ from information_printer import (print_live_npcs, print_live_monsters, print_que
                                  print_available_quests, print_in_combat_stats, print_character_xp_bar,
                                  print_character_equipment, print_inventory)
 from constants import ZONE_MOVE_BLOCK_SPECIAL_KEY
-from utils.helper import get_guid_by_name
+from command_dispatcher import CommandSet, UNKNOWN_COMMAND, CLOSE_CONTEXT
 from information_printer import print_quest_log, print_vendor_products_for_sale
 # handlers here!
 
 
-def handle_talk_to_command(command: str, character, zone_object: Zone):
-    alive_npcs, guid_name_set = zone_object.get_cs_npcs()
-
-    target = command[8:]  # name of NPC
+def handle_talk_to_command(target: str, character, zone_object: Zone):
+    """ :param target: the name of the NPC """
+    alive_npcs, _ = zone_object.get_cs_npcs()
 
     # return the guid for the npc we want to target, or None if there is no such one
-    target_guid = get_guid_by_name(target, guid_name_set)
+    target_guid = alive_npcs.get_guid_by_name(target)
 
     # using the guid, target him from the alive_monsters dictionary
     if target_guid in alive_npcs.keys():
@@ -29,35 +28,33 @@ def handle_talk_to_command(command: str, character, zone_object: Zone):
         print(f'Could not find NPC {target}.')
 
 
-def handle_engage_command(command: str, character, zone_object: Zone):
+def handle_engage_command(target: str, character, zone_object: Zone):
     """
     This checks if there is a hostile monster with the name provided in the command.
     If there is, we engage in combat with him by going into the engage_combat function in the
     combat.py module.
-    :param command: the player's command
+    :param target: the name of the monster to engage
     :param character: The player's character, a Character object
     :param zone_object: a Zone object from which we will get the monsters
     :return:
     """
     from combat import engage_combat
 
-    alive_monsters, guid_name_set = zone_object.get_cs_monsters()
-    target = command[7:]  # name of monster to engage
+    alive_monsters, _ = zone_object.get_cs_monsters()
 
-    # return the guid for the monster we want to target, or None if there is no such one
-    target_guid = get_guid_by_name(target, guid_name_set)
+    # return the guid for the lowest level monster we want to target, or None if there is no such one
+    target_guid = alive_monsters.get_guid_by_name(target)
 
     # using the guid, target him from the alive_monsters dictionary
     if target_guid in alive_monsters.keys():
         target = alive_monsters[target_guid]  # convert the string to a Monster object
-        engage_combat(character, target, alive_monsters, guid_name_set, target_guid)
+        engage_combat(character, target, alive_monsters, target_guid)
     else:
         print(f'Could not find creature {target}.')
 
 
-def handle_accept_quest_command(command: str, character, available_quests: dict):
-    quest_to_accept = command[7:]  # name of quest to accept
-
+def handle_accept_quest_command(quest_to_accept: str, character, available_quests: dict):
+    """ :param quest_to_accept: the name of the quest to accept """
     if quest_to_accept in available_quests.keys():
         quest = available_quests[quest_to_accept]
 
@@ -72,15 +69,14 @@ def handle_accept_quest_command(command: str, character, available_quests: dict)
         print("No such quest.")
 
 
-def handle_buy_from_command(command: str, character, zone_object: Zone):
+def handle_buy_from_command(target: str, character, zone_object: Zone):
     """ check to see if there is such a vendor, if it is, go to the handle_vendor_sale function
-        which initiates the while loop for browsing the vendor's inventory                      """
-    target = command[9:]  # name of Vendor
-
-    alive_npcs, guid_name_set = zone_object.get_cs_npcs()
+        which initiates the while loop for browsing the vendor's inventory
+        :param target: the name of the vendor """
+    alive_npcs, _ = zone_object.get_cs_npcs()
 
     # return the guid for the npc we want to target, or None if there is no such one
-    target_guid = get_guid_by_name(target, guid_name_set)
+    target_guid = alive_npcs.get_guid_by_name(target)
 
     # using the guid, target him from the alive_monsters dictionary
     if target_guid in alive_npcs.keys():
@@ -90,92 +86,110 @@ def handle_buy_from_command(command: str, character, zone_object: Zone):
         print(f'Could not find Vendor {target}')
 
 
+def handle_vendor_buy_command(item: str, character, vendor):
+    """ :param item: the name of the item to buy """
+    if not vendor.has_item(item):
+        print(f'{vendor.name} does not have {item} in stock.')
+        return
+
+    # check if the player has enough gold
+    if not character.has_enough_gold(vendor.get_item_price(item)):
+        print(f'You do not have enough gold to buy {item}!\n')
+        return
+
+    character.buy_item(vendor.sell_item(item))
+    print(f'{character.name} has bought {item} from {vendor.name}!')
+
+
+def handle_vendor_sell_command(item: str, character, vendor):
+    """ :param item: the name of the item to sell """
+    if character.has_item(item):
+        character.sell_item(item)
+    else:
+        print(f'You do not have {item} in your inventory!')
+        print()
+
+
+def handle_vendor_info_command(item_name: str, character, vendor):
+    """ this function handles the '[Item Name] info' command, printing the item's stats """
+    item = vendor.get_item_info(item_name)
+
+    print("\t", item, "\n") if item else None
+
+
+# the commands at a vendor, every handler is called with the character and the vendor
+VENDOR_COMMANDS = CommandSet('vendor')
+VENDOR_COMMANDS.register('buy', handle_vendor_buy_command, takes_argument=True)
+VENDOR_COMMANDS.register('sell', handle_vendor_sell_command, takes_argument=True)
+VENDOR_COMMANDS.register('info', handle_vendor_info_command, takes_argument=True, argument_first=True)
+VENDOR_COMMANDS.register('?', lambda character, vendor: pac_vendor_dialogue())
+VENDOR_COMMANDS.register('exit', lambda character, vendor: CLOSE_CONTEXT)
+
+
 def handle_vendor_sale(character, vendor):
     while True:
         print_vendor_products_for_sale(vendor_name=vendor.name, vendor_inventory=vendor.inventory)
 
-        command = input()
-        if command == 'exit':
+        if VENDOR_COMMANDS.dispatch(input(), character, vendor) == CLOSE_CONTEXT:
             break
-        elif 'buy ' in command:
-            item = command[4:]  # name of the item
-            if not vendor.has_item(item):
-                print(f'{vendor.name} does not have {item} in stock.')
-                continue
-
-            # check if the player has enough gold
-            if not character.has_enough_gold(vendor.get_item_price(item)):
-                print(f'You do not have enough gold to buy {item}!\n')
-                continue
-
-            character.buy_item(vendor.sell_item(item))
-            print(f'{character.name} has bought {item} from {vendor.name}!')
-        elif 'sell ' in command:
-            item = command[5:]  # name of the item
-            if character.has_item(item):
-                character.sell_item(item)
-            else:
-                print(f'You do not have {item} in your inventory!')
-                print()
-        elif 'info' in command:
-            item_name = command[:-5]  # name of item
-
-            item = vendor.get_item_info(item_name)
-
-            print("\t", item, "\n") if item else None
-        elif command == '?':
-            pac_vendor_dialogue()
 
 
-def handle_open_inventory_command(character):
-    """
-    This command opens the inventory of the character and lets him fiddle with the items there
-    """
-    print_inventory(character)
+def handle_inventory_equip_command(item_name: str, character):
+    """ Equips the item """
+    # failsafe check if the item is in the inventory of the player. if it's not it will return a None object,
+    # which will not pass the if checks in the equip_item method
+    item = character.inventory.get_item(item_name)
+
+    character.equip_item(item)
+    print_inventory_change(character, item, item_name)
 
-    while True:
-        command = input(">inventory ")
-        to_print = True
-
-        if command == "?":
-            pac_opened_inventory()
-            to_print = False
-        elif command == "exit":
-            print("-" * 40)
-            break
-        elif "equip" in command:
-            """ Equips the item """
-            item_name = command[6:]
 
-            # failsafe check if the item is in the inventory of the player. if it's not it will return a None object,
-            # which will not pass the if checks in the equip_item method
-            item, _ = character.inventory.get(item_name, (None, None))
+def handle_inventory_use_command(item_name: str, character):
+    """ Consumes a consumable item"""
+    # failsafe check if the item is in the inventory of the player. if it's not it will return a None object,
+    # which will not pass the if checks in the consume_item method
+    item = character.inventory.get_item(item_name)
 
-            character.equip_item(item)
-        elif "use" in command:
-            """ Consumes a consumable item"""
-            item_name = command[4:]
+    character.consume_item(item)
+    print_inventory_change(character, item, item_name)
+
+
+def print_inventory_change(character, item, item_name: str):
+    """ Prints the outcome of trying to modify the inventory """
+    if item:
+        # we've modified the inventory (consumed/equipped an item)
+        print_inventory(character)
+    else:
+        # we've tried to modify the inventory but unsuccessfuly, therefore item is None
+        print(f'{item_name} is not in your inventory.')
 
-            # failsafe check if the item is in the inventory of the player. if it's not it will return a None object,
-            # which will not pass the if checks in the consume_item method
-            item, _ = character.inventory.get(item_name, (None, None))
 
-            character.consume_item(item)
+def handle_inventory_exit_command(character):
+    print("-" * 40)
+    return CLOSE_CONTEXT
 
-        if to_print:  # we've tried to modify the inventory in some way
-            """ item and item_name are assigned if we manage to pass this if check """
-            if item:
-                # we've modified the inventory (consumed/equipped an item)
-                print_inventory(character)
-            else:
-                # we've tried to modify the inventory but unsuccessfuly, therefore item is None
-                print(f'{item_name} is not in your inventory.')
 
+# the commands in an opened inventory, every handler is called with the character
+INVENTORY_COMMANDS = CommandSet('inventory')
+INVENTORY_COMMANDS.register('?', lambda character: pac_opened_inventory())
+INVENTORY_COMMANDS.register('exit', handle_inventory_exit_command)
+INVENTORY_COMMANDS.register('equip', handle_inventory_equip_command, takes_argument=True)
+INVENTORY_COMMANDS.register('use', handle_inventory_use_command, takes_argument=True)
 
-def handle_go_to_command(command: str, character, zone_object: Zone):
-    destination = command[6:]
 
+def handle_open_inventory_command(character):
+    """
+    This command opens the inventory of the character and lets him fiddle with the items there
     """
+    print_inventory(character)
+
+    while INVENTORY_COMMANDS.dispatch(input(">inventory "), character) != CLOSE_CONTEXT:
+        pass
+
+
+def handle_go_to_command(destination: str, character, zone_object: Zone):
+    """
+    :param destination: the name of the subzone to move to
     move_player will usually return a boolean if we can initiate the move or not.
     However, there's a special case: If it returns SPECIAL_ZONE_BLOCK_KEY,
     it means that we cannot initiate the move and that the printing is handled by the method itself.
@@ -199,6 +213,26 @@ def handle_go_to_command(command: str, character, zone_object: Zone):
         print(f'No such destination as {destination} that is connected to your current subzone.')
 
 
+def handle_quest_item_choice_help_command(item_rewards: dict):
+    print("Available commands:")
+    print("\tchoose [Item Name]")
+    print("\t\tTakes the item\n")
+
+
+def handle_choose_command(item_name: str, item_rewards: dict):
+    """ Takes the item the player chooses """
+    if item_name in item_rewards.keys():
+        return item_rewards[item_name]
+    else:
+        print("No such item as ", item_name)
+
+
+# the commands in the quest reward window, every handler is called with the item rewards
+QUEST_ITEM_CHOICE_COMMANDS = CommandSet('quest item choice')
+QUEST_ITEM_CHOICE_COMMANDS.register('choose', handle_choose_command, takes_argument=True)
+QUEST_ITEM_CHOICE_COMMANDS.register('?', handle_quest_item_choice_help_command)
+
+
 def handle_quest_item_choice(item_rewards: dict):
     """
     This function opens a window where the player selects which item he wants to take from the quest
@@ -208,20 +242,9 @@ def handle_quest_item_choice(item_rewards: dict):
     print_quest_item_choices(item_rewards)
 
     while True:
-        command = input()
-
-        if "choose" in command:
-            """ Takes the item the player chooses """
-            item_name = command[7:]
-
-            if item_name in item_rewards.keys():
-                return item_rewards[item_name]
-            else:
-                print("No such item as ", item_name)
-        elif command == "?":
-            print("Available commands:")
-            print("\tchoose [Item Name]")
-            print("\t\tTakes the item\n")
+        item = QUEST_ITEM_CHOICE_COMMANDS.dispatch(input(), item_rewards)
+        if item is not None and item is not UNKNOWN_COMMAND:
+            return item
 
 
 def prompt_revive(character):
@@ -1,8 +1,45 @@
 """
 This module will read the user's commands and route them to the appropriate handler for the given command in
-command_handler.py
+command_handler.py, through the CommandSet of the context the player is in
 """
 import command_handler as ch
+from command_dispatcher import CommandSet, UNKNOWN_COMMAND
+
+# the commands out of combat, every handler is called with the player's character and the zone he is in
+MAIN_COMMANDS = CommandSet('out of combat')
+MAIN_COMMANDS.register('?', lambda character, zone_object: ch.handle_help_command())
+MAIN_COMMANDS.register('save', lambda character, zone_object: ch.handle_save_character_command(character))
+MAIN_COMMANDS.register('go to ?', lambda character, zone_object: ch.handle_go_to_help_command(zone_object))
+MAIN_COMMANDS.register('print available quests', lambda character, zone_object:
+                       ch.handle_paq_command(zone_object, character), aliases=['paq'])
+MAIN_COMMANDS.register('print quest log', lambda character, zone_object: ch.handle_pql_command(character),
+                       aliases=['pql'])
+MAIN_COMMANDS.register('print equipment', lambda character, zone_object: ch.handle_print_equipment_command(character),
+                       aliases=['peq'])
+MAIN_COMMANDS.register('print inventory', lambda character, zone_object:
+                       ch.handle_print_inventory_command(character))
+MAIN_COMMANDS.register('open inventory', lambda character, zone_object: ch.handle_open_inventory_command(character))
+MAIN_COMMANDS.register('talk to', ch.handle_talk_to_command, takes_argument=True)
+MAIN_COMMANDS.register('buy from', ch.handle_buy_from_command, takes_argument=True)
+MAIN_COMMANDS.register('engage', ch.handle_engage_command, takes_argument=True)
+MAIN_COMMANDS.register('accept', lambda quest_name, character, zone_object:
+                       ch.handle_accept_quest_command(quest_name, character, zone_object.get_cs_quests()),
+                       takes_argument=True)
+MAIN_COMMANDS.register('go to', ch.handle_go_to_command, takes_argument=True)
+MAIN_COMMANDS.register('print alive monsters', lambda character, zone_object: ch.handle_pam_command(zone_object),
+                       aliases=['pam'])
+MAIN_COMMANDS.register('print alive npcs', lambda character, zone_object: ch.handle_pan_command(zone_object),
+                       aliases=['pan'])
+MAIN_COMMANDS.register('print all alive monsters', lambda character, zone_object:
+                       ch.handle_pam_command(zone_object, print_all=True))
+MAIN_COMMANDS.register('print all alive npcs', lambda character, zone_object:
+                       ch.handle_pan_command(zone_object, print_all=True))
+
+# the commands in combat which do not end the turn, every handler is called with the character and the monster
+IN_COMBAT_COMMANDS = CommandSet('in combat')
+IN_COMBAT_COMMANDS.register('?', lambda character, monster: ch.handle_combat_help_command(character))
+IN_COMBAT_COMMANDS.register('print stats', ch.handle_combat_print_stats_command)
+IN_COMBAT_COMMANDS.register('print xp', lambda character, monster: ch.handle_combat_print_xp_command(character))
 
 
 def route_main_commands(main_character, zone_object):
@@ -11,41 +48,7 @@ def route_main_commands(main_character, zone_object):
     :param main_character: A Character class object. This is basically the player
     :param zone_object: A class object of Zone
     """
-    command = input()
-    if command is '?':
-        ch.handle_help_command()
-    elif command == 'save':
-        ch.handle_save_character_command(main_character)
-    elif command == 'go to ?':
-        ch.handle_go_to_help_command(zone_object)
-    elif command == 'print available quests' or command == 'paq':
-        ch.handle_paq_command(zone_object, main_character)
-    elif command == 'print quest log' or command == 'pql':
-        ch.handle_pql_command(main_character)
-    elif command == 'print equipment' or command == 'peq':
-        ch.handle_print_equipment_command(main_character)
-    elif command == 'print inventory':
-        ch.handle_print_inventory_command(main_character)
-    elif command == "open inventory":
-        ch.handle_open_inventory_command(main_character)
-    elif 'talk to' in command:
-        ch.handle_talk_to_command(command, main_character, zone_object)
-    elif 'buy from' in command:
-        ch.handle_buy_from_command(command, main_character, zone_object)
-    elif 'engage' in command:
-        ch.handle_engage_command(command, main_character, zone_object)
-    elif 'accept' in command:  # accept the quest
-        ch.handle_accept_quest_command(command, main_character, available_quests=zone_object.get_cs_quests())
-    elif 'go to' in command:
-        ch.handle_go_to_command(command, main_character, zone_object)
-    elif command == 'print alive monsters' or command == 'pam':
-        ch.handle_pam_command(zone_object)
-    elif command == 'print alive npcs' or command == 'pan':
-        ch.handle_pan_command(zone_object)
-    elif command == 'print all alive monsters':
-        ch.handle_pam_command(zone_object, print_all=True)
-    elif command == 'print all alive npcs':
-        ch.handle_pan_command(zone_object, print_all=True)
+    MAIN_COMMANDS.dispatch(input(), main_character, zone_object)
 
 
 # IN COMBAT COMMANDS
@@ -62,14 +65,8 @@ def route_in_combat_non_ending_turn_commands(command: str, character, monster) -
     :param monster: Monster object
     :return:
     """
-    while True:  # for commands that do not end the turn, like printing the stats or the possible commands
-        if command == '?':
-            ch.handle_combat_help_command(character)  # print available commands
-        elif command == 'print stats':
-            ch.handle_combat_print_stats_command(character, monster)
-        elif command == 'print xp':
-            ch.handle_combat_print_xp_command(character)
-        else:
-            return command
-
+    # for commands that do not end the turn, like printing the stats or the possible commands
+    while IN_COMBAT_COMMANDS.dispatch(command, character, monster) is not UNKNOWN_COMMAND:
         command = input()
+
+    return command
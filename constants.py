@@ -1,6 +1,7 @@
 """ This file holds constant variables """
 from models.creatures.creature_defaults.loader import load_creature_defaults
 from models.misc.loader import load_character_level_stats, load_character_xp_requirements
+from utils.helper import LazyMapping
 
 
 ZONE_MOVE_BLOCK_SPECIAL_KEY = '$'
@@ -8,6 +9,7 @@ GARRICK_PADFOOT_GUID = 14
 
 HOLY_HEAL_DOUBLE_HEAL_CHANCE = 30
 PROTECTIVE_HEAL_ABSORB_PERCENTAGE = 30
+SEAL_OF_RIGHTEOUSNESS_ATTACKS = 3  # how many attacks Seal of Righteousness adds its damage to
 KEY_ARMOR_ATTRIBUTE = "armor"
 KEY_STRENGTH_ATTRIBUTE = "strength"
 KEY_HEALTH_ATTRIBUTE = "health"
@@ -15,20 +17,42 @@ KEY_MANA_ATTRIBUTE = "mana"
 KEY_AGILITY_ATTRIBUTE = 'agility'
 KEY_BONUS_HEALTH_ATTRIBUTE = 'bonus_health'
 KEY_BONUS_MANA_ATTRIBUTE = 'bonus_mana'
+KEY_WEAPON_DAMAGE = 'weapon_damage'  # the damage of the equipped weapon, from which the character's damage is derived
+
+# the stats of a character which are derived from its attributes, see Character._update_derived_stats
+KEY_DERIVED_MAX_HEALTH, KEY_DERIVED_MAX_MANA = 'max_health', 'max_mana'
+KEY_DERIVED_AGILITY_BONUS, KEY_DERIVED_DAMAGE = 'agility_bonus', 'damage'  # agility gives strength and armor
+CHARACTER_DERIVED_STATS = (KEY_DERIVED_MAX_HEALTH, KEY_DERIVED_MAX_MANA, KEY_DERIVED_AGILITY_BONUS, KEY_DERIVED_DAMAGE)
+# Key: an input of the derived stats, Value: the derived stats which have to be recalculated when it changes
+CHARACTER_DERIVED_STAT_INPUTS = {KEY_BONUS_HEALTH_ATTRIBUTE: (KEY_DERIVED_MAX_HEALTH,),
+                                 KEY_BONUS_MANA_ATTRIBUTE: (KEY_DERIVED_MAX_MANA,),
+                                 KEY_AGILITY_ATTRIBUTE: (KEY_DERIVED_AGILITY_BONUS, KEY_DERIVED_DAMAGE),
+                                 KEY_STRENGTH_ATTRIBUTE: (KEY_DERIVED_DAMAGE,),
+                                 KEY_WEAPON_DAMAGE: (KEY_DERIVED_DAMAGE,)}
 
 KEY_LEVEL_STATS_HEALTH = 'health'
 KEY_LEVEL_STATS_MANA = 'mana'
 
 MAXIMUM_LEVEL_DIFFERENCE_XP_YIELD = 5  # a monster that is 5 levels lower than the character yields no XP
+SUBZONE_PREFETCH_DEPTH = 1  # how many moves away from the current subzone we load subzones in the background
+SUBZONE_PREFETCH_WORKERS = 1  # the count of threads which load subzones in the background
+ITEM_REGISTRY_MAX_SIZE = 512  # the maximum count of item prototypes kept in memory, see models/items/registry.py
+SAVE_DELETE_CHUNK_SIZE = 500  # the maximum count of values in one DELETE ... IN statement when saving a character
+JOURNAL_SYNC_EVERY_EVENTS = 16  # how many progress events are written before the journal is fsync-ed
+JOURNAL_COMPACT_EVERY_EVENTS = 256  # how many progress events are written before the journal is folded into the DB
+SIMULATION_MAX_FIGHT_TURNS = 200  # a headless fight that takes longer than this is stopped and counted as a draw
+SIMULATION_SWEEP_POINTS_PER_SHARD = 4  # how many grid points of a balance sweep a worker process runs per task
+RNG_BLOCK_SIZE = 1024  # how many random numbers a stream of the RandomService draws at once, see rng.py
+INVENTORY_STACK_SIZE = 20  # how many of the same item fit in a single inventory slot, see inventory.py
 
 CHAR_STARTER_ZONE, CHAR_STARTER_SUBZONE = "Northshire Abbey", "Northshire Valley"
 CHAR_ATTRIBUTES_TEMPLATE = {KEY_STRENGTH_ATTRIBUTE: 0, KEY_ARMOR_ATTRIBUTE: 0,
                             KEY_AGILITY_ATTRIBUTE: 0, KEY_BONUS_HEALTH_ATTRIBUTE: 0,
                             KEY_BONUS_MANA_ATTRIBUTE: 0}
-# these functions run only once due to a decorator
-CREATURE_DEFAULT_VALUES = load_creature_defaults()
-CHARACTER_LEVELUP_BONUS_STATS = load_character_level_stats()
-CHARACTER_LEVEL_XP_REQUIREMENTS = load_character_xp_requirements()
+# these tables are loaded on their first access, so that importing this module does not touch the DB
+CREATURE_DEFAULT_VALUES = LazyMapping(load_creature_defaults)
+CHARACTER_LEVELUP_BONUS_STATS = LazyMapping(load_character_level_stats)
+CHARACTER_LEVEL_XP_REQUIREMENTS = LazyMapping(load_character_xp_requirements)
 
 CHARACTER_EQUIPMENT_HEADPIECE_KEY = 'headpiece'
 CHARACTER_EQUIPMENT_SHOULDERPAD_KEY = 'shoulderpad'
@@ -3,13 +3,38 @@ This module will hold the damage class in the game.
 """
 
 
+def _round_damage(value: float) -> float:
+    """ Round the damage to 1 point after the decimal. Integers and zero are already rounded, so round() is skipped """
+    if type(value) is int or not value:
+        return value
+    return round(value, 1)
+
+
 class Damage:
     """ This class holds the damage of every character/monster in the game"""
+    __slots__ = ('phys_dmg', 'magic_dmg', 'phys_absorbed', 'magic_absorbed')
+
     def __init__(self, phys_dmg: float=0, magic_dmg: float=0):
-        self.phys_dmg = round(phys_dmg, 1)
-        self.magic_dmg = round(magic_dmg, 1)
+        self.phys_dmg = _round_damage(phys_dmg)
+        self.magic_dmg = _round_damage(magic_dmg)
         self.phys_absorbed, self.magic_absorbed = 0, 0
 
+    @classmethod
+    def batch(cls, phys_dmgs: [float], magic_dmgs: [float]=None) -> ['Damage']:
+        """
+        Create a Damage for every pair of physical and magical damage
+        :param magic_dmgs: the magical damages, none by default
+        """
+        if magic_dmgs is None:
+            return [cls(phys_dmg) for phys_dmg in phys_dmgs]
+        return [cls(phys_dmg, magic_dmg) for phys_dmg, magic_dmg in zip(phys_dmgs, magic_dmgs)]
+
+    def copy(self) -> 'Damage':
+        """ :return: a Damage which can be changed, holding the same damage and absorption as this one """
+        damage = Damage(self.phys_dmg, self.magic_dmg)
+        damage.phys_absorbed, damage.magic_absorbed = self.phys_absorbed, self.magic_absorbed
+        return damage
+
     def __eq__(self, other):
         return self.phys_dmg == other.phys_dmg and self.magic_dmg == other.magic_dmg \
                 and self.phys_absorbed == other.phys_absorbed and self.magic_absorbed == other.magic_absorbed
@@ -50,37 +75,35 @@ class Damage:
         return other - (self.phys_dmg + self.magic_dmg)
 
     def __isub__(self, other: tuple or Damage):
-        other_phys, other_magic = 0, 0
-
         # unpack other damage
         if isinstance(other, tuple):
             other_phys, other_magic = other
         elif isinstance(other, Damage):
-            other_phys = other.phys_dmg
-            other_magic = other.magic_dmg
+            other_phys, other_magic = other.phys_dmg, other.magic_dmg
+        else:
+            other_phys, other_magic = 0, 0
 
         # does not let the numbers get negative
-        modified_phys_damage = max(self.phys_dmg - other_phys, 0)
-        modified_magic_damage = max(self.magic_dmg - other_magic, 0)
+        modified_phys_damage = self.phys_dmg - other_phys
+        modified_magic_damage = self.magic_dmg - other_magic
 
-        return Damage(phys_dmg=modified_phys_damage,
-                      magic_dmg=modified_magic_damage)
+        # positional arguments, as keyword ones make the call noticeably slower
+        return Damage(modified_phys_damage if modified_phys_damage >= 0 else 0,
+                      modified_magic_damage if modified_magic_damage >= 0 else 0)
 
     def __iadd__(self, other: tuple):
-        other_phys, other_magic = 0, 0
         # unpack other damage
         if isinstance(other, tuple):
             other_phys, other_magic = other
         elif isinstance(other, Damage):
-            other_phys = other.phys_dmg
-            other_magic = other.magic_dmg
+            other_phys, other_magic = other.phys_dmg, other.magic_dmg
+        else:
+            other_phys, other_magic = 0, 0
 
-        return Damage(phys_dmg=self.phys_dmg + other_phys,
-                      magic_dmg=self.magic_dmg + other_magic)
+        return Damage(self.phys_dmg + other_phys, self.magic_dmg + other_magic)
 
     def __mul__(self, other: float):
-        return Damage(phys_dmg=(other * self.phys_dmg),
-                      magic_dmg=(other * self.magic_dmg))
+        return Damage(other * self.phys_dmg, other * self.magic_dmg)
 
     def handle_absorption(self, absorption_shield: float):
         """
@@ -108,3 +131,37 @@ class Damage:
             absorption_shield = 0
 
         return absorption_shield
+
+
+class FrozenDamage(Damage):
+    """
+    A Damage which cannot be changed once created, so that a single one can be shared safely
+    (ex: the damage of every tick of a DoT).
+    Arithmetic on it gives back a regular Damage, while absorbing it has to be done on a copy().
+    """
+    __slots__ = ()
+
+    def __init__(self, phys_dmg: float=0, magic_dmg: float=0):
+        object.__setattr__(self, 'phys_dmg', _round_damage(phys_dmg))
+        object.__setattr__(self, 'magic_dmg', _round_damage(magic_dmg))
+        object.__setattr__(self, 'phys_absorbed', 0)
+        object.__setattr__(self, 'magic_absorbed', 0)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f'{type(self).__name__} cannot be changed, use copy() to get a Damage which can!')
+
+    def __hash__(self):
+        return hash((self.phys_dmg, self.magic_dmg))
+
+    def __reduce__(self):
+        # pickle would otherwise restore the slots through __setattr__, which always raises
+        return FrozenDamage, (self.phys_dmg, self.magic_dmg)
+
+    def __copy__(self):
+        return self  # it cannot be changed, so it can be shared like a tuple
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def handle_absorption(self, absorption_shield: float):
+        raise AttributeError(f'{type(self).__name__} cannot absorb damage, use copy() to get a Damage which can!')
@@ -11,3 +11,19 @@ DB_SC_LOADED_SCRIPTS_TABLE_NAME = 'saved_character_loaded_scripts'
 DB_SC_KILLED_MONSTERS_TABLE_NAME = 'saved_character_killed_monsters'
 DB_SC_INVENTORY_TABLE_NAME = 'saved_character_inventory'
 DB_SC_COMPLETED_QUESTS_TABLE_NAME = 'saved_character_completed_quests'
+DB_SC_TABLE_NAME_PREFIX = 'saved_character'  # every table holding player progress starts with this
+
+# The PRAGMAs every connection of the writable game engine runs, see database/engine.py
+DB_PRAGMAS = {
+    'journal_mode': 'WAL',  # readers do not block the writer and vice versa
+    'synchronous': 'NORMAL',  # with WAL, a commit is durable after the next checkpoint instead of on every commit
+    'cache_size': -16000,  # negative means KiB, ~16MB of page cache per connection
+    'mmap_size': 64 * 1024 * 1024,  # read the database through a 64MB memory map instead of read() calls
+    'temp_store': 'MEMORY',
+}
+# The PRAGMAs every connection to the read-only content tables runs. The journal mode can not be changed read-only
+DB_TEMPLATE_PRAGMAS = {key: value for key, value in DB_PRAGMAS.items() if key not in ('journal_mode', 'synchronous')}
+# Open the read-only connection with immutable=1, which skips all file locking and change detection.
+# This is only safe if nothing writes to the database file while the game runs, which is not the case while
+# saved characters live in the same file as the content tables. Turn it on for a content-only database.
+DB_TEMPLATES_IMMUTABLE = False
@@ -0,0 +1,84 @@
+"""
+This module creates the SQLAlchemy engines the game uses and the session class which routes every query to one of them:
+    - the game engine, a writable connection which runs DB_PRAGMAS (WAL mode and the like) on connect.
+      Every saved_character* table is read and written through it
+    - the template engine, a read-only (optionally immutable) URI connection to the same file,
+      through which every static content table (creatures, items, quests, spells...) is read
+This way, loading content never shares a connection or a transaction with saving a character.
+"""
+import os
+import sqlite3
+
+import sqlalchemy
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from database.database_info import (DB_PRAGMAS, DB_TEMPLATE_PRAGMAS, DB_TEMPLATES_IMMUTABLE,
+                                    DB_SC_TABLE_NAME_PREFIX)
+
+_template_engines = {}  # Key: the path to the database, Value: the read-only engine to it
+
+
+def create_game_engine(db_path: str, pragmas: dict=DB_PRAGMAS):
+    """ Create the writable engine, which runs the given PRAGMAs on every new connection """
+    engine = sqlalchemy.create_engine(f'sqlite:////{db_path}', connect_args={'check_same_thread': False})
+    _run_pragmas_on_connect(engine, pragmas)
+
+    return engine
+
+
+def create_template_engine(db_path: str, pragmas: dict=DB_TEMPLATE_PRAGMAS, immutable: bool=DB_TEMPLATES_IMMUTABLE):
+    """ Create a read-only engine through an URI connection, which runs the given PRAGMAs on every new connection """
+    uri = f'file:{db_path}?mode=ro'
+    if immutable:
+        uri += '&immutable=1'
+
+    def connect():
+        return sqlite3.connect(uri, uri=True, check_same_thread=False)
+
+    # like every file database, do not pool the connections so that a replaced database file (ex: tests) is picked up
+    engine = sqlalchemy.create_engine('sqlite://', creator=connect, poolclass=NullPool)
+    _run_pragmas_on_connect(engine, pragmas)
+
+    return engine
+
+
+def get_template_engine(game_engine):
+    """ Returns the read-only engine to the same database file the given game engine is connected to """
+    db_path = os.path.realpath(game_engine.url.database)
+    if db_path not in _template_engines:
+        _template_engines[db_path] = create_template_engine(db_path)
+
+    return _template_engines[db_path]
+
+
+def _run_pragmas_on_connect(engine, pragmas: dict):
+    @event.listens_for(engine, 'connect')
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma, value in pragmas.items():
+            cursor.execute(f'PRAGMA {pragma}={value}')
+        cursor.close()
+
+
+def is_saved_character_table(table) -> bool:
+    return table is not None and getattr(table, 'name', '').startswith(DB_SC_TABLE_NAME_PREFIX)
+
+
+class RoutingSession(Session):
+    """
+    A session which queries the saved_character* tables through the game engine and every other table through
+    its read-only template engine. A session created with an explicit bind uses only that engine.
+    The engine is always read from database.main, so that it can be swapped at runtime (ex: tests).
+    """
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.bind is not None:
+            return self.bind
+        import database.main
+
+        table = mapper.local_table if mapper is not None else getattr(clause, 'table', None)
+        if is_saved_character_table(table):
+            return database.main.engine
+
+        return get_template_engine(database.main.engine)
@@ -1,10 +1,12 @@
-import sqlalchemy
 from sqlalchemy.ext.declarative import declarative_base
-from database.database_info import DB_PATH
+from sqlalchemy.orm import sessionmaker, scoped_session
 
-from sqlalchemy.orm import sessionmaker
+from database.database_info import DB_PATH
+from database.engine import create_game_engine, RoutingSession
 
-engine = sqlalchemy.create_engine(f'sqlite:////{DB_PATH}')
-Session = sessionmaker(bind=engine)
-session = Session()
+engine = create_game_engine(DB_PATH)
+# creates a new session, which reads the content tables and writes the saved_character* tables through separate engines
+Session = sessionmaker(class_=RoutingSession)
+# the game's session - a thread-local one, so that every thread gets its own connection
+session = scoped_session(Session)
 Base = declarative_base()
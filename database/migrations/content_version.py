@@ -0,0 +1,41 @@
+"""
+Adds the content_version table to the database, along with triggers which set a new random version whenever a row
+of a table the world snapshot is built from (see database/snapshot.py) is inserted, updated or deleted.
+With it, checking if the snapshot is up to date reads a single row instead of hashing the tables.
+
+    content_version
+    version
+    4817261739812763
+
+Usage:
+    python -m database.migrations.content_version [path to the database, the game's database by default]
+"""
+import sqlite3
+import sys
+
+from database.database_info import DB_PATH
+from database.snapshot import SNAPSHOT_TABLES, CONTENT_VERSION_TABLE, CONTENT_TRIGGER_EVENTS, get_content_trigger_name
+
+
+def migrate(connection: sqlite3.Connection):
+    """ Create the content version table and its triggers, unless they already exist """
+    with connection:
+        connection.execute(f'CREATE TABLE IF NOT EXISTS {CONTENT_VERSION_TABLE} (version INTEGER NOT NULL)')
+        if connection.execute(f'SELECT COUNT(*) FROM {CONTENT_VERSION_TABLE}').fetchone()[0] == 0:
+            connection.execute(f'INSERT INTO {CONTENT_VERSION_TABLE} (version) VALUES (abs(random()))')
+
+        for table_name in SNAPSHOT_TABLES:
+            for event in CONTENT_TRIGGER_EVENTS:
+                connection.execute(f'CREATE TRIGGER IF NOT EXISTS {get_content_trigger_name(table_name, event)} '
+                                   f'AFTER {event} ON {table_name} '
+                                   f'BEGIN UPDATE {CONTENT_VERSION_TABLE} SET version = abs(random()); END')
+
+
+if __name__ == '__main__':
+    db_path = sys.argv[1] if len(sys.argv) > 1 else DB_PATH
+    db_connection = sqlite3.connect(db_path)
+    try:
+        migrate(db_connection)
+    finally:
+        db_connection.close()
+    print(f'Added the content version to {db_path}')
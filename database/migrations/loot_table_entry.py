@@ -0,0 +1,83 @@
+"""
+Migrates the loot_table table from its wide format, which held 20 itemX_ID/itemX_chance column pairs,
+to the normalized loot_table_entry table, which holds one row per item in a loot table.
+
+    loot_table (before)
+    entry, item1_ID, item1_chance, item2_ID, item2_chance, ... item20_ID, item20_chance
+        1,        4,           55,        3,           30, ...         0,             0
+    loot_table (after)       loot_table_entry
+    entry                    loot_table_id, item_id, chance
+        1                                1,       4,     55
+                                         1,       3,     30
+
+An item which was in more than one slot of a loot table was rolled for once per slot, but it could only drop once.
+It becomes a single row, whose chance is the chance of at least one of those rolls succeeding,
+ex: 50% and 50% => 75%.
+
+Usage:
+    python -m database.migrations.loot_table_entry [path to the database, the game's database by default]
+"""
+import sqlite3
+import sys
+
+from database.database_info import DB_PATH
+
+WIDE_LOOT_TABLE_ITEM_SLOTS = 20
+
+
+class CombinedChance:
+    """ An SQL aggregate of the chance in percentage for at least one of independent rolls to succeed """
+    def __init__(self):
+        self.miss_chance = 1.0
+
+    def step(self, chance: int):
+        self.miss_chance *= 1 - chance / 100
+
+    def finalize(self) -> int or float:
+        chance = round((1 - self.miss_chance) * 100, 2)
+        return int(chance) if chance.is_integer() else chance
+
+
+def is_migrated(connection: sqlite3.Connection) -> bool:
+    """ The loot_table is migrated once it no longer has the itemX_ID columns """
+    loot_table_columns = [column_info[1].lower() for column_info in connection.execute('PRAGMA table_info(loot_table)')]
+    return 'item1_id' not in loot_table_columns
+
+
+def migrate(connection: sqlite3.Connection):
+    """ Move every non-empty item slot of the loot_table into loot_table_entry and drop the slot columns """
+    if is_migrated(connection):
+        return
+
+    with connection:
+        connection.execute('''CREATE TABLE loot_table_entry (
+                                  loot_table_id INTEGER REFERENCES loot_table (entry),
+                                  item_id       INTEGER REFERENCES item_template (entry),
+                                  chance        INTEGER DEFAULT (0),
+                                  PRIMARY KEY (loot_table_id, item_id)
+                              )''')
+        # the empty slots hold a 0 (or NULL) for both the item ID and the chance
+        item_slots_query = ' UNION ALL '.join(
+            f'SELECT entry, {slot} AS slot, item{slot}_ID AS item_id, item{slot}_chance AS chance FROM loot_table '
+            f'WHERE item{slot}_ID != 0 AND item{slot}_chance != 0'
+            for slot in range(1, WIDE_LOOT_TABLE_ITEM_SLOTS + 1))
+        connection.create_aggregate('combined_chance', 1, CombinedChance)
+        connection.execute(f'''INSERT INTO loot_table_entry (loot_table_id, item_id, chance)
+                               SELECT entry, item_id, combined_chance(chance) FROM ({item_slots_query})
+                               GROUP BY entry, item_id ORDER BY entry, MIN(slot)''')
+
+        # SQLite cannot drop the columns, so the table gets rebuilt
+        connection.execute('CREATE TABLE loot_table_migrated (entry INTEGER PRIMARY KEY AUTOINCREMENT)')
+        connection.execute('INSERT INTO loot_table_migrated (entry) SELECT entry FROM loot_table')
+        connection.execute('DROP TABLE loot_table')
+        connection.execute('ALTER TABLE loot_table_migrated RENAME TO loot_table')
+
+
+if __name__ == '__main__':
+    db_path = sys.argv[1] if len(sys.argv) > 1 else DB_PATH
+    db_connection = sqlite3.connect(db_path)
+    try:
+        migrate(db_connection)
+    finally:
+        db_connection.close()
+    print(f'Migrated the loot tables of {db_path}')
@@ -0,0 +1,36 @@
+"""
+This module holds a helper which counts the SQL statements that an engine sends to the database.
+It is used to measure how many queries a certain load (ex: loading a subzone) costs.
+"""
+import threading
+
+from sqlalchemy import event
+
+
+class QueryCounter:
+    """
+    A context manager which counts every statement the given engine executes while the context is open.
+    Only the statements issued from the thread which opened the context are counted, so that
+    background work on the same engine (ex: prefetching subzones) does not get mixed in.
+    Usage:
+        with QueryCounter(session.get_bind()) as query_counter:
+            load_monsters(...)
+        print(query_counter.count)
+    """
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+        self._thread_id = None
+        self._listener = self._count_query  # keep a reference to the same bound method for removing it later
+
+    def __enter__(self):
+        self._thread_id = threading.get_ident()
+        event.listen(self.engine, 'before_cursor_execute', self._listener)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        event.remove(self.engine, 'before_cursor_execute', self._listener)
+
+    def _count_query(self, *args, **kwargs):
+        if threading.get_ident() == self._thread_id:
+            self.count += 1
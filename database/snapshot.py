@@ -0,0 +1,207 @@
+"""
+This module compiles the constant tables which are read while the game starts (the creature defaults, the level up
+stats and the XP requirements) into one versioned binary snapshot file and loads them back without going through
+SQLAlchemy. The database is only ever read, through a read-only connection, and is never changed.
+
+The snapshot is keyed on the content of those tables, not on the database file, which changes with every save:
+    - if the database was migrated with database/migrations/content_version.py, the key is its content version,
+      which triggers change on every change of a snapshot table. Checking it is a single read
+    - otherwise (or if a table was recreated, which drops its triggers), the key is a checksum of the rows
+Whenever the key changes, the snapshot is considered stale and is rebuilt automatically on the next load.
+
+The rest of the static tables are still read through the ORM, since none of them are read before the first prompt:
+    - item_template, paladin_spells_template, spell_buffs and spell_dots are read when the chosen character is loaded,
+      through the relationships of its saved rows, which are read through the writable game engine
+    - creatures (joined with creature_template, loot_table, loot_table_entry and npc_vendor) and quest_template are
+      read once per subzone, on the prefetcher's thread if it got to it first, see zones/prefetcher.py
+They are converted to game objects by their schema classes (ex: CreatureTemplateSchema.convert_to_creature_template,
+the item registry), which work on the ORM's rows and relationships.
+
+To build the snapshot manually (ex: as part of a release), run:
+    python -m database.snapshot
+"""
+import hashlib
+import os
+import pickle
+import sqlite3
+
+SNAPSHOT_VERSION = 4  # bump this whenever the format of the snapshot file changes
+SNAPSHOT_FILE_EXTENSION = '.snapshot'
+SNAPSHOT_TABLES = ('creature_defaults', 'levelup_stats', 'level_xp_requirement')
+CONTENT_VERSION_TABLE = 'content_version'
+CONTENT_TRIGGER_EVENTS = ('INSERT', 'UPDATE', 'DELETE')
+
+_loaded_snapshots = {}  # Key: the path to the database, Value: WorldSnapshot
+
+
+def get_content_trigger_name(table_name: str, event: str) -> str:
+    return f'{CONTENT_VERSION_TABLE}_{table_name}_{event.lower()}'
+
+
+class WorldSnapshot:
+    """
+    Holds the contents of every snapshot table in the database
+        db_key - the key of the database the snapshot was built from, see get_database_key
+        tables - a dictionary Key: table name, Value: Tuple(1,2)
+            1 - a tuple of the column names
+            2 - a list of tuples, each one being a row
+    """
+    def __init__(self, db_key: (str, str), tables: {str: ((str,), [tuple])}):
+        self.db_key = db_key
+        self.tables = tables
+
+    def rows(self, table_name: str) -> [dict]:
+        """
+        :return: A list of dictionaries, one for every row in the table. Key: column name, Value: the cell's value
+        """
+        columns, rows = self.tables[table_name]
+        return [dict(zip(columns, row)) for row in rows]
+
+    def is_up_to_date(self, db_path: str) -> bool:
+        """ Returns a boolean indicating if the snapshot tables have not changed since the snapshot was built """
+        return self.db_key == get_database_key(db_path)
+
+
+def connect_read_only(db_path: str) -> sqlite3.Connection:
+    return sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+
+
+def get_database_key(db_path: str, connection: sqlite3.Connection=None, tables: {str: tuple}=None) -> (str, str):
+    """
+    The key the snapshot is built for - A Tuple(1,2)
+        1 - 'version' if the content version is installed along with all of its triggers, 'checksum' otherwise
+        2 - the content version or the checksum of the snapshot tables' rows
+    :param tables: the snapshot tables, if they were already read through the connection
+    """
+    own_connection = connection is None
+    if own_connection:
+        connection = connect_read_only(db_path)
+    try:
+        content_version = _read_content_version(connection)
+        if content_version is not None:
+            return 'version', str(content_version)
+        return 'checksum', _get_checksum(tables or _read_tables(connection))
+    finally:
+        if own_connection:
+            connection.close()
+
+
+def _read_content_version(connection: sqlite3.Connection) -> int or None:
+    """ :return: the content version, None if it or any of its triggers is missing """
+    expected_triggers = {get_content_trigger_name(table_name, event)
+                         for table_name in SNAPSHOT_TABLES for event in CONTENT_TRIGGER_EVENTS}
+    triggers = {name for name, in connection.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+    if not expected_triggers <= triggers:
+        return None
+
+    try:
+        row = connection.execute(f'SELECT version FROM {CONTENT_VERSION_TABLE}').fetchone()
+    except sqlite3.OperationalError:  # there is no content version table
+        return None
+    return None if row is None else row[0]
+
+
+def _read_tables(connection: sqlite3.Connection) -> {str: ((str,), [tuple])}:
+    tables = {}
+    for table_name in SNAPSHOT_TABLES:
+        cursor = connection.execute(f'SELECT * FROM {table_name}')
+        columns = tuple(column[0] for column in cursor.description)
+        tables[table_name] = (columns, cursor.fetchall())
+
+    return tables
+
+
+def _get_checksum(tables: {str: ((str,), [tuple])}) -> str:
+    """ :return: a hash of the snapshot tables' columns and rows, in a stable order """
+    checksum = hashlib.sha1()
+    for table_name in SNAPSHOT_TABLES:
+        columns, rows = tables[table_name]
+        checksum.update(repr((table_name, columns, sorted(rows, key=repr))).encode())
+
+    return checksum.hexdigest()
+
+
+def get_snapshot_path(db_path: str) -> str:
+    """ The snapshot lives right next to the database file. ex: python_wowDB.db => python_wowDB.snapshot """
+    return os.path.splitext(db_path)[0] + SNAPSHOT_FILE_EXTENSION
+
+
+def get_current_database_path() -> str:
+    """ Returns the path to the database file the game's engine is currently connected to """
+    import database.main  # the engine might be changed at runtime (ex: tests), so always read it from the module
+
+    return os.path.realpath(database.main.engine.url.database)
+
+
+def build_snapshot(db_path: str) -> WorldSnapshot:
+    """
+    Read every snapshot table with the sqlite3 module, save them into the snapshot file and return the snapshot
+    """
+    connection = connect_read_only(db_path)
+    try:
+        # read the key and the tables in one transaction, so that a change in between can not be missed
+        connection.execute('BEGIN')
+        tables = _read_tables(connection)
+        db_key = get_database_key(db_path, connection, tables)
+    finally:
+        connection.close()
+
+    snapshot = WorldSnapshot(db_key=db_key, tables=tables)
+    _save_snapshot(snapshot, get_snapshot_path(db_path))
+
+    return snapshot
+
+
+def load_world_snapshot(db_path: str=None) -> WorldSnapshot:
+    """
+    Load the snapshot of the constant tables of the database.
+    The snapshot file is read only once per process. If it does not exist, is from an older version or the tables
+    have changed since it was built, it gets rebuilt.
+    :param db_path: the path to the database, by default the one the game is connected to
+    """
+    db_path = db_path or get_current_database_path()
+
+    snapshot = _loaded_snapshots.get(db_path)
+    if snapshot is None or not snapshot.is_up_to_date(db_path):
+        snapshot = _read_snapshot(get_snapshot_path(db_path))
+
+        if snapshot is None or not snapshot.is_up_to_date(db_path):
+            snapshot = build_snapshot(db_path)
+        _loaded_snapshots[db_path] = snapshot
+
+    return snapshot
+
+
+def _read_snapshot(snapshot_path: str) -> WorldSnapshot or None:
+    """ Read the snapshot file, returning None if it's missing, corrupt or of an unsupported version """
+    try:
+        with open(snapshot_path, 'rb') as snapshot_file:
+            version, db_key, tables = pickle.load(snapshot_file)
+    except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+        return None
+
+    if version != SNAPSHOT_VERSION:
+        return None
+
+    return WorldSnapshot(db_key=db_key, tables=tables)
+
+
+def _save_snapshot(snapshot: WorldSnapshot, snapshot_path: str):
+    """
+    Write the snapshot into a temporary file and swap it in, so that a reader never sees a half-written file.
+    If the directory is read-only (ex: a packaged game), the snapshot is simply kept in memory for this process
+    """
+    temp_path = snapshot_path + '.tmp'
+    try:
+        with open(temp_path, 'wb') as snapshot_file:
+            pickle.dump((SNAPSHOT_VERSION, snapshot.db_key, snapshot.tables), snapshot_file,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, snapshot_path)
+    except OSError:
+        pass
+
+
+if __name__ == '__main__':
+    path = get_current_database_path()
+    built_snapshot = build_snapshot(path)
+    print(f'Built {get_snapshot_path(path)} with {len(built_snapshot.tables)} tables.')
@@ -1,3 +1,8 @@
+from functools import wraps
+
+from events import get_event_bus, SpellCastFailed, CAST_FAILED_NOT_ENOUGH_MANA, CAST_FAILED_ON_COOLDOWN
+
+
 def cast_spell(func):
     """
     Wraps a function that is tied to a spell cast.
@@ -16,13 +21,14 @@ def cast_spell(func):
             spell = args[1]
         mana_cost = spell.mana_cost
         if not self.has_enough_mana(mana_cost):
-            print(f'Not enough mana! {spell.name} requires {mana_cost} but you have {self.mana}!')
+            get_event_bus().emit(SpellCastFailed, self.name, spell.name, CAST_FAILED_NOT_ENOUGH_MANA, mana_cost,
+                                 self.mana)
             return False
 
         # proceed with casting the spell and start its cooldown timer
         is_ready = spell.cast()
         if not is_ready:
-            print(f'{spell.name} is still on cooldown!')
+            get_event_bus().emit(SpellCastFailed, self.name, spell.name, CAST_FAILED_ON_COOLDOWN)
             return False
 
         return func(*args, **kwargs)
@@ -32,6 +38,7 @@ def cast_spell(func):
 def run_once(func):
     """A decorator that runs a function only once."""
 
+    @wraps(func)
     def decorated(*args, **kwargs):
         try:
             return decorated.saved_result
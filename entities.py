@@ -1,39 +1,58 @@
 """
 This holds the classes for every entity in the game: Monsters and Characters currently
 """
-import random
+from contextlib import contextmanager
+from typing import NamedTuple, Tuple, Dict
+
 from termcolor import colored
-from constants import (CHARACTER_DEFAULT_EQUIPMENT, CHARACTER_LEVELUP_BONUS_STATS, CHARACTER_LEVEL_XP_REQUIREMENTS,
+from constants import (CHARACTER_DERIVED_STATS, CHARACTER_DERIVED_STAT_INPUTS, KEY_DERIVED_MAX_HEALTH,
+                       KEY_DERIVED_MAX_MANA, KEY_DERIVED_AGILITY_BONUS, KEY_DERIVED_DAMAGE, KEY_WEAPON_DAMAGE,
+                       CHARACTER_DEFAULT_EQUIPMENT, CHARACTER_LEVELUP_BONUS_STATS, CHARACTER_LEVEL_XP_REQUIREMENTS,
                        KEY_ARMOR_ATTRIBUTE, KEY_STRENGTH_ATTRIBUTE, KEY_AGILITY_ATTRIBUTE, KEY_BONUS_HEALTH_ATTRIBUTE,
                        KEY_BONUS_MANA_ATTRIBUTE, KEY_LEVEL_STATS_HEALTH, KEY_LEVEL_STATS_MANA, CHAR_STARTER_ZONE,
                        CHAR_STARTER_SUBZONE, CHAR_ATTRIBUTES_TEMPLATE, MAXIMUM_LEVEL_DIFFERENCE_XP_YIELD)
-from information_printer import print_level_up_event, print_vendor_products_for_sale
+from information_printer import print_vendor_products_for_sale
 from exceptions import ItemNotInInventoryError, NonExistantBuffError
 from utils.helper import create_character_attributes_template
+from utils.tracked_collections import TrackedSet, TrackedDict
 from items import Item, Weapon, Potion, Equipment
+from inventory import Inventory
 from quest import Quest, FetchQuest
 from decorators import has_item_in_stock
-from damage import Damage
-from buffs import BeneficialBuff, DoT
+from damage import Damage, FrozenDamage
+from buffs import BeneficialBuff, DoT, StatusEffects
+from rng import get_random_service
+from events import (get_event_bus, DotTicked, BuffExpired, DotExpired, CreatureDied, CharacterDied, DamageDealt,
+                    LootDropped, ExperienceAwarded, LevelUp, QuestCompleted, QuestItemAwarded, ItemEquipped,
+                    PotionConsumed, GossipSaid, LootNotDropped, ItemSold)
 
 
 class LivingThing:
     """
     This is the base class for all things _alive - characters, monsters and etc.
     """
+    __slots__ = ('name', 'level', 'health', 'max_health', 'mana', 'max_mana', 'absorption_shield', 'attributes',
+                 '_alive', '_in_combat', 'buffs', 'random_service')
 
-    def __init__(self, name: str, health: int = 1, mana: int = 1, level: int = 1):
+    def __init__(self, name: str, health: int = 1, mana: int = 1, level: int = 1,
+                 random_service: 'RandomService'=None):
+        """ :param random_service: the service every roll of this thing is made with, the game's one by default """
         self.name = name
+        self.level = level
+        self._init_state(health, mana, random_service)
+
+    def _init_state(self, health: int, mana: int, random_service: 'RandomService'):
+        """ Set up what changes while this thing lives - its health, mana, buffs and combat flags """
         self.health = health
         self.max_health = health
         self.mana = mana
         self.max_mana = mana
-        self.level = level
         self.absorption_shield = 0
         self.attributes = {KEY_ARMOR_ATTRIBUTE: 0}
         self._alive = True
         self._in_combat = False
-        self.buffs: {BeneficialBuff or DoT: int} = {}
+        self.buffs: {BeneficialBuff or DoT: int} = StatusEffects()
+        self.random_service: 'RandomService' = random_service or get_random_service()
 
     def is_alive(self):
         return self._alive
@@ -70,49 +89,25 @@ class LivingThing:
 
     def _update_dots(self):
         """
-        This method goes through all the DoT effects on the entity, activates their tick, reduces their duration
-        and, if the are expired, adds them to a list which holds DoTs that should be removed(expired) from the character
-        After iterating through all of the active DoTs, we remove every DoT that is in the list.
+        This method goes through all the DoT effects on the entity and activates their tick, then reduces their
+        duration and removes every DoT that has expired.
         """
-        dots_to_remove = []  # type: list of DoTs
-
-        # filter the DoTs from the character's buffs, iterate through active DoTs and reduce duration
-        for dot in list(filter(lambda buff: isinstance(buff, DoT), self.buffs.keys())):
+        # iterate through active DoTs, which are kept apart from the buffs
+        for dot in list(self.buffs.dots):
             # activate DoT effect
             self.take_dot_proc(dot)
-            # reduce duration by 1 turn
-            turns_left = self.buffs[dot]
-            turns_left -= 1
-            self.buffs[dot] = turns_left
 
-            if not turns_left:  # if it is expired
-                dots_to_remove.append(dot)
-
-        # remove the buffs
-        for dot in dots_to_remove:
+        # reduce the duration of every DoT by 1 turn and remove the expired ones
+        for dot in self.buffs.dots.pass_turn():
             self.remove_buff(dot)
 
     def _update_buffs(self):
         """
-        This method goes through all the Buffs on the netity, reduces their duration
-        and, if they are expired (0 duration) adds them to a list which holds Buffs that should be removed (are expired)
-        from the character.
-        After iterating through all of the active Buffs, we remove every Buff that is in the list
+        This method reduces the duration of all the Buffs on the entity and removes the expired (0 duration) ones.
+        Only the expired buffs are looked at, see StatusEffects.
         """
-        buffs_to_remove: [BeneficialBuff] = []  # type: list of Buffs
-
-        # iterate through active buffs and reduce duration
-        for buff in filter(lambda bf: isinstance(bf, BeneficialBuff), self.buffs.keys()):
-            # reduce duration by 1 turn
-            turns_left = self.buffs[buff]
-            turns_left -= 1
-            self.buffs[buff] = turns_left
-
-            if not turns_left:  # if it is expired
-                buffs_to_remove.append(buff)
-
-        # remove the buffs
-        for buff in buffs_to_remove:
+        # reduce the duration of every buff by 1 turn and remove the expired ones
+        for buff in self.buffs.buffs.pass_turn():
             self.remove_buff(buff)
 
     def remove_buff(self, buff: BeneficialBuff or DoT):
@@ -122,9 +117,9 @@ class LivingThing:
                                        buff.name)
         if isinstance(buff, BeneficialBuff):
             self._deapply_buff(buff)
-            print(f"Buff {buff.name} has expired from {self.name}.")
+            get_event_bus().emit(BuffExpired, self.name, buff.name)
         elif isinstance(buff, DoT):
-            print(f"DoT {buff.name} has expired from {self.name}.")
+            get_event_bus().emit(DotExpired, self.name, buff.name)
         del self.buffs[buff]
 
     def add_buff(self, buff: BeneficialBuff or DoT):
@@ -224,7 +219,7 @@ class LivingThing:
         if self.absorption_shield:  # if we have a shield
             dot_proc_damage = self._apply_damage_absorption(dot_proc_damage)
 
-        print(f'{self.name} suffers {dot_proc_damage} from {dot.name}!')
+        get_event_bus().emit(DotTicked, self.name, dot_proc_damage, dot.name)
         self._subtract_health(dot_proc_damage)
 
     def _calculate_level_difference_damage(self, damage_to_deal: int, target_level: int, inverse: bool=False) -> int:
@@ -270,6 +265,8 @@ class LivingThing:
         """
 
         if self.absorption_shield:  # if there is anything to absorb
+            if isinstance(damage, FrozenDamage):  # it is shared (ex: by every tick of a DoT), absorb from a copy
+                damage = damage.copy()
             # lowers the damage and returns our shield
             if not to_print:  # we want to modify the shield
                 self.absorption_shield = damage.handle_absorption(self.absorption_shield)
@@ -286,39 +283,132 @@ class LivingThing:
         self._alive = True
 
 
-class FriendlyNPC(LivingThing):
+class CreatureTemplate(NamedTuple):
+    """
+    An immutable record holding the already parsed values of a creature_template row - the creature_defaults it
+    falls back to, its LootTable and its vendor stock. It is built only once per entry and every spawn of the
+    creature (ex: 40 wolves) shares it, reading its static attributes from it instead of holding a copy of each.
+    """
+    entry: int
+    name: str
+    creature_type: str
+    level: int
+    health: int
+    mana: int
+    armor: int
+    min_damage: int
+    max_damage: int
+    quest_relation_id: int
+    loot_table: 'LootTable'
+    gossip: str
+    respawnable: bool
+    xp_to_give: int
+    gold_to_give_range: Tuple[int, int]
+    vendor_inventory: Dict[str, Tuple['Item', int]]
+
+    def spawn(self) -> 'VendorNPC' or 'FriendlyNPC' or 'Monster':
+        """ Create a new living object of this creature, according to its type """
+        if self.creature_type == "fnpc":
+            return FriendlyNPC.from_template(self)
+        elif self.creature_type == "vendor":
+            return VendorNPC.from_template(self)
+        elif self.creature_type == "monster":
+            return Monster.from_template(self)
+        else:
+            raise Exception(f'{self.creature_type} is not a valid creature type!')
+
+
+def _template_attribute(field_name: str) -> property:
+    """
+    :return: A property reading the field from the template of the creature.
+             Setting it gives the creature its own changed copy of the template, so its other spawns are not affected
+    """
+    def get_field(creature: 'Creature'):
+        return getattr(creature.template, field_name)
+
+    def set_field(creature: 'Creature', value):
+        creature.template = creature.template._replace(**{field_name: value})
+
+    return property(get_field, set_field, doc=f'The {field_name} of the creature, read from its template')
+
+
+class Creature(LivingThing):
+    """
+    This is the base class for the creatures in the world, every one of them a spawn of a CreatureTemplate.
+    The static attributes of a creature (name, level, damage and etc.) are read from its template, so a spawn
+    holds only its own state - health, mana, buffs, loot and combat flags.
+    """
+    __slots__ = ('template',)
+
+    name = _template_attribute('name')
+    level = _template_attribute('level')
+    min_damage = _template_attribute('min_damage')
+    max_damage = _template_attribute('max_damage')
+    quest_relation_id = _template_attribute('quest_relation_id')
+    loot_table = _template_attribute('loot_table')
+    gossip = _template_attribute('gossip')
+
+    @classmethod
+    def from_template(cls, template: CreatureTemplate, random_service: 'RandomService'=None) -> 'Creature':
+        """ Spawn a new creature which shares the given template """
+        creature = cls.__new__(cls)
+        creature._spawn(template, random_service)
+        return creature
+
+    def _spawn(self, template: CreatureTemplate, random_service: 'RandomService'):
+        self.template = template
+        self._init_state(template.health, template.mana, random_service)
+
+
+class FriendlyNPC(Creature):
     """
     This is the class for friendly creatures in the world
     """
+    __slots__ = ()
 
     def __init__(self, name: str, health: int = 1, mana: int = 1, level: int = 1, min_damage: int = 0,
                  max_damage: int=1, quest_relation_id=0, loot_table: 'LootTable'=None, gossip: str = 'Hello'):
-        super().__init__(name, health, mana, level)
-        self.level = level
-        self.min_damage = min_damage
-        self.max_damage = max_damage
-        self.gossip = gossip
-        self.colored_name = colored(self.name, color='green')
+        self._spawn(CreatureTemplate(entry=0, name=name, creature_type='fnpc', level=level, health=health, mana=mana,
+                                     armor=0, min_damage=min_damage, max_damage=max_damage,
+                                     quest_relation_id=quest_relation_id, loot_table=loot_table, gossip=gossip,
+                                     respawnable=False, xp_to_give=0, gold_to_give_range=(0, 0), vendor_inventory={}),
+                    random_service=None)
+
+    @property
+    def colored_name(self) -> str:
+        return colored(self.name, color='green')
 
     def __str__(self):
         return f'{self.colored_name}'
 
     def talk(self, player_name: str):
-        print(f'{self.colored_name} says: {self.gossip.replace("$N", player_name)}')
+        get_event_bus().emit(GossipSaid, self.colored_name, 'says', self.gossip.replace('$N', player_name))
 
 
 class VendorNPC(FriendlyNPC):
     """
     This is the class for the vendor NPCs in the world
     """
+    __slots__ = ('inventory',)
+
+    entry = _template_attribute('entry')
 
     def __init__(self, name: str, entry: int, inventory: dict, health: int=1, mana: int=1, level: int=1,
                  min_damage: int=0, max_damage: int=1, quest_relation_id=0,
                  loot_table: 'LootTable'=None, gossip: str='Hello'):
-        super().__init__(name, health, mana, level, min_damage, max_damage, quest_relation_id, loot_table, gossip)
-        self.entry = entry
+        self._spawn(CreatureTemplate(entry=entry, name=name, creature_type='vendor', level=level, health=health,
+                                     mana=mana, armor=0, min_damage=min_damage, max_damage=max_damage,
+                                     quest_relation_id=quest_relation_id, loot_table=loot_table, gossip=gossip,
+                                     respawnable=False, xp_to_give=0, gold_to_give_range=(0, 0),
+                                     vendor_inventory=dict(inventory)),
+                    random_service=None)
         self.inventory = inventory
 
+    def _spawn(self, template: CreatureTemplate, random_service: 'RandomService'):
+        super()._spawn(template, random_service)
+        # every vendor sells out his own stock, the Item objects themselves are shared
+        self.inventory = dict(template.vendor_inventory)
+
     def __str__(self):
         return f'{self.colored_name} <Vendor>'
 
@@ -358,23 +448,28 @@ class VendorNPC(FriendlyNPC):
         return item, item_count, item_price
 
 
-class Monster(LivingThing):
+class Monster(Creature):
+    __slots__ = ('_gold_to_give', 'loot')
+
+    monster_id = _template_attribute('entry')
+    xp_to_give = _template_attribute('xp_to_give')
+    respawnable = _template_attribute('respawnable')  # says if the creature can ever respawn, once killed of course
+
     def __init__(self, monster_id: int, name: str, health: int = 1, mana: int = 1, level: int = 1, min_damage: int = 0,
                  max_damage: int = 1, quest_relation_id=0, xp_to_give: int=0,
                  gold_to_give_range: (int, int)=(0, 0), loot_table: 'LootTable'=None, armor: int=0, gossip: str='',
-                 respawnable: bool=False):
-        super().__init__(name, health, mana, level)
-        self.monster_id = monster_id
-        self.level = level
-        self.min_damage = min_damage
-        self.max_damage = max_damage
-        self.xp_to_give = xp_to_give
-        self.attributes[KEY_ARMOR_ATTRIBUTE] = armor
-        self.gossip = gossip
-        self.respawnable = respawnable  # says if the creature can ever respawn, once killed of course
-        self._gold_to_give = self._calculate_gold_reward(gold_to_give_range)
-        self.quest_relation_id = quest_relation_id
-        self.loot_table = loot_table
+                 respawnable: bool=False, random_service: 'RandomService'=None):
+        self._spawn(CreatureTemplate(entry=monster_id, name=name, creature_type='monster', level=level, health=health,
+                                     mana=mana, armor=armor, min_damage=min_damage, max_damage=max_damage,
+                                     quest_relation_id=quest_relation_id, loot_table=loot_table, gossip=gossip,
+                                     respawnable=respawnable, xp_to_give=xp_to_give,
+                                     gold_to_give_range=gold_to_give_range, vendor_inventory={}),
+                    random_service)
+
+    def _spawn(self, template: CreatureTemplate, random_service: 'RandomService'):
+        super()._spawn(template, random_service)
+        self.attributes[KEY_ARMOR_ATTRIBUTE] = template.armor
+        self._gold_to_give = self._calculate_gold_reward(template.gold_to_give_range)
         self.loot = {"gold": self._gold_to_give}  # dict Key: str, Value: Item class object
 
     def __str__(self):
@@ -384,7 +479,7 @@ class Monster(LivingThing):
 
     def get_auto_attack_damage(self, target_level: int):
         # get the base auto attack damage
-        damage_to_deal = random.randint(self.min_damage, self.max_damage)
+        damage_to_deal = self.random_service.combat.randint(self.min_damage, self.max_damage)
         # factor in the level difference
         damage_to_deal = self._calculate_level_difference_damage(damage_to_deal, target_level)
 
@@ -412,15 +507,16 @@ class Monster(LivingThing):
         """
         if not self.loot_table:
             return
-        dropped_items: [Item] = self.loot_table.decide_drops()
+        dropped_items: [Item] = self.loot_table.decide_drops(self.random_service.loot)
 
         for item in dropped_items:
             self.loot[item.name] = item
+        get_event_bus().emit(LootDropped, self.name, [item.name for item in dropped_items])
 
     def give_loot(self, item_name: str):
         """ Returns the item that's looted and removes it from the monster's inventory"""
         if item_name not in self.loot:
-            print(f'{self.name} did not drop {item_name}.')
+            get_event_bus().emit(LootNotDropped, self.name, item_name)
             return False
 
         item: Item = self.loot[item_name]
@@ -430,13 +526,13 @@ class Monster(LivingThing):
     def _die(self):
         super()._die()
         self._drop_loot()
-        print(f'Creature {self.name} has died!')
+        get_event_bus().emit(CreatureDied, self.name)
 
     def _calculate_gold_reward(self, min_max_gold: tuple) -> int:
         """ Calculate the gold this monster is going to award the player
             min_max_gold: A tuple containing the minimum and maximum amount of gold a creature of this level can give
             (2,5) meaning this creature should give from 2-5 gold, picked at random"""
-        return random.randint(min_max_gold[0], min_max_gold[1])
+        return self.random_service.gold.randint(min_max_gold[0], min_max_gold[1])
 
     def say_gossip(self):
         if self.gossip:
@@ -449,14 +545,15 @@ class Monster(LivingThing):
             else:
                 verb = 'says'
 
-            print(f'{self.name} {verb}: {self.gossip}')
+            get_event_bus().emit(GossipSaid, self.name, verb, self.gossip)
 
 
 class Character(LivingThing):
     def __init__(self, name: str, level: int=1, health: int = 1, mana: int = 1, strength: int = 1, agility: int = 1,
                  loaded_scripts: set=set(), killed_monsters: set=set(), completed_quests: set=set(),
-                 saved_inventory: dict={'gold': 0}, saved_equipment: dict=CHARACTER_DEFAULT_EQUIPMENT):
-        super().__init__(name, health, mana, level=0)
+                 saved_inventory: dict={'gold': 0}, saved_equipment: dict=CHARACTER_DEFAULT_EQUIPMENT,
+                 random_service: 'RandomService'=None):
+        super().__init__(name, health, mana, level=0, random_service=random_service)
         self.min_damage = 0
         self.max_damage = 1
         self.equipped_weapon = Weapon(name="Starter Weapon", item_id=0)
@@ -466,6 +563,9 @@ class Character(LivingThing):
         self._bonus_mana = 0
         self._bonus_strength = 0
         self._bonus_armor = 0
+        # the derived stats (see constants.CHARACTER_DERIVED_STATS) whose inputs have changed since they were calculated
+        self._dirty_stats: set = set(CHARACTER_DERIVED_STATS)
+        self._stat_changes_depth = 0  # how many _stat_changes() blocks are currently open
         self.attributes: {str: int} = create_character_attributes_template()
         self._level_up(to_print=False)  # level up to 1
         if level > 1:
@@ -473,27 +573,68 @@ class Character(LivingThing):
 
         self.current_zone = CHAR_STARTER_ZONE
         self.current_subzone = CHAR_STARTER_SUBZONE
+        # the progress collections track their changes, so that saving the character writes only what has changed
         # holds the scripts that the character has seen (which should load only once)
-        self.loaded_scripts: set() = loaded_scripts
+        self.loaded_scripts: set() = TrackedSet(loaded_scripts)
         # holds the GUIDs of the creatures that the character has killed (and that should not be killable a second time)
-        self.killed_monsters: set() = killed_monsters
-        self.completed_quests: set() = completed_quests  # ids of the quests that the character has completed
+        self.killed_monsters: set() = TrackedSet(killed_monsters)
+        self.completed_quests: set() = TrackedSet(completed_quests)  # ids of the quests that the character has completed
+        # dict Key: quest ID, Value: Quest. Monsters (quest_relation_id) and items (quest_id) hold the ID of the quest
+        # they count towards, so their progress is looked up directly and no other quest is touched
         self.quest_log = {}
-        self.inventory = saved_inventory # dict Key: str, Value: tuple(Item class instance, Item Count)
-        self.equipment = saved_equipment # dict Key: Equipment slot, Value: object of class Equipment
+        self.inventory = saved_inventory  # an Inventory, Key: item name, Value: tuple(Item, Item Count)
+        self.equipment = TrackedDict(saved_equipment) # dict Key: Equipment slot, Value: object of class Equipment
+        # the entry of the saved_character row the tracked collections above are in sync with, None if never saved
+        self.saved_character_entry: int = None
+        self.journal = None  # the ProgressJournal which records the character's progress, see models/characters/journal.py
 
         self._handle_load_saved_equipment()  # add up the attributes for our saved_equipment
 
+    @property
+    def inventory(self) -> Inventory:
+        return self._inventory
+
+    @inventory.setter
+    def inventory(self, inventory: Inventory or dict):
+        """ A saved inventory dictionary (holding the gold under the 'gold' key) is converted to an Inventory """
+        self._inventory = inventory if isinstance(inventory, Inventory) else Inventory(inventory)
+
     def start_turn_update(self):
         super().start_turn_update()
         self.update_spell_cooldowns()
 
-    def add_item_to_inventory(self, item: Item, item_count=1):
-        count = item_count
-        if item.name in self.inventory:
-            count += self.inventory[item.name][1]
+    def mark_saved(self, saved_character_entry: int):
+        """
+        Mark the character's progress as being in sync with the given saved_character row.
+        Called after the character is loaded from or saved to the database.
+        """
+        self.saved_character_entry = saved_character_entry
+        for tracked_collection in (self.loaded_scripts, self.killed_monsters, self.completed_quests,
+                                   self.inventory, self.equipment):
+            tracked_collection.mark_clean()
+
+    def _record_progress(self, event: str, **event_data):
+        """ Write a progress event into the character's journal, if it has one """
+        if self.journal is not None:
+            self.journal.record(event, **event_data)
+
+    def _record_item_count(self, item: Item):
+        """ Record the count of the given item the character has after its inventory changed """
+        if self.journal is None or not item.id or item.id <= 0:
+            # items which are not in item_template (ex: the starter weapon) are never saved
+            return
+        self._record_progress('item', item_id=item.id, name=item.name, count=self.inventory.get_count(item.name))
 
-        self.inventory[item.name] = (item, count)
+    def has_unsaved_changes(self) -> bool:
+        """ Returns a boolean indicating if the character's progress has changed since it was last saved """
+        return (self.saved_character_entry is None
+                or any(tracked_collection.is_dirty
+                       for tracked_collection in (self.loaded_scripts, self.killed_monsters, self.completed_quests,
+                                                  self.inventory, self.equipment)))
+
+    def add_item_to_inventory(self, item: Item, item_count=1):
+        self.inventory.add(item, item_count)
+        self._record_item_count(item)
 
     def equip_item(self, item: Item):
         """
@@ -502,42 +643,30 @@ class Character(LivingThing):
         :param item:
         :return:
         """
-        if isinstance(item, Weapon):
-            item_in_inventory, count = self.inventory[item.name]
-
-            # remove the item we're equipping from the inventory
-            if count == 1:  # remove from the inventory
-                del self.inventory[item.name]
-            else:  # reduce it's count
-                self.inventory[item.name] = item_in_inventory, count-1
+        # the stats are recalculated once, after the old item's attributes are removed and the new one's are added
+        with self._stat_changes():
+            if isinstance(item, Weapon):
+                self._remove_item_from_inventory(item.name)  # remove the item we're equipping from the inventory
 
-            # transfer the equipped weapon to the inventory
-            eq_weapon = self.equipped_weapon
+                # transfer the equipped weapon to the inventory
+                eq_weapon = self.equipped_weapon
 
-            self.add_item_to_inventory(eq_weapon)
+                self.add_item_to_inventory(eq_weapon)
 
-            self._subtract_attributes(eq_weapon.attributes)  # remove the attributes it has given us
-            self._equip_weapon(item)
-        elif isinstance(item, Equipment):
-            item_in_inventory, count = self.inventory[item.name]
+                self._subtract_attributes(eq_weapon.attributes)  # remove the attributes it has given us
+                self._equip_weapon(item)
+            elif isinstance(item, Equipment):
+                self._remove_item_from_inventory(item.name)  # remove the item we're equipping from the inventory
 
-            # remove the item we're equipping from the inventory
-            if count == 1:  # remove from the inventory
-                del self.inventory[item.name]
-            else:  # reduce it's count
-                self.inventory[item.name] = item_in_inventory, count - 1
+                # transfer the equipped item back to the inventory
+                # TODO: Handle custom error if there isn't such a slot in the equipment
+                equipped_item: Equipment = self.equipment[item.slot]
 
-            # transfer the equipped item back to the inventory
-            # TODO: Handle custom error if there isn't such a slot in the equipment
-            equipped_item: Equipment = self.equipment[item.slot]
+                if equipped_item:
+                    self.add_item_to_inventory(equipped_item)
+                    self._subtract_attributes(equipped_item.attributes)
 
-            if equipped_item:
-                self.add_item_to_inventory(equipped_item)
-                self._subtract_attributes(equipped_item.attributes)
-
-            self._equip_gear(item)
-
-        self._calculate_stats_formulas()  # always recalculate formulas when adding an item
+                self._equip_gear(item)
 
     def consume_item(self, item: Item):
         """
@@ -546,28 +675,25 @@ class Character(LivingThing):
         """
         if isinstance(item, Potion):
             potion: Potion = item
-            potion_in_inventory, count = self.inventory[potion.name]
-
-            # remove the potion we're consuming from the inventory
-            if count == 1:  # remove from the inventory
-                del self.inventory[potion.name]
-            else:  # reduce it's count
-                self.inventory[potion.name] = potion_in_inventory, count - 1
+            self._remove_item_from_inventory(potion.name)  # remove the potion we're consuming from the inventory
 
-            print(f'{self.name} drinks {potion.name} and is afflicted by {potion.get_buff_name()}')
+            get_event_bus().emit(PotionConsumed, self.name, potion.name, potion.get_buff_name())
             # call the potion's consume method
             potion.consume(self)
 
     def _equip_weapon(self, weapon: Weapon):
-        print(f'{self.name} has equipped Weapon {weapon.name}')
+        get_event_bus().emit(ItemEquipped, self.name, 'Weapon', weapon.name)
         self.equipped_weapon = weapon
-        self._add_attributes(weapon.attributes)
+        with self._stat_changes():
+            self._dirty_stats.update(CHARACTER_DERIVED_STAT_INPUTS[KEY_WEAPON_DAMAGE])
+            self._add_attributes(weapon.attributes)
 
     def _equip_gear(self, item: Equipment):
         """ equip an equipment item like a Headpiece, Shoulderpad, Chestguard and etc."""
-        print(f'{self.name} has equipped {item.slot} {item.name}')
+        get_event_bus().emit(ItemEquipped, self.name, item.slot, item.name)
         self.equipment[item.slot] = item
         self._add_attributes(item.attributes)
+        self._record_progress('equip', slot=item.slot, item_id=item.id)
 
     def _add_attributes(self, attributes: dict):
         """ this function goes through a dictionary that holds character attributes and adds them
@@ -575,9 +701,9 @@ class Character(LivingThing):
         We directly apply it to the character's attributes dictionary because we trust that the
         argument has gone through helper.py's create_attributes function
         and has valid attribute names"""
-        for attribute_name, attribute_value in attributes.items():
-            self.attributes[attribute_name] += attribute_value
-        self._calculate_stats_formulas()
+        with self._stat_changes():
+            for attribute_name, attribute_value in attributes.items():
+                self._change_attribute(attribute_name, attribute_value)
 
     def _subtract_attributes(self, attributes: dict):
         """ this function goes through a dictionary that holds character attributes and adds them
@@ -585,32 +711,72 @@ class Character(LivingThing):
             We directly apply it to the character's attributes dictionary because we trust that the
             argument has gone through helper.py's create_attributes function
             and has valid attribute names"""
-        for attribute_name, attribute_value in attributes.items():
-            # we also trust that the values cannot be negative after the subtraction, because the same amount has
-            # been added beforehand and we currently do not support any features that lower a character's
-            # attributes outside of combat, where he will not be able to dequip an item
-            self.attributes[attribute_name] -= attribute_value
-        self._calculate_stats_formulas()
+        with self._stat_changes():
+            for attribute_name, attribute_value in attributes.items():
+                # we also trust that the values cannot be negative after the subtraction, because the same amount has
+                # been added beforehand and we currently do not support any features that lower a character's
+                # attributes outside of combat, where he will not be able to dequip an item
+                self._change_attribute(attribute_name, -attribute_value)
+
+    def _change_attribute(self, attribute_name: str, amount: int):
+        """ Change an attribute by the given amount and mark the derived stats that are calculated from it as dirty """
+        self.attributes[attribute_name] += amount
+        if amount:
+            self._dirty_stats.update(CHARACTER_DERIVED_STAT_INPUTS.get(attribute_name, ()))
+
+    @contextmanager
+    def _stat_changes(self):
+        """
+        Recalculate the dirty derived stats once, after all the changes made inside the block
+        (ex: removing the attributes of the unequipped item and adding the ones of the equipped item).
+        Blocks can be nested, the stats are recalculated when the outermost one ends.
+        """
+        self._stat_changes_depth += 1
+        try:
+            yield
+        finally:
+            self._stat_changes_depth -= 1
+        if not self._stat_changes_depth:
+            self._update_derived_stats()
 
     def _calculate_stats_formulas(self):
         """
-        Whenever we level up or equip an item, our stats are changed.
-        According to that change, we need to recalculate the formulas in which those stats are used in.
+        Recalculate every derived stat, needed when the attributes were changed directly.
+        Whenever we level up, equip an item or get buffed, only the stats which depend on the changed attributes
+        are recalculated instead, see _stat_changes.
         """
-
-        # update health according to bonus health
+        self._dirty_stats.update(CHARACTER_DERIVED_STATS)
+        if not self._stat_changes_depth:
+            self._update_derived_stats()
+
+    def _update_derived_stats(self):
+        """ Recalculate the dirty derived stats, in the order in which they depend on each other """
+        dirty_stats, self._dirty_stats = self._dirty_stats, set()
+        if KEY_DERIVED_MAX_HEALTH in dirty_stats:
+            self._update_max_health()
+        if KEY_DERIVED_MAX_MANA in dirty_stats:
+            self._update_max_mana()
+        if KEY_DERIVED_AGILITY_BONUS in dirty_stats:
+            self._update_agility_bonus()
+        if KEY_DERIVED_DAMAGE in dirty_stats:
+            self._update_damage()
+
+    def _update_max_health(self):
+        """ update health according to bonus health """
         orig_max_h = self.max_health
         self.max_health -= self._bonus_health  # remove the old bonus health
         self._bonus_health = self.attributes[KEY_BONUS_HEALTH_ATTRIBUTE]  # update bonus health
         self.max_health += self._bonus_health  # add bonus health again
+        self._handle_health_change(orig_max_h)
+
+    def _update_max_mana(self):
         orig_max_m = self.max_mana
         self.max_mana -= self._bonus_mana
         self._bonus_mana = self.attributes[KEY_BONUS_MANA_ATTRIBUTE]
         self.max_mana += self._bonus_mana
-
-        self._handle_health_change(orig_max_h)
         self._handle_mana_change(orig_max_m)
 
+    def _update_agility_bonus(self):
         # formula for agility is: for each point of agility, add 2.5 armor and 0.5 strength
         agility = self.attributes[KEY_AGILITY_ATTRIBUTE]
 
@@ -624,8 +790,7 @@ class Character(LivingThing):
         self.attributes[KEY_STRENGTH_ATTRIBUTE] += self._bonus_strength
         self.attributes[KEY_ARMOR_ATTRIBUTE] += self._bonus_armor
 
-        "Now we need to update our damage, because the strength might have been changed"
-
+    def _update_damage(self):
         # current formula for damage is: wep_dmg * 0.4 * strength
         strength = self.attributes[KEY_STRENGTH_ATTRIBUTE]
         self.min_damage = self.equipped_weapon.min_damage + (0.4 * strength)
@@ -680,7 +845,7 @@ class Character(LivingThing):
 
     def get_auto_attack_damage(self, target_level: int) -> Damage:
         # get the base auto attack damage
-        damage_to_deal = random.randint(int(self.min_damage), int(self.max_damage))
+        damage_to_deal = self.random_service.combat.randint(int(self.min_damage), int(self.max_damage))
         # factor in the level difference
         damage_to_deal = self._calculate_level_difference_damage(damage_to_deal, target_level)
 
@@ -693,7 +858,7 @@ class Character(LivingThing):
         damage = self._apply_armor_reduction(damage, attacker_level)
         damage = self._apply_damage_absorption(damage)
 
-        print(f'{monster_name} attacks {self.name} for {damage}!')
+        get_event_bus().emit(DamageDealt, monster_name, self.name, damage)
         self._subtract_health(damage)
 
     def _apply_buff(self, buff: BeneficialBuff):
@@ -701,48 +866,42 @@ class Character(LivingThing):
         buff_attributes: {str: int} = buff.get_buffed_attributes()
 
         # iterate through the buffed attributes and apply them to the character
-        for buff_type, buff_amount in buff_attributes.items():
-            if buff_type == "health":
-                self.attributes[KEY_BONUS_HEALTH_ATTRIBUTE] += buff_amount
-            elif buff_type == "mana":
-                self.attributes[KEY_BONUS_MANA_ATTRIBUTE] += buff_amount
-            else:
-                self.attributes[buff_type] += buff_amount
-
-            self._calculate_stats_formulas()  # always recalculate the formulas when stats are changed
+        with self._stat_changes():
+            for buff_type, buff_amount in buff_attributes.items():
+                if buff_type == "health":
+                    self._change_attribute(KEY_BONUS_HEALTH_ATTRIBUTE, buff_amount)
+                elif buff_type == "mana":
+                    self._change_attribute(KEY_BONUS_MANA_ATTRIBUTE, buff_amount)
+                else:
+                    self._change_attribute(buff_type, buff_amount)
 
     def _deapply_buff(self, buff: BeneficialBuff):
         """ Remove the buff from the character's stats"""
         buff_attributes: {str: int} = buff.get_buffed_attributes()
 
         # iterate through the buffed attributes and remove them from the character
-        for buff_type, buff_amount in buff_attributes.items():
-            if buff_type == "health":
-                self.attributes[KEY_BONUS_HEALTH_ATTRIBUTE] -= buff_amount
-            elif buff_type == "mana":
-                self.attributes[KEY_BONUS_MANA_ATTRIBUTE] -= buff_amount
-            else:
-                self.attributes[buff_type] -= buff_amount
-
-            self._calculate_stats_formulas()  # always recalculate the formulas when stats are changed
+        with self._stat_changes():
+            for buff_type, buff_amount in buff_attributes.items():
+                if buff_type == "health":
+                    self._change_attribute(KEY_BONUS_HEALTH_ATTRIBUTE, -buff_amount)
+                elif buff_type == "mana":
+                    self._change_attribute(KEY_BONUS_MANA_ATTRIBUTE, -buff_amount)
+                else:
+                    self._change_attribute(buff_type, -buff_amount)
 
     def _die(self):
         super()._die()
-        print(f'Character {self.name} has died!')
+        get_event_bus().emit(CharacterDied, self.name)
 
     def has_enough_gold(self, gold: int) -> bool:
         """
         :return: a boolean indicating if we have that much gold
         """
-        return self.inventory['gold'] >= gold
+        return self.inventory.gold >= gold
 
     def has_item(self, item: str) -> bool:
         """ This method checks if the character has the item in his inventory"""
-        if item == 'gold':
-            # gold is a special keyword used to store the gold in the inventory
-            return False
-
-        return item in self.inventory.keys()
+        return item in self.inventory  # the gold is not one of the items
 
     def buy_item(self, sale: (Item, int, int)):
         """
@@ -755,7 +914,8 @@ class Character(LivingThing):
         """
         item, item_count, item_price = sale
 
-        self.inventory['gold'] -= item_price
+        self.inventory.gold -= item_price
+        self._record_progress('gold', gold=self.inventory.gold)
 
         self.award_item(item, item_count)
 
@@ -764,17 +924,11 @@ class Character(LivingThing):
         This method is used when the character sells an item to the vendor.
         We give **him** the item and he gives us gold for it
         """
-        item, item_count = self.inventory[item_name]
-
-        # remove the item from the inventory
-        if item_count == 1:
-            del self.inventory[item.name]
-        else:
-            self.inventory[item_name] = (item, item_count-1)
+        item = self.inventory.get_item(item_name)
+        self._remove_item_from_inventory(item_name)
 
         gold_award = item.sell_price
-        print(f'You have sold {item_name} for {gold_award} gold.')
-        print()
+        get_event_bus().emit(ItemSold, item_name, gold_award)
         self.award_gold(gold_award)
 
     def add_quest(self, quest: Quest):
@@ -782,6 +936,7 @@ class Character(LivingThing):
             raise Exception(f'{quest.name} is already in your quest log!')
 
         self.quest_log[quest.ID] = quest
+        self._record_progress('quest_accepted', quest_id=quest.ID)
         # there are some cases where the quest can be completed on accept, i.e having the required items
         quest.check_if_complete(self)
         self._check_if_quest_completed(quest)
@@ -800,18 +955,19 @@ class Character(LivingThing):
             # if we just completed a fetch quest, we need to remove the required items for the quest
             self._remove_fetch_quest_required_items(quest)
 
-        print(f'Quest {quest.name} is completed! XP awarded: {quest.xp_reward}!')
+        get_event_bus().emit(QuestCompleted, quest.name, quest.xp_reward)
         if isinstance(item_reward, Item):
-            print(f'{self.name} is awarded {item_reward.name} from the quest {quest.name}!')
+            get_event_bus().emit(QuestItemAwarded, self.name, item_reward.name, quest.name)
             self.award_item(item_reward)
         elif isinstance(item_reward, list):
             for item in item_reward:
-                print(f'{self.name} is awarded {item.name} from the quest {quest.name}!')
+                get_event_bus().emit(QuestItemAwarded, self.name, item.name, quest.name)
                 self.award_item(item)
 
         del self.quest_log[quest.ID]  # remove from quest log
 
         self.completed_quests.add(quest.ID)
+        self._record_progress('quest_completed', quest_id=quest.ID)
         self._award_experience(xp_reward)
 
     def _remove_fetch_quest_required_items(self, quest: FetchQuest):
@@ -823,6 +979,11 @@ class Character(LivingThing):
         """ Method that awards experience to the player and checks if he levels up"""
         self.experience += xp_reward
         self.check_if_levelup()
+        self._record_progress('experience', level=self.level, experience=self.experience)
+
+    def get_lowest_xp_yielding_level(self) -> int:
+        """ :return: the lowest level a monster can be to still give this character experience when killed """
+        return self.level - MAXIMUM_LEVEL_DIFFERENCE_XP_YIELD + 1
 
     def award_monster_kill(self, monster: Monster, monster_guid: int):
         """
@@ -836,20 +997,18 @@ class Character(LivingThing):
 
         level_difference = self.level - monster_level
         xp_bonus_reward = 0
-        if level_difference >= MAXIMUM_LEVEL_DIFFERENCE_XP_YIELD:
+        if monster_level < self.get_lowest_xp_yielding_level():
             xp_reward = 0
         elif level_difference < 0:  # monster is higher level
             # 10% increase of XP for every level the monster has over player
             percentage_mod = abs(level_difference) * 0.1
             xp_bonus_reward += int(xp_reward * percentage_mod)  # convert to int
 
-        if xp_bonus_reward:
-            print(f'XP awarded: {xp_reward} + bonus {xp_bonus_reward} for the level difference!')
-        else:
-            print(f'XP awarded: {xp_reward}!')
+        get_event_bus().emit(ExperienceAwarded, xp_reward, xp_bonus_reward)
 
         if not monster.respawnable:
             self.killed_monsters.add(monster_guid)
+            self._record_progress('kill', guid=monster_guid)
 
         self._award_experience(xp_reward + xp_bonus_reward)
 
@@ -861,7 +1020,8 @@ class Character(LivingThing):
             self._check_if_quest_completed(quest)
 
     def award_gold(self, gold: int):
-        self.inventory['gold'] += gold
+        self.inventory.gold += gold
+        self._record_progress('gold', gold=self.inventory.gold)
 
     def award_item(self, item: Item, item_count=1):
         """ Take an item and put it into the character's inventory,
@@ -881,32 +1041,22 @@ class Character(LivingThing):
         """ This method removes the specified item from the player's inventory
             :param item_count: the count we want to remove, ex: we may want to remove 2 Wolf Meats, as opposed to one
             :param remove_all: simply removes all the items, with this variable set to True, item_count is useless"""
-        if item_name not in self.inventory.keys():
+        if item_name not in self.inventory:
             raise ItemNotInInventoryError(f'{item_name} is not in {self.name}\'s inventory!',
                                           inventory=self.inventory, item_name=item_name)
 
-        if remove_all:
-            del self.inventory[item_name]
-        else:
-            item, count_in_inventory = self.inventory[item_name]
-
-            # subtract the number of items we're removing from the number we have
-            resulting_count = count_in_inventory - item_count
-
-            if resulting_count <= 0:
-                # if it's 0 or less, remove the key/value pair
-                del self.inventory[item_name]
-            else:
-                # if we have items left, simply reduce their count
-                self.inventory[item_name] = item, resulting_count
+        item = self.inventory.get_item(item_name)
+        self.inventory.remove(item_name, item_count, remove_all)
+        self._record_item_count(item)
 
     def _handle_load_saved_equipment(self):
         """
         This function is used to add the attributes of all the character's equipment.
         NOTE: This is used only on the initial character load
         """
-        for item in (itm for itm in self.equipment.values() if itm is not None):
-            self._add_attributes(item.attributes)
+        with self._stat_changes():
+            for item in (itm for itm in self.equipment.values() if itm is not None):
+                self._add_attributes(item.attributes)
 
     def check_if_levelup(self):
         if self.experience >= self.xp_req_to_level:
@@ -933,16 +1083,15 @@ class Character(LivingThing):
 
         self.max_health += hp_increase_amount
         self.max_mana += mana_increase_amount
-        self.attributes[KEY_STRENGTH_ATTRIBUTE] += strength_increase_amount
-        self.attributes[KEY_ARMOR_ATTRIBUTE] += armor_increase_amount
-        self.attributes[KEY_AGILITY_ATTRIBUTE] += agility_increase_amount
-        self._calculate_stats_formulas()  # recalculate formulas with stats
+        with self._stat_changes():  # recalculate the formulas with the changed stats
+            self._change_attribute(KEY_STRENGTH_ATTRIBUTE, strength_increase_amount)
+            self._change_attribute(KEY_ARMOR_ATTRIBUTE, armor_increase_amount)
+            self._change_attribute(KEY_AGILITY_ATTRIBUTE, agility_increase_amount)
         self._regenerate()  # regen to full hp/mana
 
         if to_print:
-            print_level_up_event(name=self.name, level=self.level, armor_inc=armor_increase_amount,
-                                 hp_inc=hp_increase_amount, mana_inc=mana_increase_amount,
-                                 strength_inc=strength_increase_amount, agi_inc=agility_increase_amount)
+            get_event_bus().emit(LevelUp, self.name, self.level, armor_increase_amount, hp_increase_amount,
+                                 mana_increase_amount, strength_increase_amount, agility_increase_amount)
 
     def _lookup_next_xp_level_req(self):
         return CHARACTER_LEVEL_XP_REQUIREMENTS[self.level]
@@ -955,6 +1104,7 @@ class Character(LivingThing):
         :param script_name: the name of the script
         """
         self.loaded_scripts.add(script_name)
+        self._record_progress('script', script_name=script_name)
 
     def has_loaded_script(self, script_name: str) -> bool:
         """
@@ -0,0 +1,474 @@
+"""
+This module holds the event bus of the game. Everything that happens in the game and is shown to the player -
+a swing, a DoT tick, a heal, a level up, a drop - is emitted as a typed event to the bus,
+which hands it to its sinks:
+    TerminalSink - prints the events, the way the game always has. While the bus is batching (ex: during a turn of
+                   combat) it collects the lines and prints them in a single write once the batch is over
+    JsonLinesSink - writes every event as a line of JSON, for analytics
+    NullSink - drops the events. A bus with no other sinks does not even create them
+An event is created only if a sink will receive it, and its text is formatted only if a sink renders it,
+so a headless simulation does not build a single string.
+
+Usage:
+    get_event_bus().emit(DamageDealt, attacker.name, victim.name, damage)
+    with get_event_bus().batch():
+        ...  # the events reach the terminal at once, when the batch is over
+    set_event_bus(EventBus(sinks=[TerminalSink(), JsonLinesSink(open('events.jsonl', 'w'))]))
+    with use_event_bus(EventBus(sinks=[NullSink()])):
+        ...  # the events emitted from this thread go to the given bus, the rest of the game keeps the game's bus
+"""
+import sys
+import threading
+from contextlib import contextmanager
+from typing import NamedTuple, List
+
+
+class DamageDealt(NamedTuple):
+    """ An auto attack. The source is what the attack's magic damage comes from, if anything """
+    attacker: str
+    target: str
+    damage: 'Damage'
+    source: str = None
+
+    def render(self) -> str:
+        if self.source:
+            return f'{self.attacker} attacks {self.target} for {self.damage} from {self.source}!'
+        return f'{self.attacker} attacks {self.target} for {self.damage}!'
+
+
+class SpellDamageDealt(NamedTuple):
+    spell: str
+    target: str
+    damage: 'Damage'
+
+    def render(self) -> str:
+        return f'{self.spell} damages {self.target} for {self.damage}!'
+
+
+class DotTicked(NamedTuple):
+    target: str
+    damage: 'Damage'
+    dot: str
+
+    def render(self) -> str:
+        return f'{self.target} suffers {self.damage} from {self.dot}!'
+
+
+class BuffExpired(NamedTuple):
+    target: str
+    buff: str
+
+    def render(self) -> str:
+        return f'Buff {self.buff} has expired from {self.target}.'
+
+
+class DotExpired(NamedTuple):
+    target: str
+    dot: str
+
+    def render(self) -> str:
+        return f'DoT {self.dot} has expired from {self.target}.'
+
+
+class Healed(NamedTuple):
+    spell: str
+    target: str
+    heal: 'Heal'
+    overheal: float = 0
+
+    def render(self) -> str:
+        if self.overheal:
+            return f'{self.spell} healed {self.target} for {self.heal - self.overheal:.2f} ' \
+                   f'({self.overheal:.2f} Overheal).'
+        return f'{self.spell} healed {self.target} for {self.heal}.'
+
+
+class SpellActivated(NamedTuple):
+    caster: str
+    spell: str
+
+    def render(self) -> str:
+        return f'{self.caster} activates {self.spell}!'
+
+
+class SpellFaded(NamedTuple):
+    target: str
+    spell: str
+
+    def render(self) -> str:
+        return f'{self.spell} has faded from {self.target}'
+
+
+class CastFailed(NamedTuple):
+    caster: str
+    command: str
+
+    def render(self) -> str:
+        return 'Unsuccessful cast'
+
+
+# the reasons a SpellCastFailed event is emitted for
+CAST_FAILED_NOT_ENOUGH_MANA = 'not enough mana'
+CAST_FAILED_ON_COOLDOWN = 'on cooldown'
+
+
+class SpellCastFailed(NamedTuple):
+    """ A spell which could not be cast, the mana fields are only set if the reason is CAST_FAILED_NOT_ENOUGH_MANA """
+    caster: str
+    spell: str
+    reason: str
+    mana_cost: int = 0
+    mana: float = 0
+
+    def render(self) -> str:
+        if self.reason == CAST_FAILED_NOT_ENOUGH_MANA:
+            return f'Not enough mana! {self.spell} requires {self.mana_cost} but you have {self.mana}!'
+        return f'{self.spell} is still on cooldown!'
+
+
+class CreatureDied(NamedTuple):
+    creature: str
+
+    def render(self) -> str:
+        return f'Creature {self.creature} has died!'
+
+
+class CharacterDied(NamedTuple):
+    character: str
+
+    def render(self) -> str:
+        return f'Character {self.character} has died!'
+
+
+class MonsterSlain(NamedTuple):
+    character: str
+    monster: str
+
+    def render(self) -> str:
+        return f'{self.character} has slain {self.monster}!'
+
+
+class CharacterSlain(NamedTuple):
+    monster: str
+    character: str
+
+    def render(self) -> str:
+        return f'{self.monster} has slain character {self.character}'
+
+
+class LootDropped(NamedTuple):
+    """ The items a monster dropped on its death. The player is shown them in the loot window, not here """
+    monster: str
+    items: List[str]
+
+    def render(self) -> None:
+        return None
+
+
+class GoldLooted(NamedTuple):
+    character: str
+    gold: int
+
+    def render(self) -> str:
+        return f'{self.character} has looted {self.gold} gold.'
+
+
+class ItemLooted(NamedTuple):
+    character: str
+    item: str
+
+    def render(self) -> str:
+        return f'{self.character} has looted {self.item}.'
+
+
+class ExperienceAwarded(NamedTuple):
+    experience: int
+    bonus_experience: int = 0
+
+    def render(self) -> str:
+        if self.bonus_experience:
+            return f'XP awarded: {self.experience} + bonus {self.bonus_experience} for the level difference!'
+        return f'XP awarded: {self.experience}!'
+
+
+class LevelUp(NamedTuple):
+    character: str
+    level: int
+    armor_increase: int
+    health_increase: int
+    mana_increase: int
+    strength_increase: int
+    agility_increase: int
+
+    def render(self) -> str:
+        return '\n'.join(['*' * 20,
+                          f'Character {self.character} has leveled up to level {self.level}!',
+                          f'Armor Points increased by {self.armor_increase}',
+                          f'Health Points increased by {self.health_increase}',
+                          f'Mana Points increased by {self.mana_increase}',
+                          f'Strength Points increased by {self.strength_increase}',
+                          f'Agility Points increased by {self.agility_increase}',
+                          '*' * 20])
+
+
+class SpellLearned(NamedTuple):
+    spell: str
+
+    def render(self) -> str:
+        return f'You have learned a new spell - {self.spell}'
+
+
+class SpellRankedUp(NamedTuple):
+    spell: str
+    rank: int
+
+    def render(self) -> str:
+        return f'Spell {self.spell} has been updated to rank {self.rank}!\n' + '*' * 20
+
+
+class QuestCompleted(NamedTuple):
+    quest: str
+    experience: int
+
+    def render(self) -> str:
+        return f'Quest {self.quest} is completed! XP awarded: {self.experience}!'
+
+
+class QuestItemAwarded(NamedTuple):
+    character: str
+    item: str
+    quest: str
+
+    def render(self) -> str:
+        return f'{self.character} is awarded {self.item} from the quest {self.quest}!'
+
+
+class ItemEquipped(NamedTuple):
+    character: str
+    slot: str
+    item: str
+
+    def render(self) -> str:
+        return f'{self.character} has equipped {self.slot} {self.item}'
+
+
+class PotionConsumed(NamedTuple):
+    character: str
+    potion: str
+    buff: str
+
+    def render(self) -> str:
+        return f'{self.character} drinks {self.potion} and is afflicted by {self.buff}'
+
+
+class LootNotDropped(NamedTuple):
+    monster: str
+    item: str
+
+    def render(self) -> str:
+        return f'{self.monster} did not drop {self.item}.'
+
+
+class LootWindowClosed(NamedTuple):
+    monster: str
+
+    def render(self) -> str:
+        return '-' * 40
+
+
+class InvalidCommand(NamedTuple):
+    command: str
+
+    def render(self) -> str:
+        return 'Invalid command.'
+
+
+class ItemSold(NamedTuple):
+    item: str
+    gold: int
+
+    def render(self) -> str:
+        return f'You have sold {self.item} for {self.gold} gold.\n'
+
+
+class QuestProgressed(NamedTuple):
+    """ A step towards a quest's objective, ex: a killed monster or an obtained item """
+    quest: str
+    progress: int
+    required: int
+    objective: str
+    action: str
+
+    def render(self) -> str:
+        return f'Quest {self.quest}: {self.progress}/{self.required} {self.objective} {self.action}.'
+
+
+class GossipSaid(NamedTuple):
+    monster: str
+    verb: str
+    gossip: str
+
+    def render(self) -> str:
+        return f'{self.monster} {self.verb}: {self.gossip}'
+
+
+class EventSink:
+    """ The base class for all sinks """
+    discards_events = False  # a sink which discards every event is not handed any
+
+    def handle(self, event: NamedTuple):
+        raise NotImplementedError()
+
+    def flush(self):
+        """ Called once the events emitted so far should be written out, ex: when a batch is over """
+        pass
+
+
+class NullSink(EventSink):
+    """ Drops every event """
+    discards_events = True
+
+    def handle(self, event: NamedTuple):
+        pass
+
+
+class TerminalSink(EventSink):
+    """ Prints the text of every event, collecting the lines until flush() is called """
+    def __init__(self, stream=None):
+        """ :param stream: the stream to write to, the current sys.stdout by default """
+        self.stream = stream
+        self._lines: [str] = []
+
+    def handle(self, event: NamedTuple):
+        line = event.render()
+        if line is not None:
+            self._lines.append(line)
+
+    def flush(self):
+        if not self._lines:
+            return
+        lines, self._lines = self._lines, []
+        (self.stream or sys.stdout).write('\n'.join(lines) + '\n')
+
+
+class JsonLinesSink(EventSink):
+    """
+    Writes every event as a line of JSON holding its type and fields, ex:
+        {"event": "DamageDealt", "attacker": "Wolf", "target": "Netherblood", "damage": {"phys_dmg": 2, ...}, ...}
+    """
+    def __init__(self, file):
+        """ :param file: an open text file """
+        self.file = file
+        self._lines: [str] = []
+
+    def handle(self, event: NamedTuple):
+        import json
+        self._lines.append(json.dumps(dict(event._asdict(), event=type(event).__name__), default=_to_json))
+
+    def flush(self):
+        if not self._lines:
+            return
+        lines, self._lines = self._lines, []
+        self.file.write('\n'.join(lines) + '\n')
+        self.file.flush()
+
+
+def _to_json(value):
+    """ :return: a JSON serializable representation of a field which json cannot serialize by itself """
+    from damage import Damage
+    from heal import Heal
+    if isinstance(value, Damage):
+        return {'phys_dmg': value.phys_dmg, 'magic_dmg': value.magic_dmg,
+                'phys_absorbed': value.phys_absorbed, 'magic_absorbed': value.magic_absorbed}
+    if isinstance(value, Heal):
+        return value.heal_amount
+    return str(value)
+
+
+class EventBus:
+    """ Hands every emitted event to its sinks, flushing them after each event unless a batch is open """
+    def __init__(self, sinks: [EventSink]=None):
+        """ :param sinks: the sinks to hand the events to, a TerminalSink by default """
+        self._batch_depth = 0
+        self.sinks: [EventSink] = []
+        self._receiving_sinks: [EventSink] = []
+        self.set_sinks([TerminalSink()] if sinks is None else sinks)
+
+    def set_sinks(self, sinks: [EventSink]) -> [EventSink]:
+        """ :return: the sinks which were replaced """
+        self.flush()
+        replaced_sinks, self.sinks = self.sinks, list(sinks)
+        self._receiving_sinks = [sink for sink in self.sinks if not sink.discards_events]
+        return replaced_sinks
+
+    def add_sink(self, sink: EventSink):
+        self.set_sinks(self.sinks + [sink])
+
+    def emit(self, event_type: type, *fields):
+        """ Create an event of the given type out of the fields and hand it to the sinks, if there are any """
+        if not self._receiving_sinks:
+            return
+        event = event_type(*fields)
+        for sink in self._receiving_sinks:
+            sink.handle(event)
+        if not self._batch_depth:
+            for sink in self._receiving_sinks:
+                sink.flush()
+
+    @contextmanager
+    def batch(self):
+        """
+        Flush the sinks only once the context is closed, ex: the terminal gets a single write for a whole turn.
+        Anything printed directly while the batch is open is shown before the batch's events.
+        Batches can be nested, the sinks are flushed when the outermost one is closed.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def flush(self):
+        for sink in self._receiving_sinks:
+            sink.flush()
+
+
+# the bus every event in the game is emitted to unless it is given another one
+_event_bus: EventBus = None
+# the bus the events of a single thread are emitted to instead, see use_event_bus
+_thread_event_bus = threading.local()
+
+
+def get_event_bus() -> EventBus:
+    """ :return: the bus of the current thread if it was given one with use_event_bus, the game's bus otherwise """
+    event_bus = getattr(_thread_event_bus, 'event_bus', None)
+    if event_bus is not None:
+        return event_bus
+
+    global _event_bus
+    if _event_bus is None:
+        _event_bus = EventBus()
+    return _event_bus
+
+
+def set_event_bus(event_bus: EventBus):
+    """ Replace the game's bus, ex: with one writing the events to a JSON lines file as well """
+    global _event_bus
+    _event_bus = event_bus
+
+
+@contextmanager
+def use_event_bus(event_bus: EventBus):
+    """
+    Emit the events of the current thread to the given bus while the context is open, ex: for a headless simulation.
+    The other threads, and with them the game's bus and its sinks, are not affected
+    """
+    previous_event_bus = getattr(_thread_event_bus, 'event_bus', None)
+    _thread_event_bus.event_bus = event_bus
+    try:
+        yield event_bus
+    finally:
+        event_bus.flush()
+        _thread_event_bus.event_bus = previous_event_bus
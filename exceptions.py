@@ -17,6 +17,16 @@ class ItemNotInInventoryError(Error):
         super(Exception, self).__init__(message, inventory, item_name, args)
 
 
+class InventoryFullError(Error):
+    """ This exception is raised whenever the items we want to add to an inventory do not fit in its slots. """
+    def __init__(self, message, item_name: str, *args):
+        self.message = message
+        # value that caused the error
+        self.item_name = item_name
+
+        super(Exception, self).__init__(message, item_name, args)
+
+
 class NoSuchCharacterError(Error):
     """ This exception is raised whenever we want to load a character that is not saved in the database. """
     def __init(self, message, name: str, *args):
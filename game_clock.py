@@ -0,0 +1,119 @@
+"""
+This module holds the clock of the game, which every pause in the game (ex: between the lines of a scripted scene)
+goes through instead of sleeping directly. The clock runs in one of three modes:
+    real time - a pause of 3 seconds takes 3 seconds, as the player should see it
+    scaled - the game time runs X times faster, ex: a pause of 3 seconds takes 0.3 seconds at 10x
+    instant - pauses only move the clock's game time forward, for tests, replays and headless runs
+The Scheduler plays out delayed narrative lines (and any other delayed call) on a clock.
+
+Usage:
+    set_game_clock(GameClock(mode=CLOCK_MODE_INSTANT))
+    scheduler = Scheduler()
+    scheduler.say_lines([('Brother Haskel says: ...', 3), ('Brother Paxton says: ...', 2.5)])
+    scheduler.run()
+"""
+import heapq
+import time
+from itertools import count
+
+CLOCK_MODE_REAL_TIME, CLOCK_MODE_SCALED, CLOCK_MODE_INSTANT = 'real time', 'scaled', 'instant'
+
+
+class GameClock:
+    """
+    Measures the game time in seconds, starting from 0 when the clock is created
+        speed - how many times faster than real time the game time runs, used in the scaled mode only
+    """
+    def __init__(self, mode: str=CLOCK_MODE_REAL_TIME, speed: float=1):
+        if mode not in (CLOCK_MODE_REAL_TIME, CLOCK_MODE_SCALED, CLOCK_MODE_INSTANT):
+            raise Exception(f'{mode} is not a valid clock mode!')
+        if mode == CLOCK_MODE_SCALED and speed <= 0:
+            raise Exception(f'The speed of a scaled clock must be positive, not {speed}!')
+        self.mode = mode
+        self.speed = speed if mode == CLOCK_MODE_SCALED else 1
+        self._started_at = time.monotonic()
+        self._virtual_time = 0.0  # the game time of an instant clock, which only pauses move forward
+
+    def __str__(self):
+        if self.mode == CLOCK_MODE_SCALED:
+            return f'{self.mode} ({self.speed:g}x) clock at {self.now():.2f}s'
+        return f'{self.mode} clock at {self.now():.2f}s'
+
+    def now(self) -> float:
+        """ :return: the game time in seconds """
+        if self.mode == CLOCK_MODE_INSTANT:
+            return self._virtual_time
+        return (time.monotonic() - self._started_at) * self.speed
+
+    def sleep(self, seconds: float):
+        """ Pause the game for the given game seconds """
+        if seconds <= 0:
+            return
+        if self.mode == CLOCK_MODE_INSTANT:
+            self._virtual_time += seconds
+        else:
+            time.sleep(seconds / self.speed)
+
+    def sleep_until(self, game_time: float):
+        """ Pause the game until the clock reaches the given game time, if it has not already """
+        self.sleep(game_time - self.now())
+
+
+class Scheduler:
+    """
+    Calls functions after a delay in game time, in the order they are due.
+    Calls which are due at the same time are made in the order they were scheduled.
+    """
+    def __init__(self, clock: GameClock=None):
+        """ :param clock: the clock to wait on, the game's clock by default """
+        self.clock = clock or get_game_clock()
+        self._scheduled_calls: [(float, int, 'function', tuple)] = []  # a heap of (due time, order, function, args)
+        self._call_order = count()
+
+    def __len__(self):
+        return len(self._scheduled_calls)
+
+    def call_later(self, delay: float, function, *args):
+        """ Call the function with the given arguments once the given game seconds have passed """
+        heapq.heappush(self._scheduled_calls, (self.clock.now() + delay, next(self._call_order), function, args))
+
+    def say_lines(self, lines: [(str, float)], delay: float=0):
+        """
+        Schedule a conversation, where every line is printed after the pause that follows the previous one
+        :param lines: A list of Tuple(1,2)
+            1 - the line to print
+            2 - the game seconds to pause for after the line
+        :param delay: the game seconds to wait for before the first line
+        """
+        for line, pause in lines:
+            self.call_later(delay, print, line)
+            delay += pause
+        self.call_later(delay, _do_nothing)  # so that running the conversation waits out the last pause as well
+
+    def run(self):
+        """ Make every scheduled call, pausing on the clock until each one is due """
+        while self._scheduled_calls:
+            due_time, _, function, args = heapq.heappop(self._scheduled_calls)
+            self.clock.sleep_until(due_time)
+            function(*args)
+
+
+def _do_nothing():
+    pass
+
+
+# the clock every pause in the game goes through unless it is given another one
+_game_clock: GameClock = None
+
+
+def get_game_clock() -> GameClock:
+    global _game_clock
+    if _game_clock is None:
+        _game_clock = GameClock()
+    return _game_clock
+
+
+def set_game_clock(game_clock: GameClock):
+    """ Replace the game's clock, ex: with an instant one for automated runs """
+    global _game_clock
+    _game_clock = game_clock
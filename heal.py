@@ -2,16 +2,26 @@
 This module will hold the Heal class in the game.
 The heal class holds information about the type of heal we have
 """
-import random
 from decorators import run_once
 from constants import (HOLY_HEAL_DOUBLE_HEAL_CHANCE as DOUBLE_HEAL_CHANCE,
                        PROTECTIVE_HEAL_ABSORB_PERCENTAGE as ABSORB_PERCENTAGE)
+from rng import get_random_service
 
 
 class Heal:
+    __slots__ = ('heal_amount',)
+
     def __init__(self, heal_amount: float=0):
         self.heal_amount = heal_amount
 
+    @classmethod
+    def batch(cls, heal_amounts: [float], **kwargs) -> ['Heal']:
+        """
+        Create a heal of this class for every heal amount
+        :param kwargs: the other arguments of the heal's class, the same for every heal (ex: target)
+        """
+        return [cls(heal_amount, **kwargs) for heal_amount in heal_amounts]
+
     def __str__(self):
         return f'{self.heal_amount:.2f}'
 
@@ -44,6 +54,8 @@ class NatureHeal(Heal):
     The idea with nature heal is that every such heal leaves off a HoT (healing over time effect)
     for a % of the main heal
     """
+    __slots__ = ()
+
     def __init__(self):
         raise NotImplementedError()
 
@@ -52,8 +64,12 @@ class HolyHeal(Heal):
     """
     The idea with holy heal is that every such heal has a significant chance to heal for double it's original amount.
     """
-    def __init__(self, heal_amount: float=0):
+    __slots__ = ('random_service', 'will_double_heal')
+
+    def __init__(self, heal_amount: float=0, random_service: 'RandomService'=None):
+        """ :param random_service: the service to roll the double heal with, the game's one by default """
         super().__init__(heal_amount)
+        self.random_service = random_service or get_random_service()
         self.will_double_heal: bool = self.check_double_heal()
 
         if self.will_double_heal:
@@ -69,14 +85,14 @@ class HolyHeal(Heal):
         """ Uses random odds to calculate if this heal should trigger it's double effect
             Chances are 30%"""
         '''
-        Generate a random float from 0.0 to ~0.9999 with random.random(), then multiply it by 100
+        Generate a random float from 0.0 to ~0.9999 from the heal_crit stream, then multiply it by 100
         and compare it to the double_heal_chance. If the double_heal_chance is bigger, the item has dropped.
 
         Example: heal chance is 30% and we roll a random float. There's a 70% chance to get a float that's bigger
         than 0.3 and a 30% chance to get a float that's smaller. We roll 0.25, multiply it by 100 = 25 and see
         that the drop chance is bigger, therefore the item should drop.
         '''
-        random_float = random.random() * 100
+        random_float = self.random_service.heal_crit.random() * 100
 
         if random_float <= DOUBLE_HEAL_CHANCE:
             # we will heal for double the amount
@@ -90,6 +106,8 @@ class ProtectiveHeal(Heal):
     The idea with protective heal is that every such heal leaves off a slight absorption shield on the target, absorbing
     a % of the original heal.
     """
+    __slots__ = ('target', 'added_shield', 'shield')
+
     def __init__(self, heal_amount: float, target):
         super().__init__(heal_amount)
         self.target = target
@@ -11,31 +11,16 @@ from constants import (CHARACTER_EQUIPMENT_BOOTS_KEY, CHARACTER_EQUIPMENT_BRACER
 
 
 def print_inventory(character: 'Character'):
-    inventory = character.inventory
     """ Prints the Character's inventory """
+    inventory = character.inventory
     print("Your inventory:")
 
     # print the gold separately so it always comes up on top
-    print(f"\t{inventory['gold']} gold")
-    for key, item_tuple in [(k, v) for k, v in inventory.items() if k != 'gold']:
-        item, item_count = item_tuple
+    print(f"\t{inventory.gold} gold")
+    for item, item_count in inventory.values():
         print(f'\t{item_count} {item}')
 
 
-def print_level_up_event(name, level, armor_inc, hp_inc, mana_inc, strength_inc, agi_inc):
-    """
-    Print information when the Character leveles up
-    """
-    print('*' * 20)
-    print(f'Character {name} has leveled up to level {level}!')
-    print(f'Armor Points increased by {armor_inc}')
-    print(f'Health Points increased by {hp_inc}')
-    print(f'Mana Points increased by {mana_inc}')
-    print(f'Strength Points increased by {strength_inc}')
-    print(f'Agility Points increased by {agi_inc}')
-    print('*' * 20)
-
-
 def print_quest_log(quest_log):
     """
     Print out the character's quest log
@@ -65,15 +50,10 @@ def print_live_monsters(zone_object: 'Zone', print_all=False):
     alive_monsters, _ = zone_object.get_cs_monsters()
 
     print("Alive monsters: ")
-    # sort them by level and print the five that are the lowest level
-    sorted_list = sorted(alive_monsters.items(), key=lambda x: x[1].level)
-    printed_monsters = 0
-    for _, monster in sorted_list:
+    # the index keeps them ordered by level, print the five that are the lowest level
+    monsters = alive_monsters.by_level() if print_all else alive_monsters.get_lowest_level(5)
+    for _, monster in monsters:
         print(monster)
-        printed_monsters += 1
-
-        if not print_all and printed_monsters == 5:  # print only five monsters at once
-            break
 
     print()
 
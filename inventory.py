@@ -0,0 +1,278 @@
+"""
+This module holds the Inventory - the items a character carries, stacked by their name, and his gold.
+
+The items can be looked up by their name or by their ID, both in O(1). Every item takes one slot for each
+INVENTORY_STACK_SIZE of it that is carried. The gold is a separate counter and is not one of the items.
+Like the TrackedDict in utils/tracked_collections.py, the inventory remembers which items have changed since it was
+last marked as clean, so that saving the character writes only those.
+
+Usage:
+    inventory = Inventory({'Wolf Meat': (wolf_meat, 3)}, gold=10)
+    inventory.add(wolf_meat, 2)
+    inventory['Wolf Meat']  # (wolf_meat, 5)
+    inventory.get_by_id(1)  # (wolf_meat, 5)
+    inventory.remove_items({'Wolf Meat': 5, 'Linen Cloth': 1})  # removes both or neither
+    Inventory.from_bytes(inventory.to_bytes(), load_item)  # the binary form, see models/characters/inventory_export.py
+"""
+import struct
+from collections.abc import MutableMapping
+
+from constants import INVENTORY_STACK_SIZE
+from exceptions import ItemNotInInventoryError, InventoryFullError
+
+GOLD_KEY = 'gold'  # the gold can still be read and set as inventory['gold'], like in the saved inventory dictionaries
+_MISSING = object()  # marks an item which was not in the inventory when it was marked as clean
+
+INVENTORY_BINARY_VERSION = 2
+# the binary form is a header of (version, gold, item count), followed by an (item ID, item count) pair for every item
+_BINARY_HEADER = struct.Struct('<BqI')  # the gold is signed, a character can be in debt
+_BINARY_ITEM = struct.Struct('<II')
+
+
+def _has_valid_id(item) -> bool:
+    """ Items which are not in item_template (ex: the starter weapon) have no valid ID to be loaded back by """
+    return isinstance(item.id, int) and item.id > 0
+
+
+class Inventory(MutableMapping):
+    """
+    A dictionary of Key: item name, Value: Tuple(1,2)
+        1 - the Item
+        2 - the count of it that is carried
+    with the gold kept in a separate counter.
+        max_slots - the count of slots the inventory has, None for no limit
+    """
+    def __init__(self, items: {str: tuple}=None, gold: int=0, stack_size: int=INVENTORY_STACK_SIZE,
+                 max_slots: int=None):
+        self._items: {str: tuple} = {}
+        self._names_by_id: {int: str} = {}  # Key: item ID, Value: the name of the item
+        self.stack_size = stack_size
+        self.max_slots = max_slots
+        self.slots_used = 0
+        self.gold = gold
+        # Key: changed item name, Value: (Item, Item Count) when marked clean (or _MISSING)
+        self._original_values: {str: tuple} = {}
+        for item_name, item_and_count in dict(items or {}).items():
+            self[item_name] = item_and_count  # the gold of a saved inventory dictionary goes to the counter as well
+        self.mark_clean()
+
+    def _get_slot_count(self, item_count: int) -> int:
+        return -(-item_count // self.stack_size)
+
+    def __getitem__(self, item_name: str) -> tuple:
+        if item_name == GOLD_KEY:
+            return self.gold
+        return self._items[item_name]
+
+    def __setitem__(self, item_name: str, item_and_count: tuple):
+        """ Set the count of the item, replacing the one that was in the inventory """
+        if item_name == GOLD_KEY:
+            self.gold = item_and_count
+            return
+
+        item, item_count = item_and_count
+        if item_count <= 0:
+            if item_name in self._items:
+                del self[item_name]
+            return
+
+        old_value = self._items.get(item_name)
+        old_slots = 0 if old_value is None else self._get_slot_count(old_value[1])
+        slots_used = self.slots_used - old_slots + self._get_slot_count(item_count)
+        if self.max_slots is not None and slots_used > self.max_slots and slots_used > self.slots_used:
+            raise InventoryFullError(f'There is no space for {item_count} {item_name} in the inventory!',
+                                     item_name=item_name)
+
+        self._track(item_name)
+        if old_value is not None and old_value[0].id != item.id:
+            self._unindex_id(old_value[0], item_name)
+        self._items[item_name] = item, item_count
+        self._names_by_id[item.id] = item_name
+        self.slots_used = slots_used
+
+    def __delitem__(self, item_name: str):
+        item, item_count = self._items[item_name]
+        self._track(item_name)
+        del self._items[item_name]
+        self._unindex_id(item, item_name)
+        self.slots_used -= self._get_slot_count(item_count)
+
+    def _unindex_id(self, item, item_name: str):
+        # items without an ID (ex: the starter weapon) can share it, only drop the ID if it still points to this one
+        if self._names_by_id.get(item.id) == item_name:
+            del self._names_by_id[item.id]
+
+    def __contains__(self, item_name) -> bool:
+        return item_name in self._items
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    # the views of the items, without going through __getitem__ for every one of them
+    def keys(self):
+        return self._items.keys()
+
+    def values(self):
+        return self._items.values()
+
+    def items(self):
+        return self._items.items()
+
+    def __eq__(self, other):
+        if isinstance(other, Inventory):
+            return self.gold == other.gold and self._items == other._items
+        return super().__eq__(other)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._items!r}, gold={self.gold})'
+
+    def get_count(self, item_name: str) -> int:
+        """ :return: the count of the item that is carried, 0 if it is not in the inventory """
+        item_and_count = self._items.get(item_name)
+        return 0 if item_and_count is None else item_and_count[1]
+
+    def get_item(self, item_name: str) -> 'Item' or None:
+        """ :return: the Item with the given name, None if it is not in the inventory """
+        item_and_count = self._items.get(item_name)
+        return None if item_and_count is None else item_and_count[0]
+
+    def get_by_id(self, item_id: int) -> tuple or None:
+        """ :return: the (Item, Item Count) tuple of the item with the given ID, None if it is not in the inventory """
+        item_name = self._names_by_id.get(item_id)
+        return None if item_name is None else self._items[item_name]
+
+    def add(self, item: 'Item', item_count: int=1) -> int:
+        """
+        Add the items to the stack of their name
+        :return: the count of the item in the inventory after the addition
+        """
+        item_count += self.get_count(item.name)
+        self[item.name] = item, item_count
+        return item_count
+
+    def remove(self, item_name: str, item_count: int=1, remove_all: bool=False) -> int:
+        """
+        Remove the items from the stack of their name. Removing more than there are removes the whole stack
+        :param remove_all: simply removes all the items, with this variable set to True, item_count is useless
+        :return: the count of the item left in the inventory
+        """
+        if item_name not in self._items:
+            raise ItemNotInInventoryError(f'{item_name} is not in the inventory!', inventory=self, item_name=item_name)
+
+        item, count_in_inventory = self._items[item_name]
+        resulting_count = 0 if remove_all else count_in_inventory - item_count
+        if resulting_count <= 0:
+            del self[item_name]
+            return 0
+
+        # only the count of the stack changes, which never needs more slots
+        if item_name not in self._original_values:
+            self._original_values[item_name] = self._items[item_name]
+        self._items[item_name] = item, resulting_count
+        self.slots_used -= self._get_slot_count(count_in_inventory) - self._get_slot_count(resulting_count)
+        return resulting_count
+
+    def add_items(self, items_and_counts):
+        """
+        Add every (Item, Item Count) tuple. If they do not all fit in the inventory, none of them are added
+        """
+        items_and_counts = list(items_and_counts)
+        if self.max_slots is not None:
+            added_counts = {}
+            for item, item_count in items_and_counts:
+                added_counts[item.name] = added_counts.get(item.name, 0) + item_count
+            slots_used = self.slots_used + sum(self._get_slot_count(self.get_count(item_name) + item_count)
+                                               - self._get_slot_count(self.get_count(item_name))
+                                               for item_name, item_count in added_counts.items())
+            if slots_used > self.max_slots:
+                raise InventoryFullError(f'There is no space for {len(added_counts)} items in the inventory!',
+                                         item_name=next(iter(added_counts), None))
+
+        for item, item_count in items_and_counts:
+            self.add(item, item_count)
+
+    def remove_items(self, item_counts: {str: int}):
+        """
+        Remove the given count of every item. If one of them is not in the inventory, none of them are removed
+        :param item_counts: A dictionary, Key: item name, Value: the count to remove
+        """
+        for item_name in item_counts:
+            if item_name not in self._items:
+                raise ItemNotInInventoryError(f'{item_name} is not in the inventory!', inventory=self,
+                                              item_name=item_name)
+
+        for item_name, item_count in item_counts.items():
+            self.remove(item_name, item_count)
+
+    # change tracking, see TrackedDict in utils/tracked_collections.py
+    def _track(self, item_name: str):
+        if item_name not in self._original_values:
+            self._original_values[item_name] = self._items.get(item_name, _MISSING)
+
+    @property
+    def is_dirty(self) -> bool:
+        return self.gold != self._original_gold or bool(self.get_changes())
+
+    def mark_clean(self):
+        self._original_values = {}
+        self._original_gold = self.gold
+
+    def get_changes(self) -> {str: tuple}:
+        """
+        :return: A dictionary of the items changed since the inventory was marked as clean.
+            Key: the item's name, Value: Tuple(1,2)
+            1 - the (Item, Item Count) the item had when the inventory was marked as clean, None if it was missing
+            2 - the current (Item, Item Count) of the item, None if it was removed
+        Items which were changed back to their original count are skipped. The gold is not one of the changes.
+        """
+        changes = {}
+        for item_name, original_value in self._original_values.items():
+            current_value = self._items.get(item_name, _MISSING)
+            if current_value is original_value:
+                continue
+            if original_value is not _MISSING and current_value is not _MISSING and current_value == original_value:
+                continue
+            changes[item_name] = (None if original_value is _MISSING else original_value,
+                                  None if current_value is _MISSING else current_value)
+
+        return changes
+
+    # binary form
+    def to_bytes(self) -> bytes:
+        """
+        :return: the gold and the (item ID, item count) of every item, packed in a compact binary form.
+            The form holds nothing but the IDs and counts, so the items are loaded back from item_template
+        """
+        invalid_item_names = [item_name for item_name, (item, _) in self._items.items() if not _has_valid_id(item)]
+        if invalid_item_names:
+            raise Exception(f'{", ".join(invalid_item_names)} can not be saved in the binary form of the inventory, '
+                            f'since they have no item ID!')
+
+        id_counts = [value for item, item_count in self._items.values() for value in (item.id, item_count)]
+        try:
+            return (_BINARY_HEADER.pack(INVENTORY_BINARY_VERSION, self.gold, len(self._items))
+                    + struct.pack(f'<{len(id_counts)}I', *id_counts))
+        except struct.error as error:
+            raise Exception(f'The inventory does not fit in its binary form ({error})!')
+
+    @classmethod
+    def from_bytes(cls, data: bytes, load_item, **kwargs) -> 'Inventory':
+        """
+        :param data: an inventory in the binary form of to_bytes
+        :param load_item: a function which returns the Item for the given item ID, ex: models/items/loader.py
+        """
+        version, gold, item_count = _BINARY_HEADER.unpack_from(data)
+        if version != INVENTORY_BINARY_VERSION:
+            raise Exception(f'Version {version} of the binary inventory form is not supported!')
+        items_data = data[_BINARY_HEADER.size:]
+        if len(items_data) != item_count * _BINARY_ITEM.size:
+            raise Exception(f'The binary inventory form should hold {item_count} items, '
+                            f'but it is {len(items_data)} bytes long!')
+
+        inventory = cls(gold=gold, **kwargs)
+        inventory.add_items((load_item(item_id), count) for item_id, count in _BINARY_ITEM.iter_unpack(items_data))
+        inventory.mark_clean()
+        return inventory
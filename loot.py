@@ -0,0 +1,68 @@
+"""
+This module holds the in-memory representation of a loot table, which decides what drops off a monster.
+"""
+import numpy
+
+from rng import get_random_service
+
+
+class LootTable:
+    """
+    The items that can drop from a creature, stored in columns - one array holding the item IDs and one holding
+    their drop chance, where the same index in both arrays points to the same item.
+    This way the drops for one kill (or for thousands of simulated kills) are decided in a single vectorized pass,
+    no matter how many items the loot table holds.
+
+        entry - the entry of the loot table in the loot_table table
+        item_ids - an array of the IDs of the items
+        chances - an array of the chance in percentage (0-100%) for each item to drop
+        item_templates - the ItemTemplateSchema for each item, used to build the dropped Item objects
+    """
+    def __init__(self, entry: int, item_templates: ['ItemTemplateSchema'], chances: [int]):
+        self.entry = entry
+        self.item_templates = tuple(item_templates)
+        self.item_ids = numpy.array([item_template.entry for item_template in self.item_templates], dtype=numpy.int64)
+        self.chances = numpy.array(chances, dtype=numpy.float64)
+
+    def __len__(self):
+        return len(self.item_templates)
+
+    def roll_drops(self, kill_count: int=1, random_generator: numpy.random.Generator=None) -> numpy.ndarray:
+        """
+        Roll the dice for every item on every kill at once.
+
+        A random float from 0.0 to ~0.9999 is generated for each item and multiplied by 100,
+        if the item's drop chance is bigger or equal to it, the item has dropped.
+        Example: drop chance is 30% - there's a 30% chance to roll a float that's smaller than 0.3 and a
+            70% chance to roll one that's bigger. If we roll 0.25, multiplied by 100 = 25, the item drops.
+
+        :param kill_count: the count of kills to roll the loot for
+        :param random_generator: the generator to roll with - a numpy Generator or a RandomStream,
+                                 the loot stream of the game's RandomService by default
+        :return: A 2D boolean array of shape (kill_count, item count), where [kill][item] is True if
+                 the item has dropped on that kill
+        """
+        random_generator = random_generator or get_random_service().loot
+        rolls = random_generator.random((kill_count, len(self.item_templates))) * 100
+
+        return self.chances >= rolls
+
+    def count_drops(self, kill_count: int, random_generator: numpy.random.Generator=None) -> {int: int}:
+        """
+        Simulate the given count of kills.
+        :return: A dictionary Key: item ID, Value: the count of times the item dropped
+        """
+        drop_counts = self.roll_drops(kill_count, random_generator).sum(axis=0)
+
+        return {int(item_id): int(drop_count) for item_id, drop_count in zip(self.item_ids, drop_counts)}
+
+    def decide_drops(self, random_generator: numpy.random.Generator=None) -> ['Item']:
+        """
+        Roll the loot of a single kill
+        :return: A list of the Item objects that have dropped
+        """
+        if not self.item_templates:
+            return []
+        dropped_indices = numpy.flatnonzero(self.roll_drops(1, random_generator)[0])
+
+        return [self.item_templates[index].convert_to_item_object() for index in dropped_indices]
@@ -6,6 +6,7 @@ from information_printer import print_live_monsters, print_live_npcs, welcome_pr
 from zones.zone import Zone
 from items import Weapon
 from models.characters.saver import save_character
+from models.characters.journal import open_progress_journal
 from start_game_prompt import get_player_character
 from zones.northshire_abbey import NorthshireAbbey
 GAME_VERSION = '0.1.0 ALPHA'
@@ -15,6 +16,7 @@ ZONES = {"Northshire Abbey": None}
 def main():
     welcome_print(GAME_VERSION)
     main_character = get_player_character()
+    open_progress_journal(main_character)  # replays the progress a crash might have left unsaved
     atexit.register(on_exit_handler, main_character)
     ZONES["Northshire Abbey"] = NorthshireAbbey(main_character)
     starter_weapon = Weapon(name="Starter Weapon", item_id=0, min_damage=1, max_damage=3)
@@ -45,6 +47,7 @@ def get_zone_object(zone: str) -> Zone:
 def on_exit_handler(character):
     """ saves the character when the user quits the game"""
     save_character(character)
+    character.journal.close()
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,74 @@
+"""
+This module exports the inventory of a saved character into a file, in the compact binary form of
+Inventory.to_bytes, and imports it back into a saved character (ex: the same character in another database).
+Importing replaces the character's saved items and gold, so the character should not be played while it is done.
+
+Usage:
+    python -m models.characters.inventory_export export Netherblood netherblood.inventory
+    python -m models.characters.inventory_export import Netherblood netherblood.inventory
+"""
+import argparse
+
+from database.main import session
+from models import main as _  # load all the DB models
+from exceptions import NoSuchCharacterError
+from inventory import Inventory
+from models.characters.saved_character import SavedCharacterSchema
+from models.characters.saver import save_inventory
+
+
+def _get_saved_character(character_name: str) -> SavedCharacterSchema:
+    character_info = session.query(SavedCharacterSchema).filter_by(name=character_name).one_or_none()
+    if character_info is None:
+        raise NoSuchCharacterError(f'There is no saved character by the name of {character_name}!')
+
+    return character_info
+
+
+def export_inventory(character_name: str, path: str) -> int:
+    """
+    Write the saved inventory (and gold) of the character into the file
+    :return: the count of bytes written
+    """
+    data: bytes = _get_saved_character(character_name).build_inventory().to_bytes()
+    with open(path, 'wb') as inventory_file:
+        inventory_file.write(data)
+
+    return len(data)
+
+
+def import_inventory(character_name: str, path: str) -> Inventory:
+    """
+    Replace the saved inventory (and gold) of the character with the one exported into the file
+    :return: the imported Inventory
+    """
+    from models.items.loader import load_item
+
+    character_info = _get_saved_character(character_name)
+    with open(path, 'rb') as inventory_file:
+        inventory = Inventory.from_bytes(inventory_file.read(), load_item)
+
+    save_inventory(character_info.entry, inventory)
+    session.query(SavedCharacterSchema).filter_by(entry=character_info.entry).update({'gold': inventory.gold})
+    session.commit()
+
+    return inventory
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export or import the inventory of a saved character.')
+    parser.add_argument('action', choices=('export', 'import'))
+    parser.add_argument('character_name')
+    parser.add_argument('path', help='the file holding the exported inventory')
+    args = parser.parse_args()
+
+    if args.action == 'export':
+        byte_count = export_inventory(args.character_name, args.path)
+        print(f'Exported the inventory of {args.character_name} into {args.path} ({byte_count} bytes).')
+    else:
+        inventory = import_inventory(args.character_name, args.path)
+        print(f'Imported {len(inventory)} items and {inventory.gold} gold into {args.character_name}.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,243 @@
+"""
+This module holds the progress journal of a character - an append-only file of the progress events
+(killed monster, looted item, gold change, completed quest and so on) since the character was last saved.
+
+Writing an event is a single appended JSON line, which makes it cheap enough to be done on every change,
+as opposed to saving the whole character. The file is fsync-ed every JOURNAL_SYNC_EVERY_EVENTS events, so a crash
+loses at most that many events.
+
+Every JOURNAL_COMPACT_EVERY_EVENTS events the journal is compacted - the written events are moved into a separate
+file, which a background thread folds into the saved_character* tables and then deletes.
+On startup, whatever is left in the journal files is replayed on top of the saved character and saved.
+
+Journal file sample contents:
+    {"event": "kill", "guid": 14}
+    {"event": "item", "item_id": 1, "name": "Wolf Meat", "count": 3}
+    {"event": "gold", "gold": 61}
+"""
+import json
+import os
+import threading
+
+import database.main
+from constants import JOURNAL_SYNC_EVERY_EVENTS, JOURNAL_COMPACT_EVERY_EVENTS
+from database.snapshot import get_current_database_path
+from models.characters.saved_character import (SavedCharacterSchema, KilledMonstersSchema, CompletedQuestsSchema,
+                                               LoadedScriptsSchema, InventorySchema)
+
+JOURNAL_FILE_EXTENSION = '.journal'
+COMPACTING_FILE_EXTENSION = '.compacting'
+
+
+class ProgressJournal:
+    """
+    The progress journal of a single character.
+        path - the path to the journal file
+        compacting_path - the path to the file holding the events which are being folded into the DB
+    """
+    def __init__(self, character, path: str, sync_every: int=JOURNAL_SYNC_EVERY_EVENTS,
+                 compact_every: int=JOURNAL_COMPACT_EVERY_EVENTS):
+        self.character = character
+        self.path = path
+        self.compacting_path = path + COMPACTING_FILE_EXTENSION
+        self.sync_every = sync_every
+        self.compact_every = compact_every
+        self.event_count = len(read_events(path))  # the count of events in the journal file
+        self._unsynced_count = 0
+        self._file = open(path, 'a', encoding='utf-8')
+        self._compaction_thread: threading.Thread = None
+
+    def record(self, event: str, **event_data):
+        """ Append an event to the journal """
+        event_data['event'] = event
+        self._file.write(json.dumps(event_data) + '\n')
+        self.event_count += 1
+        self._unsynced_count += 1
+
+        if self._unsynced_count >= self.sync_every:
+            self.sync()
+        if self.event_count >= self.compact_every:
+            self.compact()
+
+    def sync(self):
+        """ Make sure that every recorded event is on the disk """
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced_count = 0
+
+    def compact(self):
+        """
+        Move the recorded events into the compacting file and start folding them into the DB in the background.
+        A character which has never been saved has no rows to fold into, so its events stay in the journal
+        until the first save.
+        """
+        character_entry = self.character.saved_character_entry
+        if character_entry is None or self.is_compacting() or os.path.exists(self.compacting_path):
+            return
+
+        self.sync()
+        self._file.close()
+        os.replace(self.path, self.compacting_path)
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self.event_count = 0
+
+        # the compacted events are going to be in the DB, so the next save does not need to write them again
+        self.character.mark_saved(character_entry)
+        self._compaction_thread = threading.Thread(target=self._fold_compacting_file, args=(character_entry,),
+                                                   name=f'{self.character.name} journal compaction')
+        self._compaction_thread.start()
+
+    def is_compacting(self) -> bool:
+        return self._compaction_thread is not None and self._compaction_thread.is_alive()
+
+    def wait_for_compaction(self):
+        if self._compaction_thread is not None:
+            self._compaction_thread.join()
+            self._compaction_thread = None
+
+    def clear(self):
+        """ Called after the character is saved, at which point every event in the journal is in the DB """
+        self.wait_for_compaction()
+        self._file.truncate(0)
+        self.event_count = 0
+        self._unsynced_count = 0
+        if os.path.exists(self.compacting_path):
+            os.remove(self.compacting_path)
+
+    def close(self):
+        self.wait_for_compaction()
+        self.sync()
+        self._file.close()
+
+    def _fold_compacting_file(self, character_entry: int):
+        """ Runs on the compaction thread, with its own DB session """
+        db_session = database.main.Session()
+        try:
+            fold_events(character_entry, read_events(self.compacting_path), db_session)
+            db_session.commit()
+            os.remove(self.compacting_path)
+        except Exception:
+            db_session.rollback()
+            # the events were not saved, forget about the character being in sync with the DB so that
+            # the next save rewrites everything. The compacting file is replayed on the next startup otherwise
+            self.character.saved_character_entry = None
+        finally:
+            db_session.close()
+
+
+def get_journal_path(character_name: str) -> str:
+    """ The journal lives next to the database. ex: Netherblood => database/Netherblood.journal """
+    return os.path.join(os.path.dirname(get_current_database_path()), character_name + JOURNAL_FILE_EXTENSION)
+
+
+def read_events(path: str) -> [dict]:
+    """
+    Read every event in the journal file. If the game crashed while writing an event,
+    the last line is incomplete and gets skipped.
+    """
+    events = []
+    try:
+        with open(path, 'r', encoding='utf-8') as journal_file:
+            for line in journal_file:
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    break
+    except FileNotFoundError:
+        pass
+
+    return events
+
+
+def open_progress_journal(character) -> ProgressJournal:
+    """
+    Replay whatever is left in the character's journal files from the last session on top of the character,
+    save it and attach a new journal to it.
+    """
+    from models.characters.saver import save_character
+
+    journal_path = get_journal_path(character.name)
+    leftover_events = read_events(journal_path + COMPACTING_FILE_EXTENSION) + read_events(journal_path)
+    for event in leftover_events:
+        replay_event(character, event)
+
+    character.journal = ProgressJournal(character, journal_path)
+    if leftover_events:
+        save_character(character)  # clears the journal
+
+    return character.journal
+
+
+def replay_event(character, event: dict):
+    """ Apply a journal event to the character, without recording it again """
+    from models.items.loader import load_item
+    event_type = event['event']
+
+    if event_type == 'kill':
+        character.killed_monsters.add(event['guid'])
+    elif event_type == 'script':
+        character.loaded_scripts.add(event['script_name'])
+    elif event_type == 'quest_completed':
+        character.completed_quests.add(event['quest_id'])
+    elif event_type == 'gold':
+        character.inventory.gold = event['gold']
+    elif event_type == 'item':
+        if event['count'] > 0:
+            character.inventory[event['name']] = (load_item(event['item_id']), event['count'])
+        else:
+            character.inventory.pop(event['name'], None)
+    elif event_type == 'equip':
+        equipped_item = character.equipment.get(event['slot'])
+        item = load_item(event['item_id'])
+        with character._stat_changes():
+            if equipped_item is not None:
+                character._subtract_attributes(equipped_item.attributes)
+            character.equipment[event['slot']] = item
+            character._add_attributes(item.attributes)
+    elif event_type == 'experience':
+        if event['level'] > character.level:
+            character._level_up(to_level=event['level'], to_print=False)
+        character.experience = event['experience']
+    # quest_accepted events are not replayed, as the quest log is not saved - the quest giver offers it again
+
+
+def fold_events(character_entry: int, events: [dict], db_session):
+    """
+    Write the final state the events lead to into the saved_character* tables of the character.
+    Every event describes a state rather than a change (ex: the new item count), so folding is idempotent.
+    """
+    from models.characters.saver import insert_rows, delete_rows, insert_inventory_counts
+
+    killed_monsters, loaded_scripts, completed_quests = set(), set(), set()
+    item_counts: {int: int} = {}
+    character_values: {str: int} = {}
+    for event in events:
+        event_type = event['event']
+        if event_type == 'kill':
+            killed_monsters.add(event['guid'])
+        elif event_type == 'script':
+            loaded_scripts.add(event['script_name'])
+        elif event_type == 'quest_completed':
+            completed_quests.add(event['quest_id'])
+        elif event_type == 'gold':
+            character_values['gold'] = event['gold']
+        elif event_type == 'item':
+            item_counts[event['item_id']] = event['count']
+        elif event_type == 'equip':
+            character_values[event['slot'] + '_id'] = event['item_id']
+        elif event_type == 'experience':
+            character_values['level'] = event['level']
+
+    for table_schema, column_name, values in ((KilledMonstersSchema, 'guid', killed_monsters),
+                                              (LoadedScriptsSchema, 'script_name', loaded_scripts),
+                                              (CompletedQuestsSchema, 'quest_id', completed_quests)):
+        # delete first so that a value which was already saved does not get a second row
+        delete_rows(table_schema, character_entry, column_name, values, db_session=db_session)
+        insert_rows(table_schema, character_entry, column_name, values, db_session=db_session)
+
+    delete_rows(InventorySchema, character_entry, 'item_id', item_counts.keys(), db_session=db_session)
+    insert_inventory_counts(character_entry, {item_id: count for item_id, count in item_counts.items() if count > 0},
+                            db_session=db_session)
+
+    if character_values:
+        db_session.query(SavedCharacterSchema).filter_by(entry=character_entry).update(character_values)
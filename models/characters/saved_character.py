@@ -3,6 +3,7 @@ from sqlalchemy.orm import relationship
 
 from models.items.item_template import ItemTemplateSchema
 from entities import Character
+from inventory import Inventory
 from constants import (CHARACTER_EQUIPMENT_BOOTS_KEY, CHARACTER_EQUIPMENT_LEGGINGS_KEY,
                        CHARACTER_EQUIPMENT_BELT_KEY, CHARACTER_EQUIPMENT_GLOVES_KEY,
                        CHARACTER_EQUIPMENT_BRACER_KEY,
@@ -90,28 +91,34 @@ class SavedCharacterSchema(Base):
 
         return saved_equipment
 
+    def build_inventory(self) -> Inventory:
+        """ Create the character's Inventory out of his saved_character_inventory rows and his gold """
+        return Inventory({i_schema.item.name: (i_schema.item.convert_to_item_object(), i_schema.item_count)
+                          for i_schema in self.inventory}, gold=self.gold)
+
     def convert_to_character_object(self) -> Character:
         """ Convert the SavedCharacter object to a Character object to be used in the game"""
         loaded_scripts: {str} = {script.script_name for script in self.loaded_scripts}
         killed_monsters: {int} = {monster.guid for monster in self.killed_monsters}
         completed_quests: {str} = {quest.quest_id for quest in self.completed_quests}
-        inventory: {str: tuple} = {i_schema.item.name: (i_schema.item.convert_to_item_object(), i_schema.item_count)
-                                   for i_schema in self.inventory}
-        inventory['gold'] = self.gold
+        inventory: Inventory = self.build_inventory()
         equipment = self.build_equipment()
         print(equipment)
 
         if self.character_class == 'paladin':
-            return Paladin(name=self.name,
-                           level=self.level,
-                           loaded_scripts=loaded_scripts,
-                           killed_monsters=killed_monsters,
-                           completed_quests=completed_quests,
-                           saved_inventory=inventory,
-                           saved_equipment=equipment)
+            character = Paladin(name=self.name,
+                                level=self.level,
+                                loaded_scripts=loaded_scripts,
+                                killed_monsters=killed_monsters,
+                                completed_quests=completed_quests,
+                                saved_inventory=inventory,
+                                saved_equipment=equipment)
         else:
             raise Exception(f'Unsupported class - {self.character_class}')
 
+        character.mark_saved(self.entry)  # the character's progress is exactly what is in the DB
+        return character
+
 
 class CompletedQuestsSchema(Base):
     """
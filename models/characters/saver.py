@@ -1,18 +1,18 @@
 """
 This module takes care for saving a character to the database
 """
-from sqlalchemy.sql.functions import coalesce, max as max_table_id
-
 from entities import Character
 from database.database_info import (DB_SC_COMPLETED_QUESTS_TABLE_NAME, DB_SC_INVENTORY_TABLE_NAME,
                                     DB_SC_LOADED_SCRIPTS_TABLE_NAME, DB_SC_KILLED_MONSTERS_TABLE_NAME)
 from constants import (CHARACTER_EQUIPMENT_BELT_KEY, CHARACTER_EQUIPMENT_BOOTS_KEY,
                        CHARACTER_EQUIPMENT_CHESTGUARD_KEY, CHARACTER_EQUIPMENT_SHOULDERPAD_KEY,
                        CHARACTER_EQUIPMENT_HEADPIECE_KEY, CHARACTER_EQUIPMENT_NECKLACE_KEY,
-                       CHARACTER_EQUIPMENT_BRACER_KEY, CHARACTER_EQUIPMENT_GLOVES_KEY, CHARACTER_EQUIPMENT_LEGGINGS_KEY)
+                       CHARACTER_EQUIPMENT_BRACER_KEY, CHARACTER_EQUIPMENT_GLOVES_KEY, CHARACTER_EQUIPMENT_LEGGINGS_KEY,
+                       SAVE_DELETE_CHUNK_SIZE)
 from items import Item
+from inventory import Inventory
+from utils.tracked_collections import TrackedSet
 from database.main import session
-from models.characters.saved_character import SavedCharacterSchema
 from models.characters.saved_character import CompletedQuestsSchema, SavedCharacterSchema, InventorySchema, LoadedScriptsSchema, KilledMonstersSchema
 
 ALLOWED_TABLES_TO_DELETE_FROM = {DB_SC_COMPLETED_QUESTS_TABLE_NAME: CompletedQuestsSchema,
@@ -23,50 +23,69 @@ ALLOWED_TABLES_TO_DELETE_FROM = {DB_SC_COMPLETED_QUESTS_TABLE_NAME: CompletedQue
 
 def save_character(character: Character):
     """
-    Save the character into the database
+    Save the character into the database, in a single transaction.
+    If the character was loaded from (or last saved to) the same saved_character row, only what has changed since
+    then is written - the added/removed killed monsters, completed quests, loaded scripts and inventory items.
+    Otherwise, every sub-table is rewritten from scratch.
+    Since the save includes everything in the character's progress journal, the journal gets cleared afterwards.
     """
-    character_info: SavedCharacterSchema = session.query(SavedCharacterSchema).filter_by(name=character.name).one_or_none()
-
-    character_level: int = character.level  # type: int
-    character_class: str = character.get_class()  # type: str
-    character_gold: int = character.inventory['gold']  # type: int
-    equipment: {str: int} = character.equipment
-    headpiece_id: int = get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_HEADPIECE_KEY])
-    shoulderpad_id: int = get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_SHOULDERPAD_KEY])
-    necklace_id: int = get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_NECKLACE_KEY])
-    chestguard_id: int = get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_CHESTGUARD_KEY])
-    bracer_id: int = get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_BRACER_KEY])
-    gloves_id: int = get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_GLOVES_KEY])
-    belt_id: int = get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_BELT_KEY])
-    leggings_id: int = get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_LEGGINGS_KEY])
-    boots_id: int = get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_BOOTS_KEY])
-
-    character_values: {str: int or str} = {
-        'name': character.name, 'character_class': character_class, 'level': character_level, 'gold': character_gold,
-        'headpiece_id': headpiece_id, 'shoulderpad_id': shoulderpad_id, 'necklace_id': necklace_id,
-        'chestguard_id': chestguard_id, 'belt_id': belt_id, 'bracer_id': bracer_id, 'gloves_id': gloves_id,
-        'leggings_id': leggings_id, 'boots_id': boots_id}
-
-    # if the character exists, update the row, otherwise create a new one
-    if character_info:
-        session.query(SavedCharacterSchema).filter_by(name=character.name).update(character_values)
-    else:
-        session.add(SavedCharacterSchema(**character_values))
-    session.commit()
+    if character.journal is not None:
+        character.journal.wait_for_compaction()  # do not let an older compaction overwrite this save
+    # the journal compaction might have changed the row, so do not trust an already loaded one
+    character_info: SavedCharacterSchema = (session.query(SavedCharacterSchema).populate_existing()
+                                            .filter_by(name=character.name).one_or_none())
+    character_values: {str: int or str} = get_character_values(character)
+
+    if character_info is None:
+        character_info = SavedCharacterSchema(**character_values)
+        session.add(character_info)
+        session.flush()  # get the entry of the new row
+    elif any(getattr(character_info, column) != value for column, value in character_values.items()):
+        # only update the row if the level, gold or equipment has changed
+        session.query(SavedCharacterSchema).filter_by(entry=character_info.entry).update(character_values)
+    char_entry: int = character_info.entry
 
     # save the sub-tables
-    char_entry = session.query(SavedCharacterSchema).filter_by(name=character.name).first().entry
-    save_loaded_scripts(char_entry, character.loaded_scripts)
-    save_killed_monsters(char_entry, character.killed_monsters)
-    save_completed_quests(char_entry, character.completed_quests)
-    save_inventory(char_entry, character.inventory)
+    if character.saved_character_entry == char_entry:
+        save_loaded_scripts_delta(char_entry, character.loaded_scripts)
+        save_killed_monsters_delta(char_entry, character.killed_monsters)
+        save_completed_quests_delta(char_entry, character.completed_quests)
+        save_inventory_delta(char_entry, character.inventory)
+    else:
+        save_loaded_scripts(char_entry, character.loaded_scripts)
+        save_killed_monsters(char_entry, character.killed_monsters)
+        save_completed_quests(char_entry, character.completed_quests)
+        save_inventory(char_entry, character.inventory)
 
     session.commit()
+    character.mark_saved(char_entry)
+    if character.journal is not None:
+        character.journal.clear()
     print("-" * 40)
     print(f'Character {character.name} was saved successfully!')
     print("-" * 40)
 
 
+def get_character_values(character: Character) -> {str: int or str}:
+    """
+    :return: A dictionary holding the values of the character's saved_character row. Key: column, Value: value
+    """
+    equipment: {str: int} = character.equipment
+
+    return {
+        'name': character.name, 'character_class': character.get_class(), 'level': character.level,
+        'gold': character.inventory.gold,
+        'headpiece_id': get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_HEADPIECE_KEY]),
+        'shoulderpad_id': get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_SHOULDERPAD_KEY]),
+        'necklace_id': get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_NECKLACE_KEY]),
+        'chestguard_id': get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_CHESTGUARD_KEY]),
+        'belt_id': get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_BELT_KEY]),
+        'bracer_id': get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_BRACER_KEY]),
+        'gloves_id': get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_GLOVES_KEY]),
+        'leggings_id': get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_LEGGINGS_KEY]),
+        'boots_id': get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_BOOTS_KEY])}
+
+
 def save_loaded_scripts(char_id: int, loaded_scripts: set):
     """
     This function saves the character's loaded scripts into the saved_character_loaded_scripts DB table
@@ -79,13 +98,7 @@ def save_loaded_scripts(char_id: int, loaded_scripts: set):
     """
 
     delete_rows_from_table(table_name=DB_SC_LOADED_SCRIPTS_TABLE_NAME, char_id=char_id)  # delete the old values first
-
-    for loaded_script in loaded_scripts:
-        script_to_save = LoadedScriptsSchema()
-        script_to_save.saved_character_id = char_id
-        script_to_save.script_name = loaded_script
-
-        session.add(script_to_save)
+    insert_rows(LoadedScriptsSchema, char_id, 'script_name', loaded_scripts)
 
 
 def save_killed_monsters(char_id: int, killed_monsters: set):
@@ -102,13 +115,7 @@ def save_killed_monsters(char_id: int, killed_monsters: set):
     """
 
     delete_rows_from_table(table_name=DB_SC_KILLED_MONSTERS_TABLE_NAME, char_id=char_id)  # delete the old values first
-
-    for monster_guid in killed_monsters:
-        k_monster_to_save = KilledMonstersSchema()
-        k_monster_to_save.saved_character_id = char_id
-        k_monster_to_save.guid = monster_guid
-
-        session.add(k_monster_to_save)
+    insert_rows(KilledMonstersSchema, char_id, 'guid', killed_monsters)
 
 
 def save_completed_quests(char_id: int, completed_quests: set):
@@ -124,16 +131,10 @@ def save_completed_quests(char_id: int, completed_quests: set):
     """
 
     delete_rows_from_table(table_name=DB_SC_COMPLETED_QUESTS_TABLE_NAME, char_id=char_id)  # delete the old values first
-
-    for quest_id in completed_quests:
-        c_quest_to_save = CompletedQuestsSchema()
-        c_quest_to_save.saved_character_id = char_id
-        c_quest_to_save.quest_id = quest_id
-
-        session.add(c_quest_to_save)
+    insert_rows(CompletedQuestsSchema, char_id, 'quest_id', completed_quests)
 
 
-def save_inventory(char_id: int, inventory: dict):
+def save_inventory(char_id: int, inventory: Inventory):
     """
     This function saves the character's inventory into the saved_character_inventory DB table
     Table sample contents:
@@ -143,22 +144,95 @@ def save_inventory(char_id: int, inventory: dict):
      Meaning the character has 5 Wolf Meats in his inventory
 
     :param char_id: The id of the character this inventory is associated with
-    :param inventory: A dictionary, Key: item_name, Value: tuple(Item class instance, Item Count)
+    :param inventory: An Inventory, Key: item_name, Value: tuple(Item class instance, Item Count).
+                      The gold is saved in the saved_character table
     """
 
     delete_rows_from_table(table_name=DB_SC_INVENTORY_TABLE_NAME, char_id=char_id)  # delete the old values first
+    _insert_inventory_rows(char_id, inventory.values())
+
+
+def save_loaded_scripts_delta(char_id: int, loaded_scripts: TrackedSet):
+    """
+    Save only the scripts that were loaded/forgotten since the character was last saved
+    into the saved_character_loaded_scripts DB table
+    """
+    delete_rows(LoadedScriptsSchema, char_id, 'script_name', loaded_scripts.removed)
+    insert_rows(LoadedScriptsSchema, char_id, 'script_name', loaded_scripts.added)
+
 
-    for item_name in inventory.keys():
-        if item_name != 'gold':
-            item_id = inventory[item_name][0].id  # get the instance of Item's ID
-            item_count = inventory[item_name][1]
+def save_killed_monsters_delta(char_id: int, killed_monsters: TrackedSet):
+    """
+    Save only the monsters that were killed since the character was last saved
+    into the saved_character_killed_monsters DB table
+    """
+    delete_rows(KilledMonstersSchema, char_id, 'guid', killed_monsters.removed)
+    insert_rows(KilledMonstersSchema, char_id, 'guid', killed_monsters.added)
+
+
+def save_completed_quests_delta(char_id: int, completed_quests: TrackedSet):
+    """
+    Save only the quests that were completed since the character was last saved
+    into the saved_character_completed_quests DB table
+    """
+    delete_rows(CompletedQuestsSchema, char_id, 'quest_id', completed_quests.removed)
+    insert_rows(CompletedQuestsSchema, char_id, 'quest_id', completed_quests.added)
 
-            inv_to_save = InventorySchema()
-            inv_to_save.saved_character_id = char_id
-            inv_to_save.item_id = item_id
-            inv_to_save.item_count = item_count
 
-            session.add(inv_to_save)
+def save_inventory_delta(char_id: int, inventory: Inventory):
+    """
+    Save only the inventory items which were added, removed or had their count changed since the character
+    was last saved into the saved_character_inventory DB table.
+    A changed item has its old row deleted and a new one inserted.
+    """
+    changes: {str: tuple} = inventory.get_changes()  # the gold is saved in the saved_character table
+
+    old_item_ids = {old_value[0].id for old_value, _ in changes.values() if old_value is not None}
+    delete_rows(InventorySchema, char_id, 'item_id', old_item_ids)
+    _insert_inventory_rows(char_id, [new_value for _, new_value in changes.values() if new_value is not None])
+
+
+def insert_rows(table_schema, char_id: int, column_name: str, values, db_session=session):
+    """
+    Insert a (saved_character_id, column_name) row for every value with a single executemany statement
+    :param table_schema: one of the schemas in ALLOWED_TABLES_TO_DELETE_FROM
+    :param db_session: the session to execute with, which is the game's session by default
+    """
+    rows = [{'saved_character_id': char_id, column_name: value} for value in values]
+    if rows:
+        db_session.execute(table_schema.__table__.insert(), rows)
+
+
+def delete_rows(table_schema, char_id: int, column_name: str, values, db_session=session):
+    """
+    Delete every row of the character whose column_name is one of the values,
+    in chunks of SAVE_DELETE_CHUNK_SIZE to stay below SQLite's limit of bound parameters
+    :param table_schema: one of the schemas in ALLOWED_TABLES_TO_DELETE_FROM
+    :param db_session: the session to execute with, which is the game's session by default
+    """
+    values = list(values)
+    table = table_schema.__table__
+    for chunk_start in range(0, len(values), SAVE_DELETE_CHUNK_SIZE):
+        chunk = values[chunk_start:chunk_start + SAVE_DELETE_CHUNK_SIZE]
+        db_session.execute(table.delete().where((table.c.saved_character_id == char_id)
+                                             & table.c[column_name].in_(chunk)))
+
+
+def _insert_inventory_rows(char_id: int, items_and_counts: [tuple]):
+    """ Insert a saved_character_inventory row for every (Item, Item Count) tuple """
+    insert_inventory_counts(char_id, {item.id: item_count for item, item_count in items_and_counts})
+
+
+def insert_inventory_counts(char_id: int, item_counts: {int: int}, db_session=session):
+    """
+    Insert a saved_character_inventory row for every item with a single executemany statement
+    :param item_counts: A dictionary, Key: item_id, Value: Item Count
+    :param db_session: the session to execute with, which is the game's session by default
+    """
+    rows = [{'saved_character_id': char_id, 'item_id': item_id, 'item_count': item_count}
+            for item_id, item_count in item_counts.items()]
+    if rows:
+        db_session.execute(InventorySchema.__table__.insert(), rows)
 
 
 def delete_rows_from_table(table_name: str, char_id: int):
@@ -1,12 +1,12 @@
 from decorators import run_once
-from models.creatures.creature_defaults.creature_defaults import CreatureDefaultsSchema
-from database.main import session
+from database.snapshot import load_world_snapshot
 
 
 @run_once
 def load_creature_defaults() -> {int: {str: int}}:
     """
     Load the default values that a creature should have/give at a certain level.
+    They are read from the world snapshot, which avoids going through the ORM at startup.
 
     :return: A dictionary as follows: Key: Level(ex: 1), Value: Dictionary{'armor': 50,
                                                                     'min_gold_reward': 2,
@@ -15,11 +15,12 @@ def load_creature_defaults() -> {int: {str: int}}:
         """
     creature_defaults = {}
 
-    loaded_creature_defaults: [CreatureDefaultsSchema] = session.query(CreatureDefaultsSchema).all()
+    loaded_creature_defaults: [dict] = load_world_snapshot().rows('creature_defaults')
     for creature_default in loaded_creature_defaults:
-        creature_defaults[creature_default.creature_level] = {'armor': creature_default.armor,
-                                                              'min_gold_reward': creature_default.min_gold_reward,
-                                                              'max_gold_reward': creature_default.max_gold_reward,
-                                                              'xp_reward': creature_default.xp_reward}
+        creature_defaults[creature_default['creature_level']] = {
+            'armor': creature_default['armor'],
+            'min_gold_reward': creature_default['min_gold_reward'],
+            'max_gold_reward': creature_default['max_gold_reward'],
+            'xp_reward': creature_default['xp_reward']}
 
     return creature_defaults
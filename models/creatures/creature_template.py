@@ -1,8 +1,22 @@
 from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey
 from sqlalchemy.orm import relationship
 
+from utils.helper import parse_int
+from entities import CreatureTemplate
+from constants import CREATURE_DEFAULT_VALUES
 from database.main import Base
 
+# Key: creature_template entry, Value: the CreatureTemplate parsed from it. Cleared by clear_creature_templates
+_loaded_creature_templates: {int: CreatureTemplate} = {}
+
+
+def clear_creature_templates():
+    """
+    Forget every parsed CreatureTemplate, so that the next spawn of a creature parses its row again.
+    Call it whenever the content of the creature tables changes while the game is running, ex: in a test
+    """
+    _loaded_creature_templates.clear()
+
 
 class CreatureTemplateSchema(Base):
     """
@@ -53,6 +67,42 @@ class CreatureTemplateSchema(Base):
     gossip = Column(Text)
     respawnable = Column(Boolean)
 
+    def convert_to_creature_template(self) -> CreatureTemplate:
+        """
+        Parse this row into an immutable CreatureTemplate.
+        The result is cached by the entry, so every row gets parsed only once no matter how many spawns it has,
+        until clear_creature_templates is called.
+        """
+        creature_template = _loaded_creature_templates.get(self.entry)
+        if creature_template is None:
+            creature_template = self._build_creature_template()
+            _loaded_creature_templates[self.entry] = creature_template
+
+        return creature_template
+
+    def _build_creature_template(self) -> CreatureTemplate:
+        level: int = parse_int(self.level)
+        armor: int = parse_int(self.armor)
+        xp_to_give: int = 0
+        gold_to_give_range: (int, int) = (0, 0)
+        vendor_inventory: {str: ('Item', int)} = {}
+        loot_table: 'LootTable' = self.loot_table.convert_to_loot_table() if self.loot_table else None
+
+        if self.type == "monster":
+            gold_to_give_range = (CREATURE_DEFAULT_VALUES[level]['min_gold_reward'],
+                                  CREATURE_DEFAULT_VALUES[level]['max_gold_reward'])
+            xp_to_give = CREATURE_DEFAULT_VALUES[level]['xp_reward']
+            armor = armor if armor else CREATURE_DEFAULT_VALUES[level]['armor']
+        elif self.type == "vendor":
+            vendor_inventory = self.build_vendor_inventory()
+
+        return CreatureTemplate(entry=self.entry, name=self.name, creature_type=self.type, level=level,
+                                health=parse_int(self.health), mana=parse_int(self.mana), armor=armor,
+                                min_damage=parse_int(self.min_dmg), max_damage=parse_int(self.max_dmg),
+                                quest_relation_id=parse_int(self.quest_relation_id), loot_table=loot_table,
+                                gossip=self.gossip, respawnable=self.respawnable, xp_to_give=xp_to_give,
+                                gold_to_give_range=gold_to_give_range, vendor_inventory=vendor_inventory)
+
     def build_vendor_inventory(self):
         """
         This function loads all the items that a certain vendor should sell.
@@ -1,24 +1,100 @@
 """ This module loads information from the associated models in its folder """
-from sqlalchemy import or_, and_
+from sqlalchemy.orm import joinedload, subqueryload
 
 from database.main import session
 from models.creatures.creatures import CreaturesSchema
+from models.creatures.creature_template import CreatureTemplateSchema
+from models.creatures.npc_vendor import NpcVendorSchema
+from models.items.loot_table import LootTableSchema
+from models.items.loot_table_entry import LootTableEntrySchema
 from entities import Monster, LivingThing, VendorNPC
+from utils.entity_index import EntityIndex
 
 
 def load_monsters(zone: str, subzone: str, character) -> tuple:
     """
     Loads all the creatures in the given zone
 
-        :return: A Dictionary: Key: guid, Value: Object of class entities.py/Monster,
-                 A Set of Tuples ((Monster GUID, Monster Name))
+        :return: An EntityIndex: Key: guid, Value: Object of class entities.py/Monster,
+                 A live Set of Tuples ((Monster GUID, Monster Name))
     """
+    print("Loading Monsters...")
+    creatures = _query_spawns().filter_by(type='monster', zone=zone, sub_zone=subzone).all()
+    monsters_dict, guid_name_set = _convert_monsters(creatures, character)
 
-    monsters_dict: {int: Monster} = {}
-    guid_name_set: {(int, str)} = set()
+    print("Monsters loaded!")
+    return monsters_dict, guid_name_set
+
+
+def load_npcs(zone: str, subzone: str) -> tuple:
+    """
+    Load all the friendly NPCs in the given zone/subzone
+
+
+        :return: An EntityIndex: Key: guid, Value: Object of class entities.py/FriendlyNPC,
+                 A live Set of Tuples ((npc GUID, npc Name))
+    """
+    print("Loading Friendly NPCs...")
+    loaded_npcs = _query_spawns().filter((((CreaturesSchema.type == 'fnpc') | (CreaturesSchema.type == 'vendor'))
+                                          & (CreaturesSchema.zone == zone) & (CreaturesSchema.sub_zone == subzone)))
+    npcs_dict, guid_name_set = _convert_npcs(loaded_npcs)
+
+    print("Friendly NPCs loaded!")
+    return npcs_dict, guid_name_set
+
+
+def load_subzone_creatures(zone: str, subzone: str, character, db_session=session, to_print: bool=True) -> tuple:
+    """
+    Loads every creature spawn (monsters and NPCs) in the given zone/subzone with a single eager query,
+    as opposed to calling load_monsters and load_npcs separately.
+        :param db_session: the session to query with, which is the game's session by default
+        :param to_print: A boolean indicating if we want to print the loading messages
+
+        :return: A Tuple (1,2,3,4)
+            1 - An EntityIndex: Key: guid, Value: Object of class entities.py/Monster
+            2 - A live Set of Tuples ((Monster GUID, Monster Name)), see EntityIndex.guid_names
+            3 - An EntityIndex: Key: guid, Value: Object of class entities.py/FriendlyNPC
+            4 - A live Set of Tuples ((npc GUID, npc Name)), see EntityIndex.guid_names
+    """
+    if to_print:
+        print("Loading Creatures...")
+    spawns = _query_spawns(db_session).filter_by(zone=zone, sub_zone=subzone).all()
+    monsters_dict, monster_guid_name_set = _convert_monsters(
+        [spawn for spawn in spawns if spawn.type == 'monster'], character)
+    npcs_dict, npc_guid_name_set = _convert_npcs(
+        [spawn for spawn in spawns if spawn.type in ('fnpc', 'vendor')])
+
+    if to_print:
+        print("Creatures loaded!")
+    return monsters_dict, monster_guid_name_set, npcs_dict, npc_guid_name_set
+
+
+def _query_spawns(db_session=session):
+    """
+    Build a query for CreaturesSchema which eagerly loads everything that converting a spawn to a LivingThing needs:
+        - the creature_template row of the spawn
+        - its loot table and every item in that loot table
+        - the vendor's inventory and every item in it
+    Without this, each of those relationships would be lazily loaded with a separate SELECT per spawn.
+    """
+    template_load = joinedload(CreaturesSchema.creature)
+    loot_table_load = (template_load.joinedload(CreatureTemplateSchema.loot_table)
+                       .joinedload(LootTableSchema.entries).joinedload(LootTableEntrySchema.item))
+    # the vendor inventory is a collection, load it with one additional query for all the spawns
+    vendor_inventory_load = (template_load.subqueryload(CreatureTemplateSchema.vendor_inventory)
+                             .joinedload(NpcVendorSchema.item))
+
+    return db_session.query(CreaturesSchema).options(loot_table_load, vendor_inventory_load)
+
+
+def _convert_monsters(creatures: [CreaturesSchema], character) -> tuple:
+    """
+    Convert the loaded monster spawns to Monster objects, skipping the ones the character has already killed
+        :return: An EntityIndex: Key: guid, Value: Object of class entities.py/Monster,
+                 A live Set of Tuples ((Monster GUID, Monster Name))
+    """
+    monsters_dict: {int: Monster} = EntityIndex()
 
-    print("Loading Monsters...")
-    creatures = session.query(CreaturesSchema).filter_by(type='monster', zone=zone, sub_zone=subzone).all()
     for creature in creatures:
         if character.has_killed_monster(creature.guid):
             # if the character has killed this monster before and has it saved, we don't want to load it
@@ -26,33 +102,22 @@ def load_monsters(zone: str, subzone: str, character) -> tuple:
 
         monster = creature.convert_to_living_thing_object()
 
-        guid_name_set.add((creature.guid, monster.name))
         monsters_dict[creature.guid] = monster
 
-    print("Monsters loaded!")
-    return monsters_dict, guid_name_set
+    return monsters_dict, monsters_dict.guid_names
 
 
-def load_npcs(zone: str, subzone: str) -> tuple:
+def _convert_npcs(loaded_npcs: [CreaturesSchema]) -> tuple:
     """
-    Load all the friendly NPCs in the given zone/subzone
-
-
-        :return: A Dictionary: Key: guid, Value: Object of class entities.py/FriendlyNPC,
-                 A Set of Tuples ((npc GUID, npc Name))
+    Convert the loaded NPC spawns to FriendlyNPC/VendorNPC objects
+        :return: An EntityIndex: Key: guid, Value: Object of class entities.py/FriendlyNPC,
+                 A live Set of Tuples ((npc GUID, npc Name))
     """
+    npcs_dict: {int: 'FriendlyNPC' or 'VendorNPC'} = EntityIndex()
 
-    npcs_dict: {str: 'FriendlyNPC' or 'VendorNPC'} = {}
-    guid_name_set: {(int, str)} = set()
-
-    print("Loading Friendly NPCs...")
-    loaded_npcs = session.query(CreaturesSchema).filter((((CreaturesSchema.type == 'fnpc') | (CreaturesSchema.type == 'vendor'))
-                                                         & (CreaturesSchema.zone == zone) & (CreaturesSchema.sub_zone == subzone)))
     for npc_info in loaded_npcs:
         guid: int = npc_info.guid
         loaded_npc = npc_info.convert_to_living_thing_object()
-        guid_name_set.add((guid, loaded_npc.name))
         npcs_dict[guid] = loaded_npc
 
-    print("Friendly NPCs loaded!")
-    return npcs_dict, guid_name_set
+    return npcs_dict, npcs_dict.guid_names
@@ -1,10 +1,12 @@
 from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy.orm import object_session
 
 from models.spells.loader import load_buff
+from models.items.registry import item_registry
 from utils.helper import create_attributes_dict
 from items import Weapon, Equipment, Potion, Item
 from utils.helper import parse_int
-from database.main import Base
+from database.main import Base, session
 
 
 class ItemTemplateSchema(Base):
@@ -56,6 +58,14 @@ class ItemTemplateSchema(Base):
     effect = Column(Integer)
 
     def convert_to_item_object(self) -> Item:
+        """
+        Convert the row to an object of class Item (or its subclasses).
+        Every entry is built only once and kept in the item registry, this returns a copy of it.
+        """
+        return item_registry.get_item(self)
+
+    def build_item_object(self) -> Item:
+        """ Build a new Item object from the row. Use convert_to_item_object instead, which goes through the registry """
         item_id: int = self.entry
         item_name: str = self.name
         item_type: str = self.type
@@ -89,7 +99,8 @@ class ItemTemplateSchema(Base):
                                  buy_price=item_buy_price, sell_price=item_sell_price)
         elif item_type == 'potion':
             buff_id: int = self.effect
-            item_buff_effect: 'BeneficialBuff' = load_buff(buff_id)
+            # query the buff with the session this row was loaded with, which might be a background thread's one
+            item_buff_effect: 'BeneficialBuff' = load_buff(buff_id, db_session=object_session(self) or session)
 
             return Potion(name=item_name, item_id=item_id, buy_price=item_buy_price, sell_price=item_sell_price,
                           buff=item_buff_effect)
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, ForeignKey
+from sqlalchemy.orm import relationship
+
+from database.main import Base
+
+
+class LootTableEntrySchema(Base):
+    """
+    A single item which can drop from a loot table.
+    loot_table_id - the entry of the loot table in loot_table
+    item_id - the ID of the item that can drop
+    chance - the chance in percentage (0-100%) for the item to drop
+
+    Example:
+        loot_table_id, item_id, chance
+                    1,       4,     55
+                    1,       3,     30
+    Meaning a creature whose col loot_table_ID from creature_template is equal to 1 has:
+        55% chance to drop Item with ID 4
+        30% chance to drop Item with ID 3
+    """
+    __tablename__ = 'loot_table_entry'
+
+    loot_table_id = Column(Integer, ForeignKey('loot_table.entry'), primary_key=True)
+    item_id = Column(Integer, ForeignKey('item_template.entry'), primary_key=True)
+    item = relationship('ItemTemplateSchema')
+    chance = Column(Integer)
@@ -0,0 +1,91 @@
+"""
+This module holds the process-wide registry of item prototypes.
+Converting an item_template row to an Item (and loading the buff of a potion) is done only once per entry,
+every later conversion of the same entry gets a copy of the already built prototype.
+"""
+import threading
+from collections import OrderedDict
+from copy import copy
+from typing import NamedTuple
+
+from constants import ITEM_REGISTRY_MAX_SIZE
+
+
+class ItemRegistryStats(NamedTuple):
+    """ A snapshot of the registry's counters """
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ItemRegistry:
+    """
+    A size-bounded cache of Item prototypes, keyed by the item_template entry.
+    When it gets full, the least recently used prototype is evicted.
+
+    The prototypes are never handed out for modification. get_item returns a shallow copy of the prototype,
+    which the caller is free to change (ex: a vendor overriding the buy_price), while get_prototype returns the
+    shared prototype itself and should only be used for reading.
+    """
+    def __init__(self, max_size: int=ITEM_REGISTRY_MAX_SIZE):
+        if max_size <= 0:
+            raise Exception(f'The item registry needs a positive size, {max_size} was given!')
+        self.max_size = max_size
+        self._prototypes: OrderedDict = OrderedDict()  # Key: item entry, Value: Item prototype
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._prototypes)
+
+    def __contains__(self, item_entry: int):
+        return item_entry in self._prototypes
+
+    def get_item(self, item_template: 'ItemTemplateSchema') -> 'Item':
+        """ Return a copy of the item's prototype, building it if it's not in the registry """
+        return copy(self.get_prototype(item_template))
+
+    def get_prototype(self, item_template: 'ItemTemplateSchema') -> 'Item':
+        """ Return the shared prototype of the item, building it if it's not in the registry. Do not modify it! """
+        entry: int = item_template.entry
+        with self._lock:
+            prototype = self._prototypes.get(entry)
+            if prototype is not None:
+                self.hits += 1
+                self._prototypes.move_to_end(entry)
+                return prototype
+            self.misses += 1
+
+        # build it outside of the lock, since building a potion queries the DB for its buff
+        prototype = item_template.build_item_object()
+
+        with self._lock:
+            self._prototypes[entry] = prototype
+            self._prototypes.move_to_end(entry)
+            while len(self._prototypes) > self.max_size:
+                self._prototypes.popitem(last=False)
+                self.evictions += 1
+
+        return prototype
+
+    def stats(self) -> ItemRegistryStats:
+        return ItemRegistryStats(hits=self.hits, misses=self.misses, evictions=self.evictions,
+                                 size=len(self._prototypes), max_size=self.max_size)
+
+    def clear(self):
+        """ Remove every prototype and reset the counters """
+        with self._lock:
+            self._prototypes.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+item_registry = ItemRegistry()
@@ -1,9 +1,18 @@
-# Import every model out there to load the model itself
-from models.items import (item_template, loot_table)
+"""
+Import every schema so that it gets registered in the declarative Base.
+The schemas reference each other by name (ex: relationship('ItemTemplateSchema')) and nothing queries the DB at
+import time, so the order of the imports below does not matter.
+Once all of them are registered, the mappers are configured here at once, so that a missing schema is reported
+immediately instead of on the first query.
+"""
+from sqlalchemy.orm import configure_mappers
+
+from models.characters import saved_character
+from models.creatures import (creature_template, creatures, npc_vendor)
+from models.creatures.creature_defaults import creature_defaults
+from models.items import (item_template, loot_table, loot_table_entry)
 from models.misc import (level_xp_requirement, levelup_stats)
 from models.quests import quest_template
-from models.creatures.creature_defaults import creature_defaults
-from models.creatures import (npc_vendor, creature_template, creatures)
-from models.characters import saved_character
-from models.spells import (paladin_spells_template, spell_dots, spell_buffs)
-# WARNING: The order of which everything is imported is crucial!
+from models.spells import (paladin_spells_template, spell_buffs, spell_dots)
+
+configure_mappers()
@@ -1,6 +1,4 @@
-from database.main import session
-from models.misc.levelup_stats import LevelUpStatsSchema
-from models.misc.level_xp_requirement import LevelXpRequirementSchema
+from database.snapshot import load_world_snapshot
 from decorators import run_once
 from utils.helper import parse_int
 
@@ -9,7 +7,8 @@ from utils.helper import parse_int
 def load_character_level_stats() -> dict:
     """
     Return a dictionary holding information about the amount of stats that a character should get according
-    to the level he has just attained
+    to the level he has just attained.
+    The stats are read from the world snapshot, which avoids going through the ORM at startup.
     """
     # Define these here as well. We can't import from constants because constants imports from here
     KEY_LEVELUP_STATS_HEALTH = 'health'
@@ -19,15 +18,15 @@ def load_character_level_stats() -> dict:
     KEY_LEVELUP_STATS_AGILITY = 'agility'
 
     level_stats = {}
-    loaded_stats = session.query(LevelUpStatsSchema).all()
+    loaded_stats: [dict] = load_world_snapshot().rows('levelup_stats')
 
     for stat in loaded_stats:
-        level = stat.level
-        health = parse_int(stat.health)
-        mana = parse_int(stat.mana)
-        strength = parse_int(stat.strength)
-        agility = parse_int(stat.agility)
-        armor = parse_int(stat.armor)
+        level = stat['level']
+        health = parse_int(stat['health'])
+        mana = parse_int(stat['mana'])
+        strength = parse_int(stat['strength'])
+        agility = parse_int(stat['agility'])
+        armor = parse_int(stat['armor'])
 
         level_stats[level] = {
             KEY_LEVELUP_STATS_HEALTH: health,
@@ -44,7 +43,8 @@ def load_character_level_stats() -> dict:
 def load_character_xp_requirements() -> {int: int}:
     """
     Load the information about the necessary XP needed to reach a certain level.
+    It is read from the world snapshot, which avoids going through the ORM at startup.
     """
-    loaded_xp_reqs = session.query(LevelXpRequirementSchema).all()
+    loaded_xp_reqs: [dict] = load_world_snapshot().rows('level_xp_requirement')
 
-    return {xp_req.level: xp_req.xp_required for xp_req in loaded_xp_reqs}
+    return {xp_req['level']: xp_req['xp_required'] for xp_req in loaded_xp_reqs}
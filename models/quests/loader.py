@@ -1,23 +1,31 @@
+from sqlalchemy.orm import joinedload
+
 from utils.helper import parse_int
 from models.quests.quest_template import QuestSchema
 from quest import Quest, FetchQuest, KillQuest
 from database.main import session
 
 
-def load_quests(zone: str, subzone: str, character) -> {str: Quest}:
+def load_quests(zone: str, subzone: str, character, db_session=session, to_print: bool=True) -> {str: Quest}:
     """
     Load all the quests in the zone/subzone that are available for the given character.
 
     :param zone: The zone that the query will use
     :param subzone: The subzone that the query will use
     :param character: The Character object we're loading the quests for.
+    :param db_session: the session to query with, which is the game's session by default
+    :param to_print: A boolean indicating if we want to print the loading message
     :return: A Dctionary Key: Quest Name Value: Quest Object
     """
 
     loaded_quests: {str: Quest} = {}
-    quests = session.query(QuestSchema).filter_by(zone=zone, sub_zone=subzone).all()
+    # eagerly load the item rewards, otherwise every reward would be queried separately on conversion
+    quests = (db_session.query(QuestSchema)
+              .options(joinedload(QuestSchema.reward1), joinedload(QuestSchema.reward2), joinedload(QuestSchema.reward3))
+              .filter_by(zone=zone, sub_zone=subzone).all())
 
-    print("Loading Quests...")
+    if to_print:
+        print("Loading Quests...")
     for quest in quests:
         if character.has_completed_quest(quest.entry):
             continue  # do not load the quest into the game if the character has completed it
@@ -5,7 +5,7 @@ from models.spells.spell_dots import DotSchema
 from models.spells.paladin_spells_template import PaladinSpellsSchema
 
 
-def load_buff(buff_id: int) -> 'BeneficialBuff':
+def load_buff(buff_id: int, db_session=session) -> 'BeneficialBuff':
     """
     Loads a buff from the DB table spells_buffs, whose contents are the following:
     entry,             name, duration,    stat,   amount,   stat2,   amount2,stat3,   amount3, comment
@@ -17,9 +17,10 @@ def load_buff(buff_id: int) -> 'BeneficialBuff':
 
     Load the information about the buff, convert it to an class Buff object and return it
     :param buff_id: the buff entry in spells_buffs
+    :param db_session: the session to query with, which is the game's session by default
     :return: A instance of class Buff
     """
-    buff: BuffSchema = session.query(BuffSchema).get(buff_id)
+    buff: BuffSchema = db_session.query(BuffSchema).get(buff_id)
     return buff.convert_to_beneficial_buff_object()
 
 
@@ -1,7 +1,7 @@
 from sqlalchemy import Column, Integer, String, Text
 
 from buffs import DoT
-from damage import Damage
+from damage import Damage, FrozenDamage
 
 from database.main import Base
 
@@ -38,9 +38,9 @@ class DotSchema(Base):
         dot_duration: int = self.duration
 
         if dot_damage_school == "magic":
-            dot_damage: Damage = Damage(magic_dmg=dot_damage_per_tick)
+            dot_damage: Damage = FrozenDamage(magic_dmg=dot_damage_per_tick)
         elif dot_damage_school == "physical":
-            dot_damage: Damage = Damage(phys_dmg=dot_damage_per_tick)
+            dot_damage: Damage = FrozenDamage(phys_dmg=dot_damage_per_tick)
         else:
             raise Exception('Unsupported Damage type!')
 
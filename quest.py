@@ -1,3 +1,6 @@
+from events import get_event_bus, QuestProgressed
+
+
 class Quest:
     def __init__(self, quest_name: str, quest_id, xp_reward: int, item_reward_dict: dict, reward_choice_enabled: bool,
                  level_required: int, is_completed: bool = False):
@@ -57,7 +60,8 @@ class KillQuest(Quest):
 
     def update_kills(self):
         self.kills += 1
-        print(f'Quest {self.name}: {self.kills}/{self.required_kills} {self.required_monster} slain.')
+        get_event_bus().emit(QuestProgressed, self.name, self.kills, self.required_kills, self.required_monster,
+                             'slain')
         self.check_if_complete()
 
     def check_if_complete(self, character: 'Character'=None):
@@ -84,10 +88,11 @@ class FetchQuest(Quest):
         """ Given the player's inventory, check if he has enough to complete the quest"""
         if character is None or not hasattr(character, 'inventory'):
             raise Exception('The FetchQuest check_if_complete method requires  that a character object is passed to it!')
-        _, item_count = character.inventory.get(self.required_item, (self.required_item, 0))
+        item_count = character.inventory.get_count(self.required_item)
 
         if item_count:
-            print(f'Quest {self.name}: {item_count}/{self.required_item_count} {self.required_item} obtained.')
+            get_event_bus().emit(QuestProgressed, self.name, item_count, self.required_item_count, self.required_item,
+                                 'obtained')
 
         if item_count >= self.required_item_count:
             self._quest_complete()
@@ -0,0 +1,165 @@
+"""
+This module holds the random number service of the game. Every roll goes through one of its named streams:
+    combat - the damage of auto attacks
+    heal_crit - the double heal of a HolyHeal
+    loot - the drops of a loot table
+    gold - the gold a monster gives
+Each stream draws its numbers from its own numpy generator in blocks, so that a roll is a list lookup instead of
+a call into the random module. Seeding the service makes every stream reproducible, and the rolls can be recorded
+and replayed later, which reproduces a bug exactly.
+
+Usage:
+    random_service = RandomService(seed=42)
+    random_service.combat.randint(1, 3)
+    random_service.start_recording()
+    ...
+    save_recording(random_service.stop_recording(), 'rolls.json')
+    RandomService().replay(load_recording('rolls.json'))
+"""
+import json
+
+from constants import RNG_BLOCK_SIZE
+
+COMBAT_STREAM, HEAL_CRIT_STREAM, LOOT_STREAM, GOLD_STREAM = 'combat', 'heal_crit', 'loot', 'gold'
+STREAM_NAMES = (COMBAT_STREAM, HEAL_CRIT_STREAM, LOOT_STREAM, GOLD_STREAM)
+
+
+class RandomStream:
+    """
+    A stream of random floats from 0.0 to ~0.9999, served from a block which is refilled in bulk once it runs out.
+    numpy is imported on the first refill, so that it is not loaded on startup.
+    """
+    def __init__(self, name: str, seed: int, stream_index: int, block_size: int=RNG_BLOCK_SIZE):
+        self.name = name
+        self.block_size = block_size
+        self._seed = seed
+        self._stream_index = stream_index
+        self._generator = None
+        self._block: [float] = []
+        self._position = 0
+        self._recorded_rolls: [float] = None  # None while the stream is not being recorded
+
+    def _refill(self):
+        if self._generator is None:
+            import numpy
+            # the stream's seed depends only on the service's seed and the stream's index,
+            # so rolling on one stream never changes the rolls of another
+            self._generator = numpy.random.default_rng(numpy.random.SeedSequence(self._seed,
+                                                                                 spawn_key=(self._stream_index,)))
+        self._block = self._generator.random(self.block_size).tolist()
+        self._position = 0
+
+    def _take(self, count: int) -> [float]:
+        rolls = []
+        while len(rolls) < count:
+            if self._position >= len(self._block):
+                self._refill()
+            taken_count = min(count - len(rolls), len(self._block) - self._position)
+            rolls.extend(self._block[self._position:self._position + taken_count])
+            self._position += taken_count
+
+        if self._recorded_rolls is not None:
+            self._recorded_rolls.extend(rolls)
+        return rolls
+
+    def random(self, size=None) -> float or 'numpy.ndarray':
+        """
+        :param size: the shape of the array of floats to return, a single float by default.
+                     This way the stream can be used in place of a numpy.random.Generator (ex: by a LootTable)
+        """
+        if size is None:
+            if self._position >= len(self._block):
+                self._refill()
+            roll = self._block[self._position]
+            self._position += 1
+            if self._recorded_rolls is not None:
+                self._recorded_rolls.append(roll)
+            return roll
+
+        import numpy
+        shape = (size,) if isinstance(size, int) else tuple(size)
+        return numpy.array(self._take(int(numpy.prod(shape))), dtype=numpy.float64).reshape(shape)
+
+    def randint(self, low: int, high: int) -> int:
+        """ :return: a random integer from low to high, both included - like random.randint """
+        if high < low:
+            raise ValueError(f'Empty range for randint({low}, {high})')
+        return low + int(self.random() * (high - low + 1))
+
+    def start_recording(self):
+        self._recorded_rolls = []
+
+    def stop_recording(self) -> [float]:
+        """ :return: every roll since start_recording() was called """
+        recorded_rolls, self._recorded_rolls = self._recorded_rolls or [], None
+        return recorded_rolls
+
+    def replay(self, rolls: [float]):
+        """ Serve the given rolls first, drawing new ones from the generator once they run out """
+        self._block = list(rolls) + self._block[self._position:]
+        self._position = 0
+
+
+class RandomService:
+    """
+    Holds a RandomStream for every name in STREAM_NAMES, accessible as an attribute (ex: random_service.combat)
+    """
+    def __init__(self, seed: int=None, block_size: int=RNG_BLOCK_SIZE):
+        """
+        :param seed: the seed of every stream, a random one by default. It is kept in self.seed,
+                     so that a game can be rerun with the same rolls
+        """
+        if seed is None:
+            import secrets
+            seed = secrets.randbits(64)
+        self.seed = seed
+        self.streams = {name: RandomStream(name, seed, stream_index, block_size)
+                        for stream_index, name in enumerate(STREAM_NAMES)}
+        self.combat: RandomStream = self.streams[COMBAT_STREAM]
+        self.heal_crit: RandomStream = self.streams[HEAL_CRIT_STREAM]
+        self.loot: RandomStream = self.streams[LOOT_STREAM]
+        self.gold: RandomStream = self.streams[GOLD_STREAM]
+
+    def __deepcopy__(self, memo):
+        # the service is shared by everything in the game, a copied character should keep rolling with it
+        return self
+
+    def start_recording(self):
+        for stream in self.streams.values():
+            stream.start_recording()
+
+    def stop_recording(self) -> {str: [float]}:
+        """ :return: A dictionary Key: the name of a stream, Value: every roll it made since start_recording() """
+        return {name: stream.stop_recording() for name, stream in self.streams.items()}
+
+    def replay(self, recording: {str: [float]}):
+        """ Make every stream serve the rolls it made in the recording first """
+        for name, rolls in recording.items():
+            self.streams[name].replay(rolls)
+
+
+def save_recording(recording: {str: [float]}, path: str):
+    with open(path, 'w') as recording_file:
+        json.dump(recording, recording_file)
+
+
+def load_recording(path: str) -> {str: [float]}:
+    with open(path) as recording_file:
+        return json.load(recording_file)
+
+
+# the service every entity, heal and loot table rolls with unless it is given another one
+_game_random_service: RandomService = None
+
+
+def get_random_service() -> RandomService:
+    global _game_random_service
+    if _game_random_service is None:
+        _game_random_service = RandomService()
+    return _game_random_service
+
+
+def set_random_service(random_service: RandomService):
+    """ Replace the game's service, ex: with a seeded one. Affects only the objects created afterwards """
+    global _game_random_service
+    _game_random_service = random_service
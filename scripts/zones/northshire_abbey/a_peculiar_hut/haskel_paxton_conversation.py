@@ -1,38 +1,36 @@
-from time import sleep
 import combat
+from game_clock import Scheduler
 
 SCRIPT_NAME = "HASKEL_PAXTON_CONVERSATION"
 
 
 def script(subzone, character):
     print("*" * 40)
-    print("Brother Haskel says: Everything is going according to plan, \
-    I have set you up a meeting with the Archbishop in three weeks.")
-    sleep(3)
-    print("Brother Paxton says: It will be an honor for me.")
-    sleep(2.5)
-    print("Brother Haskel says: All these years have led to this, you have better be prepared, Pax.")
-    sleep(3)
-    print("Brother Paxton says: I did not spend ten years in Ravenholdt for nothing.\
+    scheduler = Scheduler()
+    # every line is followed by the pause in seconds before the next one
+    scheduler.say_lines([
+        ("Brother Haskel says: Everything is going according to plan, \
+    I have set you up a meeting with the Archbishop in three weeks.", 3),
+        ("Brother Paxton says: It will be an honor for me.", 2.5),
+        ("Brother Haskel says: All these years have led to this, you have better be prepared, Pax.", 3),
+        ("Brother Paxton says: I did not spend ten years in Ravenholdt for nothing.\
      Benedictus' end will bring forth a massive expedition to avenge him, \
-     I only fear if the Brotherhood will be able to withstand it.")
-    sleep(4)
-    print("Brother Haskel says: I have complete trust in Edwin's plans."
-          "Your sacrifice will play a key role in our mission and for that you have my respect.")
-    sleep(3)
-    print(f'{character.name} says: Unbelievable, the two of you work for the Defias?!')
-    sleep(2.5)
+     I only fear if the Brotherhood will be able to withstand it.", 4),
+        ("Brother Haskel says: I have complete trust in Edwin's plans."
+         "Your sacrifice will play a key role in our mission and for that you have my respect.", 3),
+        (f'{character.name} says: Unbelievable, the two of you work for the Defias?!', 2.5)
+    ])
+    scheduler.run()
 
     # engage combat with Paxton
     brother_paxton = subzone._alive_monsters[subzone.GUID_BROTHER_PAXTON]
-    combat.engage_combat(character, brother_paxton, subzone._alive_monsters, subzone._monster_guid_name_set,
-                         subzone.GUID_BROTHER_PAXTON)
+    combat.engage_combat(character, brother_paxton, subzone._alive_monsters, subzone.GUID_BROTHER_PAXTON)
 
-    print(f"Brother Haskel says: You have not seen the last of the Brotherhood, {character.name}!")
-    sleep(2)
-    print("Haskel drops a smoke bomb!")
-    sleep(0.5)
-    print("Smoke fills the hut...")
-    sleep(2)
-    print("When the smoke clears, you see that the traitor is nowhere in sight...")
+    scheduler.say_lines([
+        (f"Brother Haskel says: You have not seen the last of the Brotherhood, {character.name}!", 2),
+        ("Haskel drops a smoke bomb!", 0.5),
+        ("Smoke fills the hut...", 2),
+        ("When the smoke clears, you see that the traitor is nowhere in sight...", 0)
+    ])
+    scheduler.run()
     print()
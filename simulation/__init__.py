@@ -0,0 +1,3 @@
+"""
+This package runs fights without a player - for balance testing, load testing and statistics.
+"""
@@ -0,0 +1,293 @@
+"""
+This module holds the batch combat engine - it simulates many fights between copies of the same Paladin and monster
+at once, holding the state of every fight in numpy arrays and applying each turn as vectorized operations.
+It follows the turn logic of simulation/combat_engine.py and the formulas of entities.py/classes.py:
+    armor reduction - LivingThing._apply_armor_reduction
+    level difference - LivingThing._calculate_level_difference_damage (and Paladin.get_auto_attack_damage)
+    Flash of Light's double heal - heal.HolyHeal
+    Seal of Righteousness' damage on attacks - Paladin._spell_seal_of_righteousness_attack
+    Melting Strike's damage and its DoT - Paladin.spell_melting_strike and LivingThing.take_dot_proc
+Absorption shields are not simulated, since nothing in a Paladin-versus-monster fight gives one.
+
+Usage:
+    result = simulate_fights(character, monster, SealThenAttackPolicy(), fight_count=1_000_000)
+    result.win_rate, result.time_to_kill_histogram(), result.mana_curve
+"""
+from typing import NamedTuple, Dict
+
+import numpy
+
+import heal
+from classes import Paladin
+from combat import get_available_spells
+from constants import SEAL_OF_RIGHTEOUSNESS_ATTACKS, SIMULATION_MAX_FIGHT_TURNS, KEY_ARMOR_ATTRIBUTE
+from damage import Damage
+from entities import Monster
+from simulation.policies import (Policy, COMMANDS, ATTACK_ID, SEAL_OF_RIGHTEOUSNESS_ID, FLASH_OF_LIGHT_ID,
+                                 MELTING_STRIKE_ID)
+
+# Key: the ID of a spell's command, Value: the name of the spell in Paladin.learned_spells
+SPELL_NAMES = {SEAL_OF_RIGHTEOUSNESS_ID: Paladin.KEY_SEAL_OF_RIGHTEOUSNESS,
+               FLASH_OF_LIGHT_ID: Paladin.KEY_FLASH_OF_LIGHT,
+               MELTING_STRIKE_ID: Paladin.KEY_MELTING_STRIKE}
+
+
+def _round_damage(damage: numpy.ndarray) -> numpy.ndarray:
+    """ Round the damage like the Damage class does """
+    return numpy.round(damage, 1)
+
+
+def _level_difference_modifier(level: int, target_level: int) -> float:
+    """
+    :return: the signed percentage by which _calculate_level_difference_damage changes the damage dealt
+             from an entity of the given level to a target of the other level
+    """
+    level_difference = level - target_level
+    percentage_mod = abs(level_difference) * 0.1
+    return percentage_mod if level_difference > 0 else -percentage_mod
+
+
+def _armor_reduction(armor: float, attacker_level: int) -> float:
+    """ :return: the percentage of physical damage that armor reduces, as in _apply_armor_reduction """
+    return armor / (armor + 400 + 85 * attacker_level)
+
+
+class FightBatch:
+    """
+    The state of fight_count concurrent fights, each one between a copy of the character and a copy of the monster.
+    The stats that never change during a fight are kept as plain numbers, the ones that do - as arrays with one
+    value for each fight.
+    """
+    def __init__(self, character: Paladin, monster: Monster, fight_count: int):
+        self.fight_count = fight_count
+        self.character_level = character.level
+        self.character_max_health = character.max_health
+        self.character_min_damage = int(character.min_damage)
+        self.character_max_damage = int(character.max_damage)
+        self.monster_level = monster.level
+        self.monster_min_damage = monster.min_damage
+        self.monster_max_damage = monster.max_damage
+
+        self.character_damage_modifier = _level_difference_modifier(character.level, monster.level)
+        self.monster_damage_modifier = _level_difference_modifier(monster.level, character.level)
+        self.character_armor_reduction = _armor_reduction(character.attributes[KEY_ARMOR_ATTRIBUTE], monster.level)
+        self.monster_armor_reduction = _armor_reduction(monster.attributes[KEY_ARMOR_ATTRIBUTE], character.level)
+
+        available_spells = get_available_spells(character)
+        # Key: the ID of the spell's command, Value: the PaladinSpell
+        self.spells = {command_id: character.learned_spells[spell_name]
+                       for command_id, spell_name in SPELL_NAMES.items()
+                       if COMMANDS[command_id] in available_spells and spell_name in character.learned_spells}
+        self._calculate_spell_damage(character, monster)
+
+        self.character_health = numpy.full(fight_count, character.health, dtype=numpy.float64)
+        self.character_mana = numpy.full(fight_count, character.mana, dtype=numpy.float64)
+        self.monster_health = numpy.full(fight_count, monster.health, dtype=numpy.float64)
+        self.sor_active = numpy.zeros(fight_count, dtype=bool)
+        self.sor_attacks = numpy.zeros(fight_count, dtype=numpy.int64)  # Paladin.SOR_TURNS
+        self.monster_dot_turns = numpy.zeros(fight_count, dtype=numpy.int64)
+        # Key: the ID of the spell's command, Value: an array of Spell._cooldown_counter/Spell.is_ready for each fight
+        self.spell_cooldowns = {command_id: numpy.zeros(fight_count, dtype=numpy.int64) for command_id in self.spells}
+        self.spells_ready = {command_id: numpy.zeros(fight_count, dtype=bool) for command_id in self.spells}
+
+    def _calculate_spell_damage(self, character: Paladin, monster: Monster):
+        """
+        The damage of the spells does not depend on any roll, so it is calculated once with the scalar formulas
+        """
+        self.sor_damage = 0
+        if SEAL_OF_RIGHTEOUSNESS_ID in self.spells:
+            sor_damage = self.spells[SEAL_OF_RIGHTEOUSNESS_ID].damage1
+            self.sor_damage = Damage(magic_dmg=sor_damage + sor_damage * self.character_damage_modifier).magic_dmg
+
+        self.melting_strike_damage = 0
+        self.melting_strike_dot_duration = 0
+        self.melting_strike_dot_damage = 0
+        if MELTING_STRIKE_ID in self.spells:
+            spell = self.spells[MELTING_STRIKE_ID]
+            strike_damage = monster._apply_armor_reduction(Damage(phys_dmg=spell.damage1), character.level)
+            self.melting_strike_damage = strike_damage.phys_dmg + strike_damage.magic_dmg
+
+            dot = spell.harmful_effect
+            if dot is not None:
+                # noinspection PyTypeChecker
+                dot_damage: Damage = monster._calculate_level_difference_damage(dot.damage, target_level=character.level,
+                                                                                inverse=True)
+                if dot_damage.phys_dmg:
+                    dot_damage = monster._apply_armor_reduction(dot_damage, attacker_level=monster.level)
+                self.melting_strike_dot_duration = dot.duration
+                self.melting_strike_dot_damage = dot_damage.phys_dmg + dot_damage.magic_dmg
+
+    def update_monster_dots(self, fights: numpy.ndarray):
+        """ The start of the monster's turn - LivingThing._update_dots """
+        ticking = fights & (self.monster_dot_turns > 0)
+        self.monster_health = numpy.where(ticking, self.monster_health - self.melting_strike_dot_damage,
+                                          self.monster_health)
+        self.monster_dot_turns -= ticking
+
+    def update_spell_cooldowns(self, fights: numpy.ndarray):
+        """ The start of the character's turn - Spell.pass_turn for every spell """
+        for command_id, cooldowns in self.spell_cooldowns.items():
+            self.spells_ready[command_id] |= fights & (cooldowns == 0)
+            cooldowns -= fights & (cooldowns != 0)
+
+    def monster_attack(self, fights: numpy.ndarray, random_generator: numpy.random.Generator):
+        """ Monster.attack and Character.take_attack """
+        damage = random_generator.integers(self.monster_min_damage, self.monster_max_damage, size=self.fight_count,
+                                           endpoint=True).astype(numpy.float64)
+        damage = _round_damage(damage + damage * self.monster_damage_modifier)
+        damage = _round_damage(damage - damage * self.character_armor_reduction)
+        self.character_health = numpy.where(fights, self.character_health - damage, self.character_health)
+
+    def character_attack(self, fights: numpy.ndarray, random_generator: numpy.random.Generator):
+        """ Paladin.attack and Monster.take_attack """
+        damage = random_generator.integers(self.character_min_damage, self.character_max_damage,
+                                           size=self.fight_count, endpoint=True).astype(numpy.float64)
+        damage = _round_damage(damage + damage * self.character_damage_modifier)
+        damage = _round_damage(damage - damage * self.monster_armor_reduction)
+        sealed_attacks = fights & self.sor_active
+        damage += numpy.where(sealed_attacks, self.sor_damage, 0)
+        self.sor_attacks -= sealed_attacks
+        self.monster_health = numpy.where(fights, self.monster_health - damage, self.monster_health)
+
+    def cast_spell(self, command_id: int, fights: numpy.ndarray,
+                   random_generator: numpy.random.Generator) -> numpy.ndarray:
+        """
+        Cast the spell in the given fights, if there is enough mana and it is not on cooldown - decorators.cast_spell
+        :return: a boolean array, True for the fights in which the spell was cast
+        """
+        spell = self.spells[command_id]
+        casts = fights & (self.character_mana >= spell.mana_cost) & self.spells_ready[command_id]
+        self.spell_cooldowns[command_id][casts] = spell.cooldown
+        self.spells_ready[command_id] &= ~casts
+        self.character_mana = numpy.where(casts, self.character_mana - spell.mana_cost, self.character_mana)
+
+        if command_id == SEAL_OF_RIGHTEOUSNESS_ID:
+            self.sor_active |= casts
+            self.sor_attacks[casts] = SEAL_OF_RIGHTEOUSNESS_ATTACKS
+        elif command_id == FLASH_OF_LIGHT_ID:
+            # the chance is read from the heal module on every cast, as HolyHeal does
+            double_heals = random_generator.random(self.fight_count) * 100 <= heal.DOUBLE_HEAL_CHANCE
+            heal_amount = numpy.where(double_heals, spell.heal1 * 2, spell.heal1)
+            healed_health = numpy.minimum(self.character_health + heal_amount, self.character_max_health)
+            self.character_health = numpy.where(casts, healed_health, self.character_health)
+        elif command_id == MELTING_STRIKE_ID:
+            self.monster_health = numpy.where(casts, self.monster_health - self.melting_strike_damage,
+                                              self.monster_health)
+            self.monster_dot_turns[casts] = self.melting_strike_dot_duration
+
+        return casts
+
+    def end_turn_update(self, fights: numpy.ndarray):
+        """ The end of the character's turn - Paladin.end_turn_update fades Seal of Righteousness """
+        self.sor_active &= ~(fights & (self.sor_attacks == 0))
+
+
+class BatchResult(NamedTuple):
+    """
+    The outcome of a batch of fights, every array holds one value for each fight
+        character_won - True if the monster died
+        character_died - True if the character died. A fight in which neither died took too long
+        turns - the count of turns each fight took
+        character_health, character_mana - what the character was left with at the end of each fight
+        monster_health - what the monster was left with at the end of each fight
+        casts - Key: spell command, Value: how many times it was successfully cast in all the fights
+        failed_casts - the count of casts in all the fights which failed due to missing mana or a cooldown
+        mana_curve - the average mana of the character at the end of each turn, out of the fights which lasted that long
+    """
+    character_won: numpy.ndarray
+    character_died: numpy.ndarray
+    turns: numpy.ndarray
+    character_health: numpy.ndarray
+    character_mana: numpy.ndarray
+    monster_health: numpy.ndarray
+    casts: Dict[str, int]
+    failed_casts: int
+    mana_curve: numpy.ndarray
+
+    @property
+    def fight_count(self) -> int:
+        return len(self.turns)
+
+    @property
+    def win_rate(self) -> float:
+        return self.character_won.mean()
+
+    @property
+    def death_rate(self) -> float:
+        return self.character_died.mean()
+
+    def time_to_kill_histogram(self) -> numpy.ndarray:
+        """
+        :return: an array where the value at index X is the count of fights the character won in X turns
+        """
+        return numpy.bincount(self.turns[self.character_won], minlength=self.turns.max(initial=0) + 1)
+
+
+def simulate_fights(character: Paladin, monster: Monster, policy: Policy, fight_count: int,
+                    max_turns: int=SIMULATION_MAX_FIGHT_TURNS,
+                    random_generator: numpy.random.Generator=None) -> BatchResult:
+    """
+    Simulate fight_count fights between the character and the monster, each starting from their current state,
+    the way simulation.combat_engine.run_fight plays out one fight.
+    :param random_generator: the generator to roll every random number with, a new unseeded one by default
+    """
+    random_generator = random_generator or numpy.random.default_rng()
+    fights = FightBatch(character, monster, fight_count)
+    policy.reset_batch(fight_count)
+
+    in_progress = numpy.ones(fight_count, dtype=bool)
+    character_won = numpy.zeros(fight_count, dtype=bool)
+    character_died = numpy.zeros(fight_count, dtype=bool)
+    turns = numpy.zeros(fight_count, dtype=numpy.int64)
+    casts = numpy.zeros(len(COMMANDS), dtype=numpy.int64)
+    failed_casts = 0
+    mana_curve = []
+
+    for turn in range(1, max_turns + 1):
+        if not in_progress.any():
+            break
+        turns[in_progress] = turn
+
+        fights.update_monster_dots(in_progress)
+        fights.update_spell_cooldowns(in_progress)
+        monster_died = in_progress & (fights.monster_health <= 0)  # most probably from a DoT
+        character_won |= monster_died
+        in_progress &= ~monster_died
+
+        fights.monster_attack(in_progress, random_generator)
+        died = in_progress & (fights.character_health <= 0)
+        character_died |= died
+        in_progress &= ~died
+        acting = in_progress.copy()
+
+        # a failed cast does not end the turn, the fights in which it failed ask the policy again
+        failed_commands = numpy.zeros((fight_count, len(COMMANDS)), dtype=bool)
+        asked = in_progress
+        while asked.any():
+            commands = policy.choose_commands(fights, turn, asked)
+            commands = numpy.where(failed_commands[numpy.arange(fight_count), commands], ATTACK_ID, commands)
+
+            fights.character_attack(asked & (commands == ATTACK_ID), random_generator)
+            failed = numpy.zeros(fight_count, dtype=bool)
+            for command_id in fights.spells:
+                casting = asked & (commands == command_id)
+                if not casting.any():
+                    continue
+                cast = fights.cast_spell(command_id, casting, random_generator)
+                casts[command_id] += numpy.count_nonzero(cast)
+                failed_commands[casting & ~cast, command_id] = True
+                failed |= casting & ~cast
+            failed_casts += numpy.count_nonzero(failed)
+            asked = failed
+
+        fights.end_turn_update(acting)
+        mana_curve.append(fights.character_mana[turns == turn].mean())
+        monster_died = in_progress & (fights.monster_health <= 0)
+        character_won |= monster_died
+        in_progress &= ~monster_died
+
+    return BatchResult(character_won=character_won, character_died=character_died, turns=turns,
+                       character_health=fights.character_health, character_mana=fights.character_mana,
+                       monster_health=fights.monster_health,
+                       casts={COMMANDS[command_id]: int(count) for command_id, count in enumerate(casts) if count},
+                       failed_casts=int(failed_casts), mana_curve=numpy.array(mana_curve))
@@ -0,0 +1,156 @@
+"""
+This module holds the headless combat engine - it plays out a fight between a character and a monster
+with the same turn logic as combat.engage_combat, but takes the character's commands from a policy
+instead of input() and returns the outcome as a FightResult.
+
+Usage:
+    results = run_fights(character, monster_factory=creature_template.spawn, policy=SealThenAttackPolicy(),
+                         fight_count=1000)
+"""
+from contextlib import contextmanager
+from typing import NamedTuple, Dict, Callable
+
+from combat import get_available_spells, handle_monster_death
+from constants import SIMULATION_MAX_FIGHT_TURNS
+from entities import Character, Monster
+from events import EventBus, NullSink, use_event_bus
+from simulation.policies import Policy, ATTACK_COMMAND
+
+
+class FightResult(NamedTuple):
+    """
+    The outcome of a single headless fight
+        character_won - True if the monster died, False if the character died, None if the fight took too long
+        turns - the count of turns the fight took
+        character_health, character_mana - what the character was left with at the end of the fight
+        monster_health - what the monster was left with at the end of the fight
+        casts - Key: spell command, Value: how many times it was successfully cast
+        failed_casts - the count of casts which failed due to missing mana or a cooldown
+    """
+    character_won: bool
+    turns: int
+    character_health: float
+    character_mana: float
+    monster_health: float
+    casts: Dict[str, int]
+    failed_casts: int
+
+
+@contextmanager
+def silenced_output():
+    """
+    Emit the events of the current thread to a bus of its own with a NullSink while the context is open.
+    Everything a fight shows is emitted to the bus, so nothing else needs silencing, and with no sinks to receive
+    them, the events of the fight are not even created. The game's bus and its sinks are left alone.
+    """
+    with use_event_bus(EventBus(sinks=[NullSink()])):
+        yield
+
+
+def run_fight(character: Character, monster: Monster, policy: Policy, max_turns: int=SIMULATION_MAX_FIGHT_TURNS,
+              award_kill: bool=False, monster_guid: int=0) -> FightResult:
+    """
+    Play out a fight between the character and the monster, the way combat.engage_combat does.
+    A failed cast does not end the turn and the policy is asked again. If it insists on the same failing command,
+    the character auto attacks instead.
+    :param award_kill: A boolean indicating if the character should be awarded the kill (XP, quest progress and
+                       the killed monster) like in the game. Off by default, so that the character does not change
+                       between fights
+    :param monster_guid: the GUID the monster is awarded as, if award_kill is True
+    """
+    policy.reset()
+    available_spells: {str} = get_available_spells(character)
+    casts: {str: int} = {}
+    failed_casts = 0
+    failed_commands = set()  # the commands that failed during the current turn
+    will_end_turn = True
+    turn = 0
+    character_won = None
+
+    character.enter_combat()
+    monster.enter_combat()
+    while True:
+        if not will_end_turn:
+            will_end_turn = True
+        else:
+            turn += 1
+            if turn > max_turns:
+                break
+            failed_commands.clear()
+            monster.start_turn_update()
+            character.start_turn_update()
+
+            if monster.is_alive():
+                monster.attack(character)
+            else:  # the monster has died, most probably from a DoT
+                character_won = True
+                break
+
+        if not character.is_alive():
+            character_won = False
+            break
+
+        command = policy.choose_command(character, monster, turn)
+        if command in failed_commands:
+            command = ATTACK_COMMAND
+
+        if command == ATTACK_COMMAND:
+            character.attack(monster)
+        elif command in available_spells:
+            if character.spell_handler(command, monster):
+                casts[command] = casts.get(command, 0) + 1
+            else:
+                # don't count this iteration as a turn and ask the policy again
+                failed_casts += 1
+                failed_commands.add(command)
+                will_end_turn = False
+
+        if will_end_turn:
+            monster.end_turn_update()
+            character.end_turn_update()
+
+        if not monster.is_alive():
+            character_won = True
+            break
+
+    if character_won and award_kill:
+        handle_monster_death(character, monster, {monster_guid: monster}, monster_guid, to_loot=False)
+    result = FightResult(character_won=character_won, turns=min(turn, max_turns),
+                         character_health=character.health, character_mana=character.mana,
+                         monster_health=monster.health, casts=casts, failed_casts=failed_casts)
+    character.leave_combat()
+    monster.leave_combat()
+
+    return result
+
+
+def reset_character(character: Character):
+    """ Bring the character back to the state it was in before a fight - alive, with full health and no buffs """
+    for buff in list(character.buffs):
+        character.remove_buff(buff)
+    character.absorption_shield = 0
+    character.revive()
+    character.leave_combat()
+
+
+def run_fights(character: Character, monster_factory: Callable[[], Monster], policy: Policy, fight_count: int,
+               max_turns: int=SIMULATION_MAX_FIGHT_TURNS, to_print: bool=False) -> [FightResult]:
+    """
+    Play out fight_count fights of the character against new monsters, resetting the character after each one
+    :param monster_factory: a function returning a new monster to fight, ex: CreatureTemplate.spawn
+    :param to_print: A boolean indicating if we want to print every blow, like in the game
+    """
+    if to_print:
+        return _run_fights(character, monster_factory, policy, fight_count, max_turns)
+    with silenced_output():
+        return _run_fights(character, monster_factory, policy, fight_count, max_turns)
+
+
+def _run_fights(character: Character, monster_factory: Callable[[], Monster], policy: Policy, fight_count: int,
+                max_turns: int) -> [FightResult]:
+    results = []
+    for _ in range(fight_count):
+        results.append(run_fight(character, monster_factory(), policy, max_turns=max_turns))
+        reset_character(character)
+
+    return results
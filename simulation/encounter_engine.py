@@ -0,0 +1,244 @@
+"""
+This module holds the encounter engine - it plays out a fight between two sides: a character with its allies
+(ex: an escorted creature) against any count of monsters. Like simulation/combat_engine.py, the character's commands
+are taken from a policy and the outcome is returned as a result.
+
+Every round each alive participant takes one turn, in the order of its initiative. The turns are kept in a priority
+queue ordered by (round, initiative), so finding the next participant to act costs the same in a group of hundreds
+as in a group of two. A participant's DoTs and buffs are updated on its own turn, and only its own. A participant who
+dies is not searched for and removed from the queue - its turn is skipped once it comes up.
+Everybody attacks the first alive participant of the other side, the way a group focuses its target.
+
+Usage:
+    encounter = Encounter(character, policy=SealThenAttackPolicy())
+    for guid, monster in alive_monsters.items():
+        encounter.add_hostile(monster, guid)
+    result = encounter.run()
+"""
+import heapq
+from collections import deque
+from itertools import count
+from typing import NamedTuple, Dict, List
+
+from combat import get_available_spells
+from constants import SIMULATION_MAX_FIGHT_TURNS
+from entities import LivingThing, Character, Monster
+from simulation.combat_engine import silenced_output
+from simulation.policies import Policy, ATTACK_COMMAND
+
+# the two sides of an encounter, the order of which breaks ties in initiative -
+# the hostiles act first, the way the monster strikes first in combat.engage_combat
+TEAM_HOSTILE, TEAM_CHARACTER = 'hostile', 'character'
+TEAMS = (TEAM_HOSTILE, TEAM_CHARACTER)
+OPPOSING_TEAMS = {TEAM_HOSTILE: TEAM_CHARACTER, TEAM_CHARACTER: TEAM_HOSTILE}
+
+
+class Participant:
+    """
+    A living thing taking part in an encounter
+        guid - the GUID of the participant, None for the character
+        initiative - the higher it is, the earlier the participant acts in a round
+        order - the count of participants which joined the encounter before this one, the last tie breaker
+    """
+    __slots__ = ('entity', 'team', 'guid', 'initiative', 'order')
+
+    def __init__(self, entity: LivingThing, team: str, guid: int, initiative: int, order: int):
+        self.entity = entity
+        self.team = team
+        self.guid = guid
+        self.initiative = initiative
+        self.order = order
+
+    def __repr__(self):
+        return f'Participant({self.entity.name}, {self.team}, guid={self.guid})'
+
+    def turn_key(self, round_number: int) -> tuple:
+        """ :return: the key the participant's turn in the given round is ordered by in the turn queue """
+        return round_number, -self.initiative, TEAMS.index(self.team), self.order
+
+
+class EncounterResult(NamedTuple):
+    """
+    The outcome of an encounter
+        character_won - True if every hostile died, False if the character's side died,
+                        None if the encounter took too long
+        rounds - the count of rounds the encounter took
+        turns - the count of turns taken by all participants
+        character_health, character_mana - what the character was left with at the end of the encounter
+        deaths - the GUIDs of the participants who died, in the order they died (the character's is None)
+        casts - Key: spell command, Value: how many times it was successfully cast
+        failed_casts - the count of casts which failed due to missing mana or a cooldown
+    """
+    character_won: bool
+    rounds: int
+    turns: int
+    character_health: float
+    character_mana: float
+    deaths: List[int]
+    casts: Dict[str, int]
+    failed_casts: int
+
+
+class Encounter:
+    """
+    A fight of the character and its allies against a group of hostiles.
+    Allies and hostiles are Monsters - an ally simply fights on the character's side.
+    """
+    def __init__(self, character: Character, policy: Policy, max_rounds: int=SIMULATION_MAX_FIGHT_TURNS,
+                 award_kills: bool=False):
+        """
+        :param policy: the policy choosing the character's command on each of its turns, the target of which is
+                       the first alive hostile
+        :param award_kills: A boolean indicating if the character should be awarded every hostile which dies
+                            (XP, quest progress and the killed monster) like in the game
+        """
+        self.character = character
+        self.policy = policy
+        self.max_rounds = max_rounds
+        self.award_kills = award_kills
+        self.round = 0
+        self.turns = 0
+        self.deaths: [int] = []
+        self.casts: {str: int} = {}
+        self.failed_casts = 0
+        self.participants: [Participant] = []
+        self._join_order = count()
+        self._turn_queue: [(tuple, Participant)] = []  # a heap of (turn key, participant)
+        # the alive participants of each side in the order they joined, the dead are dropped once they reach the front
+        self._targets: {str: deque} = {team: deque() for team in TEAMS}
+        self._alive_counts: {str: int} = {team: 0 for team in TEAMS}
+        self._character_participant = self._add_participant(character, TEAM_CHARACTER, guid=None, initiative=None)
+
+    def __len__(self):
+        """ :return: the count of alive participants """
+        return sum(self._alive_counts.values())
+
+    def add_hostile(self, monster: Monster, guid: int, initiative: int=None) -> Participant:
+        """ :param initiative: the initiative of the monster, its level by default """
+        return self._add_participant(monster, TEAM_HOSTILE, guid, initiative)
+
+    def add_ally(self, monster: Monster, guid: int, initiative: int=None) -> Participant:
+        """ :param initiative: the initiative of the monster, its level by default """
+        return self._add_participant(monster, TEAM_CHARACTER, guid, initiative)
+
+    def _add_participant(self, entity: LivingThing, team: str, guid: int or None, initiative: int or None):
+        if not entity.is_alive():
+            raise Exception(f'{entity.name} cannot join the encounter, as it is dead!')
+        participant = Participant(entity, team, guid, entity.level if initiative is None else initiative,
+                                  next(self._join_order))
+        # a participant joining mid-encounter takes its first turn in the current round
+        heapq.heappush(self._turn_queue, (participant.turn_key(max(self.round, 1)), participant))
+        self.participants.append(participant)
+        self._targets[team].append(participant)
+        self._alive_counts[team] += 1
+        entity.enter_combat()
+
+        return participant
+
+    def get_target(self, team: str) -> Participant or None:
+        """ :return: the first alive participant of the given side, None if they have all died """
+        targets = self._targets[team]
+        while targets and not targets[0].entity.is_alive():
+            targets.popleft()
+        return targets[0] if targets else None
+
+    def is_over(self) -> bool:
+        return not self._alive_counts[TEAM_HOSTILE] or not self._alive_counts[TEAM_CHARACTER]
+
+    def run(self, to_print: bool=False) -> EncounterResult:
+        """
+        Play out the encounter until one of the sides dies or it takes more than max_rounds rounds
+        :param to_print: A boolean indicating if we want to print every blow, like in the game
+        """
+        if to_print:
+            return self._run()
+        with silenced_output():
+            return self._run()
+
+    def _run(self) -> EncounterResult:
+        self.policy.reset()
+        self._available_spells: {str} = get_available_spells(self.character)
+
+        while not self.is_over():
+            (round_number, *_), participant = heapq.heappop(self._turn_queue)
+            if not participant.entity.is_alive():
+                continue  # the participant has died since its turn was queued
+            if round_number > self.max_rounds:
+                break
+
+            self.round = round_number
+            self._take_turn(participant)
+            if participant.entity.is_alive():
+                heapq.heappush(self._turn_queue, (participant.turn_key(round_number + 1), participant))
+
+        if not self._alive_counts[TEAM_HOSTILE]:
+            character_won = True
+        elif not self._alive_counts[TEAM_CHARACTER]:
+            character_won = False
+        else:
+            character_won = None
+        result = EncounterResult(character_won=character_won, rounds=self.round, turns=self.turns,
+                                 character_health=self.character.health, character_mana=self.character.mana,
+                                 deaths=list(self.deaths), casts=dict(self.casts), failed_casts=self.failed_casts)
+        self._leave_combat()
+
+        return result
+
+    def _take_turn(self, participant: Participant):
+        """ Update the participant's DoTs, have it act on its target, then update its buffs """
+        self.turns += 1
+        entity = participant.entity
+
+        entity.start_turn_update()
+        if not entity.is_alive():  # it has died from a DoT
+            self._handle_death(participant)
+            return
+
+        target = self.get_target(OPPOSING_TEAMS[participant.team])
+        if participant is self._character_participant:
+            self._take_character_turn(target.entity)
+        else:
+            _auto_attack(entity, target.entity)
+
+        if not target.entity.is_alive():
+            self._handle_death(target)
+        entity.end_turn_update()
+
+    def _take_character_turn(self, target: Monster):
+        """
+        Use the command the policy chooses. A failed cast does not end the turn and the policy is asked again.
+        If it insists on a command which failed, the character auto attacks instead.
+        """
+        failed_commands = set()
+        while True:
+            command = self.policy.choose_command(self.character, target, self.round)
+            if command in failed_commands:
+                command = ATTACK_COMMAND
+
+            if command == ATTACK_COMMAND:
+                self.character.attack(target)
+            elif command in self._available_spells:
+                if not self.character.spell_handler(command, target):
+                    self.failed_casts += 1
+                    failed_commands.add(command)
+                    continue
+                self.casts[command] = self.casts.get(command, 0) + 1
+            break
+
+    def _handle_death(self, participant: Participant):
+        self._alive_counts[participant.team] -= 1
+        self.deaths.append(participant.guid)
+        if self.award_kills and participant.team == TEAM_HOSTILE and self.character.is_alive():
+            self.character.award_monster_kill(monster=participant.entity, monster_guid=participant.guid)
+
+    def _leave_combat(self):
+        for participant in self.participants:
+            participant.entity.leave_combat()
+
+
+def _auto_attack(attacker: Monster, victim: LivingThing):
+    """ Have a monster auto attack a character, or another monster if it is on the character's side """
+    if isinstance(victim, Character):
+        attacker.attack(victim)
+    else:
+        victim.take_attack(attacker.get_auto_attack_damage(victim.level), attacker.level)
@@ -0,0 +1,140 @@
+"""
+This module holds the policies which play the character's side of a headless fight.
+A policy is asked for a command at every turn, the same commands a player would type in combat:
+    'attack' - an auto attack
+    'sor', 'fol', 'ms' - Seal of Righteousness, Flash of Light and Melting Strike
+Every policy also decides for a whole batch of fights at once (see simulation/batch_engine.py),
+where the commands are represented by their index in COMMANDS.
+"""
+import numpy
+
+from classes import Paladin
+from entities import Character, Monster
+
+ATTACK_COMMAND = 'attack'
+SEAL_OF_RIGHTEOUSNESS_COMMAND = 'sor'
+FLASH_OF_LIGHT_COMMAND = 'fol'
+MELTING_STRIKE_COMMAND = 'ms'
+COMMANDS = (ATTACK_COMMAND, SEAL_OF_RIGHTEOUSNESS_COMMAND, FLASH_OF_LIGHT_COMMAND, MELTING_STRIKE_COMMAND)
+COMMAND_IDS = {command: command_id for command_id, command in enumerate(COMMANDS)}
+ATTACK_ID, SEAL_OF_RIGHTEOUSNESS_ID, FLASH_OF_LIGHT_ID, MELTING_STRIKE_ID = range(len(COMMANDS))
+
+
+class Policy:
+    """ The base class for all policies """
+    name = 'policy'
+
+    def reset(self):
+        """ Called before every fight, so that a policy which keeps state can start over """
+        pass
+
+    def choose_command(self, character: Character, monster: Monster, turn: int) -> str:
+        """
+        :param turn: the number of the current turn, starting from 1
+        :return: the command the character uses this turn
+        """
+        raise NotImplementedError()
+
+    def reset_batch(self, fight_count: int):
+        """ Called before a batch of fights is simulated, so that a policy which keeps state can start over """
+        pass
+
+    def choose_commands(self, fights: 'FightBatch', turn: int, asked: numpy.ndarray) -> numpy.ndarray:
+        """
+        Decide the command of every fight in the batch at once
+        :param asked: a boolean array, True for the fights which are asked for a command
+        :return: an array holding the ID of the command each fight uses this turn
+        """
+        raise NotImplementedError()
+
+
+class AlwaysAttackPolicy(Policy):
+    """ Auto attacks every turn """
+    name = 'always attack'
+
+    def choose_command(self, character: Character, monster: Monster, turn: int) -> str:
+        return ATTACK_COMMAND
+
+    def choose_commands(self, fights: 'FightBatch', turn: int, asked: numpy.ndarray) -> numpy.ndarray:
+        return numpy.full(fights.fight_count, ATTACK_ID)
+
+
+class SealThenAttackPolicy(Policy):
+    """ Activates Seal of Righteousness whenever it is not active and auto attacks otherwise """
+    name = 'sor then attack'
+
+    def choose_command(self, character: Character, monster: Monster, turn: int) -> str:
+        if not character.SOR_ACTIVE:
+            return SEAL_OF_RIGHTEOUSNESS_COMMAND
+        return ATTACK_COMMAND
+
+    def choose_commands(self, fights: 'FightBatch', turn: int, asked: numpy.ndarray) -> numpy.ndarray:
+        return numpy.where(fights.sor_active, ATTACK_ID, SEAL_OF_RIGHTEOUSNESS_ID)
+
+
+class HealBelowPolicy(Policy):
+    """
+    Casts Flash of Light whenever the character's health drops below a percentage of its maximum health,
+    otherwise (or if the character has not learned it yet) lets another policy decide
+    """
+    def __init__(self, health_percentage: float=0.3, fallback_policy: Policy=None):
+        self.health_percentage = health_percentage
+        self.fallback_policy = fallback_policy or AlwaysAttackPolicy()
+        self.name = f'heal below {health_percentage:.0%}, otherwise {self.fallback_policy.name}'
+
+    def reset(self):
+        self.fallback_policy.reset()
+
+    def reset_batch(self, fight_count: int):
+        self.fallback_policy.reset_batch(fight_count)
+
+    def choose_command(self, character: Character, monster: Monster, turn: int) -> str:
+        if (character.health < character.max_health * self.health_percentage
+                and Paladin.KEY_FLASH_OF_LIGHT in character.learned_spells):
+            return FLASH_OF_LIGHT_COMMAND
+        return self.fallback_policy.choose_command(character, monster, turn)
+
+    def choose_commands(self, fights: 'FightBatch', turn: int, asked: numpy.ndarray) -> numpy.ndarray:
+        should_heal = ((fights.character_health < fights.character_max_health * self.health_percentage)
+                       & (FLASH_OF_LIGHT_ID in fights.spells))
+        # the fallback is asked only where it would be asked in a single fight
+        fallback_commands = self.fallback_policy.choose_commands(fights, turn, asked & ~should_heal)
+        return numpy.where(should_heal, FLASH_OF_LIGHT_ID, fallback_commands)
+
+
+class ScriptedPolicy(Policy):
+    """ Uses the given commands in order, auto attacking once they run out """
+    def __init__(self, commands: [str]):
+        self.commands = list(commands)
+        self._next_command_index = 0
+        self._command_ids = numpy.array([COMMAND_IDS[command] for command in self.commands] + [ATTACK_ID])
+        self._next_command_indices: numpy.ndarray = None  # the next command index of every fight in a batch
+        self.name = f'scripted {", ".join(self.commands)}'
+
+    def reset(self):
+        self._next_command_index = 0
+
+    def reset_batch(self, fight_count: int):
+        self._next_command_indices = numpy.zeros(fight_count, dtype=numpy.int64)
+
+    def choose_command(self, character: Character, monster: Monster, turn: int) -> str:
+        if self._next_command_index >= len(self.commands):
+            return ATTACK_COMMAND
+
+        command = self.commands[self._next_command_index]
+        self._next_command_index += 1
+        return command
+
+    def choose_commands(self, fights: 'FightBatch', turn: int, asked: numpy.ndarray) -> numpy.ndarray:
+        # the last command ID is an attack, used once the commands run out
+        command_ids = self._command_ids[numpy.minimum(self._next_command_indices, len(self.commands))]
+        self._next_command_indices += asked
+        return command_ids
+
+
+# Key: the name a policy is chosen by from the command line, Value: a function creating the policy
+POLICIES = {
+    'attack': AlwaysAttackPolicy,
+    'sor': SealThenAttackPolicy,
+    'heal': lambda: HealBelowPolicy(fallback_policy=SealThenAttackPolicy())
+}
@@ -0,0 +1,163 @@
+"""
+This module runs balance sweeps - a batch of simulated fights (see simulation/batch_engine.py) for every point of a
+grid of character levels, creatures and policies - sharded across a pool of worker processes.
+
+Every grid point rolls with its own random stream, derived from the master seed and the point's index in the grid,
+so a sweep with the same master seed gives bit-identical results no matter how many workers run it
+or how the points are split into shards.
+
+Usage:
+    world = load_sweep_world(character_levels=range(1, 8), creature_entries=[11, 12])
+    points = build_grid(range(1, 8), [11, 12], ['attack', 'sor', 'heal'])
+    results = run_sweep(world, points, fight_count=100_000, master_seed=42)
+"""
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from io import StringIO
+from itertools import product, repeat
+from typing import NamedTuple, Dict
+
+import numpy
+
+from classes import Paladin
+from constants import SIMULATION_MAX_FIGHT_TURNS, SIMULATION_SWEEP_POINTS_PER_SHARD
+from simulation.batch_engine import simulate_fights
+from simulation.policies import POLICIES
+
+
+class SweepPoint(NamedTuple):
+    """
+    A single point of the sweep's grid
+        index - the point's position in the grid, its random stream is derived from it
+        policy - the name of the policy in simulation.policies.POLICIES
+    """
+    index: int
+    character_level: int
+    creature_entry: int
+    policy: str
+
+
+class SweepResult(NamedTuple):
+    """
+    A row of the sweep's summary table, holding the outcome of the fights of a single grid point
+        average_time_to_kill - the average count of turns of the fights the character won, NaN if it won none
+        average_mana_left - the average mana the character was left with at the end of a fight
+    """
+    character_level: int
+    creature_entry: int
+    creature_name: str
+    creature_level: int
+    policy: str
+    fight_count: int
+    win_rate: float
+    death_rate: float
+    average_time_to_kill: float
+    average_mana_left: float
+
+
+class SweepWorld(NamedTuple):
+    """
+    The static world data a sweep needs, loaded once by the main process and handed to every worker once
+        characters - Key: level, Value: a Paladin of that level
+        creature_templates - Key: entry, Value: the CreatureTemplate of that creature
+    """
+    characters: Dict[int, Paladin]
+    creature_templates: Dict[int, 'CreatureTemplate']
+
+
+# the world of the current worker process, set by _initialize_worker
+_worker_world: SweepWorld = None
+
+
+def create_character(level: int) -> Paladin:
+    """
+    Create a Paladin of the given level which keeps its own spells.
+    Paladin.learned_spells is shared by every Paladin (see the TODO in classes.py), so a character would otherwise
+    know the spells of any higher level character created before it.
+    """
+    Paladin.learned_spells = {}
+    with redirect_stdout(StringIO()):  # silence the learned spells
+        character = Paladin(name='Simulator', level=level)
+    character.learned_spells = Paladin.learned_spells
+
+    return character
+
+
+def load_sweep_world(character_levels: [int], creature_entries: [int], db_session=None) -> SweepWorld:
+    """
+    Load the characters and creatures of a sweep
+    :param db_session: the session to query with, which is the game's session by default
+    """
+    import database.main
+    from models.creatures.creature_template import CreatureTemplateSchema
+
+    db_session = db_session or database.main.session
+    creature_templates = {}
+    for creature_entry in creature_entries:
+        creature_template_schema = db_session.query(CreatureTemplateSchema).get(creature_entry)
+        if creature_template_schema is None:
+            raise Exception(f'There is no creature with entry {creature_entry} in creature_template!')
+        creature_templates[creature_entry] = creature_template_schema.convert_to_creature_template()
+
+    original_learned_spells = Paladin.learned_spells
+    characters = {level: create_character(level) for level in character_levels}
+    Paladin.learned_spells = original_learned_spells
+
+    return SweepWorld(characters=characters, creature_templates=creature_templates)
+
+
+def build_grid(character_levels: [int], creature_entries: [int], policies: [str]) -> [SweepPoint]:
+    """ Build every combination of the given character levels, creatures and policies """
+    for policy in policies:
+        if policy not in POLICIES:
+            raise Exception(f'{policy} is not a valid policy! Choose from {", ".join(POLICIES)}')
+
+    return [SweepPoint(index=index, character_level=character_level, creature_entry=creature_entry, policy=policy)
+            for index, (character_level, creature_entry, policy)
+            in enumerate(product(character_levels, creature_entries, policies))]
+
+
+def get_random_generator(master_seed: int, point: SweepPoint) -> numpy.random.Generator:
+    """ Create the independent random stream of a grid point, which depends only on the master seed and its index """
+    return numpy.random.default_rng(numpy.random.SeedSequence(master_seed, spawn_key=(point.index,)))
+
+
+def run_point(world: SweepWorld, point: SweepPoint, fight_count: int, master_seed: int,
+              max_turns: int=SIMULATION_MAX_FIGHT_TURNS) -> SweepResult:
+    creature_template = world.creature_templates[point.creature_entry]
+    result = simulate_fights(world.characters[point.character_level], creature_template.spawn(),
+                             POLICIES[point.policy](), fight_count, max_turns=max_turns,
+                             random_generator=get_random_generator(master_seed, point))
+
+    won_turns = result.turns[result.character_won]
+    return SweepResult(character_level=point.character_level, creature_entry=point.creature_entry,
+                       creature_name=creature_template.name, creature_level=creature_template.level,
+                       policy=point.policy, fight_count=fight_count, win_rate=float(result.win_rate),
+                       death_rate=float(result.death_rate),
+                       average_time_to_kill=float(won_turns.mean()) if len(won_turns) else float('nan'),
+                       average_mana_left=float(result.character_mana.mean()))
+
+
+def _initialize_worker(world: SweepWorld):
+    global _worker_world
+    _worker_world = world
+
+
+def _run_shard(points: [SweepPoint], fight_count: int, master_seed: int, max_turns: int) -> [SweepResult]:
+    return [run_point(_worker_world, point, fight_count, master_seed, max_turns=max_turns) for point in points]
+
+
+def run_sweep(world: SweepWorld, points: [SweepPoint], fight_count: int, master_seed: int, workers: int=None,
+              points_per_shard: int=SIMULATION_SWEEP_POINTS_PER_SHARD,
+              max_turns: int=SIMULATION_MAX_FIGHT_TURNS) -> [SweepResult]:
+    """
+    Simulate fight_count fights for every grid point on a pool of worker processes
+    :param workers: the count of worker processes, the count of CPUs by default
+    :return: the summary table - a SweepResult for every point, in the order of the points
+    """
+    shards = [points[index:index + points_per_shard] for index in range(0, len(points), points_per_shard)]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_initialize_worker, initargs=(world,)) as executor:
+        shard_results = executor.map(_run_shard, shards, repeat(fight_count), repeat(master_seed),
+                                     repeat(max_turns))
+        return [result for shard_result in shard_results for result in shard_result]
@@ -2231,418 +2231,173 @@ INSERT INTO item_template (
 DROP TABLE IF EXISTS loot_table;
 
 CREATE TABLE loot_table (
-    entry         INTEGER PRIMARY KEY AUTOINCREMENT,
-    item1_ID      INTEGER DEFAULT (0) 
-                          REFERENCES item_template (entry),
-    item1_chance  INTEGER DEFAULT (0),
-    item2_ID      INTEGER DEFAULT (0) 
-                          REFERENCES item_template (entry),
-    item2_chance  INTEGER DEFAULT (0),
-    item3_ID      INTEGER DEFAULT (0) 
-                          REFERENCES item_template (entry),
-    item3_chance  INTEGER DEFAULT (0),
-    item4_ID      INTEGER DEFAULT (0) 
-                          REFERENCES item_template (entry),
-    item4_chance  INTEGER DEFAULT (0),
-    item5_ID      INTEGER DEFAULT (0) 
-                          REFERENCES item_template (entry),
-    item5_chance  INTEGER DEFAULT (0),
-    item6_ID      INTEGER DEFAULT (0) 
-                          REFERENCES item_template (entry),
-    item6_chance  INTEGER DEFAULT (0),
-    item7_ID      INTEGER DEFAULT (0) 
-                          REFERENCES item_template (entry),
-    item7_chance  INTEGER DEFAULT (0),
-    item8_ID      INTEGER DEFAULT (0) 
-                          REFERENCES item_template (entry),
-    item8_chance  INTEGER DEFAULT (0),
-    item9_ID      INTEGER DEFAULT (0) 
-                          REFERENCES item_template (entry),
-    item9_chance  INTEGER DEFAULT (0),
-    item10_ID     INTEGER DEFAULT (0) 
-                          REFERENCES item_template (entry),
-    item10_chance INTEGER DEFAULT (0),
-    item11_ID     INTEGER DEFAULT (0) 
-                          REFERENCES item_template (entry),
-    item11_chance INTEGER DEFAULT (0),
-    item12_ID     INTEGER DEFAULT (0) 
-                          REFERENCES item_template (entry),
-    item12_chance INTEGER DEFAULT (0),
-    item13_ID     INTEGER DEFAULT (0) 
-                          REFERENCES item_template (entry),
-    item13_chance INTEGER DEFAULT (0),
-    item14_ID     INTEGER DEFAULT (0) 
-                          REFERENCES item_template (entry),
-    item14_chance INTEGER DEFAULT (0),
-    item15_ID     INTEGER DEFAULT (0) 
-                          REFERENCES item_template (entry),
-    item15_chance INTEGER DEFAULT (0),
-    item16_ID     INTEGER DEFAULT (0) 
-                          REFERENCES item_template (entry),
-    item16_chance INTEGER DEFAULT (0),
-    item17_ID     INTEGER DEFAULT (0) 
-                          REFERENCES item_template (entry),
-    item17_chance INTEGER DEFAULT (0),
-    item18_ID     INTEGER DEFAULT (0) 
-                          REFERENCES item_template (entry),
-    item18_chance INTEGER DEFAULT (0),
-    item19_ID     INTEGER DEFAULT (0) 
-                          REFERENCES item_template (entry),
-    item19_chance INTEGER DEFAULT (0),
-    item20_ID     INTEGER DEFAULT (0) 
-                          REFERENCES item_template (entry),
-    item20_chance INTEGER DEFAULT (0) 
+    entry INTEGER PRIMARY KEY AUTOINCREMENT
 );
 
 INSERT INTO loot_table (
-                           entry,
-                           item1_ID,
-                           item1_chance,
-                           item2_ID,
-                           item2_chance,
-                           item3_ID,
-                           item3_chance,
-                           item4_ID,
-                           item4_chance,
-                           item5_ID,
-                           item5_chance,
-                           item6_ID,
-                           item6_chance,
-                           item7_ID,
-                           item7_chance,
-                           item8_ID,
-                           item8_chance,
-                           item9_ID,
-                           item9_chance,
-                           item10_ID,
-                           item10_chance,
-                           item11_ID,
-                           item11_chance,
-                           item12_ID,
-                           item12_chance,
-                           item13_ID,
-                           item13_chance,
-                           item14_ID,
-                           item14_chance,
-                           item15_ID,
-                           item15_chance,
-                           item16_ID,
-                           item16_chance,
-                           item17_ID,
-                           item17_chance,
-                           item18_ID,
-                           item18_chance,
-                           item19_ID,
-                           item19_chance,
-                           item20_ID,
-                           item20_chance
+                           entry
                        )
                        VALUES (
-                           1,
-                           1,
-                           70,
-                           2,
-                           70,
-                           4,
-                           5,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0
+                           1
                        );
 
 INSERT INTO loot_table (
-                           entry,
-                           item1_ID,
-                           item1_chance,
-                           item2_ID,
-                           item2_chance,
-                           item3_ID,
-                           item3_chance,
-                           item4_ID,
-                           item4_chance,
-                           item5_ID,
-                           item5_chance,
-                           item6_ID,
-                           item6_chance,
-                           item7_ID,
-                           item7_chance,
-                           item8_ID,
-                           item8_chance,
-                           item9_ID,
-                           item9_chance,
-                           item10_ID,
-                           item10_chance,
-                           item11_ID,
-                           item11_chance,
-                           item12_ID,
-                           item12_chance,
-                           item13_ID,
-                           item13_chance,
-                           item14_ID,
-                           item14_chance,
-                           item15_ID,
-                           item15_chance,
-                           item16_ID,
-                           item16_chance,
-                           item17_ID,
-                           item17_chance,
-                           item18_ID,
-                           item18_chance,
-                           item19_ID,
-                           item19_chance,
-                           item20_ID,
-                           item20_chance
+                           entry
                        )
                        VALUES (
-                           2,
-                           10,
-                           20,
-                           4,
-                           10,
-                           3,
-                           15,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0
+                           2
                        );
 
 INSERT INTO loot_table (
-                           entry,
-                           item1_ID,
-                           item1_chance,
-                           item2_ID,
-                           item2_chance,
-                           item3_ID,
-                           item3_chance,
-                           item4_ID,
-                           item4_chance,
-                           item5_ID,
-                           item5_chance,
-                           item6_ID,
-                           item6_chance,
-                           item7_ID,
-                           item7_chance,
-                           item8_ID,
-                           item8_chance,
-                           item9_ID,
-                           item9_chance,
-                           item10_ID,
-                           item10_chance,
-                           item11_ID,
-                           item11_chance,
-                           item12_ID,
-                           item12_chance,
-                           item13_ID,
-                           item13_chance,
-                           item14_ID,
-                           item14_chance,
-                           item15_ID,
-                           item15_chance,
-                           item16_ID,
-                           item16_chance,
-                           item17_ID,
-                           item17_chance,
-                           item18_ID,
-                           item18_chance,
-                           item19_ID,
-                           item19_chance,
-                           item20_ID,
-                           item20_chance
+                           entry
                        )
                        VALUES (
-                           3,
-                           10,
-                           50,
-                           4,
-                           20,
-                           3,
-                           20,
-                           9,
-                           100,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0
+                           3
                        );
 
 INSERT INTO loot_table (
-                           entry,
-                           item1_ID,
-                           item1_chance,
-                           item2_ID,
-                           item2_chance,
-                           item3_ID,
-                           item3_chance,
-                           item4_ID,
-                           item4_chance,
-                           item5_ID,
-                           item5_chance,
-                           item6_ID,
-                           item6_chance,
-                           item7_ID,
-                           item7_chance,
-                           item8_ID,
-                           item8_chance,
-                           item9_ID,
-                           item9_chance,
-                           item10_ID,
-                           item10_chance,
-                           item11_ID,
-                           item11_chance,
-                           item12_ID,
-                           item12_chance,
-                           item13_ID,
-                           item13_chance,
-                           item14_ID,
-                           item14_chance,
-                           item15_ID,
-                           item15_chance,
-                           item16_ID,
-                           item16_chance,
-                           item17_ID,
-                           item17_chance,
-                           item18_ID,
-                           item18_chance,
-                           item19_ID,
-                           item19_chance,
-                           item20_ID,
-                           item20_chance
+                           entry
                        )
                        VALUES (
-                           4,
-                           14,
-                           100,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0,
-                           0
+                           4
                        );
 
 
+-- Table: loot_table_entry
+DROP TABLE IF EXISTS loot_table_entry;
+
+CREATE TABLE loot_table_entry (
+    loot_table_id INTEGER REFERENCES loot_table (entry),
+    item_id       INTEGER REFERENCES item_template (entry),
+    chance        INTEGER DEFAULT (0),
+    PRIMARY KEY (
+        loot_table_id,
+        item_id
+    )
+);
+
+INSERT INTO loot_table_entry (
+                                 loot_table_id,
+                                 item_id,
+                                 chance
+                             )
+                             VALUES (
+                                 1,
+                                 1,
+                                 70
+                             );
+
+INSERT INTO loot_table_entry (
+                                 loot_table_id,
+                                 item_id,
+                                 chance
+                             )
+                             VALUES (
+                                 1,
+                                 2,
+                                 70
+                             );
+
+INSERT INTO loot_table_entry (
+                                 loot_table_id,
+                                 item_id,
+                                 chance
+                             )
+                             VALUES (
+                                 1,
+                                 4,
+                                 5
+                             );
+
+INSERT INTO loot_table_entry (
+                                 loot_table_id,
+                                 item_id,
+                                 chance
+                             )
+                             VALUES (
+                                 2,
+                                 10,
+                                 20
+                             );
+
+INSERT INTO loot_table_entry (
+                                 loot_table_id,
+                                 item_id,
+                                 chance
+                             )
+                             VALUES (
+                                 2,
+                                 4,
+                                 10
+                             );
+
+INSERT INTO loot_table_entry (
+                                 loot_table_id,
+                                 item_id,
+                                 chance
+                             )
+                             VALUES (
+                                 2,
+                                 3,
+                                 15
+                             );
+
+INSERT INTO loot_table_entry (
+                                 loot_table_id,
+                                 item_id,
+                                 chance
+                             )
+                             VALUES (
+                                 3,
+                                 10,
+                                 50
+                             );
+
+INSERT INTO loot_table_entry (
+                                 loot_table_id,
+                                 item_id,
+                                 chance
+                             )
+                             VALUES (
+                                 3,
+                                 4,
+                                 20
+                             );
+
+INSERT INTO loot_table_entry (
+                                 loot_table_id,
+                                 item_id,
+                                 chance
+                             )
+                             VALUES (
+                                 3,
+                                 3,
+                                 20
+                             );
+
+INSERT INTO loot_table_entry (
+                                 loot_table_id,
+                                 item_id,
+                                 chance
+                             )
+                             VALUES (
+                                 3,
+                                 9,
+                                 100
+                             );
+
+INSERT INTO loot_table_entry (
+                                 loot_table_id,
+                                 item_id,
+                                 chance
+                             )
+                             VALUES (
+                                 4,
+                                 14,
+                                 100
+                             );
+
+
 -- Table: level_xp_requirement
 DROP TABLE IF EXISTS level_xp_requirement;
 
@@ -2874,5 +2629,94 @@ INSERT INTO levelup_stats (
                           );
 
 
+-- Table: content_version
+DROP TABLE IF EXISTS content_version;
+
+CREATE TABLE content_version (
+    version INTEGER NOT NULL
+);
+
+INSERT INTO content_version (
+                                version
+                            )
+                            VALUES (
+                                1
+                            );
+
+-- Triggers: content_version_*, see database/migrations/content_version.py
+
+CREATE TRIGGER content_version_creature_defaults_insert
+         AFTER INSERT
+            ON creature_defaults
+BEGIN
+    UPDATE content_version
+       SET version = abs(random() );
+END;
+
+CREATE TRIGGER content_version_creature_defaults_update
+         AFTER UPDATE
+            ON creature_defaults
+BEGIN
+    UPDATE content_version
+       SET version = abs(random() );
+END;
+
+CREATE TRIGGER content_version_creature_defaults_delete
+         AFTER DELETE
+            ON creature_defaults
+BEGIN
+    UPDATE content_version
+       SET version = abs(random() );
+END;
+
+CREATE TRIGGER content_version_levelup_stats_insert
+         AFTER INSERT
+            ON levelup_stats
+BEGIN
+    UPDATE content_version
+       SET version = abs(random() );
+END;
+
+CREATE TRIGGER content_version_levelup_stats_update
+         AFTER UPDATE
+            ON levelup_stats
+BEGIN
+    UPDATE content_version
+       SET version = abs(random() );
+END;
+
+CREATE TRIGGER content_version_levelup_stats_delete
+         AFTER DELETE
+            ON levelup_stats
+BEGIN
+    UPDATE content_version
+       SET version = abs(random() );
+END;
+
+CREATE TRIGGER content_version_level_xp_requirement_insert
+         AFTER INSERT
+            ON level_xp_requirement
+BEGIN
+    UPDATE content_version
+       SET version = abs(random() );
+END;
+
+CREATE TRIGGER content_version_level_xp_requirement_update
+         AFTER UPDATE
+            ON level_xp_requirement
+BEGIN
+    UPDATE content_version
+       SET version = abs(random() );
+END;
+
+CREATE TRIGGER content_version_level_xp_requirement_delete
+         AFTER DELETE
+            ON level_xp_requirement
+BEGIN
+    UPDATE content_version
+       SET version = abs(random() );
+END;
+
+
 COMMIT TRANSACTION;
 PRAGMA foreign_keys = on;
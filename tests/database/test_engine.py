@@ -0,0 +1,74 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import database.main
+from tests.create_test_db import engine, session, Base
+
+database.main.engine = engine
+database.main.session = session
+database.main.Base = Base
+
+import models.main
+from sqlalchemy.exc import OperationalError
+from database.engine import create_game_engine, create_template_engine, get_template_engine, RoutingSession
+from database.snapshot import get_current_database_path
+from models.characters.saved_character import SavedCharacterSchema, KilledMonstersSchema
+from models.items.item_template import ItemTemplateSchema
+
+
+class EngineTests(unittest.TestCase):
+    """
+    Every test works on a copy of the test database, since the game engine changes its journal mode
+    """
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'test.db')
+        shutil.copyfile(get_current_database_path(), self.db_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_game_engine_runs_pragmas(self):
+        game_engine = create_game_engine(self.db_path, pragmas={'journal_mode': 'WAL', 'cache_size': -1234})
+
+        with game_engine.connect() as connection:
+            self.assertEqual(connection.execute('PRAGMA journal_mode').scalar(), 'wal')
+            self.assertEqual(connection.execute('PRAGMA cache_size').scalar(), -1234)
+
+    def test_template_engine_is_read_only(self):
+        template_engine = create_template_engine(self.db_path)
+
+        with template_engine.connect() as connection:
+            self.assertGreater(connection.execute('SELECT COUNT(*) FROM item_template').scalar(), 0)
+            with self.assertRaises(OperationalError):
+                connection.execute('DELETE FROM item_template')
+
+    def test_get_template_engine_is_cached(self):
+        game_engine = create_game_engine(self.db_path)
+
+        self.assertIs(get_template_engine(game_engine), get_template_engine(game_engine))
+
+    def test_routing_session(self):
+        game_engine = create_game_engine(self.db_path)
+        db_session = RoutingSession()
+
+        with mock.patch('database.main.engine', game_engine):
+            self.assertIs(db_session.get_bind(SavedCharacterSchema.__mapper__), game_engine)
+            self.assertIs(db_session.get_bind(clause=KilledMonstersSchema.__table__.insert()), game_engine)
+            self.assertIs(db_session.get_bind(ItemTemplateSchema.__mapper__), get_template_engine(game_engine))
+            self.assertIsNotNone(db_session.query(ItemTemplateSchema).first())
+            self.assertIsNotNone(db_session.query(SavedCharacterSchema).first())
+        db_session.close()
+
+    def test_routing_session_with_explicit_bind(self):
+        db_session = RoutingSession(bind=engine)
+
+        self.assertIs(db_session.get_bind(SavedCharacterSchema.__mapper__), engine)
+        self.assertIs(db_session.get_bind(ItemTemplateSchema.__mapper__), engine)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import sqlite3
+import unittest
+
+from database.migrations import loot_table_entry, content_version
+from database.migrations.loot_table_entry import WIDE_LOOT_TABLE_ITEM_SLOTS
+
+
+class LootTableEntryMigrationTests(unittest.TestCase):
+    """
+    Tests for the migration of the wide loot_table into loot_table_entry, on an in-memory database
+    """
+    def setUp(self):
+        self.connection = sqlite3.connect(':memory:')
+        slot_columns = ', '.join(f'item{slot}_ID INTEGER DEFAULT (0), item{slot}_chance INTEGER DEFAULT (0)'
+                                 for slot in range(1, WIDE_LOOT_TABLE_ITEM_SLOTS + 1))
+        self.connection.execute(f'CREATE TABLE loot_table (entry INTEGER PRIMARY KEY AUTOINCREMENT, {slot_columns})')
+        self._insert_wide_row(1, [(4, 55), (3, 30)])
+        self._insert_wide_row(2, [(10, 50), (0, 0), (4, 10), (10, 50), (7, 0)])  # Linen Cloth is in two slots
+        self._insert_wide_row(3, [])
+
+    def tearDown(self):
+        self.connection.close()
+
+    def _insert_wide_row(self, entry: int, items_and_chances: [(int, int)]):
+        columns = ['entry'] + [f'item{slot}_{column}' for slot in range(1, len(items_and_chances) + 1)
+                               for column in ('ID', 'chance')]
+        values = [entry] + [value for item_and_chance in items_and_chances for value in item_and_chance]
+        self.connection.execute(f'INSERT INTO loot_table ({", ".join(columns)}) '
+                                f'VALUES ({", ".join("?" * len(values))})', values)
+
+    def test_migrate(self):
+        loot_table_entry.migrate(self.connection)
+
+        self.assertTrue(loot_table_entry.is_migrated(self.connection))
+        self.assertEqual(self.connection.execute('SELECT * FROM loot_table_entry').fetchall(),
+                         [(1, 4, 55), (1, 3, 30), (2, 10, 75), (2, 4, 10)])
+        self.assertEqual(self.connection.execute('SELECT * FROM loot_table').fetchall(), [(1,), (2,), (3,)])
+
+    def test_migrate_twice(self):
+        """ Migrating an already migrated database should not change it """
+        loot_table_entry.migrate(self.connection)
+        loot_table_entry.migrate(self.connection)
+
+        self.assertEqual(self.connection.execute('SELECT COUNT(*) FROM loot_table_entry').fetchone()[0], 4)
+
+    def test_combined_chance(self):
+        combined_chance = loot_table_entry.CombinedChance()
+        for chance in (50, 50, 20):
+            combined_chance.step(chance)
+
+        self.assertEqual(combined_chance.finalize(), 80)
+
+
+class ContentVersionMigrationTests(unittest.TestCase):
+    def setUp(self):
+        self.connection = sqlite3.connect(':memory:')
+        self.connection.execute('CREATE TABLE creature_defaults (creature_level INTEGER, armor INTEGER)')
+        self.connection.execute('CREATE TABLE levelup_stats (level INTEGER, health INTEGER)')
+        self.connection.execute('CREATE TABLE level_xp_requirement (level INTEGER, xp_required INTEGER)')
+        self.connection.execute('INSERT INTO level_xp_requirement VALUES (1, 400)')
+
+    def tearDown(self):
+        self.connection.close()
+
+    def _get_version(self) -> int:
+        return self.connection.execute('SELECT version FROM content_version').fetchone()[0]
+
+    def test_migrate(self):
+        """ Every change of a snapshot table should change the content version """
+        content_version.migrate(self.connection)
+        content_version.migrate(self.connection)
+
+        versions = [self._get_version()]
+        for statement in ('INSERT INTO creature_defaults VALUES (1, 50)', 'UPDATE levelup_stats SET health = 1',
+                          'UPDATE level_xp_requirement SET xp_required = 1', 'DELETE FROM level_xp_requirement'):
+            self.connection.execute(statement)
+            versions.append(self._get_version())
+
+        self.assertEqual(self.connection.execute('SELECT COUNT(*) FROM content_version').fetchone()[0], 1)
+        # updating the empty levelup_stats changes no rows, so it does not change the version
+        self.assertEqual(len(set(versions)), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+import os
+import pickle
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+import database.main
+from tests.create_test_db import engine, session, Base
+
+database.main.engine = engine
+database.main.session = session
+database.main.Base = Base
+
+import models.main
+import database.snapshot
+from database.snapshot import (build_snapshot, load_world_snapshot, get_snapshot_path, get_current_database_path,
+                               SNAPSHOT_TABLES, SNAPSHOT_VERSION)
+
+
+class SnapshotTests(unittest.TestCase):
+    """
+    Tests for the precompiled snapshot of the static tables.
+    Every test works on a copy of the test database, so that touching it does not affect the other tests
+    """
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'test.db')
+        shutil.copyfile(get_current_database_path(), self.db_path)
+        self.snapshot_path = get_snapshot_path(self.db_path)
+
+    def tearDown(self):
+        database.snapshot._loaded_snapshots.pop(self.db_path, None)
+        shutil.rmtree(self.temp_dir)
+
+    def _execute(self, *statements):
+        connection = sqlite3.connect(self.db_path)
+        for statement in statements:
+            connection.execute(statement)
+        connection.commit()
+        connection.close()
+
+    def _drop_content_version(self):
+        connection = sqlite3.connect(self.db_path)
+        triggers = connection.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'").fetchall()
+        connection.close()
+        self._execute('DROP TABLE content_version', *(f'DROP TRIGGER {name}' for name, in triggers))
+
+    def test_build_snapshot(self):
+        """ Every static table should be in the snapshot with all of its rows """
+        snapshot = build_snapshot(self.db_path)
+
+        self.assertTrue(os.path.exists(self.snapshot_path))
+        connection = sqlite3.connect(self.db_path)
+        for table_name in SNAPSHOT_TABLES:
+            expected_row_count = connection.execute(f'SELECT COUNT(*) FROM {table_name}').fetchone()[0]
+            self.assertEqual(len(snapshot.rows(table_name)), expected_row_count)
+        connection.close()
+
+    def test_rows(self):
+        """ The rows should be dictionaries keyed by the column names """
+        snapshot = build_snapshot(self.db_path)
+
+        xp_reqs = {row['level']: row['xp_required'] for row in snapshot.rows('level_xp_requirement')}
+        connection = sqlite3.connect(self.db_path)
+        expected_xp_reqs = dict(connection.execute('SELECT level, xp_required FROM level_xp_requirement').fetchall())
+        connection.close()
+
+        self.assertEqual(xp_reqs, expected_xp_reqs)
+
+    def test_load_uses_existing_snapshot(self):
+        """ An up to date snapshot file should simply be read, without touching the database """
+        expected_tables = build_snapshot(self.db_path).tables
+
+        with mock.patch('database.snapshot.build_snapshot') as build_mock:
+            snapshot = load_world_snapshot(self.db_path)
+
+        self.assertFalse(build_mock.called)
+        self.assertEqual(snapshot.tables, expected_tables)
+
+    def test_load_rebuilds_when_database_changes(self):
+        """ Once the database is changed, the snapshot is stale and should get rebuilt """
+        old_snapshot = load_world_snapshot(self.db_path)
+        self._execute('UPDATE level_xp_requirement SET xp_required = 1 WHERE level = 1')
+
+        snapshot = load_world_snapshot(self.db_path)
+
+        self.assertNotEqual(snapshot.db_key, old_snapshot.db_key)
+        xp_reqs = {row['level']: row['xp_required'] for row in snapshot.rows('level_xp_requirement')}
+        self.assertEqual(xp_reqs[1], 1)
+
+    def test_load_ignores_saves(self):
+        """ Saving a character changes the database file, but not the snapshot tables """
+        snapshot = load_world_snapshot(self.db_path)
+        self._execute('UPDATE saved_character SET gold = gold + 1')
+        database.snapshot._loaded_snapshots.pop(self.db_path)
+
+        with mock.patch('database.snapshot.build_snapshot') as build_mock:
+            loaded_snapshot = load_world_snapshot(self.db_path)
+
+        self.assertFalse(build_mock.called)
+        self.assertEqual(loaded_snapshot.db_key, snapshot.db_key)
+
+    def test_load_rebuilds_recreated_table(self):
+        """ Recreating a table drops its triggers, so the snapshot should fall back to the checksum of the rows """
+        old_snapshot = load_world_snapshot(self.db_path)
+        self._execute('CREATE TABLE xp_copy AS SELECT * FROM level_xp_requirement', 'DROP TABLE level_xp_requirement',
+                      'ALTER TABLE xp_copy RENAME TO level_xp_requirement', 'DELETE FROM level_xp_requirement')
+
+        snapshot = load_world_snapshot(self.db_path)
+
+        self.assertEqual(old_snapshot.db_key[0], 'version')
+        self.assertEqual(snapshot.db_key[0], 'checksum')
+        self.assertNotEqual(old_snapshot.rows('level_xp_requirement'), [])
+        self.assertEqual(snapshot.rows('level_xp_requirement'), [])
+        self.assertTrue(snapshot.is_up_to_date(self.db_path))
+
+    def test_load_without_content_version(self):
+        """ A database which was not migrated to the content version should be keyed on the checksum of the rows """
+        self._drop_content_version()
+
+        snapshot = load_world_snapshot(self.db_path)
+        self._execute('UPDATE saved_character SET gold = gold + 1')
+        self.assertTrue(snapshot.is_up_to_date(self.db_path))
+        self._execute('UPDATE level_xp_requirement SET xp_required = 1 WHERE level = 1')
+
+        self.assertEqual(snapshot.db_key[0], 'checksum')
+        self.assertFalse(snapshot.is_up_to_date(self.db_path))
+
+    def test_load_does_not_change_the_database(self):
+        """ Loading should neither migrate the database nor touch it in any other way """
+        self._drop_content_version()
+        with open(self.db_path, 'rb') as db_file:
+            db_contents = db_file.read()
+
+        load_world_snapshot(self.db_path)
+
+        with open(self.db_path, 'rb') as db_file:
+            self.assertEqual(db_file.read(), db_contents)
+
+    def test_load_from_read_only_directory(self):
+        """ If the snapshot file can not be written, the snapshot should still be loaded """
+        with mock.patch('database.snapshot.open', side_effect=PermissionError, create=True):
+            snapshot = load_world_snapshot(self.db_path)
+
+        self.assertEqual(set(snapshot.tables.keys()), set(SNAPSHOT_TABLES))
+        self.assertFalse(os.path.exists(self.snapshot_path))
+
+    def test_load_rebuilds_old_version(self):
+        """ A snapshot file from another version of the format should be ignored and rebuilt """
+        snapshot = build_snapshot(self.db_path)
+        with open(self.snapshot_path, 'wb') as snapshot_file:
+            pickle.dump((SNAPSHOT_VERSION - 1, snapshot.db_key, {}), snapshot_file)
+
+        loaded_snapshot = load_world_snapshot(self.db_path)
+
+        self.assertEqual(loaded_snapshot.tables, snapshot.tables)
+
+    def test_load_rebuilds_corrupt_file(self):
+        """ A corrupt snapshot file should be ignored and rebuilt """
+        with open(self.snapshot_path, 'wb') as snapshot_file:
+            snapshot_file.write(b'not a snapshot')
+
+        snapshot = load_world_snapshot(self.db_path)
+
+        self.assertEqual(set(snapshot.tables.keys()), set(SNAPSHOT_TABLES))
+
+
+if __name__ == '__main__':
+    unittest.main()
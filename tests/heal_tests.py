@@ -89,6 +89,12 @@ class HealTests(unittest.TestCase):
 
         self.assertEqual(heal_1, heal_2)
 
+    def test_slots(self):
+        self.assertFalse(hasattr(Heal(heal_amount=5), '__dict__'))
+
+    def test_batch(self):
+        self.assertEqual(Heal.batch([5, 10.5]), [Heal(heal_amount=5), Heal(heal_amount=10.5)])
+
 
 class HolyHealTests(unittest.TestCase):
     def test_init(self):
@@ -203,6 +209,13 @@ class ProtectiveHealTests(unittest.TestCase):
 
         self.assertEqual(target.absorption_shield, expected_shield)
 
+    def test_batch(self):
+        target = Mock(absorption_shield=0)
+        p_heals = ProtectiveHeal.batch([50, 100], target=target)
+
+        self.assertEqual([p_heal.heal_amount for p_heal in p_heals], [50, 100])
+        self.assertTrue(all(p_heal.target is target for p_heal in p_heals))
+
 
 if __name__ == '__main__':
     unittest.main()
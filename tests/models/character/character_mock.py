@@ -53,4 +53,5 @@ loaded_scripts = {'HASKEL_PAXTON_CONVERSATION'}
 completed_quests = {1}
 killed_monsters = {14, 15, 20}
 character = Paladin(name=name, level=level, loaded_scripts=loaded_scripts, killed_monsters=killed_monsters,
-                        completed_quests=completed_quests, saved_inventory=char_inventory, saved_equipment=char_equipment)
\ No newline at end of file
+                        completed_quests=completed_quests, saved_inventory=char_inventory, saved_equipment=char_equipment)
+character.mark_saved(entry)  # the mock is the saved character with this entry
@@ -0,0 +1,58 @@
+import importlib
+import os
+import shutil
+import tempfile
+import unittest
+
+from tests.delete_test_db import delete_test_db
+import database.main
+from tests.create_test_db import engine, session, Base
+
+database.main.engine = engine
+database.main.session = session
+database.main.Base = Base
+
+import models.main
+from exceptions import NoSuchCharacterError
+from models.characters.inventory_export import export_inventory, import_inventory
+from models.characters.saved_character import SavedCharacterSchema, InventorySchema
+from tests.models.character.character_mock import entry, gold
+
+
+class InventoryExportTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'netherblood.inventory')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+        # restore the DB
+        import tests.create_test_db as create_db_mod
+        session.commit()
+        delete_test_db()
+        importlib.reload(create_db_mod)
+
+    def _get_item_counts(self, character_entry: int) -> {int: int}:
+        return {row.item_id: row.item_count
+                for row in session.query(InventorySchema).filter_by(saved_character_id=character_entry)}
+
+    def test_export_and_import(self):
+        """ Importing the exported inventory of a character into another one should give it the same items and gold """
+        expected_item_counts = self._get_item_counts(entry)
+
+        byte_count = export_inventory('Netherblood', self.path)
+        import_inventory('Visionary', self.path)
+
+        self.assertEqual(byte_count, os.path.getsize(self.path))
+        visionary = session.query(SavedCharacterSchema).filter_by(name='Visionary').one()
+        self.assertEqual(self._get_item_counts(visionary.entry), expected_item_counts)
+        self.assertEqual(visionary.gold, gold)
+
+    def test_export_unknown_character(self):
+        with self.assertRaises(NoSuchCharacterError):
+            export_inventory('Nobody', self.path)
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import importlib
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from tests.delete_test_db import delete_test_db
+import database.main
+from tests.create_test_db import engine, session, Base
+import tests.create_test_db as create_test_db
+
+database.main.engine = engine
+database.main.session = session
+database.main.Base = Base
+
+import models.main
+from models.characters.journal import (ProgressJournal, read_events, replay_event, fold_events, get_journal_path,
+                                       open_progress_journal, COMPACTING_FILE_EXTENSION)
+from models.characters.saved_character import SavedCharacterSchema, KilledMonstersSchema, InventorySchema
+from tests.models.character.character_mock import entry
+
+
+class ProgressJournalTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.journal_path = os.path.join(self.temp_dir.name, 'Netherblood.journal')
+        with mock.patch('builtins.print'):
+            self.character = session.query(SavedCharacterSchema).get(entry).convert_to_character_object()
+        session.commit()
+
+    def tearDown(self):
+        if self.character.journal is not None:
+            self.character.journal.close()
+        self.temp_dir.cleanup()
+        session.commit()
+        delete_test_db()
+        importlib.reload(create_test_db)
+
+    def test_character_records_progress(self):
+        self.character.journal = ProgressJournal(self.character, self.journal_path)
+        wolf_meat, wolf_meat_count = self.character.inventory['Wolf Meat']
+        gold = self.character.inventory['gold']
+
+        self.character.award_monster_kill(mock.Mock(level=1, xp_to_give=0, quest_relation_id=None, respawnable=False),
+                                          monster_guid=100)
+        self.character.award_gold(5)
+        self.character.award_item(wolf_meat)
+        self.character.load_script('SOME_SCRIPT')
+        self.character.journal.sync()
+
+        events = read_events(self.journal_path)
+        self.assertIn({'event': 'kill', 'guid': 100}, events)
+        self.assertIn({'event': 'gold', 'gold': gold + 5}, events)
+        self.assertIn({'event': 'item', 'item_id': wolf_meat.id, 'name': 'Wolf Meat', 'count': wolf_meat_count + 1},
+                      events)
+        self.assertIn({'event': 'script', 'script_name': 'SOME_SCRIPT'}, events)
+
+    def test_read_events_skips_incomplete_line(self):
+        with open(self.journal_path, 'w') as journal_file:
+            journal_file.write('{"event": "kill", "guid": 1}\n{"event": "kill", "gu')
+
+        self.assertEqual(read_events(self.journal_path), [{'event': 'kill', 'guid': 1}])
+
+    def test_read_events_missing_file(self):
+        self.assertEqual(read_events(self.journal_path), [])
+
+    def test_replay_event(self):
+        replay_event(self.character, {'event': 'kill', 'guid': 100})
+        replay_event(self.character, {'event': 'gold', 'gold': 1000})
+        replay_event(self.character, {'event': 'item', 'item_id': 1, 'name': 'Wolf Meat', 'count': 0})
+        replay_event(self.character, {'event': 'item', 'item_id': 2, 'name': 'Wolf Pelt', 'count': 10})
+
+        self.assertIn(100, self.character.killed_monsters)
+        self.assertEqual(self.character.inventory['gold'], 1000)
+        self.assertNotIn('Wolf Meat', self.character.inventory)
+        self.assertEqual(self.character.inventory['Wolf Pelt'][1], 10)
+
+    def test_fold_events(self):
+        events = [{'event': 'kill', 'guid': 100}, {'event': 'kill', 'guid': 14},  # 14 is already saved
+                  {'event': 'gold', 'gold': 10}, {'event': 'gold', 'gold': 20},
+                  {'event': 'item', 'item_id': 1, 'name': 'Wolf Meat', 'count': 0}]
+        fold_events(entry, events, session)
+        session.commit()
+
+        killed_guids = [row.guid for row in session.query(KilledMonstersSchema).filter_by(saved_character_id=entry)]
+        self.assertCountEqual(killed_guids, [14, 15, 20, 100])
+        self.assertEqual(session.query(SavedCharacterSchema).get(entry).gold, 20)
+        self.assertEqual(session.query(InventorySchema).filter_by(saved_character_id=entry, item_id=1).count(), 0)
+
+    def test_compact_folds_events_in_the_background(self):
+        journal = ProgressJournal(self.character, self.journal_path, compact_every=2)
+        self.character.journal = journal
+        self.character.killed_monsters.add(100)
+        journal.record('kill', guid=100)
+        self.assertEqual(journal.event_count, 1)
+
+        journal.record('gold', gold=1234)  # reaches compact_every
+        journal.wait_for_compaction()
+
+        self.assertEqual(journal.event_count, 0)
+        self.assertFalse(os.path.exists(journal.compacting_path))
+        self.assertFalse(self.character.has_unsaved_changes())
+        session.expire_all()
+        self.assertEqual(session.query(SavedCharacterSchema).get(entry).gold, 1234)
+        self.assertEqual(session.query(KilledMonstersSchema).filter_by(saved_character_id=entry, guid=100).count(), 1)
+
+    def test_open_progress_journal_replays_leftover_events(self):
+        journal_path = get_journal_path(self.character.name)
+        self.addCleanup(lambda: os.path.exists(journal_path) and os.remove(journal_path))
+        with open(journal_path + COMPACTING_FILE_EXTENSION, 'w') as compacting_file:
+            compacting_file.write('{"event": "kill", "guid": 100}\n')
+        with open(journal_path, 'w') as journal_file:
+            journal_file.write('{"event": "gold", "gold": 4321}\n')
+
+        with mock.patch('builtins.print'):
+            journal = open_progress_journal(self.character)
+
+        self.assertIs(self.character.journal, journal)
+        self.assertIn(100, self.character.killed_monsters)
+        self.assertEqual(self.character.inventory['gold'], 4321)
+        # the replayed progress should have been saved and the journal cleared
+        self.assertEqual(journal.event_count, 0)
+        self.assertFalse(os.path.exists(journal.compacting_path))
+        self.assertEqual(read_events(journal_path), [])
+        self.assertEqual(session.query(SavedCharacterSchema).get(entry).gold, 4321)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,6 +14,7 @@ database.main.Base = Base
 
 import models.main
 from classes import Paladin
+from database.query_counter import QueryCounter
 from models.characters.saved_character import SavedCharacterSchema
 from models.items.item_template import ItemTemplateSchema
 from tests.models.character.character_mock import character, char_equipment, entry
@@ -70,6 +71,52 @@ class SavedCharacterSaverTests(unittest.TestCase):
         # assert they're the same
         self.assertEqual(vars(received_character), vars(self.expected_character))
 
+    def test_save_loaded_character_writes_only_changes(self):
+        """
+        Saving a character that was loaded from the DB should only insert/delete the rows which changed,
+        leaving the rest of its rows untouched
+        """
+        loaded_character = session.query(SavedCharacterSchema).get(entry).convert_to_character_object()
+        old_monster_row_ids = {row.guid: row.id for row in
+                               session.query(KilledMonstersSchema).filter_by(saved_character_id=entry)}
+        wolf_meat, _ = loaded_character.inventory['Wolf Meat']
+
+        loaded_character.killed_monsters.add(1)
+        loaded_character.completed_quests.add(2)
+        loaded_character.loaded_scripts.discard('HASKEL_PAXTON_CONVERSATION')
+        loaded_character.inventory['Wolf Meat'] = (wolf_meat, 10)
+        del loaded_character.inventory['Linen Cloth']
+        loaded_character.inventory['gold'] += 5
+        save_character(loaded_character)
+
+        monster_row_ids = {row.guid: row.id for row in
+                           session.query(KilledMonstersSchema).filter_by(saved_character_id=entry)}
+        self.assertEqual(set(monster_row_ids.keys()), {1, 14, 15, 20})
+        # the monsters which were already saved should have kept their rows
+        for guid, row_id in old_monster_row_ids.items():
+            self.assertEqual(monster_row_ids[guid], row_id)
+
+        saved_character = session.query(SavedCharacterSchema).get(entry)
+        session.refresh(saved_character)
+        self.assertEqual(saved_character.gold, loaded_character.inventory['gold'])
+        received_character = saved_character.convert_to_character_object()
+        self.assertEqual(received_character.killed_monsters, loaded_character.killed_monsters)
+        self.assertEqual(received_character.completed_quests, loaded_character.completed_quests)
+        self.assertEqual(received_character.loaded_scripts, set())
+        self.assertCountEqual(received_character.inventory, loaded_character.inventory)
+        self.assertEqual(received_character.inventory['Wolf Meat'][1], 10)
+        self.assertFalse(loaded_character.has_unsaved_changes())
+
+    def test_save_unchanged_character(self):
+        """ Saving a character with no changes should only query for its row """
+        loaded_character = session.query(SavedCharacterSchema).get(entry).convert_to_character_object()
+        self.assertFalse(loaded_character.has_unsaved_changes())
+
+        with QueryCounter(session.bind) as query_counter:
+            save_character(loaded_character)
+
+        self.assertEqual(query_counter.count, 1)
+
     def test_save_loaded_scripts(self):
         test_char_id = 133
         loaded_scripts = {'The Beat is too low', 'and the vocals too loud'}
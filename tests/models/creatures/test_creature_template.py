@@ -8,7 +8,7 @@ database.main.engine = engine
 database.main.session = session
 database.main.Base = Base
 import models.main
-from models.creatures.creature_template import CreatureTemplateSchema
+from models.creatures.creature_template import CreatureTemplateSchema, CreatureTemplate, clear_creature_templates
 from models.creatures.npc_vendor import NpcVendorSchema
 from models.items.loot_table import LootTableSchema
 from models.items.item_template import ItemTemplateSchema
@@ -74,6 +74,82 @@ class CreatureTemplateTests(unittest.TestCase):
         received_inventory = non_vendor_dummy.build_vendor_inventory()
         self.assertEqual(received_inventory, {})
 
+    def test_convert_to_creature_template(self):
+        vendor_dummy: CreatureTemplateSchema = session.query(CreatureTemplateSchema).get(self.dummy_entry)
+
+        creature_template = vendor_dummy.convert_to_creature_template()
+
+        self.assertTrue(isinstance(creature_template, CreatureTemplate))
+        self.assertEqual(creature_template.entry, self.dummy_entry)
+        self.assertEqual(creature_template.name, self.dummy_name)
+        self.assertEqual(creature_template.level, self.dummy_level)
+        self.assertEqual(creature_template.vendor_inventory, self.dummy_inventory)
+
+    def test_convert_to_creature_template_is_cached(self):
+        """ Every row should be parsed only once and the template should be shared """
+        vendor_dummy: CreatureTemplateSchema = session.query(CreatureTemplateSchema).get(self.dummy_entry)
+
+        self.assertIs(vendor_dummy.convert_to_creature_template(), vendor_dummy.convert_to_creature_template())
+
+    def test_clear_creature_templates(self):
+        """ Once the templates are cleared, the row should be parsed again, ex: after it was changed """
+        vendor_dummy: CreatureTemplateSchema = session.query(CreatureTemplateSchema).get(self.dummy_entry)
+        old_template = vendor_dummy.convert_to_creature_template()
+
+        clear_creature_templates()
+        vendor_dummy.level = self.dummy_level + 1
+        try:
+            new_template = vendor_dummy.convert_to_creature_template()
+        finally:
+            session.expire(vendor_dummy)
+            clear_creature_templates()
+
+        self.assertIsNot(new_template, old_template)
+        self.assertEqual(new_template.level, self.dummy_level + 1)
+
+    def test_spawn_has_its_own_state(self):
+        """ Spawns of the same template should not share their mutable state """
+        monster_template = session.query(CreatureTemplateSchema).get(1).convert_to_creature_template()
+        first_monster, second_monster = monster_template.spawn(), monster_template.spawn()
+
+        first_monster.health -= 5
+        first_monster.buffs['Dummy'] = 1
+
+        self.assertEqual(second_monster.health, monster_template.health)
+        self.assertEqual(second_monster.buffs, {})
+
+    def test_spawn_shares_the_template(self):
+        """ Spawns should read their static attributes from the template they share, instead of holding a copy """
+        monster_template = session.query(CreatureTemplateSchema).get(1).convert_to_creature_template()
+        first_monster, second_monster = monster_template.spawn(), monster_template.spawn()
+
+        self.assertIs(first_monster.template, monster_template)
+        self.assertIs(second_monster.template, monster_template)
+        self.assertEqual((first_monster.name, first_monster.level, first_monster.monster_id),
+                         (monster_template.name, monster_template.level, monster_template.entry))
+        self.assertFalse(hasattr(first_monster, '__dict__'))
+
+    def test_spawn_changed_attribute(self):
+        """ Changing a static attribute of a spawn should change only that spawn, never the shared template """
+        monster_template = session.query(CreatureTemplateSchema).get(1).convert_to_creature_template()
+        first_monster, second_monster = monster_template.spawn(), monster_template.spawn()
+
+        first_monster.level += 1
+
+        self.assertEqual(first_monster.level, monster_template.level + 1)
+        self.assertEqual(second_monster.level, monster_template.level)
+        self.assertIs(second_monster.template, monster_template)
+
+    def test_spawn_vendor_has_its_own_inventory(self):
+        vendor_template = session.query(CreatureTemplateSchema).get(self.dummy_entry).convert_to_creature_template()
+        first_vendor, second_vendor = vendor_template.spawn(), vendor_template.spawn()
+
+        first_vendor.sell_item('Wolf Meat')
+
+        self.assertFalse(first_vendor.has_item('Wolf Meat'))
+        self.assertTrue(second_vendor.has_item('Wolf Meat'))
+        self.assertEqual(vendor_template.vendor_inventory, self.dummy_inventory)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -10,7 +10,8 @@ database.main.Base = Base
 import models.main
 from models.creatures.creature_template import CreatureTemplateSchema
 from models.creatures.creatures import CreaturesSchema
-from models.creatures.loader import load_monsters, load_npcs
+from models.creatures.loader import load_monsters, load_npcs, load_subzone_creatures
+from database.query_counter import QueryCounter
 from entities import Monster, FriendlyNPC, VendorNPC
 from items import Item
 
@@ -87,6 +88,46 @@ class LoaderTest(unittest.TestCase):
         self.assertEqual(len(npcs_dict.keys()), expected_npc_count)
         self.assertEqual(len(npcs_dict.keys()), len(guid_name_set))
 
+    def test_load_subzone_creatures(self):
+        """
+        Load every creature in Northshire Valley at once. It should split them into monsters and NPCs
+        the same way load_monsters and load_npcs do
+        """
+        expected_monsters, expected_monster_guid_names = load_monsters(zone='Northshire Abbey',
+                                                                       subzone='Northshire Valley',
+                                                                       character=self.character)
+        expected_npcs, expected_npc_guid_names = load_npcs(zone='Northshire Abbey', subzone='Northshire Valley')
+
+        monsters, monster_guid_names, npcs, npc_guid_names = load_subzone_creatures(zone='Northshire Abbey',
+                                                                                    subzone='Northshire Valley',
+                                                                                    character=self.character)
+        self.assertCountEqual(monsters.keys(), expected_monsters.keys())
+        self.assertEqual(monster_guid_names, expected_monster_guid_names)
+        self.assertCountEqual(npcs.keys(), expected_npcs.keys())
+        self.assertEqual(npc_guid_names, expected_npc_guid_names)
+        for monster in monsters.values():
+            self.assertTrue(isinstance(monster, Monster))
+        for npc in npcs.values():
+            self.assertTrue(isinstance(npc, FriendlyNPC))
+
+    def test_load_subzone_creatures_query_count(self):
+        """
+        Loading the creatures should take a bounded amount of queries, no matter how many spawns there are.
+        Clear the session beforehand so that nothing comes from the identity map
+        """
+        session.expunge_all()
+        with QueryCounter(session.bind) as query_counter:
+            monsters, _, npcs, _ = load_subzone_creatures(zone='Northshire Abbey', subzone='Northshire Vineyards',
+                                                          character=self.character)
+        self.assertEqual(len(monsters), 7)
+        self.assertLessEqual(query_counter.count, 2)
+
+        session.expunge_all()
+        with QueryCounter(session.bind) as query_counter:
+            load_subzone_creatures(zone='Northshire Abbey', subzone='Northshire Valley', character=self.character)
+        # the valley has a vendor, whose inventory is loaded in one more query
+        self.assertLessEqual(query_counter.count, 3)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,7 @@
 import unittest
 
+import numpy
+
 import database.main
 from tests.create_test_db import engine, session, Base
 database.main.engine = engine
@@ -9,7 +11,9 @@ database.main.Base = Base
 import models.main
 from items import Item, Potion, Weapon
 from buffs import BeneficialBuff
+from loot import LootTable
 from models.items.loot_table import LootTableSchema
+from models.items.loot_table_entry import LootTableEntrySchema
 from models.items.item_template import ItemTemplateSchema
 
 
@@ -25,26 +29,25 @@ class LootTableSchemaTests(unittest.TestCase):
 
     def test_values(self):
         loot_schema: LootTableSchema = session.query(LootTableSchema).get(self.loot_table_entry)
-        self.assertEqual(self.item_1, loot_schema.item1_id)
-        self.assertEqual(self.item_1_chance, loot_schema.item1_chance)
-        self.assertTrue(isinstance(loot_schema.item1, ItemTemplateSchema))
-
-        self.assertEqual(self.item_2, loot_schema.item2_id)
-        self.assertEqual(self.item_2_chance, loot_schema.item2_chance)
-        self.assertTrue(isinstance(loot_schema.item2, ItemTemplateSchema))
+        self.assertEqual(len(loot_schema.entries), 3)
+        loot_entries = {loot_entry.item_id: loot_entry for loot_entry in loot_schema.entries}
 
-        self.assertEqual(self.item_3, loot_schema.item3_id)
-        self.assertEqual(self.item_3_chance, loot_schema.item3_chance)
-        self.assertTrue(isinstance(loot_schema.item3, ItemTemplateSchema))
+        for item_id, chance in [(self.item_1, self.item_1_chance), (self.item_2, self.item_2_chance),
+                                (self.item_3, self.item_3_chance)]:
+            loot_entry: LootTableEntrySchema = loot_entries[item_id]
+            self.assertEqual(loot_entry.loot_table_id, self.loot_table_entry)
+            self.assertEqual(loot_entry.chance, chance)
+            self.assertTrue(isinstance(loot_entry.item, ItemTemplateSchema))
 
-        for i in range(4, 21):
-            item_id = getattr(loot_schema, f'item{i}_id')
-            item_chance = getattr(loot_schema, f'item{i}_chance')
-            item_obj = getattr(loot_schema, f'item{i}')
+    def test_convert_to_loot_table(self):
+        loot_table: LootTable = session.query(LootTableSchema).get(self.loot_table_entry).convert_to_loot_table()
 
-            self.assertFalse(item_id)
-            self.assertFalse(item_chance)
-            self.assertIsNone(item_obj)
+        self.assertTrue(isinstance(loot_table, LootTable))
+        self.assertEqual(loot_table.entry, self.loot_table_entry)
+        self.assertEqual(len(loot_table), 3)
+        self.assertEqual(dict(zip(loot_table.item_ids.tolist(), loot_table.chances.tolist())),
+                         {self.item_1: self.item_1_chance, self.item_2: self.item_2_chance,
+                          self.item_3: self.item_3_chance})
 
     def test_decide_drops(self):
         """
@@ -75,5 +78,56 @@ class LootTableSchemaTests(unittest.TestCase):
         self.assertGreater(received_items_count, 10)
 
 
+class LootTableTests(unittest.TestCase):
+    def setUp(self):
+        self.wolf_meat = session.query(ItemTemplateSchema).get(1)
+        self.wolf_pelt = session.query(ItemTemplateSchema).get(2)
+        self.garricks_head = session.query(ItemTemplateSchema).get(9)
+        self.loot_table = LootTable(entry=1, item_templates=[self.wolf_meat, self.wolf_pelt, self.garricks_head],
+                                    chances=[50, 0.5, 100])
+
+    def test_roll_drops_shape(self):
+        drops = self.loot_table.roll_drops(kill_count=1000, random_generator=numpy.random.default_rng(1))
+
+        self.assertEqual(drops.shape, (1000, 3))
+        self.assertEqual(drops.dtype, bool)
+        self.assertTrue(drops[:, 2].all())  # a 100% chance should always drop
+
+    def test_count_drops(self):
+        """ Simulating a lot of kills should drop every item about as often as its chance says """
+        drop_counts = self.loot_table.count_drops(kill_count=100000, random_generator=numpy.random.default_rng(1))
+
+        self.assertEqual(set(drop_counts.keys()), {1, 2, 9})
+        self.assertAlmostEqual(drop_counts[1] / 100000, 0.5, delta=0.01)
+        self.assertAlmostEqual(drop_counts[2] / 100000, 0.005, delta=0.001)
+        self.assertEqual(drop_counts[9], 100000)
+
+    def test_decide_drops(self):
+        drops = self.loot_table.decide_drops()
+
+        self.assertIn(self.garricks_head.convert_to_item_object(), drops)
+        self.assertTrue(all(isinstance(drop, Item) for drop in drops))
+
+    def test_decide_drops_is_seedable(self):
+        first_drops = self.loot_table.decide_drops(numpy.random.default_rng(7))
+        second_drops = self.loot_table.decide_drops(numpy.random.default_rng(7))
+
+        self.assertEqual([drop.id for drop in first_drops], [drop.id for drop in second_drops])
+
+    def test_empty_loot_table(self):
+        loot_table = LootTable(entry=1, item_templates=[], chances=[])
+
+        self.assertEqual(loot_table.decide_drops(), [])
+        self.assertEqual(loot_table.count_drops(10), {})
+
+    def test_more_than_twenty_items(self):
+        """ The loot table is no longer limited to 20 items """
+        item_templates = session.query(ItemTemplateSchema).all() * 2
+        loot_table = LootTable(entry=1, item_templates=item_templates, chances=[100] * len(item_templates))
+
+        self.assertGreater(len(item_templates), 20)
+        self.assertEqual(len(loot_table.decide_drops()), len(item_templates))
+
+
 if __name__ == '__main__':
     unittest.main()
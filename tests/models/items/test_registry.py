@@ -0,0 +1,67 @@
+import unittest
+
+import database.main
+from tests.create_test_db import engine, session, Base
+database.main.engine = engine
+database.main.session = session
+database.main.Base = Base
+
+import models.main
+from models.items.item_template import ItemTemplateSchema
+from models.items.registry import ItemRegistry, ItemRegistryStats
+from items import Potion
+
+
+class ItemRegistryTests(unittest.TestCase):
+    def setUp(self):
+        self.registry = ItemRegistry(max_size=2)
+        self.wolf_meat = session.query(ItemTemplateSchema).get(1)
+        self.wolf_pelt = session.query(ItemTemplateSchema).get(2)
+        self.strength_potion = session.query(ItemTemplateSchema).get(4)
+
+    def test_get_item_builds_once(self):
+        """ The first lookup should build the item and the second one should reuse it """
+        first_item = self.registry.get_item(self.strength_potion)
+        second_item = self.registry.get_item(self.strength_potion)
+
+        self.assertTrue(isinstance(first_item, Potion))
+        self.assertEqual(vars(first_item), vars(second_item))
+        self.assertEqual(self.registry.stats(), ItemRegistryStats(hits=1, misses=1, evictions=0, size=1, max_size=2))
+        self.assertEqual(self.registry.stats().hit_ratio, 0.5)
+
+    def test_get_item_returns_copies(self):
+        """ Modifying a returned item should not modify the prototype or the other copies """
+        first_item = self.registry.get_item(self.wolf_meat)
+        first_item.buy_price = 1000
+
+        second_item = self.registry.get_item(self.wolf_meat)
+
+        self.assertIsNot(first_item, second_item)
+        self.assertNotEqual(second_item.buy_price, 1000)
+        self.assertIs(self.registry.get_prototype(self.wolf_meat), self.registry.get_prototype(self.wolf_meat))
+
+    def test_lru_eviction(self):
+        """ When the registry is full, the least recently used item should be evicted """
+        self.registry.get_item(self.wolf_meat)
+        self.registry.get_item(self.wolf_pelt)
+        self.registry.get_item(self.wolf_meat)  # wolf pelt is now the least recently used
+        self.registry.get_item(self.strength_potion)
+
+        self.assertIn(self.wolf_meat.entry, self.registry)
+        self.assertIn(self.strength_potion.entry, self.registry)
+        self.assertNotIn(self.wolf_pelt.entry, self.registry)
+        self.assertEqual(len(self.registry), 2)
+        self.assertEqual(self.registry.stats().evictions, 1)
+
+    def test_clear(self):
+        self.registry.get_item(self.wolf_meat)
+        self.registry.clear()
+
+        self.assertEqual(self.registry.stats(), ItemRegistryStats(hits=0, misses=0, evictions=0, size=0, max_size=2))
+
+    def test_invalid_size(self):
+        self.assertRaises(Exception, ItemRegistry, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,22 +3,30 @@ Collect all the tests and run them here
 """
 import unittest, os
 # Import all the tests, wow what a pain
-from tests.models.character import test_loader as test_char_loader, test_saver as test_char_saver, test_saved_character
+from tests.models.character import (test_loader as test_char_loader, test_saver as test_char_saver, test_saved_character,
+                                    test_journal, test_inventory_export)
 from tests.models.creatures import test_creature_template, test_creatures, test_npc_vendor, test_loader as test_creatures_loader
 from tests.models.creatures.creature_defaults import test_loader as test_creature_def_loader
-from tests.models.items import test_loader as test_item_loader, test_item_template, test_loot_table
+from tests.models.items import test_loader as test_item_loader, test_item_template, test_loot_table, test_registry
 from tests.models.misc import test_misc_loader
 from tests.models.quests import test_loader as test_quest_loader, test_quest_template
 from tests.models.spells import test_buff_schema, test_dot_schema, test_paladin_spells
-from tests.utils import test_helper
-from tests.zones import test_northshire_abbey
-from tests import test_buffs, test_entities, test_damage, heal_tests, test_classes
+from tests.utils import test_helper, test_startup_report, test_tracked_collections, test_entity_index
+from tests.database import test_snapshot, test_engine, test_migrations
+from tests.zones import test_northshire_abbey, test_prefetcher
+from tests.simulation import test_combat_engine, test_batch_engine, test_sweep, test_encounter_engine
+from tests import (test_buffs, test_entities, test_damage, heal_tests, test_classes, test_rng, test_game_clock,
+                   test_events, test_command_dispatcher, test_inventory)
 
 modules_to_load = [test_saved_character, test_creature_template, test_creatures, test_npc_vendor, test_loot_table,
                    test_creatures_loader, test_creature_def_loader, test_item_loader, test_item_template,
                    test_char_saver, test_misc_loader, test_quest_loader, test_quest_template, test_buff_schema,
                    test_dot_schema, test_paladin_spells, test_helper, test_northshire_abbey, test_buffs, test_entities,
-                   test_damage, heal_tests, test_classes]
+                   test_damage, heal_tests, test_classes, test_snapshot,
+                   test_startup_report, test_registry, test_prefetcher, test_tracked_collections,
+                   test_journal, test_inventory_export, test_engine, test_migrations, test_combat_engine,
+                   test_batch_engine, test_sweep, test_rng, test_game_clock, test_encounter_engine, test_events,
+                   test_entity_index, test_command_dispatcher, test_inventory]
 
 loader = unittest.TestLoader()
 main_suite = loader.loadTestsFromModule(test_char_loader)
@@ -0,0 +1,118 @@
+import unittest
+from io import StringIO
+from unittest import mock
+
+import numpy
+
+import database.main
+from tests.create_test_db import engine, session, Base
+
+database.main.engine = engine
+database.main.session = session
+database.main.Base = Base
+
+import models.main
+from classes import Paladin
+from entities import Monster
+from simulation.batch_engine import simulate_fights, BatchResult
+from simulation.combat_engine import run_fight, run_fights
+from simulation.policies import (AlwaysAttackPolicy, SealThenAttackPolicy, HealBelowPolicy, ScriptedPolicy,
+                                 SEAL_OF_RIGHTEOUSNESS_COMMAND, MELTING_STRIKE_COMMAND, FLASH_OF_LIGHT_COMMAND)
+
+
+class BatchEngineTests(unittest.TestCase):
+    def setUp(self):
+        with mock.patch('sys.stdout', new_callable=StringIO):
+            self.character = Paladin(name='Simulator', level=3, health=30, mana=100, strength=10)
+        self.random_generator = numpy.random.default_rng(1)
+
+    def create_monster(self, min_damage: int=2, max_damage: int=2):
+        return Monster(monster_id=1, name='Wolf', health=60, mana=0, level=4, min_damage=min_damage,
+                       max_damage=max_damage, armor=150)
+
+    def assert_same_fight(self, policy):
+        """ Without any rolls, every fight in the batch should end exactly like the scalar fight """
+        self.character.min_damage = self.character.max_damage = 5
+
+        with mock.patch('sys.stdout', new_callable=StringIO):
+            fight_result = run_fight(self.character, self.create_monster(), policy)
+        self.character.revive()
+        result = simulate_fights(self.character, self.create_monster(), policy, fight_count=3,
+                                 random_generator=self.random_generator)
+
+        self.assertTrue(numpy.all(result.turns == fight_result.turns))
+        self.assertTrue(numpy.all(result.character_won == bool(fight_result.character_won)))
+        self.assertTrue(numpy.allclose(result.character_health, fight_result.character_health))
+        self.assertTrue(numpy.allclose(result.character_mana, fight_result.character_mana))
+        self.assertTrue(numpy.allclose(result.monster_health, fight_result.monster_health))
+        self.assertEqual(result.casts, {command: count * 3 for command, count in fight_result.casts.items()})
+        self.assertEqual(result.failed_casts, fight_result.failed_casts * 3)
+
+    def test_same_as_combat_engine_attack(self):
+        self.assert_same_fight(AlwaysAttackPolicy())
+
+    def test_same_as_combat_engine_seal(self):
+        self.assert_same_fight(SealThenAttackPolicy())
+
+    def test_same_as_combat_engine_melting_strike(self):
+        """ Melting Strike's DoT should tick at the start of the next turns, the second cast should fail on cooldown """
+        self.assert_same_fight(ScriptedPolicy([MELTING_STRIKE_COMMAND, SEAL_OF_RIGHTEOUSNESS_COMMAND,
+                                               MELTING_STRIKE_COMMAND]))
+
+    def test_cross_check_against_combat_engine(self):
+        """ With rolls, the batch should have the same win rate and fight length as the scalar engine """
+        policy = HealBelowPolicy(fallback_policy=SealThenAttackPolicy())
+
+        fight_results = run_fights(self.character, lambda: self.create_monster(1, 5), policy, fight_count=3000)
+        result = simulate_fights(self.character, self.create_monster(1, 5), policy, fight_count=30000,
+                                 random_generator=self.random_generator)
+
+        win_rate = sum(1 for fight_result in fight_results if fight_result.character_won) / len(fight_results)
+        average_turns = sum(fight_result.turns for fight_result in fight_results) / len(fight_results)
+        self.assertAlmostEqual(result.win_rate, win_rate, delta=0.05)
+        self.assertAlmostEqual(result.turns.mean(), average_turns, delta=0.3)
+
+    def test_double_heal(self):
+        """ Flash of Light should heal for double its amount in about 30% of the casts """
+        self.character.health = 1
+        monster = Monster(monster_id=1, name='Dummy', health=1000, mana=0, level=3, min_damage=0, max_damage=0)
+
+        with mock.patch('heal.DOUBLE_HEAL_CHANCE', 30):
+            result = simulate_fights(self.character, monster, ScriptedPolicy([FLASH_OF_LIGHT_COMMAND]),
+                                     fight_count=10000, max_turns=1, random_generator=self.random_generator)
+
+        heal = self.character.learned_spells[Paladin.KEY_FLASH_OF_LIGHT].heal1
+        self.assertTrue(numpy.all(numpy.isin(result.character_health, (1 + heal, 1 + heal * 2))))
+        self.assertAlmostEqual(numpy.mean(result.character_health == 1 + heal * 2), 0.3, delta=0.02)
+
+    def test_fights_take_too_long(self):
+        monster = Monster(monster_id=1, name='Dummy', health=1000, mana=0, level=3, min_damage=0, max_damage=0)
+
+        result = simulate_fights(self.character, monster, AlwaysAttackPolicy(), fight_count=10, max_turns=4,
+                                 random_generator=self.random_generator)
+
+        self.assertIsInstance(result, BatchResult)
+        self.assertFalse(result.character_won.any())
+        self.assertFalse(result.character_died.any())
+        self.assertTrue(numpy.all(result.turns == 4))
+        self.assertEqual(len(result.mana_curve), 4)
+
+    def test_time_to_kill_histogram(self):
+        result = simulate_fights(self.character, self.create_monster(1, 5), SealThenAttackPolicy(), fight_count=1000,
+                                 random_generator=self.random_generator)
+
+        histogram = result.time_to_kill_histogram()
+        self.assertEqual(histogram.sum(), result.character_won.sum())
+        self.assertGreater(histogram[result.turns[result.character_won][0]], 0)
+
+    def test_seeded_fights_repeat(self):
+        results = [simulate_fights(self.character, self.create_monster(1, 5), SealThenAttackPolicy(), fight_count=100,
+                                   random_generator=numpy.random.default_rng(42))
+                   for _ in range(2)]
+
+        self.assertTrue(numpy.array_equal(results[0].turns, results[1].turns))
+        self.assertTrue(numpy.array_equal(results[0].character_health, results[1].character_health))
+
+
+if __name__ == '__main__':
+    unittest.main()
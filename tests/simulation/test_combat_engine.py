@@ -0,0 +1,187 @@
+import threading
+import unittest
+from io import StringIO
+from unittest import mock
+from unittest.mock import Mock
+
+import database.main
+from tests.create_test_db import engine, session, Base
+
+database.main.engine = engine
+database.main.session = session
+database.main.Base = Base
+
+import models.main
+from classes import Paladin
+from entities import Monster
+from events import EventBus, CreatureDied, get_event_bus, set_event_bus
+from quest import KillQuest
+from simulation.combat_engine import FightResult, run_fight, run_fights, reset_character, silenced_output
+from simulation.policies import (AlwaysAttackPolicy, SealThenAttackPolicy, HealBelowPolicy, ScriptedPolicy,
+                                 ATTACK_COMMAND, SEAL_OF_RIGHTEOUSNESS_COMMAND, FLASH_OF_LIGHT_COMMAND)
+
+
+class CombatEngineTests(unittest.TestCase):
+    def setUp(self):
+        self.character = Paladin(name='Simulator', level=3, health=1000, mana=1000, strength=10)
+
+    def create_weak_monster(self):
+        return Monster(monster_id=1, name='Weakling', health=30, mana=0, level=1, min_damage=1, max_damage=1,
+                       xp_to_give=100)
+
+    def create_strong_monster(self):
+        return Monster(monster_id=2, name='Hogger', health=100000, mana=0, level=3, min_damage=400, max_damage=400)
+
+    def test_character_wins(self):
+        with mock.patch('sys.stdout', new_callable=StringIO):
+            result = run_fight(self.character, self.create_weak_monster(), AlwaysAttackPolicy())
+
+        self.assertIsInstance(result, FightResult)
+        self.assertTrue(result.character_won)
+        self.assertGreater(result.turns, 0)
+        self.assertLessEqual(result.monster_health, 0)
+        self.assertEqual(result.casts, {})
+        self.assertFalse(self.character.is_in_combat())
+
+    def test_character_dies(self):
+        with mock.patch('sys.stdout', new_callable=StringIO):
+            result = run_fight(self.character, self.create_strong_monster(), AlwaysAttackPolicy())
+
+        self.assertFalse(result.character_won)
+        self.assertEqual(result.turns, 3)  # 400 damage a turn against 1000 health
+        self.assertLessEqual(result.character_health, 0)
+
+    def test_fight_takes_too_long(self):
+        """ A fight over the maximum count of turns should be stopped and counted as a draw """
+        monster = Monster(monster_id=3, name='Dummy', health=100000, mana=0, level=1, min_damage=0, max_damage=0)
+
+        with mock.patch('sys.stdout', new_callable=StringIO):
+            result = run_fight(self.character, monster, AlwaysAttackPolicy(), max_turns=5)
+
+        self.assertIsNone(result.character_won)
+        self.assertEqual(result.turns, 5)
+
+    def test_seal_then_attack_policy(self):
+        with mock.patch('sys.stdout', new_callable=StringIO):
+            result = run_fight(self.character, self.create_weak_monster(), SealThenAttackPolicy())
+
+        self.assertTrue(result.character_won)
+        self.assertEqual(list(result.casts.keys()), [SEAL_OF_RIGHTEOUSNESS_COMMAND])
+        self.assertGreaterEqual(result.casts[SEAL_OF_RIGHTEOUSNESS_COMMAND], 1)
+
+    def test_failed_cast_does_not_end_turn(self):
+        """ A cast that fails should be retried with an attack in the same turn """
+        self.character.mana = 0
+        monster = Monster(monster_id=3, name='Dummy', health=100000, mana=0, level=1, min_damage=0, max_damage=0)
+
+        with mock.patch('sys.stdout', new_callable=StringIO):
+            result = run_fight(self.character, monster, ScriptedPolicy([SEAL_OF_RIGHTEOUSNESS_COMMAND]), max_turns=1)
+
+        self.assertEqual(result.failed_casts, 1)
+        self.assertEqual(result.casts, {})
+        self.assertLess(result.monster_health, 100000)  # the attack went through
+
+    def test_heal_below_policy(self):
+        policy = HealBelowPolicy(health_percentage=0.5)
+        self.character.health = 100
+
+        self.assertEqual(policy.choose_command(self.character, self.create_weak_monster(), 1), FLASH_OF_LIGHT_COMMAND)
+        self.character.health = self.character.max_health
+        self.assertEqual(policy.choose_command(self.character, self.create_weak_monster(), 1), ATTACK_COMMAND)
+
+    def test_scripted_policy_resets(self):
+        policy = ScriptedPolicy([SEAL_OF_RIGHTEOUSNESS_COMMAND])
+        monster = self.create_weak_monster()
+
+        self.assertEqual(policy.choose_command(self.character, monster, 1), SEAL_OF_RIGHTEOUSNESS_COMMAND)
+        self.assertEqual(policy.choose_command(self.character, monster, 2), ATTACK_COMMAND)
+        policy.reset()
+        self.assertEqual(policy.choose_command(self.character, monster, 1), SEAL_OF_RIGHTEOUSNESS_COMMAND)
+
+    def test_award_kill(self):
+        with mock.patch('sys.stdout', new_callable=StringIO):
+            run_fight(self.character, self.create_weak_monster(), AlwaysAttackPolicy(), award_kill=True, monster_guid=7)
+
+        self.assertIn(7, self.character.killed_monsters)
+        self.assertEqual(self.character.experience, 100)
+
+    def test_fight_does_not_award_kill_by_default(self):
+        with mock.patch('sys.stdout', new_callable=StringIO):
+            run_fight(self.character, self.create_weak_monster(), AlwaysAttackPolicy())
+
+        self.assertEqual(len(self.character.killed_monsters), 0)
+        self.assertEqual(self.character.experience, 0)
+
+    def test_reset_character(self):
+        with mock.patch('sys.stdout', new_callable=StringIO):
+            run_fight(self.character, self.create_strong_monster(), SealThenAttackPolicy())
+            reset_character(self.character)
+
+        self.assertEqual(self.character.health, self.character.max_health)
+        self.assertEqual(self.character.mana, self.character.max_mana)
+        self.assertFalse(self.character.SOR_ACTIVE)
+        self.assertEqual(len(self.character.buffs), 0)
+
+    def test_run_fights_does_not_print(self):
+        with mock.patch('sys.stdout', new_callable=StringIO) as output:
+            results = run_fights(self.character, self.create_strong_monster, AlwaysAttackPolicy(), fight_count=3)
+
+        self.assertEqual(output.getvalue(), '')
+        self.assertEqual(len(results), 3)
+        # every fight should start from the same state
+        self.assertTrue(all(result.turns == 3 for result in results))
+
+    def test_silenced_quest_progress(self):
+        """ The progress of a quest should be silenced along with the fight """
+        self.character.add_quest(KillQuest(quest_name='Kill Weaklings', quest_id=1, required_monster='Weakling',
+                                           xp_reward=0, item_reward_dict={}, reward_choice_enabled=False,
+                                           level_required=1, required_kills=2))
+        monster = Monster(monster_id=1, name='Weakling', health=30, mana=0, level=1, min_damage=1, max_damage=1,
+                          quest_relation_id=1)
+
+        with mock.patch('sys.stdout', new_callable=StringIO) as output, silenced_output():
+            run_fight(self.character, monster, AlwaysAttackPolicy(), award_kill=True)
+
+        self.assertEqual(output.getvalue(), '')
+        self.assertEqual(self.character.quest_log[1].kills, 1)
+
+    def test_silenced_cast_failures(self):
+        """ A cast without enough mana or on cooldown should be silenced along with the fight """
+        self.character.mana = 0
+
+        with mock.patch('sys.stdout', new_callable=StringIO) as output, silenced_output():
+            result = run_fight(self.character, self.create_weak_monster(),
+                               ScriptedPolicy([FLASH_OF_LIGHT_COMMAND, ATTACK_COMMAND]))
+
+        self.assertEqual(output.getvalue(), '')
+        self.assertGreater(result.failed_casts, 0)
+
+    def test_silenced_output_leaves_the_game_bus_alone(self):
+        """ The sinks of the game's bus (ex: the terminal) should keep getting the events of the other threads """
+        game_sink = Mock(discards_events=False)
+        original_event_bus = get_event_bus()
+        self.addCleanup(set_event_bus, original_event_bus)
+        set_event_bus(EventBus(sinks=[game_sink]))
+
+        with silenced_output():
+            run_fight(self.character, self.create_weak_monster(), AlwaysAttackPolicy())
+            thread = threading.Thread(target=lambda: get_event_bus().emit(CreatureDied, 'Boar'))
+            thread.start()
+            thread.join()
+
+        game_sink.handle.assert_called_once_with(CreatureDied('Boar'))
+
+    def test_silenced_output_leaves_other_threads_printing(self):
+        """ Threads which print while a fight is silenced, ex: the prefetcher, should not lose their output """
+        output = StringIO()
+
+        with silenced_output():
+            thread = threading.Thread(target=print, args=('Prefetched Northshire Vineyards',), kwargs={'file': output})
+            thread.start()
+            thread.join()
+
+        self.assertEqual(output.getvalue(), 'Prefetched Northshire Vineyards\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+import unittest
+from io import StringIO
+from unittest import mock
+
+import database.main
+from tests.create_test_db import engine, session, Base
+
+database.main.engine = engine
+database.main.session = session
+database.main.Base = Base
+
+import models.main
+from buffs import DoT
+from classes import Paladin
+from damage import Damage
+from entities import Monster
+from simulation.encounter_engine import Encounter, EncounterResult, TEAM_HOSTILE, TEAM_CHARACTER
+from simulation.policies import AlwaysAttackPolicy, SealThenAttackPolicy
+
+
+class EncounterEngineTests(unittest.TestCase):
+    def setUp(self):
+        self.character = Paladin(name='Simulator', level=3, health=1000, mana=1000, strength=10)
+
+    def create_monster(self, health: int=30, damage: int=1, level: int=1, xp_to_give: int=0):
+        return Monster(monster_id=1, name='Weakling', health=health, mana=0, level=level, min_damage=damage,
+                       max_damage=damage, xp_to_give=xp_to_give)
+
+    def test_character_wins(self):
+        encounter = Encounter(self.character, AlwaysAttackPolicy())
+        monsters = {guid: self.create_monster() for guid in range(1, 4)}
+        for guid, monster in monsters.items():
+            encounter.add_hostile(monster, guid)
+
+        result = encounter.run()
+
+        self.assertIsInstance(result, EncounterResult)
+        self.assertTrue(result.character_won)
+        self.assertEqual(result.deaths, [1, 2, 3])  # the character focuses the first alive monster
+        self.assertEqual(len(encounter), 1)
+        self.assertFalse(self.character.is_in_combat())
+        self.assertTrue(all(not monster.is_in_combat() for monster in monsters.values()))
+
+    def test_character_dies(self):
+        encounter = Encounter(self.character, AlwaysAttackPolicy())
+        for guid in range(1, 5):
+            encounter.add_hostile(self.create_monster(health=100000, damage=100, level=3), guid)
+
+        result = encounter.run()
+
+        self.assertFalse(result.character_won)
+        self.assertEqual(result.rounds, 3)  # 4 monsters deal 400 damage a round against 1000 health
+        self.assertEqual(result.deaths, [None])
+        self.assertLessEqual(result.character_health, 0)
+
+    def test_encounter_takes_too_long(self):
+        encounter = Encounter(self.character, AlwaysAttackPolicy(), max_rounds=5)
+        encounter.add_hostile(self.create_monster(health=100000, damage=0), guid=1)
+
+        result = encounter.run()
+
+        self.assertIsNone(result.character_won)
+        self.assertEqual(result.rounds, 5)
+        self.assertEqual(result.turns, 10)
+
+    def test_initiative_order(self):
+        """ Participants should act from the highest initiative, the hostiles first on equal initiative """
+        encounter = Encounter(self.character, AlwaysAttackPolicy(), max_rounds=2)
+        slow_monster = self.create_monster(health=100000, damage=0)
+        fast_monster = self.create_monster(health=100000, damage=0)
+        encounter.add_hostile(slow_monster, guid=1, initiative=1)
+        encounter.add_hostile(fast_monster, guid=2, initiative=10)
+        acted = []
+        original_take_turn = encounter._take_turn
+
+        def take_turn(participant):
+            acted.append(participant.guid)
+            original_take_turn(participant)
+
+        with mock.patch.object(encounter, '_take_turn', side_effect=take_turn):
+            encounter.run()
+
+        # the character's initiative is its level, 3
+        self.assertEqual(acted, [2, None, 1, 2, None, 1])
+
+    def test_death_mid_round_skips_turn(self):
+        """ A monster killed before its turn in the round should not act """
+        encounter = Encounter(self.character, AlwaysAttackPolicy())
+        doomed_monster = self.create_monster(health=1, damage=500)
+        encounter.add_hostile(doomed_monster, guid=1, initiative=1)
+
+        result = encounter.run()
+
+        self.assertTrue(result.character_won)
+        self.assertEqual(result.turns, 1)
+        self.assertEqual(self.character.health, self.character.max_health)
+
+    def test_dot_death_on_own_turn(self):
+        """ A monster should suffer its DoTs on its own turn and die from them without acting """
+        encounter = Encounter(self.character, AlwaysAttackPolicy())
+        monster = self.create_monster(health=5, damage=500, level=3)
+        monster.add_buff(DoT(name='Burn', damage_tick=Damage(magic_dmg=10), duration=3, caster_lvl=3))
+        encounter.add_hostile(monster, guid=1)
+
+        result = encounter.run()
+
+        self.assertTrue(result.character_won)
+        self.assertEqual(result.deaths, [1])
+        self.assertEqual(result.turns, 1)
+
+    def test_ally_fights_for_character(self):
+        """ An ally should keep fighting the hostiles once the character dies """
+        self.character.health = 1
+        encounter = Encounter(self.character, AlwaysAttackPolicy())
+        ally = self.create_monster(health=100000, damage=50, level=3)
+        encounter.add_ally(ally, guid=10, initiative=0)
+        encounter.add_hostile(self.create_monster(health=200, damage=5, level=3), guid=1)
+
+        result = encounter.run()
+
+        self.assertTrue(result.character_won)
+        self.assertEqual(result.deaths, [None, 1])
+        self.assertGreater(result.rounds, 1)
+
+    def test_casts_are_counted(self):
+        encounter = Encounter(self.character, SealThenAttackPolicy())
+        encounter.add_hostile(self.create_monster(), guid=1)
+
+        result = encounter.run()
+
+        self.assertTrue(result.character_won)
+        self.assertGreaterEqual(result.casts.get('sor', 0), 1)
+
+    def test_award_kills(self):
+        encounter = Encounter(self.character, AlwaysAttackPolicy(), award_kills=True)
+        encounter.add_hostile(self.create_monster(xp_to_give=50), guid=1)
+        encounter.add_hostile(self.create_monster(xp_to_give=50), guid=2)
+
+        encounter.run()
+
+        self.assertEqual(self.character.killed_monsters, {1, 2})
+        self.assertEqual(self.character.experience, 100)
+
+    def test_dead_participant_cannot_join(self):
+        monster = self.create_monster()
+        with mock.patch('sys.stdout', new_callable=StringIO):
+            monster.take_attack(Damage(phys_dmg=100), attacker_level=1)
+
+        with self.assertRaises(Exception):
+            Encounter(self.character, AlwaysAttackPolicy()).add_hostile(monster, guid=1)
+
+    def test_large_group(self):
+        """ Hundreds of participants should all take their turns and die in order """
+        self.character.health = self.character.max_health = 10 ** 9
+        encounter = Encounter(self.character, AlwaysAttackPolicy(), max_rounds=10000)
+        for guid in range(1, 301):
+            encounter.add_hostile(self.create_monster(health=1), guid)
+        for guid in range(1001, 1101):
+            encounter.add_ally(self.create_monster(health=100, damage=1000), guid)
+
+        with mock.patch('sys.stdout', new_callable=StringIO):
+            result = encounter.run()
+
+        self.assertTrue(result.character_won)
+        self.assertEqual(result.deaths, list(range(1, 301)))
+        self.assertEqual(encounter.get_target(TEAM_HOSTILE), None)
+        self.assertIs(encounter.get_target(TEAM_CHARACTER).entity, self.character)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+
+import database.main
+from tests.create_test_db import engine, session, Base
+
+database.main.engine = engine
+database.main.session = session
+database.main.Base = Base
+
+import models.main
+from classes import Paladin
+from simulation.sweep import (SweepPoint, SweepResult, create_character, load_sweep_world, build_grid, run_point,
+                              run_sweep)
+
+
+class SweepTests(unittest.TestCase):
+    def setUp(self):
+        self.character_levels = [2, 3]
+        self.creature_entries = [1, 8]  # Adder and Beggar
+        self.policies = ['attack', 'heal']
+        self.world = load_sweep_world(self.character_levels, self.creature_entries)
+        self.points = build_grid(self.character_levels, self.creature_entries, self.policies)
+
+    def test_build_grid(self):
+        self.assertEqual(len(self.points), 8)
+        self.assertEqual(self.points[0], SweepPoint(index=0, character_level=2, creature_entry=1, policy='attack'))
+        self.assertEqual(self.points[-1], SweepPoint(index=7, character_level=3, creature_entry=8, policy='heal'))
+        self.assertEqual([point.index for point in self.points], list(range(8)))
+
+    def test_build_grid_invalid_policy(self):
+        with self.assertRaises(Exception):
+            build_grid([1], [1], ['dance'])
+
+    def test_create_character_keeps_own_spells(self):
+        """ A character should not know the spells of a higher level character created before it """
+        original_learned_spells = Paladin.learned_spells
+        self.addCleanup(setattr, Paladin, 'learned_spells', original_learned_spells)
+        higher_level_character = create_character(3)
+        character = create_character(1)
+
+        self.assertIn(Paladin.KEY_MELTING_STRIKE, higher_level_character.learned_spells)
+        self.assertNotIn(Paladin.KEY_MELTING_STRIKE, character.learned_spells)
+
+    def test_load_sweep_world(self):
+        self.assertEqual(set(self.world.characters), {2, 3})
+        self.assertEqual(self.world.characters[3].level, 3)
+        self.assertEqual(self.world.creature_templates[1].name, 'Adder')
+
+    def test_load_sweep_world_invalid_creature(self):
+        with self.assertRaises(Exception):
+            load_sweep_world([1], [999999])
+
+    def test_same_results_regardless_of_workers(self):
+        """ The sweep should give the same results in a single process, on one worker and on many small shards """
+        expected_results = [run_point(self.world, point, fight_count=500, master_seed=42) for point in self.points]
+
+        one_worker_results = run_sweep(self.world, self.points, fight_count=500, master_seed=42, workers=1,
+                                       points_per_shard=len(self.points))
+        many_workers_results = run_sweep(self.world, self.points, fight_count=500, master_seed=42, workers=3,
+                                         points_per_shard=1)
+
+        self.assertIsInstance(one_worker_results[0], SweepResult)
+        self.assertEqual(one_worker_results, expected_results)
+        self.assertEqual(many_workers_results, expected_results)
+
+    def test_different_seeds_give_different_results(self):
+        point = self.points[2]  # level 2 against a Beggar, attacking
+
+        results = {run_point(self.world, point, fight_count=500, master_seed=master_seed)
+                   for master_seed in range(5)}
+
+        self.assertGreater(len(results), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
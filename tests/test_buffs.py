@@ -1,4 +1,5 @@
 from copy import deepcopy
+import pickle
 import unittest
 
 from buffs import *
@@ -193,7 +194,82 @@ class DoTTests(unittest.TestCase):
         self.assertEqual(self.dot_dummy.level, self.caster_level)
 
 
-
+class StatusEffectsTests(unittest.TestCase):
+    """
+    Tests for the StatusEffects container, which holds the buffs and DoTs of an entity
+    """
+    def setUp(self):
+        self.buff = BeneficialBuff(name='Buff', buff_stats_and_amounts=[('armor', 10)], duration=2)
+        self.other_buff = BeneficialBuff(name='Other Buff', buff_stats_and_amounts=[('armor', 5)], duration=3)
+        self.dot = DoT(name='Dot', damage_tick=Damage(magic_dmg=2), duration=2, caster_lvl=1)
+        self.status_effects = StatusEffects()
+        for effect in (self.buff, self.other_buff, self.dot):
+            self.status_effects[effect] = effect.duration
+
+    def test_mapping(self):
+        self.assertEqual(self.status_effects, {self.buff: 2, self.other_buff: 3, self.dot: 2})
+        self.assertEqual(len(self.status_effects), 3)
+        self.assertIn(self.dot, self.status_effects)
+        self.assertEqual(self.status_effects[self.other_buff], 3)
+
+        del self.status_effects[self.buff]
+
+        self.assertNotIn(self.buff, self.status_effects)
+        self.assertEqual(self.status_effects, {self.other_buff: 3, self.dot: 2})
+        with self.assertRaises(KeyError):
+            self.status_effects[self.buff]
+        with self.assertRaises(KeyError):
+            del self.status_effects[self.buff]
+
+    def test_lanes(self):
+        """ DoTs and buffs should be kept apart """
+        self.assertEqual(list(self.status_effects.buffs), [self.buff, self.other_buff])
+        self.assertEqual(list(self.status_effects.dots), [self.dot])
+
+    def test_pass_turn(self):
+        """ Passing a turn should reduce the turns left of the lane's effects and return the expired ones """
+        self.assertEqual(self.status_effects.buffs.pass_turn(), [])
+        self.assertEqual(self.status_effects, {self.buff: 1, self.other_buff: 2, self.dot: 2})
+
+        self.assertEqual(self.status_effects.buffs.pass_turn(), [self.buff])
+        # the expired buff stays until it is removed
+        self.assertEqual(self.status_effects, {self.buff: 0, self.other_buff: 1, self.dot: 2})
+
+    def test_set_turns_left_reindexes(self):
+        """ Setting the turns left of an effect again should move it to its new expiry turn """
+        self.status_effects.buffs.pass_turn()
+        self.status_effects[self.buff] = 3
+
+        self.assertEqual(self.status_effects.buffs.pass_turn(), [])
+        self.assertEqual(self.status_effects.buffs.pass_turn(), [self.other_buff])
+        self.assertEqual(self.status_effects.buffs.pass_turn(), [self.buff])
+
+    def test_removed_effect_does_not_expire(self):
+        del self.status_effects[self.buff]
+        self.status_effects.buffs.pass_turn()
+
+        self.assertEqual(self.status_effects.buffs.pass_turn(), [])
+
+    def test_hash_computed_once(self):
+        buff = BeneficialBuff(name='Buff', buff_stats_and_amounts=[('armor', 10)], duration=2)
+        expected_hash = hash(buff)
+        buff.name = 'Renamed'
+
+        self.assertEqual(hash(buff), expected_hash)
+
+    def test_copied_effect_computes_its_hash(self):
+        """ A copied (or unpickled) effect should not keep the cached hash, which could come from another process """
+        hash(self.buff)
+
+        self.assertIsNone(deepcopy(self.buff)._hash)
+        self.assertIsNone(pickle.loads(pickle.dumps(self.dot))._hash)
+
+    def test_pickle(self):
+        unpickled_status_effects = pickle.loads(pickle.dumps(self.status_effects))
+
+        self.assertEqual(unpickled_status_effects, self.status_effects)
+        self.assertEqual(unpickled_status_effects.buffs.pass_turn(), [])
+        self.assertEqual(len(unpickled_status_effects.buffs.pass_turn()), 1)
 
 
 if __name__ == '__main__':
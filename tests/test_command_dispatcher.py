@@ -0,0 +1,114 @@
+import unittest
+from unittest.mock import Mock, patch
+
+import database.main
+from tests.create_test_db import engine, session, Base
+
+database.main.engine = engine
+database.main.session = session
+database.main.Base = Base
+
+import models.main
+import command_handler
+import command_router
+from command_dispatcher import CommandSet, UNKNOWN_COMMAND
+
+
+class CommandSetTests(unittest.TestCase):
+    def setUp(self):
+        self.go_to_help, self.go_to = Mock(return_value='help'), Mock(return_value='moved')
+        self.take_all, self.take = Mock(), Mock()
+        self.info, self.pam = Mock(), Mock()
+        self.command_set = CommandSet('test')
+        self.command_set.register('go to ?', self.go_to_help)
+        self.command_set.register('go to', self.go_to, takes_argument=True)
+        self.command_set.register('take all', self.take_all)
+        self.command_set.register('take', self.take, takes_argument=True)
+        self.command_set.register('info', self.info, takes_argument=True, argument_first=True)
+        self.command_set.register('print alive monsters', self.pam, aliases=['pam'])
+
+    def test_longest_verb_wins(self):
+        self.assertEqual(self.command_set.dispatch('go to ?'), 'help')
+        self.assertEqual(self.command_set.dispatch('go to Northshire Abbey'), 'moved')
+        self.go_to.assert_called_once_with('Northshire Abbey')
+        self.command_set.dispatch('take all')
+        self.take_all.assert_called_once_with()
+        self.take.assert_not_called()
+
+    def test_argument_keeps_its_case(self):
+        self.command_set.dispatch('TAKE  Wolf Meat ')
+
+        self.take.assert_called_once_with('Wolf Meat')
+
+    def test_argument_starting_with_a_longer_verb(self):
+        """ 'take allspice' is not 'take all' """
+        self.command_set.dispatch('take allspice')
+
+        self.take.assert_called_once_with('allspice')
+        self.take_all.assert_not_called()
+
+    def test_alias(self):
+        self.command_set.dispatch('PAM')
+        self.command_set.dispatch('print alive monsters')
+
+        self.assertEqual(self.pam.call_count, 2)
+
+    def test_argument_first(self):
+        self.command_set.dispatch('Linen Cloth info')
+
+        self.info.assert_called_once_with('Linen Cloth')
+
+    def test_handler_gets_dispatch_arguments(self):
+        character, zone = Mock(), Mock()
+
+        self.command_set.dispatch('go to Elwynn Forest', character, zone)
+        self.command_set.dispatch('pam', character, zone)
+
+        self.go_to.assert_called_once_with('Elwynn Forest', character, zone)
+        self.pam.assert_called_once_with(character, zone)
+
+    def test_unknown_command(self):
+        for line in ('', 'go', 'goto Elwynn', 'pamm', 'print alive', 'info'):
+            self.assertIs(self.command_set.dispatch(line), UNKNOWN_COMMAND, line)
+
+    def test_duplicate_register(self):
+        self.assertIn('take', self.command_set)
+        self.assertEqual(len(self.command_set), 6)
+        with self.assertRaises(Exception):
+            self.command_set.register('Take', Mock())
+        with self.assertRaises(Exception):
+            self.command_set.register('print alive monsters quickly', Mock(), aliases=['pam'])
+        with self.assertRaises(Exception):
+            self.command_set.register('item info', Mock(), argument_first=True)
+
+
+class MainCommandsTests(unittest.TestCase):
+    def test_route_main_commands(self):
+        character, zone = Mock(), Mock()
+        with patch('command_handler.handle_pam_command') as pam, patch('builtins.input', return_value='pam'):
+            command_router.route_main_commands(character, zone)
+
+        pam.assert_called_once_with(zone)
+
+    def test_main_commands_arguments(self):
+        command, argument = command_router.MAIN_COMMANDS.match('engage Kobold Worker')
+        self.assertIs(command.handler, command_handler.handle_engage_command)
+        self.assertEqual(argument, 'Kobold Worker')
+
+        command, argument = command_router.MAIN_COMMANDS.match('go to ?')
+        self.assertFalse(command.takes_argument)
+
+    def test_in_combat_commands(self):
+        """ The commands which do not end the turn should be run until the player types another one """
+        character, monster = Mock(), Mock()
+        with patch('command_handler.handle_combat_print_xp_command') as print_xp, \
+                patch('builtins.input', side_effect=['print xp', 'attack']):
+            command = command_router.route_in_combat_non_ending_turn_commands('print xp', character, monster)
+
+        self.assertEqual(command, 'attack')
+        self.assertEqual(print_xp.call_count, 2)
+        print_xp.assert_called_with(character)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
+import copy
+import pickle
 import unittest
-from damage import Damage
+from damage import Damage, FrozenDamage
 
 
 class DamageTests(unittest.TestCase):
@@ -211,5 +213,96 @@ class DamageTests(unittest.TestCase):
         self.assertEqual(dmg, expected_dmg)
         self.assertEqual(left_shield, expected_shield)
 
+    def test_slots(self):
+        """ Damage is created on every swing, it should not carry a __dict__ around """
+        dmg = Damage(phys_dmg=1)
+        self.assertFalse(hasattr(dmg, '__dict__'))
+        with self.assertRaises(AttributeError):
+            dmg.crit = True
+
+    def test_init_keeps_ints(self):
+        dmg = Damage(phys_dmg=5)
+        self.assertIs(type(dmg.phys_dmg), int)
+        self.assertEqual(dmg.magic_dmg, 0)
+
+    def test_isub_not_negative(self):
+        dmg = Damage(phys_dmg=5.5, magic_dmg=1)
+        dmg -= Damage(phys_dmg=1.2, magic_dmg=3)
+
+        self.assertEqual(dmg, Damage(phys_dmg=4.3, magic_dmg=0))
+
+    def test_batch(self):
+        expected_damages = [Damage(phys_dmg=1.1, magic_dmg=3), Damage(phys_dmg=2, magic_dmg=4.4)]
+
+        self.assertEqual(Damage.batch([1.13, 2], [3, 4.44]), expected_damages)
+        self.assertEqual(Damage.batch([1, 2]), [Damage(phys_dmg=1), Damage(phys_dmg=2)])
+
+    def test_copy(self):
+        dmg = Damage(phys_dmg=10, magic_dmg=6)
+        dmg.handle_absorption(7)
+
+        copied_dmg = dmg.copy()
+        copied_dmg.handle_absorption(5)
+
+        self.assertEqual(copied_dmg.phys_dmg, 4)
+        self.assertEqual(dmg.phys_dmg, 9)
+        self.assertEqual(dmg.phys_absorbed, 1)
+
+
+class FrozenDamageTests(unittest.TestCase):
+    def test_init(self):
+        dmg = FrozenDamage(phys_dmg=1.34, magic_dmg=1.49391)
+
+        self.assertEqual(dmg, Damage(phys_dmg=1.3, magic_dmg=1.5))
+
+    def test_cannot_change(self):
+        dmg = FrozenDamage(phys_dmg=5)
+
+        with self.assertRaises(AttributeError):
+            dmg.phys_dmg = 1
+        with self.assertRaises(AttributeError):
+            dmg.handle_absorption(3)
+        self.assertEqual(dmg.phys_dmg, 5)
+
+    def test_arithmetic_gives_damage(self):
+        """ Operations on a FrozenDamage should leave it untouched and give back a Damage which can be changed """
+        dmg = frozen_dmg = FrozenDamage(phys_dmg=5, magic_dmg=2)
+        dmg -= (1, 1)
+
+        self.assertIs(type(dmg), Damage)
+        self.assertEqual(dmg, Damage(phys_dmg=4, magic_dmg=1))
+        self.assertIs(type(frozen_dmg * 2), Damage)
+        self.assertEqual(frozen_dmg, Damage(phys_dmg=5, magic_dmg=2))
+
+    def test_copy(self):
+        copied_dmg = FrozenDamage(phys_dmg=10, magic_dmg=6).copy()
+        copied_dmg.handle_absorption(7)
+
+        self.assertIs(type(copied_dmg), Damage)
+        self.assertEqual(copied_dmg.phys_absorbed, 1)
+
+    def test_hash(self):
+        self.assertEqual(hash(FrozenDamage(phys_dmg=5)), hash(FrozenDamage(phys_dmg=5)))
+
+    def test_pickle(self):
+        """ The balance sweep sends the world to its worker processes, DoTs with a FrozenDamage included """
+        dmg = FrozenDamage(phys_dmg=1.34, magic_dmg=2)
+
+        unpickled_dmg = pickle.loads(pickle.dumps(dmg, protocol=pickle.HIGHEST_PROTOCOL))
+
+        self.assertIs(type(unpickled_dmg), FrozenDamage)
+        self.assertEqual(unpickled_dmg, dmg)
+        self.assertEqual(hash(unpickled_dmg), hash(dmg))
+        with self.assertRaises(AttributeError):
+            unpickled_dmg.phys_dmg = 5
+
+    def test_copy_module(self):
+        dmg = FrozenDamage(phys_dmg=5, magic_dmg=2)
+
+        for copied_dmg in (copy.copy(dmg), copy.deepcopy(dmg), copy.deepcopy({'tick': dmg})['tick']):
+            self.assertIs(type(copied_dmg), FrozenDamage)
+            self.assertEqual(copied_dmg, dmg)
+
+
 if __name__ == '__main__':
     unittest.main()
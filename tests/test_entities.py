@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 import sys
 import termcolor
 from io import StringIO
@@ -11,7 +11,7 @@ from constants import (
     KEY_ARMOR_ATTRIBUTE, CHARACTER_DEFAULT_EQUIPMENT, CHARACTER_LEVELUP_BONUS_STATS, CHAR_STARTER_SUBZONE,
     CHAR_STARTER_ZONE, MAXIMUM_LEVEL_DIFFERENCE_XP_YIELD, CHARACTER_LEVELUP_BONUS_STATS, CHARACTER_LEVEL_XP_REQUIREMENTS)
 from entities import LivingThing, FriendlyNPC, VendorNPC, Monster, Character
-from damage import Damage
+from damage import Damage, FrozenDamage
 from quest import Quest, FetchQuest, KillQuest
 from utils.helper import create_attributes_dict
 from items import Item, Equipment, Weapon, Potion
@@ -223,6 +223,20 @@ class LivingThingTests(unittest.TestCase):
         finally:
             sys.stdout = sys.__stdout__
 
+    def test_take_dot_proc_absorbed_keeps_dot_damage(self):
+        """ Absorbing a DoT tick should not change the damage of the DoT's next ticks """
+        dot = DoT(name='Disease', damage_tick=FrozenDamage(magic_dmg=5), duration=2, caster_lvl=self.level)
+        self.dummy.absorption_shield = 3
+        try:
+            sys.stdout = StringIO()
+            self.dummy.take_dot_proc(dot)
+        finally:
+            sys.stdout = sys.__stdout__
+
+        self.assertEqual(self.dummy.health, self.health - 2)
+        self.assertEqual(self.dummy.absorption_shield, 0)
+        self.assertEqual(dot.damage, Damage(magic_dmg=5))
+
     def test_update_dots(self):
         """
         The _update_dots function reduces the duration of each dot and activates its damage tick
@@ -583,7 +597,7 @@ class MonsterTests(unittest.TestCase):
         self.dropped_item_mock = Mock(name='something')
         self.dropped_item_mock2 = Mock(name='smth')
         loot_to_drop = [self.dropped_item_mock, self.dropped_item_mock2]
-        self.loot_table = Mock(decide_drops=lambda: loot_to_drop)
+        self.loot_table = Mock(decide_drops=lambda random_generator=None: loot_to_drop)
         self.dummy = Monster(monster_id=self.monster_id, name=self.name, health=self.health, mana=self.mana,
                              level=self.level, min_damage=self.min_damage, max_damage=self.max_damage,
                              quest_relation_id=self.quest_relation_id, xp_to_give=self.xp_to_give,
@@ -1258,6 +1272,49 @@ class CharacterTests(unittest.TestCase):
         self.assertEqual(self.dummy.min_damage, orig_min_damage)
         self.assertEqual(self.dummy.max_damage, orig_max_damage)
 
+    def test_stat_change_updates_only_dependent_stats(self):
+        """ An armor buff should not recalculate the health, mana or damage of the character """
+        armor_buff = BeneficialBuff(name='Stoneskin', buff_stats_and_amounts=[('armor', 10)], duration=2)
+        orig_armor = self.dummy.attributes['armor']
+        with patch.object(self.dummy, '_update_max_health') as update_max_health, \
+                patch.object(self.dummy, '_update_max_mana') as update_max_mana, \
+                patch.object(self.dummy, '_update_damage') as update_damage:
+            self.dummy.add_buff(armor_buff)
+
+        self.assertEqual(self.dummy.attributes['armor'], orig_armor + 10)
+        update_max_health.assert_not_called()
+        update_max_mana.assert_not_called()
+        update_damage.assert_not_called()
+
+    def test_stat_change_updates_stats_once(self):
+        """ Equipping an item removes the old item's attributes and adds the new one's, but should update once """
+        helmet = Equipment(name='Helm', item_id=1, slot='headpiece',
+                           attributes=create_attributes_dict(bonus_health=5, agility=2))
+        self.dummy.add_item_to_inventory(helmet)
+        self.dummy.equip_item(helmet)
+        other_helmet = Equipment(name='Other Helm', item_id=2, slot='headpiece',
+                                 attributes=create_attributes_dict(bonus_health=7, agility=1))
+        self.dummy.add_item_to_inventory(other_helmet)
+        orig_agility = self.dummy.attributes['agility']
+
+        with patch.object(self.dummy, '_update_damage', wraps=self.dummy._update_damage) as update_damage:
+            self.dummy.equip_item(other_helmet)
+
+        update_damage.assert_called_once_with()
+        self.assertEqual(self.dummy.attributes['agility'], orig_agility - 1)
+        self.assertEqual(self.dummy.max_health, self.health + 7 + CHARACTER_LEVELUP_BONUS_STATS[1]['health'])
+        self.assertEqual(self.dummy._dirty_stats, set())
+
+    def test_stat_changes_nested(self):
+        """ The derived stats should be updated when the outermost _stat_changes block ends """
+        orig_min_damage = self.dummy.min_damage
+        with self.dummy._stat_changes():
+            with self.dummy._stat_changes():
+                self.dummy._change_attribute('strength', 10)
+            self.assertEqual(self.dummy.min_damage, orig_min_damage)
+
+        self.assertAlmostEqual(self.dummy.min_damage, orig_min_damage + 4)
+
     def test_calculate_stats_formulas_in_combat(self):
         """ Adding more health in combat should increase the char's max health but not affect his current health"""
         self.dummy.enter_combat()
@@ -1591,7 +1648,7 @@ class CharacterTests(unittest.TestCase):
 
     def test_has_item(self):
         self.dummy.inventory = {
-            'item1': None,
+            'item1': (Item(name='item1', item_id=1, buy_price=1, sell_price=1), 1),
         }
 
         self.assertTrue(self.dummy.has_item('item1'))
@@ -1915,6 +1972,11 @@ class CharacterTests(unittest.TestCase):
         self.assertEqual(self.dummy.experience, orig_xp + expected_xp)
         self.assertNotIn(guid, self.dummy.killed_monsters)
 
+    def test_get_lowest_xp_yielding_level(self):
+        self.dummy.level = 10
+
+        self.assertEqual(self.dummy.get_lowest_xp_yielding_level(), 10 - MAXIMUM_LEVEL_DIFFERENCE_XP_YIELD + 1)
+
     def test_award_monster_kill_for_quest(self):
         """ Killing a monster that is for a quest should update the quest's killed monsters count """
         q_id = 10
@@ -1932,6 +1994,19 @@ class CharacterTests(unittest.TestCase):
 
         self.assertTrue(k_quest.is_completed)
 
+    def test_award_monster_kill_large_quest_log(self):
+        """ Only the quest the monster is for should be updated, no matter how many quests the character is on """
+        k_quest = KillQuest(quest_name="kill", quest_id=10, required_monster='Monster', level_required=1,
+                            item_reward_dict={}, reward_choice_enabled=False, required_kills=10, xp_reward=10)
+        other_quests = {quest_id: Mock(ID=quest_id, is_completed=False) for quest_id in range(11, 5000)}
+        self.dummy.quest_log = {k_quest.ID: k_quest, **other_quests}
+        mon = Monster(monster_id=1, name="Monster", xp_to_give=10, level=self.dummy.level, quest_relation_id=k_quest.ID)
+
+        self.dummy.award_monster_kill(mon, 1)
+
+        self.assertEqual(k_quest.kills, 1)
+        self.assertFalse(any(quest.method_calls for quest in other_quests.values()))
+
     def test_award_gold(self):
         self.dummy.inventory = {'gold': 0}
         self.dummy.award_gold(10)
@@ -1963,6 +2038,20 @@ class CharacterTests(unittest.TestCase):
 
         self.assertTrue(f_quest.is_completed)
 
+    def test_award_item_large_quest_log(self):
+        """ Only the quest the item is for should check if it is completed """
+        f_quest = FetchQuest(quest_name="d", quest_id=1, required_item='item', required_item_count=2,
+                             item_reward_dict={}, xp_reward=1, reward_choice_enabled=False, level_required=1)
+        other_quests = {quest_id: Mock(ID=quest_id, is_completed=False) for quest_id in range(2, 5000)}
+        self.dummy.quest_log = {f_quest.ID: f_quest, **other_quests}
+        item = Item(name="item", item_id=1, buy_price=1, sell_price=1, quest_id=f_quest.ID)
+
+        self.dummy.award_item(item, 2)
+
+        self.assertTrue(f_quest.is_completed)
+        self.assertNotIn(f_quest.ID, self.dummy.quest_log)
+        self.assertFalse(any(quest.method_calls for quest in other_quests.values()))
+
     def test_remove_item_from_inventory(self):
         """ The remove_item_from inventory removes an item from the inventory of the character """
         item = Item(name="item", item_id=1, buy_price=1, sell_price=1)
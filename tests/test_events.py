@@ -0,0 +1,149 @@
+import json
+import threading
+import unittest
+from io import StringIO
+from unittest.mock import Mock
+
+import database.main
+from tests.create_test_db import engine, session, Base
+
+database.main.engine = engine
+database.main.session = session
+database.main.Base = Base
+
+import models.main
+from buffs import DoT
+from damage import Damage
+from entities import Monster
+from events import (EventBus, TerminalSink, NullSink, JsonLinesSink, DamageDealt, DotTicked, Healed, LootDropped,
+                    LevelUp, SpellCastFailed, CAST_FAILED_NOT_ENOUGH_MANA, CAST_FAILED_ON_COOLDOWN, get_event_bus,
+                    set_event_bus, use_event_bus)
+from heal import Heal
+
+
+class EventRenderTests(unittest.TestCase):
+    def test_damage_dealt(self):
+        self.assertEqual(DamageDealt('Wolf', 'Netherblood', Damage(phys_dmg=2)).render(),
+                         'Wolf attacks Netherblood for 2.00 physical damage!')
+        self.assertEqual(DamageDealt('Netherblood', 'Wolf', Damage(3, 1), 'Seal of Righteousness').render(),
+                         'Netherblood attacks Wolf for 3.00 physical damage and 1.00 magical damage '
+                         'from Seal of Righteousness!')
+
+    def test_healed(self):
+        self.assertEqual(Healed('Flash of Light', 'Netherblood', Heal(10)).render(),
+                         'Flash of Light healed Netherblood for 10.00.')
+        self.assertEqual(Healed('Flash of Light', 'Netherblood', Heal(10), 4).render(),
+                         'Flash of Light healed Netherblood for 6.00 (4.00 Overheal).')
+
+    def test_level_up(self):
+        lines = LevelUp('Netherblood', 2, 1, 10, 5, 2, 3).render().split('\n')
+
+        self.assertEqual(len(lines), 8)
+        self.assertEqual(lines[1], 'Character Netherblood has leveled up to level 2!')
+
+    def test_spell_cast_failed(self):
+        self.assertEqual(SpellCastFailed('Netherblood', 'Flash of Light', CAST_FAILED_NOT_ENOUGH_MANA, 25, 10).render(),
+                         'Not enough mana! Flash of Light requires 25 but you have 10!')
+        self.assertEqual(SpellCastFailed('Netherblood', 'Melting Strike', CAST_FAILED_ON_COOLDOWN).render(),
+                         'Melting Strike is still on cooldown!')
+
+    def test_loot_dropped_is_not_rendered(self):
+        """ The drops are shown in the loot window, so the terminal should not print anything for them """
+        output = StringIO()
+        event_bus = EventBus(sinks=[TerminalSink(output)])
+
+        event_bus.emit(LootDropped, 'Wolf', ['Wolf Meat'])
+
+        self.assertEqual(output.getvalue(), '')
+
+
+class EventBusTests(unittest.TestCase):
+    def setUp(self):
+        self.output = StringIO()
+        self.event_bus = EventBus(sinks=[TerminalSink(self.output)])
+
+    def test_emit_flushes_outside_batch(self):
+        self.event_bus.emit(DotTicked, 'Wolf', Damage(magic_dmg=2), 'Burn')
+
+        self.assertEqual(self.output.getvalue(), 'Wolf suffers 2.00 magical damage from Burn!\n')
+
+    def test_batch_writes_once(self):
+        """ The events of a batch should be written in a single write once the outermost batch is over """
+        self.output.write = Mock(side_effect=self.output.write)
+
+        with self.event_bus.batch():
+            self.event_bus.emit(DotTicked, 'Wolf', Damage(magic_dmg=2), 'Burn')
+            with self.event_bus.batch():
+                self.event_bus.emit(DotTicked, 'Wolf', Damage(magic_dmg=3), 'Burn')
+            self.assertEqual(self.output.getvalue(), '')
+
+        self.output.write.assert_called_once_with('Wolf suffers 2.00 magical damage from Burn!\n'
+                                                  'Wolf suffers 3.00 magical damage from Burn!\n')
+
+    def test_null_sink_does_not_create_events(self):
+        event_type = Mock()
+        self.event_bus.set_sinks([NullSink()])
+
+        self.event_bus.emit(event_type, 'Wolf')
+
+        event_type.assert_not_called()
+
+    def test_set_sinks(self):
+        sink = TerminalSink(StringIO())
+
+        replaced_sinks = self.event_bus.set_sinks([sink])
+        self.event_bus.set_sinks(replaced_sinks)
+        self.event_bus.emit(DotTicked, 'Wolf', Damage(magic_dmg=2), 'Burn')
+
+        self.assertEqual(sink.stream.getvalue(), '')
+        self.assertNotEqual(self.output.getvalue(), '')
+
+    def test_json_lines_sink(self):
+        json_file = StringIO()
+        self.event_bus.add_sink(JsonLinesSink(json_file))
+
+        self.event_bus.emit(DamageDealt, 'Wolf', 'Netherblood', Damage(phys_dmg=2))
+        self.event_bus.emit(Healed, 'Flash of Light', 'Netherblood', Heal(10))
+
+        first_event, second_event = map(json.loads, json_file.getvalue().splitlines())
+        self.assertEqual(first_event, {'event': 'DamageDealt', 'attacker': 'Wolf', 'target': 'Netherblood',
+                                       'damage': {'phys_dmg': 2, 'magic_dmg': 0, 'phys_absorbed': 0,
+                                                  'magic_absorbed': 0},
+                                       'source': None})
+        self.assertEqual(second_event, {'event': 'Healed', 'spell': 'Flash of Light', 'target': 'Netherblood',
+                                        'heal': 10, 'overheal': 0})
+        self.assertNotEqual(self.output.getvalue(), '')  # the terminal still gets the events
+
+    def test_set_event_bus(self):
+        original_event_bus = get_event_bus()
+        self.addCleanup(set_event_bus, original_event_bus)
+        set_event_bus(self.event_bus)
+        monster = Monster(monster_id=1, name='Wolf', health=100)
+        monster.add_buff(DoT(name='Burn', damage_tick=Damage(magic_dmg=2), duration=1, caster_lvl=1))
+
+        monster.start_turn_update()
+
+        self.assertEqual(self.output.getvalue(), 'Wolf suffers 2.00 magical damage from Burn!\n'
+                                                 'DoT Burn has expired from Wolf.\n')
+
+    def test_use_event_bus(self):
+        """ Only the events of the thread which uses the bus should go to it, the others keep the game's bus """
+        original_event_bus = get_event_bus()
+        self.addCleanup(set_event_bus, original_event_bus)
+        set_event_bus(self.event_bus)
+        thread_output = StringIO()
+        other_thread = threading.Thread(target=lambda: get_event_bus().emit(DotTicked, 'Boar', Damage(1), 'Burn'))
+
+        with use_event_bus(EventBus(sinks=[TerminalSink(thread_output)])):
+            get_event_bus().emit(DotTicked, 'Wolf', Damage(magic_dmg=2), 'Burn')
+            other_thread.start()
+            other_thread.join()
+            self.assertEqual(self.event_bus.sinks[0].stream.getvalue(),
+                             'Boar suffers 1.00 physical damage from Burn!\n')
+
+        self.assertEqual(thread_output.getvalue(), 'Wolf suffers 2.00 magical damage from Burn!\n')
+        self.assertIs(get_event_bus(), self.event_bus)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import sys
+import time
+import unittest
+from io import StringIO
+
+from game_clock import (GameClock, Scheduler, CLOCK_MODE_REAL_TIME, CLOCK_MODE_SCALED, CLOCK_MODE_INSTANT,
+                        get_game_clock, set_game_clock)
+
+
+class GameClockTests(unittest.TestCase):
+    def test_instant_sleep(self):
+        """ An instant clock should only move its game time forward when sleeping """
+        clock = GameClock(mode=CLOCK_MODE_INSTANT)
+        start = time.monotonic()
+
+        clock.sleep(3600)
+        clock.sleep(-5)  # negative pauses are skipped
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(clock.now(), 3600)
+
+    def test_sleep_until(self):
+        clock = GameClock(mode=CLOCK_MODE_INSTANT)
+        clock.sleep_until(10)
+        clock.sleep_until(4)  # already passed
+
+        self.assertEqual(clock.now(), 10)
+
+    def test_scaled_sleep(self):
+        """ A scaled clock should pause for the game seconds divided by its speed """
+        clock = GameClock(mode=CLOCK_MODE_SCALED, speed=100)
+        start = time.monotonic()
+
+        clock.sleep(1)
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.01)
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertGreaterEqual(clock.now(), 1)
+
+    def test_real_time_ignores_speed(self):
+        self.assertEqual(GameClock(mode=CLOCK_MODE_REAL_TIME, speed=10).speed, 1)
+
+    def test_invalid_clock(self):
+        with self.assertRaises(Exception):
+            GameClock(mode='fast forward')
+        with self.assertRaises(Exception):
+            GameClock(mode=CLOCK_MODE_SCALED, speed=0)
+
+    def test_set_game_clock(self):
+        original_game_clock = get_game_clock()
+        self.addCleanup(set_game_clock, original_game_clock)
+        clock = GameClock(mode=CLOCK_MODE_INSTANT)
+
+        set_game_clock(clock)
+
+        self.assertIs(get_game_clock(), clock)
+        self.assertIs(Scheduler().clock, clock)
+
+
+class SchedulerTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = GameClock(mode=CLOCK_MODE_INSTANT)
+        self.scheduler = Scheduler(self.clock)
+        self.calls = []
+
+    def record_call(self, name: str):
+        self.calls.append((name, self.clock.now()))
+
+    def test_run_in_due_order(self):
+        """ Calls should be made once they are due, and in the order they were scheduled when due at once """
+        self.scheduler.call_later(5, self.record_call, 'third')
+        self.scheduler.call_later(1, self.record_call, 'first')
+        self.scheduler.call_later(1, self.record_call, 'second')
+
+        self.assertEqual(len(self.scheduler), 3)
+        self.scheduler.run()
+
+        self.assertEqual(self.calls, [('first', 1), ('second', 1), ('third', 5)])
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_delay_is_relative_to_now(self):
+        self.clock.sleep(10)
+        self.scheduler.call_later(2, self.record_call, 'call')
+        self.scheduler.run()
+
+        self.assertEqual(self.calls, [('call', 12)])
+
+    def test_say_lines(self):
+        """ Every line should be printed after the pause of the previous one, and the last pause waited out """
+        output = StringIO()
+        try:
+            sys.stdout = output
+            self.scheduler.say_lines([('Hello', 3), ('World', 2.5)], delay=1)
+            self.scheduler.run()
+        finally:
+            sys.stdout = sys.__stdout__
+
+        self.assertEqual(output.getvalue(), 'Hello\nWorld\n')
+        self.assertEqual(self.clock.now(), 6.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+import unittest
+
+from exceptions import ItemNotInInventoryError, InventoryFullError
+from inventory import Inventory
+from items import Item, Weapon
+
+
+class InventoryTests(unittest.TestCase):
+    def setUp(self):
+        self.wolf_meat = Item(name='Wolf Meat', item_id=1, buy_price=1, sell_price=1)
+        self.linen_cloth = Item(name='Linen Cloth', item_id=2, buy_price=1, sell_price=1)
+        self.starter_weapon = Weapon(name='Starter Weapon', item_id=0)
+        self.inventory = Inventory({'Wolf Meat': (self.wolf_meat, 3), 'gold': 10}, stack_size=5)
+
+    def test_saved_inventory_dictionary(self):
+        """ The gold of a saved inventory dictionary should be the gold counter, not one of the items """
+        self.assertEqual(self.inventory.gold, 10)
+        self.assertEqual(self.inventory['gold'], 10)
+        self.assertNotIn('gold', self.inventory)
+        self.assertEqual(list(self.inventory.items()), [('Wolf Meat', (self.wolf_meat, 3))])
+        self.assertEqual(len(self.inventory), 1)
+
+    def test_lookups(self):
+        self.assertEqual(self.inventory['Wolf Meat'], (self.wolf_meat, 3))
+        self.assertEqual(self.inventory.get_by_id(1), (self.wolf_meat, 3))
+        self.assertIsNone(self.inventory.get_by_id(2))
+        self.assertIs(self.inventory.get_item('Wolf Meat'), self.wolf_meat)
+        self.assertIsNone(self.inventory.get_item('Linen Cloth'))
+        self.assertEqual(self.inventory.get_count('Wolf Meat'), 3)
+        self.assertEqual(self.inventory.get_count('Linen Cloth'), 0)
+
+    def test_add_and_remove(self):
+        self.assertEqual(self.inventory.add(self.wolf_meat, 2), 5)
+        self.assertEqual(self.inventory.remove('Wolf Meat', 4), 1)
+        self.assertEqual(self.inventory.remove('Wolf Meat', 4), 0)
+
+        self.assertNotIn('Wolf Meat', self.inventory)
+        self.assertIsNone(self.inventory.get_by_id(1))
+        with self.assertRaises(ItemNotInInventoryError):
+            self.inventory.remove('Wolf Meat')
+
+    def test_remove_all(self):
+        self.inventory.remove('Wolf Meat', remove_all=True)
+
+        self.assertEqual(len(self.inventory), 0)
+
+    def test_items_without_id(self):
+        """ Items which share an ID (ex: 0) should keep being found by their ID until all of them are removed """
+        other_weapon = Weapon(name='Other Weapon', item_id=0)
+        self.inventory.add(self.starter_weapon)
+        self.inventory.add(other_weapon)
+
+        self.inventory.remove('Starter Weapon')
+
+        self.assertEqual(self.inventory.get_by_id(0), (other_weapon, 1))
+
+    def test_stack_slots(self):
+        self.assertEqual(self.inventory.slots_used, 1)
+
+        self.inventory.add(self.wolf_meat, 3)  # 6 Wolf Meats in stacks of 5
+        self.inventory.add(self.linen_cloth)
+        self.assertEqual(self.inventory.slots_used, 3)
+
+        self.inventory.remove('Wolf Meat', 2)
+        self.inventory.remove('Linen Cloth')
+        self.assertEqual(self.inventory.slots_used, 1)
+
+    def test_max_slots(self):
+        inventory = Inventory(stack_size=5, max_slots=2)
+        inventory.add(self.wolf_meat, 10)
+
+        with self.assertRaises(InventoryFullError):
+            inventory.add(self.wolf_meat)
+        with self.assertRaises(InventoryFullError):
+            inventory.add(self.linen_cloth)
+        self.assertEqual(inventory.get_count('Wolf Meat'), 10)
+        self.assertEqual(inventory.slots_used, 2)
+
+    def test_add_items_all_or_nothing(self):
+        inventory = Inventory(stack_size=5, max_slots=2)
+
+        with self.assertRaises(InventoryFullError):
+            inventory.add_items([(self.wolf_meat, 5), (self.linen_cloth, 5), (self.wolf_meat, 1)])
+        self.assertEqual(len(inventory), 0)
+
+        inventory.add_items([(self.wolf_meat, 3), (self.linen_cloth, 5), (self.wolf_meat, 2)])
+        self.assertEqual(inventory.get_count('Wolf Meat'), 5)
+        self.assertEqual(inventory.get_count('Linen Cloth'), 5)
+
+    def test_remove_items_all_or_nothing(self):
+        self.inventory.add(self.linen_cloth, 2)
+
+        with self.assertRaises(ItemNotInInventoryError):
+            self.inventory.remove_items({'Wolf Meat': 1, 'Silk Cloth': 1})
+        self.assertEqual(self.inventory.get_count('Wolf Meat'), 3)
+
+        self.inventory.remove_items({'Wolf Meat': 3, 'Linen Cloth': 1})
+        self.assertNotIn('Wolf Meat', self.inventory)
+        self.assertEqual(self.inventory.get_count('Linen Cloth'), 1)
+
+    def test_changes(self):
+        self.assertFalse(self.inventory.is_dirty)
+
+        self.inventory.add(self.linen_cloth)
+        self.inventory.remove('Wolf Meat', 1)
+        self.assertEqual(self.inventory.get_changes(), {'Linen Cloth': (None, (self.linen_cloth, 1)),
+                                                        'Wolf Meat': ((self.wolf_meat, 3), (self.wolf_meat, 2))})
+
+        self.inventory.mark_clean()
+        self.inventory.remove('Linen Cloth')
+        self.assertEqual(self.inventory.get_changes(), {'Linen Cloth': ((self.linen_cloth, 1), None)})
+
+    def test_changed_back_is_not_a_change(self):
+        self.inventory.add(self.wolf_meat)
+        self.inventory.remove('Wolf Meat')
+
+        self.assertEqual(self.inventory.get_changes(), {})
+        self.assertFalse(self.inventory.is_dirty)
+
+    def test_gold_is_dirty(self):
+        """ The gold is saved in the saved_character table, so it is not one of the changes, but it is unsaved """
+        self.inventory.gold += 5
+
+        self.assertTrue(self.inventory.is_dirty)
+        self.assertEqual(self.inventory.get_changes(), {})
+
+    def test_binary_form(self):
+        self.inventory.add(self.linen_cloth, 7)
+        items = {item.id: item for item in (self.wolf_meat, self.linen_cloth)}
+
+        loaded_inventory = Inventory.from_bytes(self.inventory.to_bytes(), items.get, stack_size=5)
+
+        self.assertEqual(loaded_inventory, self.inventory)
+        self.assertEqual(loaded_inventory.slots_used, 3)
+        self.assertFalse(loaded_inventory.is_dirty)
+
+    def test_binary_form_gold(self):
+        """ The gold should keep its sign and size """
+        for gold in (-25, 0, 2 ** 40):
+            self.inventory.gold = gold
+
+            loaded_inventory = Inventory.from_bytes(self.inventory.to_bytes(), lambda item_id: self.wolf_meat)
+
+            self.assertEqual(loaded_inventory.gold, gold)
+
+        self.inventory.gold = 2 ** 70
+        with self.assertRaises(Exception):
+            self.inventory.to_bytes()
+
+    def test_binary_form_items_without_id(self):
+        """ Items without an ID can not be loaded back, so they should not be lost silently """
+        self.inventory.add(self.starter_weapon)
+
+        with self.assertRaises(Exception) as context:
+            self.inventory.to_bytes()
+        self.assertIn('Starter Weapon', str(context.exception))
+
+    def test_binary_form_version(self):
+        data = bytearray(self.inventory.to_bytes())
+        data[0] = 255
+
+        with self.assertRaises(Exception):
+            Inventory.from_bytes(bytes(data), lambda item_id: self.wolf_meat)
+
+    def test_binary_form_truncated(self):
+        with self.assertRaises(Exception):
+            Inventory.from_bytes(self.inventory.to_bytes()[:-1], lambda item_id: self.wolf_meat)
+
+
+if __name__ == '__main__':
+    unittest.main()
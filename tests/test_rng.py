@@ -0,0 +1,132 @@
+import os
+import tempfile
+import unittest
+
+import database.main
+from tests.create_test_db import engine, session, Base
+
+database.main.engine = engine
+database.main.session = session
+database.main.Base = Base
+
+import models.main
+from entities import Monster
+from heal import HolyHeal
+from rng import RandomService, STREAM_NAMES, get_random_service, set_random_service, save_recording, load_recording
+
+
+class RandomStreamTests(unittest.TestCase):
+    def setUp(self):
+        self.random_service = RandomService(seed=42, block_size=8)
+
+    def test_random_range(self):
+        rolls = [self.random_service.combat.random() for _ in range(100)]
+
+        for roll in rolls:
+            self.assertGreaterEqual(roll, 0)
+            self.assertLess(roll, 1)
+
+    def test_random_refills_block(self):
+        """ The stream should keep serving rolls after its block runs out, without repeating the block """
+        rolls = [self.random_service.combat.random() for _ in range(20)]
+
+        self.assertEqual(len(set(rolls)), 20)
+
+    def test_random_with_size(self):
+        """ Rolls taken as an array should continue the same stream as single rolls """
+        expected_service = RandomService(seed=42, block_size=8)
+        expected_rolls = [expected_service.loot.random() for _ in range(13)]
+        first_roll = self.random_service.loot.random()
+
+        rolls = self.random_service.loot.random((3, 4))
+
+        self.assertEqual(rolls.shape, (3, 4))
+        self.assertEqual([first_roll] + rolls.ravel().tolist(), expected_rolls)
+
+    def test_randint_bounds(self):
+        rolls = {self.random_service.combat.randint(1, 3) for _ in range(200)}
+
+        self.assertEqual(rolls, {1, 2, 3})
+
+    def test_randint_single_value(self):
+        self.assertEqual(self.random_service.gold.randint(5, 5), 5)
+
+    def test_randint_empty_range(self):
+        with self.assertRaises(ValueError):
+            self.random_service.gold.randint(3, 1)
+
+
+class RandomServiceTests(unittest.TestCase):
+    def test_same_seed_same_rolls(self):
+        first_service, second_service = RandomService(seed=7), RandomService(seed=7)
+
+        for stream_name in STREAM_NAMES:
+            self.assertEqual([first_service.streams[stream_name].random() for _ in range(50)],
+                             [second_service.streams[stream_name].random() for _ in range(50)])
+
+    def test_different_seeds_different_rolls(self):
+        self.assertNotEqual([RandomService(seed=1).combat.random() for _ in range(10)],
+                            [RandomService(seed=2).combat.random() for _ in range(10)])
+
+    def test_streams_are_independent(self):
+        """ Rolling on one stream should not change the rolls of another """
+        random_service, expected_service = RandomService(seed=7), RandomService(seed=7)
+        for _ in range(100):
+            random_service.loot.random()
+
+        self.assertEqual([random_service.combat.random() for _ in range(10)],
+                         [expected_service.combat.random() for _ in range(10)])
+
+    def test_record_and_replay(self):
+        random_service = RandomService()
+        random_service.start_recording()
+        expected_rolls = [random_service.combat.randint(1, 10) for _ in range(20)]
+        expected_gold = random_service.gold.randint(0, 100)
+        recording = random_service.stop_recording()
+
+        replaying_service = RandomService()
+        replaying_service.replay(recording)
+
+        self.assertEqual([replaying_service.combat.randint(1, 10) for _ in range(20)], expected_rolls)
+        self.assertEqual(replaying_service.gold.randint(0, 100), expected_gold)
+        self.assertEqual(recording[STREAM_NAMES[1]], [])  # the heal_crit stream was not rolled on
+
+    def test_stop_recording_without_start(self):
+        self.assertEqual(RandomService().stop_recording(), {stream_name: [] for stream_name in STREAM_NAMES})
+
+    def test_save_and_load_recording(self):
+        random_service = RandomService(seed=3)
+        random_service.start_recording()
+        for _ in range(5):
+            random_service.heal_crit.random()
+        recording = random_service.stop_recording()
+        recording_path = os.path.join(tempfile.mkdtemp(), 'rolls.json')
+
+        save_recording(recording, recording_path)
+
+        self.assertEqual(load_recording(recording_path), recording)
+
+    def test_set_random_service(self):
+        original_random_service = get_random_service()
+        self.addCleanup(set_random_service, original_random_service)
+        random_service = RandomService(seed=1)
+
+        set_random_service(random_service)
+
+        self.assertIs(get_random_service(), random_service)
+        self.assertIs(HolyHeal(heal_amount=10).random_service, random_service)
+
+    def test_seeded_monster_rolls(self):
+        """ Two monsters given services with the same seed should deal the same damage and give the same gold """
+        first_monster = Monster(monster_id=1, name='Wolf', min_damage=1, max_damage=10, gold_to_give_range=(1, 100),
+                                random_service=RandomService(seed=11))
+        second_monster = Monster(monster_id=1, name='Wolf', min_damage=1, max_damage=10, gold_to_give_range=(1, 100),
+                                 random_service=RandomService(seed=11))
+
+        self.assertEqual(first_monster.loot['gold'], second_monster.loot['gold'])
+        self.assertEqual([first_monster.get_auto_attack_damage(1).phys_dmg for _ in range(20)],
+                         [second_monster.get_auto_attack_damage(1).phys_dmg for _ in range(20)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+Test the EntityIndex in utils/entity_index.py
+"""
+import unittest
+from typing import NamedTuple
+
+from utils.entity_index import EntityIndex, normalize_name
+
+
+class Creature(NamedTuple):
+    """ Everything the index needs from a LivingThing """
+    name: str
+    level: int = 1
+
+
+class EntityIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.entity_index = EntityIndex({1: Creature('Kobold Worker', 3), 2: Creature('Kobold Worker', 2),
+                                         3: Creature('Kobold Laborer', 4), 4: Creature('Garrick Padfoot', 5)})
+
+    def test_mapping(self):
+        self.assertEqual(len(self.entity_index), 4)
+        self.assertEqual(self.entity_index[3], Creature('Kobold Laborer', 4))
+        self.assertIn(4, self.entity_index)
+        self.assertEqual(set(self.entity_index.keys()), {1, 2, 3, 4})
+
+    def test_normalize_name(self):
+        self.assertEqual(normalize_name('  Kobold   WORKER '), 'kobold worker')
+
+    def test_get_guid_by_name(self):
+        """ The lowest level entity with the name should be returned, no matter the case or whitespace """
+        self.assertEqual(self.entity_index.get_guid_by_name('Kobold Worker'), 2)
+        self.assertEqual(self.entity_index.get_guid_by_name('kobold  worker'), 2)
+        self.assertEqual(self.entity_index.get_by_name('garrick padfoot'), Creature('Garrick Padfoot', 5))
+        self.assertIsNone(self.entity_index.get_guid_by_name('Hogger'))
+
+    def test_same_level_lowest_guid(self):
+        self.entity_index[0] = Creature('Kobold Worker', 2)
+
+        self.assertEqual(self.entity_index.get_guid_by_name('Kobold Worker'), 0)
+
+    def test_delete_updates_names(self):
+        """ Once an entity dies, the next one with its name should be returned """
+        del self.entity_index[2]
+        self.assertEqual(self.entity_index.get_guid_by_name('Kobold Worker'), 1)
+
+        del self.entity_index[1]
+        self.assertIsNone(self.entity_index.get_guid_by_name('Kobold Worker'))
+        self.assertEqual(self.entity_index.find_names('kobold'), ['Kobold Laborer'])
+
+    def test_respawn(self):
+        del self.entity_index[2]
+        self.entity_index[2] = Creature('Kobold Worker', 2)
+
+        self.assertEqual(self.entity_index.get_guid_by_name('Kobold Worker'), 2)
+        self.assertIn((2, 'Kobold Worker'), self.entity_index.guid_names)
+
+    def test_replace_entity(self):
+        self.entity_index[2] = Creature('Hogger', 11)
+
+        self.assertEqual(self.entity_index.get_guid_by_name('Kobold Worker'), 1)
+        self.assertEqual(self.entity_index.get_guid_by_name('Hogger'), 2)
+
+    def test_prefix(self):
+        self.assertEqual(self.entity_index.find_names('KOB'), ['Kobold Laborer', 'Kobold Worker'])
+        self.assertEqual(self.entity_index.find_names('x'), [])
+        # a prefix is looked up only if it matches a single name
+        self.assertEqual(self.entity_index.get_guid_by_name('garr'), 4)
+        self.assertIsNone(self.entity_index.get_guid_by_name('kobold'))
+        self.assertIsNone(self.entity_index.get_guid_by_name('garr', allow_prefix=False))
+        self.assertIsNone(self.entity_index.get_guid_by_name(''))
+
+    def test_guid_names(self):
+        guid_names = self.entity_index.guid_names
+
+        self.assertEqual(set(guid_names), {(1, 'Kobold Worker'), (2, 'Kobold Worker'), (3, 'Kobold Laborer'),
+                                           (4, 'Garrick Padfoot')})
+        del self.entity_index[4]
+        self.assertEqual(len(guid_names), 3)
+        self.assertNotIn((4, 'Garrick Padfoot'), guid_names)
+        self.assertNotIn((1, 'Kobold Laborer'), guid_names)
+
+    def test_by_level(self):
+        self.assertEqual([guid for guid, _ in self.entity_index.by_level()], [2, 1, 3, 4])
+        self.assertEqual(self.entity_index.get_lowest_level(2), [(2, Creature('Kobold Worker', 2)),
+                                                                 (1, Creature('Kobold Worker', 3))])
+        self.assertEqual(self.entity_index.get_lowest_level(10, min_level=4),
+                         [(3, Creature('Kobold Laborer', 4)), (4, Creature('Garrick Padfoot', 5))])
+
+    def test_level_range(self):
+        self.assertEqual([guid for guid, _ in self.entity_index.by_level(min_level=3, max_level=4)], [1, 3])
+        self.assertEqual([guid for guid, _ in self.entity_index.by_level(max_level=2)], [2])
+        self.assertEqual(list(self.entity_index.by_level(min_level=6)), [])
+
+    def test_level_order_after_changes(self):
+        """ Deaths, respawns and replaced entities should keep the level order, with the lowest GUID first """
+        del self.entity_index[2]
+        self.entity_index[2] = Creature('Kobold Worker', 5)
+        self.entity_index[4] = Creature('Hogger', 11)
+        self.entity_index[0] = Creature('Kobold Worker', 3)
+
+        self.assertEqual([(guid, creature.level) for guid, creature in self.entity_index.by_level()],
+                         [(0, 3), (1, 3), (3, 4), (2, 5), (4, 11)])
+
+        for guid in list(self.entity_index):
+            del self.entity_index[guid]
+        self.assertEqual(self.entity_index.get_lowest_level(5), [])
+
+    def test_many_spawns(self):
+        """ Killing off thousands of spawns sharing a name should go from the lowest level, then the lowest GUID """
+        entity_index = EntityIndex({guid: Creature('Wolf', level=guid % 7) for guid in range(5000)})
+        killed = []
+
+        while entity_index:
+            guid = entity_index.get_guid_by_name('wolf')
+            killed.append((entity_index[guid].level, guid))
+            del entity_index[guid]
+
+        self.assertEqual(killed, sorted((guid % 7, guid) for guid in range(5000)))
+        self.assertEqual(list(entity_index.by_level()), [])
+        self.assertEqual(entity_index.find_names('w'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
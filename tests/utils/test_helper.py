@@ -3,7 +3,7 @@ Test the helper functions in utils/helper.py
 """
 import unittest
 
-from utils.helper import parse_int
+from utils.helper import parse_int, LazyMapping
 
 
 class TestUtils(unittest.TestCase):
@@ -25,5 +25,37 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(parse_int([]), 0)
 
 
+class LazyMappingTests(unittest.TestCase):
+    def setUp(self):
+        self.load_count = 0
+
+    def loader(self):
+        self.load_count += 1
+        return {1: 'one', 2: 'two'}
+
+    def test_does_not_load_on_creation(self):
+        lazy_mapping = LazyMapping(self.loader)
+
+        self.assertFalse(lazy_mapping.is_loaded)
+        self.assertEqual(self.load_count, 0)
+
+    def test_loads_once_on_first_access(self):
+        lazy_mapping = LazyMapping(self.loader)
+
+        self.assertEqual(lazy_mapping[1], 'one')
+        self.assertTrue(lazy_mapping.is_loaded)
+        self.assertEqual(lazy_mapping.get(3), None)
+        self.assertIn(2, lazy_mapping)
+        self.assertEqual(list(lazy_mapping.keys()), [1, 2])
+        self.assertEqual(len(lazy_mapping), 2)
+        self.assertEqual(dict(lazy_mapping), {1: 'one', 2: 'two'})
+        self.assertEqual(self.load_count, 1)
+
+    def test_missing_key(self):
+        lazy_mapping = LazyMapping(self.loader)
+
+        self.assertRaises(KeyError, lambda: lazy_mapping[3])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,39 @@
+"""
+Test the parsing of the -X importtime output in utils/startup_report.py
+"""
+import unittest
+
+from utils.startup_report import parse_import_times, get_total_import_time_us, ImportTime
+
+IMPORT_TIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       102 |        102 |   _io
+import time:       250 |        250 |     buffs
+import time:       400 |        650 |   entities
+Some other stderr line
+import time:      1301 |       2053 | main
+"""
+
+
+class StartupReportTests(unittest.TestCase):
+    def test_parse_import_times(self):
+        expected_import_times = [ImportTime(module='_io', self_us=102, cumulative_us=102, depth=1),
+                                 ImportTime(module='buffs', self_us=250, cumulative_us=250, depth=2),
+                                 ImportTime(module='entities', self_us=400, cumulative_us=650, depth=1),
+                                 ImportTime(module='main', self_us=1301, cumulative_us=2053, depth=0)]
+
+        self.assertEqual(parse_import_times(IMPORT_TIME_OUTPUT), expected_import_times)
+
+    def test_get_total_import_time_us(self):
+        import_times = parse_import_times(IMPORT_TIME_OUTPUT)
+
+        self.assertEqual(get_total_import_time_us(import_times, 'main'), 2053)
+
+    def test_get_total_import_time_us_not_imported(self):
+        import_times = parse_import_times(IMPORT_TIME_OUTPUT)
+
+        # entities is not a top-level import
+        self.assertRaises(Exception, get_total_import_time_us, import_times, 'entities')
+
+
+if __name__ == '__main__':
+    unittest.main()
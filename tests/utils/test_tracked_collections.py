@@ -0,0 +1,126 @@
+"""
+Test the collections in utils/tracked_collections.py
+"""
+import pickle
+import unittest
+from copy import deepcopy
+
+from utils.tracked_collections import TrackedSet, TrackedDict
+
+
+class TrackedSetTests(unittest.TestCase):
+    def setUp(self):
+        self.tracked_set = TrackedSet({1, 2, 3})
+
+    def test_starts_clean(self):
+        self.assertFalse(self.tracked_set.is_dirty)
+        self.assertEqual(self.tracked_set, {1, 2, 3})
+
+    def test_tracks_added_and_removed(self):
+        self.tracked_set.add(4)
+        self.tracked_set.add(1)  # already in the set, should not count as added
+        self.tracked_set.discard(2)
+        self.tracked_set.remove(3)
+
+        self.assertTrue(self.tracked_set.is_dirty)
+        self.assertEqual(self.tracked_set.added, {4})
+        self.assertEqual(self.tracked_set.removed, {2, 3})
+
+    def test_add_back_removed_element_is_not_a_change(self):
+        self.tracked_set.discard(1)
+        self.tracked_set.add(1)
+        self.tracked_set.add(5)
+        self.tracked_set.discard(5)
+
+        self.assertFalse(self.tracked_set.is_dirty)
+
+    def test_bulk_operations(self):
+        self.tracked_set |= {3, 4}
+        self.tracked_set -= {1}
+        self.tracked_set.update([5], [6])
+
+        self.assertEqual(self.tracked_set, {2, 3, 4, 5, 6})
+        self.assertEqual(self.tracked_set.added, {4, 5, 6})
+        self.assertEqual(self.tracked_set.removed, {1})
+
+        self.tracked_set.clear()
+        self.assertEqual(self.tracked_set.added, set())
+        self.assertEqual(self.tracked_set.removed, {1, 2, 3})
+
+    def test_remove_missing_element_raises(self):
+        with self.assertRaises(KeyError):
+            self.tracked_set.remove(10)
+        self.assertFalse(self.tracked_set.is_dirty)
+
+    def test_mark_clean(self):
+        self.tracked_set.add(4)
+        self.tracked_set.mark_clean()
+
+        self.assertFalse(self.tracked_set.is_dirty)
+        self.tracked_set.discard(4)
+        self.assertEqual(self.tracked_set.removed, {4})
+
+    def test_deepcopy_keeps_changes(self):
+        self.tracked_set.add(4)
+        copied_set = deepcopy(self.tracked_set)
+
+        self.assertIsInstance(copied_set, TrackedSet)
+        self.assertEqual(copied_set, {1, 2, 3, 4})
+        self.assertEqual(copied_set.added, {4})
+
+
+class TrackedDictTests(unittest.TestCase):
+    def setUp(self):
+        self.tracked_dict = TrackedDict({'gold': 10, 'Wolf Meat': 2})
+
+    def test_starts_clean(self):
+        self.assertFalse(self.tracked_dict.is_dirty)
+        self.assertEqual(self.tracked_dict.get_changes(), {})
+
+    def test_tracks_set_and_deleted_keys(self):
+        self.tracked_dict['gold'] += 5
+        self.tracked_dict['Wolf Pelt'] = 1
+        del self.tracked_dict['Wolf Meat']
+
+        self.assertTrue(self.tracked_dict.is_dirty)
+        self.assertEqual(self.tracked_dict.get_changes(), {'gold': (10, 15),
+                                                           'Wolf Pelt': (None, 1),
+                                                           'Wolf Meat': (2, None)})
+
+    def test_change_back_is_not_a_change(self):
+        self.tracked_dict['gold'] = 20
+        self.tracked_dict['gold'] = 10
+        self.tracked_dict['Wolf Pelt'] = 1
+        self.tracked_dict.pop('Wolf Pelt')
+
+        self.assertFalse(self.tracked_dict.is_dirty)
+        self.assertFalse(self.tracked_dict.is_changed('gold'))
+
+    def test_mark_clean(self):
+        self.tracked_dict['gold'] = 20
+        self.tracked_dict.mark_clean()
+
+        self.assertFalse(self.tracked_dict.is_dirty)
+        self.tracked_dict.update(gold=30)
+        self.assertEqual(self.tracked_dict.get_changes(), {'gold': (20, 30)})
+
+    def test_delete_missing_key_raises(self):
+        with self.assertRaises(KeyError):
+            del self.tracked_dict['Linen Cloth']
+        self.assertFalse(self.tracked_dict.is_dirty)
+
+    def test_compares_like_a_dict(self):
+        self.assertEqual(self.tracked_dict, {'gold': 10, 'Wolf Meat': 2})
+
+    def test_pickle_keeps_changes(self):
+        self.tracked_dict['gold'] = 15
+
+        unpickled_dict = pickle.loads(pickle.dumps(self.tracked_dict))
+
+        self.assertIsInstance(unpickled_dict, TrackedDict)
+        self.assertEqual(unpickled_dict, self.tracked_dict)
+        self.assertEqual(unpickled_dict.get_changes(), {'gold': (10, 15)})
+
+
+if __name__ == '__main__':
+    unittest.main()
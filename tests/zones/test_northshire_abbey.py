@@ -3,11 +3,11 @@ import unittest.mock
 import sys
 from copy import deepcopy
 from io import StringIO
-from datetime import datetime, timedelta
 
 import models.main
 from zones.northshire_abbey import NorthshireAbbey, NorthshireValley, NorthshireVineyards
 from constants import ZONE_MOVE_BLOCK_SPECIAL_KEY, GARRICK_PADFOOT_GUID
+from game_clock import GameClock, CLOCK_MODE_INSTANT, get_game_clock, set_game_clock
 
 
 class NorthshireAbbeyTests(unittest.TestCase):
@@ -48,6 +48,8 @@ class NorthshireAbbeyTests(unittest.TestCase):
         self.assertEqual(len(zone.cs_alive_npcs.keys()), self.northshire_valley_npc_count)
         self.assertEqual(len(zone.cs_available_quests.keys()), self.northshire_valley_quest_count)
         self.assertEqual(zone.curr_subzone, 'Northshire Valley')
+        # the subzone should report how many queries loading it took
+        self.assertGreater(zone.loaded_zones['Northshire Valley'].load_query_count, 0)
 
     def test_move_player_valid(self):
         """
@@ -100,7 +102,6 @@ class NorthshireAbbeyTests(unittest.TestCase):
                                   character=self.char_mock)
         self.assertTrue(result)
         del zone.cs_alive_monsters[GARRICK_PADFOOT_GUID]
-        zone.cs_monsters_guid_name_set.remove((GARRICK_PADFOOT_GUID, 'Garrick Padfoot'))
         result = zone.move_player(current_subzone=mid_zone, destination=go_to_subzone,
                                   character=self.char_mock)
 
@@ -187,18 +188,18 @@ class NorthshireAbbeyTests(unittest.TestCase):
         zone.move_player(current_subzone=start_subzone, destination=mid_zone,
                                   character=self.char_mock)
         del zone.cs_alive_monsters[GARRICK_PADFOOT_GUID]
-        zone.cs_monsters_guid_name_set.remove((GARRICK_PADFOOT_GUID, 'Garrick Padfoot'))
         zone.move_player(current_subzone=mid_zone, destination=go_to_subzone,
                                   character=self.char_mock)
 
-        # start the test
-        start = datetime.now()
+        # start the test, on an instant clock so that the script's pauses do not take real time
+        original_game_clock = get_game_clock()
+        self.addCleanup(set_game_clock, original_game_clock)
+        game_clock = GameClock(mode=CLOCK_MODE_INSTANT)
+        set_game_clock(game_clock)
         zone.engage_zone_entered_script(self.char_mock)
-        end = datetime.now()
 
-        # 5 seconds should have passed at least while the script played out
-        duration: timedelta = end - start
-        self.assertGreater(duration.seconds, 5)
+        # 5 seconds of game time should have passed at least while the script played out
+        self.assertGreater(game_clock.now(), 5)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,95 @@
+import unittest
+import unittest.mock
+
+import database.main
+from tests.create_test_db import engine, session, Base
+database.main.engine = engine
+database.main.session = session
+database.main.Base = Base
+
+import models.main
+from zones.northshire_abbey import NorthshireAbbey, NorthshireVineyards, PeculiarHut
+from zones.prefetcher import SubZonePrefetcher
+
+
+class SubZonePrefetcherTests(unittest.TestCase):
+    def setUp(self):
+        self.char_mock = unittest.mock.Mock(level=10)
+        self.char_mock.has_completed_quest = lambda x: False
+        self.char_mock.has_killed_monster = lambda x: False
+        self.zone = NorthshireAbbey(self.char_mock)
+        self.zone.prefetcher.shutdown()  # use our own prefetchers in the tests
+        self.northshire_vineyards_monster_count = 7
+
+    def tearDown(self):
+        NorthshireAbbey.loaded_zones = {"Northshire Valley": None,
+                                        "Northshire Vineyards": None,
+                                        "A Peculiar Hut": None}
+
+    def test_get_neighbours(self):
+        first_level_prefetcher = SubZonePrefetcher(self.zone, self.char_mock, depth=1)
+        second_level_prefetcher = SubZonePrefetcher(self.zone, self.char_mock, depth=2)
+
+        self.assertEqual(first_level_prefetcher._get_neighbours('Northshire Valley'), ['Northshire Vineyards'])
+        self.assertEqual(second_level_prefetcher._get_neighbours('Northshire Valley'),
+                         ['Northshire Vineyards', 'A Peculiar Hut'])
+
+    def test_prefetch_and_take(self):
+        prefetcher = SubZonePrefetcher(self.zone, self.char_mock, depth=2, max_workers=2)
+
+        prefetcher.prefetch_neighbours('Northshire Valley')
+
+        self.assertTrue(prefetcher.is_prefetching('Northshire Vineyards'))
+        self.assertTrue(prefetcher.is_prefetching('A Peculiar Hut'))
+        vineyards = prefetcher.take('Northshire Vineyards')
+        self.assertTrue(isinstance(vineyards, NorthshireVineyards))
+        self.assertEqual(len(vineyards.get_monsters()[0]), self.northshire_vineyards_monster_count)
+        self.assertTrue(isinstance(prefetcher.take('A Peculiar Hut'), PeculiarHut))
+        # once taken, it is no longer held by the prefetcher
+        self.assertFalse(prefetcher.is_prefetching('Northshire Vineyards'))
+        self.assertIsNone(prefetcher.take('Northshire Vineyards'))
+        prefetcher.shutdown()
+
+    def test_prefetch_skips_loaded_subzones(self):
+        prefetcher = SubZonePrefetcher(self.zone, self.char_mock, depth=1)
+
+        prefetcher.prefetch_neighbours('Northshire Vineyards')
+
+        # the valley is already loaded
+        self.assertFalse(prefetcher.is_prefetching('Northshire Valley'))
+        self.assertTrue(prefetcher.is_prefetching('A Peculiar Hut'))
+        prefetcher.shutdown()
+
+    def test_zero_depth_disables_prefetching(self):
+        prefetcher = SubZonePrefetcher(self.zone, self.char_mock, depth=0)
+
+        prefetcher.prefetch_neighbours('Northshire Valley')
+
+        self.assertFalse(prefetcher.is_prefetching('Northshire Vineyards'))
+        self.assertIsNone(prefetcher.take('Northshire Vineyards'))
+
+    def test_take_failed_prefetch(self):
+        """ If the prefetch has failed, take should return None so that the subzone gets loaded normally """
+        prefetcher = SubZonePrefetcher(self.zone, self.char_mock, depth=1)
+
+        with unittest.mock.patch.object(self.zone, 'create_subzone', side_effect=Exception('DB is gone')):
+            prefetcher.prefetch_neighbours('Northshire Valley')
+            self.assertIsNone(prefetcher.take('Northshire Vineyards'))
+        prefetcher.shutdown()
+
+    def test_move_player_uses_prefetched_subzone(self):
+        self.zone.prefetcher = SubZonePrefetcher(self.zone, self.char_mock, depth=1)
+        self.zone.prefetcher.prefetch_neighbours('Northshire Valley')
+        prefetched_vineyards = self.zone.prefetcher._futures['Northshire Vineyards'].result()
+
+        self.zone.move_player('Northshire Valley', 'Northshire Vineyards', self.char_mock)
+
+        self.assertIs(self.zone.loaded_zones['Northshire Vineyards'], prefetched_vineyards)
+        self.assertEqual(len(self.zone.cs_alive_monsters), self.northshire_vineyards_monster_count)
+        # we should have started loading the neighbours of the vineyards
+        self.assertTrue(self.zone.prefetcher.is_prefetching('A Peculiar Hut'))
+        self.zone.prefetcher.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+This module runs a balance sweep (see simulation/sweep.py) of Paladins of every given level against every monster
+of the given levels with every given policy, on all CPU cores, and prints the summary table.
+
+Usage:
+    python -m utils.balance_sweep [--character-levels LEVELS] [--monster-levels LEVELS] [--policies attack,sor,heal]
+                                  [--fights COUNT] [--seed SEED] [--workers COUNT] [--csv PATH]
+
+LEVELS is a range (ex: 1-7) or a comma separated list (ex: 1,3,5), every level in the database by default.
+A sweep run again with the same --seed gives the same results, no matter the count of workers.
+"""
+import argparse
+import csv
+
+DEFAULT_FIGHTS_COUNT = 100_000
+DEFAULT_POLICIES = 'attack,sor,heal'
+
+
+def parse_levels(levels: str) -> [int]:
+    """ Parse a range of levels (ex: 1-7) or a comma separated list of them (ex: 1,3,5) """
+    if '-' in levels:
+        first_level, last_level = levels.split('-')
+        return list(range(int(first_level), int(last_level) + 1))
+
+    return [int(level) for level in levels.split(',')]
+
+
+def load_monster_entries(monster_levels: [int] or None, db_session=None) -> [int]:
+    """
+    :param monster_levels: the levels of the monsters to load, every level by default
+    :return: the entries of the monsters in creature_template of the given levels
+    """
+    import database.main
+    from models.creatures.creature_template import CreatureTemplateSchema
+
+    db_session = db_session or database.main.session
+    query = db_session.query(CreatureTemplateSchema.entry).filter_by(type='monster')
+    if monster_levels is not None:
+        query = query.filter(CreatureTemplateSchema.level.in_(monster_levels))
+
+    return [entry for entry, in query.order_by(CreatureTemplateSchema.level, CreatureTemplateSchema.entry)]
+
+
+def print_results(results: ['SweepResult']):
+    print(f'{"level":>5} {"creature":>28} {"policy":>7} {"won":>8} {"died":>8} {"ttk":>6} {"mana left":>10}')
+    for result in results:
+        creature = f'Level {result.creature_level} {result.creature_name}'
+        print(f'{result.character_level:>5} {creature:>28} {result.policy:>7} {result.win_rate:8.2%} '
+              f'{result.death_rate:8.2%} {result.average_time_to_kill:6.2f} {result.average_mana_left:10.2f}')
+
+
+def write_csv(results: ['SweepResult'], csv_path: str):
+    from simulation.sweep import SweepResult
+
+    with open(csv_path, 'w', newline='') as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(SweepResult._fields)
+        writer.writerows(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulate fights for a grid of character levels, monsters and '
+                                                 'policies on all CPU cores.')
+    parser.add_argument('--character-levels', help='the levels of the Paladin, every level by default')
+    parser.add_argument('--monster-levels', help='the levels of the monsters, every level by default')
+    parser.add_argument('--policies', default=DEFAULT_POLICIES, help='how the Paladin fights, comma separated')
+    parser.add_argument('--fights', type=int, default=DEFAULT_FIGHTS_COUNT,
+                        help='the count of fights to simulate for every point of the grid')
+    parser.add_argument('--seed', type=int, help='the master seed, a random one is picked (and printed) by default')
+    parser.add_argument('--workers', type=int, help='the count of worker processes, the count of CPUs by default')
+    parser.add_argument('--csv', help='a path to write the summary table to, as CSV')
+    args = parser.parse_args()
+
+    import numpy
+    import models.main
+    from constants import CHARACTER_LEVELUP_BONUS_STATS
+    from simulation.sweep import load_sweep_world, build_grid, run_sweep
+
+    character_levels = (parse_levels(args.character_levels) if args.character_levels
+                        else sorted(CHARACTER_LEVELUP_BONUS_STATS))
+    monster_entries = load_monster_entries(parse_levels(args.monster_levels) if args.monster_levels else None)
+    master_seed = args.seed if args.seed is not None else numpy.random.SeedSequence().entropy
+
+    world = load_sweep_world(character_levels, monster_entries)
+    points = build_grid(character_levels, monster_entries, args.policies.split(','))
+    print(f'Simulating {args.fights} fights for each of {len(points)} points (master seed {master_seed})')
+    results = run_sweep(world, points, args.fights, master_seed, workers=args.workers)
+
+    print_results(results)
+    if args.csv:
+        write_csv(results, args.csv)
+
+
+if __name__ == '__main__':
+    main()
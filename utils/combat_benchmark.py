@@ -0,0 +1,69 @@
+"""
+This module measures how many headless fights (see simulation/combat_engine.py) run per minute on a single core,
+with every policy against the same monster.
+
+Usage:
+    python -m utils.combat_benchmark [--fights COUNT] [--level LEVEL]
+"""
+import argparse
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+DEFAULT_FIGHTS_COUNT = 20000
+DEFAULT_LEVEL = 3
+
+
+def run_benchmark(fights_count: int, level: int) -> {str: (float, float, float)}:
+    """
+    :return: A dictionary Key: the name of the policy, Value: Tuple(1,2,3)
+        1 - the count of fights per minute
+        2 - the percentage of fights the character won
+        3 - the average count of turns a fight took
+    """
+    import models.main
+    from classes import Paladin
+    from entities import Monster
+    from simulation.combat_engine import run_fights
+    from simulation.policies import AlwaysAttackPolicy, SealThenAttackPolicy, HealBelowPolicy, ScriptedPolicy
+
+    with redirect_stdout(StringIO()):
+        character = Paladin(name='Benchmarker', level=level)
+
+    def create_monster():
+        return Monster(monster_id=1, name='Timber Wolf', health=15 * level, mana=0, level=level,
+                       min_damage=1, max_damage=level + 1, armor=50 * level)
+
+    policies = [AlwaysAttackPolicy(), SealThenAttackPolicy(), HealBelowPolicy(fallback_policy=SealThenAttackPolicy()),
+                ScriptedPolicy(['sor', 'ms'])]
+    timings = {}
+    for policy in policies:
+        start = time.perf_counter()
+        results = run_fights(character, create_monster, policy, fights_count)
+        elapsed = time.perf_counter() - start
+
+        won_count = sum(1 for result in results if result.character_won)
+        timings[policy.name] = (fights_count / elapsed * 60, won_count / fights_count * 100,
+                                sum(result.turns for result in results) / fights_count)
+
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the throughput of the headless combat engine.')
+    parser.add_argument('--fights', type=int, default=DEFAULT_FIGHTS_COUNT,
+                        help='the count of fights played out with each policy')
+    parser.add_argument('--level', type=int, default=DEFAULT_LEVEL,
+                        help='the level of the character and the monster')
+    args = parser.parse_args()
+
+    timings = run_benchmark(args.fights, args.level)
+
+    print(f'{args.fights} fights per policy at level {args.level}:')
+    print(f'{"":>42} {"fights/min":>12} {"won":>8} {"turns":>7}')
+    for policy_name, (fights_per_minute, won_percentage, average_turns) in timings.items():
+        print(f'{policy_name:>42} {fights_per_minute:12.0f} {won_percentage:7.1f}% {average_turns:7.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+This module times the operations on the Damage and Heal types which run on every swing, heal and DoT tick.
+Before timing an operation it checks that it gives the expected result, so that a faster Damage or Heal
+which behaves differently fails here instead of passing as a speedup.
+
+Usage:
+    python -m utils.damage_benchmark [--loops COUNT]
+"""
+import argparse
+import timeit
+
+DEFAULT_LOOPS_COUNT = 200_000
+
+
+def _absorbed(damage: 'Damage', absorption_shield: float) -> ('Damage', float):
+    """ :return: the damage after absorbing the shield, and what is left of the shield """
+    absorption_shield = damage.handle_absorption(absorption_shield)
+    return damage, absorption_shield
+
+
+def _subtracted(damage: 'Damage', other) -> 'Damage':
+    damage -= other
+    return damage
+
+
+def _added(damage: 'Damage', other) -> 'Damage':
+    damage += other
+    return damage
+
+
+def _healed(heal: 'Heal', health: float) -> float:
+    health += heal
+    return health
+
+
+def get_cases() -> [(str, 'function', object)]:
+    """
+    :return: A list of Tuple(1,2,3)
+        1 - the name of the operation
+        2 - a function taking no arguments which runs the operation once and returns its result
+        3 - the result the operation is expected to give
+    """
+    from damage import Damage, FrozenDamage
+    from entities import Monster
+    from heal import Heal
+
+    armored_monster = Monster(monster_id=1, name='Benchmarker', level=3, armor=100)
+    damage = Damage(phys_dmg=5.3, magic_dmg=2.1)
+    frozen_damage = FrozenDamage(magic_dmg=2)
+
+    def absorbed_damage(phys_absorbed, magic_absorbed, phys_dmg=0.0, magic_dmg=0.0):
+        expected_damage = Damage(phys_dmg=phys_dmg, magic_dmg=magic_dmg)
+        expected_damage.phys_absorbed, expected_damage.magic_absorbed = phys_absorbed, magic_absorbed
+        return expected_damage
+
+    return [
+        ('Damage(int, int)', lambda: Damage(phys_dmg=5, magic_dmg=2), Damage(5, 2)),
+        ('Damage(float, float)', lambda: Damage(phys_dmg=5.37, magic_dmg=2.11), Damage(5.4, 2.1)),
+        ('Damage.batch(10 ints)', lambda: Damage.batch(range(10)), [Damage(phys_dmg) for phys_dmg in range(10)]),
+        ('FrozenDamage(int)', lambda: FrozenDamage(magic_dmg=2), Damage(0, 2)),
+        ('health - Damage', lambda: 20 - damage, 12.6),
+        ('Damage - float', lambda: damage - 1.5, 5.9),
+        ('Damage += Damage', lambda: _added(damage, damage), Damage(10.6, 4.2)),
+        ('Damage += tuple', lambda: _added(damage, (1, 1)), Damage(6.3, 3.1)),
+        ('Damage -= tuple', lambda: _subtracted(damage, (1, 3)), Damage(4.3, 0)),
+        ('Damage -= Damage', lambda: _subtracted(damage, Damage(1, 1)), Damage(4.3, 1.1)),
+        ('Damage * float', lambda: damage * 1.1, Damage(5.8, 2.3)),
+        ('FrozenDamage * float', lambda: frozen_damage * 1.5, Damage(0, 3)),
+        ('absorb magic only', lambda: _absorbed(Damage(3, 4), 1), (absorbed_damage(0, 1, 3, 3), 0)),
+        ('absorb magic and phys', lambda: _absorbed(Damage(3, 4), 5), (absorbed_damage(1, 4, 2), 0)),
+        ('absorb everything', lambda: _absorbed(Damage(3, 4), 10), (absorbed_damage(3, 4), 3)),
+        ('absorb FrozenDamage', lambda: armored_monster._apply_damage_absorption(frozen_damage),
+         Damage(0, 2)),  # the monster has no shield, the shared damage comes back untouched
+        ('armor reduction', lambda: armored_monster._apply_armor_reduction(damage, 3), Damage(4.6, 2.1)),
+        ('level difference', lambda: armored_monster._calculate_level_difference_damage(damage, 1),
+         Damage(6.4, 2.5)),
+        ('Heal(float)', lambda: Heal(10.5), Heal(10.5)),
+        ('Heal.batch(10 floats)', lambda: Heal.batch([10.5] * 10), [Heal(10.5)] * 10),
+        ('health += Heal', lambda: _healed(Heal(10.5), 5), 15.5),
+    ]
+
+
+def run_benchmark(loops_count: int) -> {str: float}:
+    """
+    :return: A dictionary Key: the name of the operation, Value: the nanoseconds it takes on average
+    """
+    timings = {}
+    for name, operation, expected_result in get_cases():
+        result = operation()
+        if result != expected_result:
+            raise Exception(f'{name} gave {result}, expected {expected_result}!')
+
+        timings[name] = min(timeit.repeat(operation, number=loops_count, repeat=3)) / loops_count * 1e9
+
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the speed of the Damage and Heal types.')
+    parser.add_argument('--loops', type=int, default=DEFAULT_LOOPS_COUNT,
+                        help='the count of times each operation is run per measurement')
+    args = parser.parse_args()
+
+    timings = run_benchmark(args.loops)
+
+    print(f'{"":>24} {"ns/op":>8}')
+    for name, nanoseconds in timings.items():
+        print(f'{name:>24} {nanoseconds:8.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+This module measures the read latency of the content tables through a default SQLAlchemy engine (how the game
+connected before database/engine.py) and through the game's engines (WAL, PRAGMAs and a read-only connection).
+
+Usage:
+    python -m utils.db_benchmark [--lookups COUNT] [--repeat COUNT]
+
+The benchmark runs on a temporary copy of the game's database, so the real one is never modified.
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+DEFAULT_LOOKUPS_COUNT = 2000
+DEFAULT_REPEAT_COUNT = 5
+BENCHMARK_ZONE, BENCHMARK_SUBZONE = 'Northshire Abbey', 'Northshire Vineyards'
+
+
+def time_item_lookups(db_session, item_ids: [int], repeat: int) -> float:
+    """
+    :return: the best average time (in microseconds) it took to query a single item_template row by its entry
+    """
+    from models.items.item_template import ItemTemplateSchema
+
+    best_time = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item_id in item_ids:
+            db_session.query(ItemTemplateSchema).filter_by(entry=item_id).first()
+        best_time = min(best_time, (time.perf_counter() - start) / len(item_ids))
+        db_session.commit()  # end the read transaction, as the game does between commands
+
+    return best_time * 1_000_000
+
+
+def time_subzone_loads(db_session, character, repeat: int) -> float:
+    """
+    :return: the best time (in milliseconds) it took to load every creature in the benchmark subzone
+    """
+    from models.creatures.loader import load_subzone_creatures
+
+    best_time = float('inf')
+    for _ in range(repeat):
+        db_session.expire_all()  # do not let the identity map answer for the database
+        start = time.perf_counter()
+        load_subzone_creatures(BENCHMARK_ZONE, BENCHMARK_SUBZONE, character, db_session=db_session, to_print=False)
+        best_time = min(best_time, time.perf_counter() - start)
+        db_session.commit()
+
+    return best_time * 1000
+
+
+def run_benchmark(db_path: str, lookups_count: int, repeat: int) -> {str: (float, float)}:
+    """
+    :return: A dictionary Key: the name of the setup, Value: Tuple(1,2)
+        1 - the best average time of an item lookup, in microseconds
+        2 - the best time of a subzone load, in milliseconds
+    """
+    import sqlalchemy
+    from sqlalchemy.orm import sessionmaker
+    import database.main
+    from database.engine import create_game_engine
+
+    database.main.engine = create_game_engine(db_path)
+    import models.main
+    from classes import Paladin
+
+    with redirect_stdout(StringIO()):
+        character = Paladin(name='Benchmarker')
+    item_ids = [item_id % 20 + 1 for item_id in range(lookups_count)]
+
+    sessions = {
+        'default engine': sessionmaker(bind=sqlalchemy.create_engine(f'sqlite:///{db_path}'))(),
+        'game engines': database.main.Session()
+    }
+    timings = {}
+    for setup, db_session in sessions.items():
+        timings[setup] = (time_item_lookups(db_session, item_ids, repeat),
+                          time_subzone_loads(db_session, character, repeat))
+        db_session.close()
+
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the read latency of the content tables.')
+    parser.add_argument('--lookups', type=int, default=DEFAULT_LOOKUPS_COUNT,
+                        help='the count of item_template lookups per repetition')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT_COUNT,
+                        help='how many times each measurement is taken, the best time is reported')
+    args = parser.parse_args()
+
+    from database.database_info import DB_PATH
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        db_path = os.path.join(temp_dir, os.path.basename(DB_PATH))
+        shutil.copyfile(DB_PATH, db_path)
+        timings = run_benchmark(db_path, args.lookups, args.repeat)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    print(f'Read latency (best of {args.repeat}):')
+    print(f'{"":>16} {"item lookup":>14} {"subzone load":>14}')
+    for setup, (lookup_us, subzone_ms) in timings.items():
+        print(f'{setup:>16} {lookup_us:11.1f} us {subzone_ms:11.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+"""
+This module holds the EntityIndex - the living things of a subzone (its monsters or its NPCs) by their GUID,
+indexed by their name and by their level as well, so that a command like 'engage Kobold Worker' or the listing of
+the lowest level monsters does not scan (or sort) the subzone.
+Deleting a dead monster from the index (or adding a respawned one) updates the name and level indexes along with it.
+
+Usage:
+    alive_monsters = EntityIndex({guid: monster, ...})
+    guid = alive_monsters.get_guid_by_name('kobold worker')  # the lowest level alive Kobold Worker
+    alive_monsters.find_names('kob')  # ['Kobold Worker', 'Kobold Laborer']
+    alive_monsters.get_lowest_level(5)  # [(guid, monster), ...] of the five lowest level monsters
+    alive_monsters.by_level(min_level=3, max_level=5)  # (guid, monster) pairs, by level then GUID
+    del alive_monsters[guid]
+"""
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+from collections.abc import MutableMapping, Set
+
+
+def normalize_name(name: str) -> str:
+    """ :return: the name the way it is looked up by - case insensitive and with its whitespace collapsed """
+    return ' '.join(name.split()).casefold()
+
+
+class GuidNameView(Set):
+    """ A live, read-only set of the (GUID, name) tuples of the entities in an EntityIndex """
+    def __init__(self, entity_index: 'EntityIndex'):
+        self._entity_index = entity_index
+
+    def __contains__(self, guid_name: (int, str)) -> bool:
+        guid, name = guid_name
+        return guid in self._entity_index and self._entity_index[guid].name == name
+
+    def __iter__(self):
+        return ((guid, entity.name) for guid, entity in self._entity_index.items())
+
+    def __len__(self):
+        return len(self._entity_index)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({set(self)!r})'
+
+
+class EntityIndex(MutableMapping):
+    """
+    A dictionary of Key: GUID, Value: a LivingThing, which can also be looked up by the (normalized) names
+    of the entities. When several entities share a name, the lookup returns the one with the lowest level,
+    and the lowest GUID out of those.
+    The entities can also be iterated in order of their level (then GUID), without sorting them each time.
+    """
+    def __init__(self, entities: {int: 'LivingThing'}=None):
+        self._entities: {int: 'LivingThing'} = {}
+        # Key: normalized name, Value: a dictionary of Key: GUID, Value: the level it was indexed with
+        self._guids_by_name: {str: {int: int}} = {}
+        # Key: normalized name, Value: a heap of (level, GUID), which may hold entries of removed entities.
+        # These are dropped once they reach the top of the heap
+        self._name_heaps: {str: [(int, int)]} = {}
+        self._display_names: {str: str} = {}  # Key: normalized name, Value: the name as the entities have it
+        self._sorted_names: [str] = []  # the normalized names, sorted for the prefix search
+        self._levels: [int] = []  # the levels of the entities, sorted and without duplicates
+        self._guids_by_level: {int: [int]} = {}  # Key: level, Value: the sorted GUIDs of the entities with the level
+        self.guid_names = GuidNameView(self)
+        if entities:
+            self.update(entities)
+
+    def __getitem__(self, guid: int) -> 'LivingThing':
+        return self._entities[guid]
+
+    def __setitem__(self, guid: int, entity: 'LivingThing'):
+        if guid in self._entities:
+            self._unindex(guid)
+        self._entities[guid] = entity
+
+        name = normalize_name(entity.name)
+        name_guids = self._guids_by_name.get(name)
+        if name_guids is None:
+            name_guids = self._guids_by_name[name] = {}
+            self._name_heaps[name] = []
+            self._display_names[name] = entity.name
+            self._sorted_names.insert(bisect_left(self._sorted_names, name), name)
+        name_guids[guid] = entity.level
+        heapq.heappush(self._name_heaps[name], (entity.level, guid))
+
+        level_guids = self._guids_by_level.get(entity.level)
+        if level_guids is None:
+            level_guids = self._guids_by_level[entity.level] = []
+            insort(self._levels, entity.level)
+        insort(level_guids, guid)
+
+    def __delitem__(self, guid: int):
+        self._unindex(guid)
+        del self._entities[guid]
+
+    def _unindex(self, guid: int):
+        name = normalize_name(self._entities[guid].name)
+        name_guids = self._guids_by_name[name]
+        level = name_guids.pop(guid)  # the level the entity was indexed with
+        if not name_guids:
+            del self._guids_by_name[name]
+            del self._name_heaps[name]
+            del self._display_names[name]
+            del self._sorted_names[bisect_left(self._sorted_names, name)]
+        elif len(self._name_heaps[name]) > 2 * len(name_guids) + 8:
+            # too many removed entities are left in the heap, rebuild it out of the indexed ones
+            self._name_heaps[name] = [(level, guid) for guid, level in name_guids.items()]
+            heapq.heapify(self._name_heaps[name])
+
+        level_guids = self._guids_by_level[level]
+        del level_guids[bisect_left(level_guids, guid)]
+        if not level_guids:
+            del self._guids_by_level[level]
+            del self._levels[bisect_left(self._levels, level)]
+
+    def __iter__(self):
+        return iter(self._entities)
+
+    def __len__(self):
+        return len(self._entities)
+
+    def __contains__(self, guid) -> bool:
+        return guid in self._entities
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._entities!r})'
+
+    def _get_guid_by_normalized_name(self, name: str) -> int or None:
+        name_guids = self._guids_by_name.get(name)
+        if name_guids is None:
+            return None
+
+        name_heap = self._name_heaps[name]
+        while name_guids.get(name_heap[0][1]) != name_heap[0][0]:
+            heapq.heappop(name_heap)  # the entity has been removed since
+        return name_heap[0][1]
+
+    def get_guid_by_name(self, name: str, allow_prefix: bool=True) -> int or None:
+        """
+        :param name: the name of the entity, matched case insensitively
+        :param allow_prefix: A boolean indicating if the name can be the start of an entity's name, as long as
+                             it is the start of a single name in the index
+        :return: the GUID of the lowest level entity with the name, None if there is no such one
+        """
+        name = normalize_name(name)
+        guid = self._get_guid_by_normalized_name(name)
+        if guid is None and allow_prefix and name:
+            matching_names = self._find_normalized_names(name)
+            if len(matching_names) == 1:
+                guid = self._get_guid_by_normalized_name(matching_names[0])
+
+        return guid
+
+    def get_by_name(self, name: str, allow_prefix: bool=True) -> 'LivingThing' or None:
+        """ :return: the lowest level entity with the name, see get_guid_by_name """
+        guid = self.get_guid_by_name(name, allow_prefix)
+        return None if guid is None else self._entities[guid]
+
+    def find_names(self, prefix: str) -> [str]:
+        """ :return: the names of the entities, sorted, which start with the given prefix (case insensitive) """
+        return [self._display_names[name] for name in self._find_normalized_names(normalize_name(prefix))]
+
+    def _find_normalized_names(self, prefix: str) -> [str]:
+        matching_names = []
+        for name in self._sorted_names[bisect_left(self._sorted_names, prefix):]:
+            if not name.startswith(prefix):
+                break
+            matching_names.append(name)
+
+        return matching_names
+
+    def by_level(self, min_level: int=None, max_level: int=None):
+        """
+        Iterate through the entities in order of their level, and of their GUID out of those with the same level.
+        The index must not be modified while iterating it
+        :param min_level: the lowest level of the entities to iterate through, None for no limit
+        :param max_level: the highest level of the entities to iterate through, None for no limit
+        :return: a generator of (GUID, entity) tuples
+        """
+        start = 0 if min_level is None else bisect_left(self._levels, min_level)
+        end = len(self._levels) if max_level is None else bisect_right(self._levels, max_level)
+        for level in self._levels[start:end]:
+            for guid in self._guids_by_level[level]:
+                yield guid, self._entities[guid]
+
+    def get_lowest_level(self, count: int, min_level: int=None) -> [(int, 'LivingThing')]:
+        """ :return: the (GUID, entity) tuples of the count entities with the lowest level, see by_level """
+        return list(islice(self.by_level(min_level=min_level), count))
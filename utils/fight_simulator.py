@@ -0,0 +1,108 @@
+"""
+This module simulates a large amount of fights between a Paladin and a creature from creature_template
+with the batch combat engine (simulation/batch_engine.py) and prints the win and death rates,
+the time-to-kill histogram and the mana curve of the fights.
+
+Usage:
+    python -m utils.fight_simulator CREATURE_ENTRY [--level LEVEL] [--policy attack|sor|heal] [--fights COUNT]
+                                                   [--seed SEED] [--cross-check COUNT]
+
+--cross-check plays out COUNT fights with the scalar engine (simulation/combat_engine.py) as well,
+so that the two engines can be compared.
+"""
+import argparse
+from contextlib import redirect_stdout
+from io import StringIO
+
+DEFAULT_FIGHTS_COUNT = 1_000_000
+DEFAULT_POLICY = 'sor'
+HISTOGRAM_BAR_WIDTH = 50  # the count of characters in the longest bar of the time-to-kill histogram
+
+
+def load_opponents(creature_entry: int, level: int=None) -> tuple:
+    """
+    :param level: the level of the Paladin, the creature's level by default
+    :return: A tuple (1,2)
+        1 - the Paladin
+        2 - the CreatureTemplate of the creature
+    """
+    import models.main
+    from classes import Paladin
+    from database.main import session
+    from models.creatures.creature_template import CreatureTemplateSchema
+
+    creature_template_schema = session.query(CreatureTemplateSchema).get(creature_entry)
+    if creature_template_schema is None:
+        raise Exception(f'There is no creature with entry {creature_entry} in creature_template!')
+    creature_template = creature_template_schema.convert_to_creature_template()
+
+    with redirect_stdout(StringIO()):  # silence the learned spells
+        character = Paladin(name='Simulator', level=level or creature_template.level)
+
+    return character, creature_template
+
+
+def print_result(result: 'BatchResult'):
+    print(f'Won: {result.win_rate:.2%} | Died: {result.death_rate:.2%} '
+          f'| Took too long: {1 - result.win_rate - result.death_rate:.2%}')
+    for command, cast_count in result.casts.items():
+        print(f'{command} casts per fight: {cast_count / result.fight_count:.2f}')
+
+    histogram = result.time_to_kill_histogram()
+    if histogram.any():
+        average_time_to_kill = (histogram * range(len(histogram))).sum() / histogram.sum()
+        print(f'Time to kill (average {average_time_to_kill:.2f} turns):')
+        for turns, fights_count in enumerate(histogram):
+            if fights_count:
+                bar = '#' * max(1, round(fights_count / histogram.max() * HISTOGRAM_BAR_WIDTH))
+                print(f'{turns:>5} {fights_count / histogram.sum():7.2%} {bar}')
+
+    print('Average mana at the end of each turn:')
+    print(' '.join(f'{mana:.1f}' for mana in result.mana_curve))
+
+
+def print_cross_check(result: 'BatchResult', fight_results: ['FightResult']):
+    """ Compare the batch result against the fights played out with the scalar engine """
+    won_count = sum(1 for fight_result in fight_results if fight_result.character_won)
+    died_count = sum(1 for fight_result in fight_results if fight_result.character_won is False)
+    average_turns = sum(fight_result.turns for fight_result in fight_results) / len(fight_results)
+
+    print(f'{"":>8} {"won":>8} {"died":>8} {"turns":>7}')
+    print(f'{"batch":>8} {result.win_rate:8.2%} {result.death_rate:8.2%} {result.turns.mean():7.2f}')
+    print(f'{"scalar":>8} {won_count / len(fight_results):8.2%} {died_count / len(fight_results):8.2%} '
+          f'{average_turns:7.2f}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulate fights between a Paladin and a creature.')
+    parser.add_argument('creature_entry', type=int, help='the entry of the creature in creature_template')
+    parser.add_argument('--level', type=int, help="the level of the Paladin, the creature's level by default")
+    parser.add_argument('--policy', default=DEFAULT_POLICY, help='how the Paladin fights: attack, sor or heal')
+    parser.add_argument('--fights', type=int, default=DEFAULT_FIGHTS_COUNT, help='the count of fights to simulate')
+    parser.add_argument('--seed', type=int, help='the seed of the random generator')
+    parser.add_argument('--cross-check', type=int, default=0,
+                        help='the count of fights to also play out with the scalar combat engine')
+    args = parser.parse_args()
+
+    import numpy
+    from simulation.batch_engine import simulate_fights
+    from simulation.combat_engine import run_fights
+    from simulation.policies import POLICIES
+
+    if args.policy not in POLICIES:
+        raise Exception(f'{args.policy} is not a valid policy! Choose from {", ".join(POLICIES)}')
+    character, creature_template = load_opponents(args.creature_entry, args.level)
+
+    print(f'Level {character.level} Paladin against Level {creature_template.level} {creature_template.name}, '
+          f'{args.fights} fights ({args.policy}):')
+    result = simulate_fights(character, creature_template.spawn(), POLICIES[args.policy](), args.fights,
+                             random_generator=numpy.random.default_rng(args.seed))
+    print_result(result)
+
+    if args.cross_check:
+        fight_results = run_fights(character, creature_template.spawn, POLICIES[args.policy](), args.cross_check)
+        print_cross_check(result, fight_results)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,7 @@
 This module holds helper functions.
 i.e functions that do not serve any specific purpose but are needed in multiple places
 """
+from collections.abc import Mapping
 from copy import deepcopy
 
 
@@ -62,16 +63,36 @@ def create_character_attributes_template() -> dict:
     return deepcopy(CHAR_ATTRIBUTES_TEMPLATE)
 
 
-def get_guid_by_name(name: str, guid_names: {(int, str)}):
+class LazyMapping(Mapping):
     """
-    A function that returns a GUID which is associated with the given name,
-    if there is no such one, return None
-    :param guid_names: A set of tuples, holding the GUID and NAME
-    :param name: The name of the creature you want to get a GUID of
-    :return: the GUID you're searching for
+    A read-only dictionary whose contents are produced by the given loader function on first access.
+    Used for constant tables which would otherwise have to be read from the DB at import time.
+        ex: CREATURE_DEFAULT_VALUES = LazyMapping(load_creature_defaults)
+            ... nothing is loaded until CREATURE_DEFAULT_VALUES[1] is accessed
     """
-    for guid, potential_name in guid_names:
-        if potential_name == name:
-            return guid
+    def __init__(self, loader: callable):
+        self._loader = loader
+        self._data = None
 
-    return None
+    @property
+    def is_loaded(self) -> bool:
+        return self._data is not None
+
+    def _materialize(self) -> dict:
+        if self._data is None:
+            self._data = self._loader()
+        return self._data
+
+    def __getitem__(self, key):
+        return self._materialize()[key]
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __len__(self):
+        return len(self._materialize())
+
+    def __repr__(self):
+        if not self.is_loaded:
+            return f'{self.__class__.__name__}(<not loaded: {self._loader.__name__}>)'
+        return f'{self.__class__.__name__}({self._data!r})'
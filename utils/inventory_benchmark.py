@@ -0,0 +1,131 @@
+"""
+This module times the inventory operations of a character carrying a large inventory (ex: 10000 different items),
+comparing the Inventory in inventory.py against the dictionary with a 'gold' key the character used to carry.
+Before timing an operation it checks that both inventories give the same result.
+
+Usage:
+    python -m utils.inventory_benchmark [--items COUNT] [--loops COUNT]
+"""
+import argparse
+import json
+import timeit
+
+DEFAULT_ITEMS_COUNT = 10000
+DEFAULT_LOOPS_COUNT = 20
+
+
+def create_inventories(items_count: int) -> ('TrackedDict', 'Inventory'):
+    """ :return: the same inventory of items_count different items and 100 gold, in both forms """
+    from inventory import Inventory
+    from items import Item
+    from utils.tracked_collections import TrackedDict
+
+    saved_inventory = {f'Item {item_id}': (Item(f'Item {item_id}', item_id, buy_price=1, sell_price=1),
+                                           item_id % 7 + 1)
+                       for item_id in range(1, items_count + 1)}
+    saved_inventory['gold'] = 100
+
+    return TrackedDict(saved_inventory), Inventory(saved_inventory)
+
+
+def _get_by_id(inventory: dict, item_id: int) -> tuple:
+    """ The dictionary is keyed by the item names, so finding an item by its ID scans it """
+    return next((value for key, value in inventory.items() if key != 'gold' and value[0].id == item_id), None)
+
+
+def _list_items(inventory: dict) -> list:
+    return [item_and_count for item_name, item_and_count in inventory.items() if item_name != 'gold']
+
+
+def _loot(inventory: dict, item: 'Item', loot_count: int=1):
+    """ The way Character.add_item_to_inventory added an item to the dictionary """
+    count = inventory[item.name][1] + loot_count if item.name in inventory else loot_count
+    inventory[item.name] = (item, count)
+
+
+def _loot_and_use(inventory, item: 'Item', loot_count: int) -> int:
+    """ Loot a stack of an item and use all of it one by one, like a character drinking potions """
+    _loot(inventory, item, loot_count)
+    for _ in range(loot_count):
+        item, count = inventory[item.name]
+        if count == 1:
+            del inventory[item.name]
+        else:
+            inventory[item.name] = (item, count - 1)
+    return count - 1
+
+
+def _loot_and_use_inventory(inventory: 'Inventory', item: 'Item', loot_count: int) -> int:
+    inventory.add(item, loot_count)
+    for _ in range(loot_count):
+        count = inventory.remove(item.name)
+    return count
+
+
+def _dumps(inventory: dict) -> bytes:
+    """ The most compact form of the dictionary, without pickling the Item objects """
+    return json.dumps([inventory['gold'], [(item.id, count) for item, count in _list_items(inventory)]]).encode()
+
+
+def get_cases(items_count: int) -> [(str, 'function', 'function')]:
+    """
+    :return: A list of Tuple(1,2,3)
+        1 - the name of the operation
+        2 - a function taking no arguments which runs the operation on the dictionary and returns its result
+        3 - a function taking no arguments which runs the operation on the Inventory and returns its result
+    """
+    tracked_dict, inventory = create_inventories(items_count)
+    for item_id in range(1, items_count + 1, 10):  # loot more of every tenth item, for the saver to write
+        item = inventory.get_by_id(item_id)[0]
+        _loot(tracked_dict, item)
+        inventory.add(item)
+    last_id = items_count
+    potion = inventory.get_by_id(last_id)[0]
+
+    return [
+        ('get by ID', lambda: _get_by_id(tracked_dict, last_id), lambda: inventory.get_by_id(last_id)),
+        ('list items', lambda: _list_items(tracked_dict), lambda: list(inventory.values())),
+        ('loot and use 20', lambda: _loot_and_use(tracked_dict, potion, 20),
+         lambda: _loot_and_use_inventory(inventory, potion, 20)),
+        ('save changes', lambda: {name: change for name, change in tracked_dict.get_changes().items()
+                                  if name != 'gold'},
+         inventory.get_changes),
+        ('serialize', lambda: len(_dumps(tracked_dict)), lambda: len(inventory.to_bytes())),
+    ]
+
+
+def run_benchmark(items_count: int, loops: int) -> {str: (float, float)}:
+    """
+    :return: A dictionary Key: the name of the operation,
+        Value: the best time in microseconds it took to run it once on the dictionary and on the Inventory
+    """
+    timings = {}
+    for case, run_on_dict, run_on_inventory in get_cases(items_count):
+        dict_result, inventory_result = run_on_dict(), run_on_inventory()
+        if case != 'serialize' and dict_result != inventory_result:
+            raise Exception(f'{case} gives {inventory_result} on the Inventory instead of {dict_result}!')
+
+        timings[case] = tuple(min(timeit.repeat(run, number=loops, repeat=5)) / loops * 1_000_000
+                              for run in (run_on_dict, run_on_inventory))
+
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time the operations on a large inventory.')
+    parser.add_argument('--items', type=int, default=DEFAULT_ITEMS_COUNT,
+                        help='the count of different items in the inventory')
+    parser.add_argument('--loops', type=int, default=DEFAULT_LOOPS_COUNT,
+                        help='how many times each operation is run per timing, the best of 5 timings is reported')
+    args = parser.parse_args()
+
+    tracked_dict, inventory = create_inventories(args.items)
+    print(f'An inventory of {args.items} items, in microseconds per operation:')
+    print(f'{"operation":>16} {"dict":>12} {"Inventory":>12}')
+    for case, (dict_time, inventory_time) in run_benchmark(args.items, args.loops).items():
+        print(f'{case:>16} {dict_time:12.2f} {inventory_time:12.2f}')
+    print(f'{"saved size":>16} {len(_dumps(tracked_dict)):10} B {len(inventory.to_bytes()):10} B')
+
+
+if __name__ == '__main__':
+    main()
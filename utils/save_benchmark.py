@@ -0,0 +1,107 @@
+"""
+This module measures how long saving a character takes with a large amount of progress
+(ex: tens of thousands of killed monsters), comparing a full save against an incremental one.
+
+Usage:
+    python -m utils.save_benchmark [--killed-monsters COUNT] [--repeat COUNT]
+
+The benchmark runs on a temporary copy of the game's database, so the real one is never modified.
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+DEFAULT_KILLED_MONSTERS_COUNT = 10000
+DEFAULT_REPEAT_COUNT = 5
+BENCHMARK_CHARACTER_NAME = 'Benchmarker'
+
+
+def use_database(db_path: str):
+    """ Point the game's engine and session to the given database. Must be called before the models are imported """
+    import database.main
+    from database.engine import create_game_engine
+
+    database.main.engine = create_game_engine(db_path)
+    database.main.session = database.main.Session()  # routes its queries through the new engine
+
+
+def time_save(character, repeat: int) -> float:
+    """
+    :return: the best time (in milliseconds) it took to save the character, out of `repeat` saves
+    """
+    from models.characters.saver import save_character
+
+    best_time = float('inf')
+    for _ in range(repeat):
+        with redirect_stdout(StringIO()):  # silence the save messages
+            start = time.perf_counter()
+            save_character(character)
+            best_time = min(best_time, time.perf_counter() - start)
+
+    return best_time * 1000
+
+
+def run_benchmark(killed_monsters_count: int, repeat: int) -> {str: float}:
+    """
+    Save a character with killed_monsters_count killed monsters in three ways:
+        full - the character is not in sync with the DB, so every sub-table is rewritten
+        one kill - the character was saved and killed one more monster since
+        no changes - the character was saved and nothing has changed since
+    :return: A dictionary Key: the name of the case, Value: the best time in milliseconds
+    """
+    from classes import Paladin
+
+    with redirect_stdout(StringIO()):
+        character = Paladin(name=BENCHMARK_CHARACTER_NAME,
+                            killed_monsters=set(range(1, killed_monsters_count + 1)))
+
+    timings = {}
+    full_save_time = float('inf')
+    for _ in range(repeat):
+        character.saved_character_entry = None  # forget the save, forcing a full rewrite
+        full_save_time = min(full_save_time, time_save(character, repeat=1))
+    timings['full'] = full_save_time
+
+    one_kill_time = float('inf')
+    for _ in range(repeat):
+        character.killed_monsters.add(len(character.killed_monsters) + 1)
+        one_kill_time = min(one_kill_time, time_save(character, repeat=1))
+    timings['one kill'] = one_kill_time
+
+    timings['no changes'] = time_save(character, repeat=repeat)
+
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure how long saving a character takes.')
+    parser.add_argument('--killed-monsters', type=int, default=DEFAULT_KILLED_MONSTERS_COUNT,
+                        help='the count of monsters the character has killed')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT_COUNT,
+                        help='how many times each save is timed, the best time is reported')
+    args = parser.parse_args()
+
+    from database.database_info import DB_PATH
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        db_path = os.path.join(temp_dir, os.path.basename(DB_PATH))
+        shutil.copyfile(DB_PATH, db_path)
+        use_database(db_path)
+        import models.main
+
+        timings = run_benchmark(args.killed_monsters, args.repeat)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    print(f'Saving a character with {args.killed_monsters} killed monsters (best of {args.repeat}):')
+    for case, milliseconds in timings.items():
+        print(f'{case:>12}: {milliseconds:10.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+This module measures how long spawning a creature from its CreatureTemplate takes and how much memory every spawn
+holds, for each creature type. A zone spawns the same creature many times (ex: 40 wolves), so both add up.
+
+Usage:
+    python -m utils.spawn_benchmark [--spawns COUNT]
+"""
+import argparse
+import time
+import tracemalloc
+
+DEFAULT_SPAWNS_COUNT = 20000
+
+
+def create_creature_templates() -> {str: 'CreatureTemplate'}:
+    """ :return: A dictionary Key: the creature type, Value: a CreatureTemplate of that type """
+    from models.creatures.creature_template import CreatureTemplate
+    from items import Item
+    from loot import LootTable
+
+    loot_table = LootTable(entry=1, item_templates=[], chances=[])  # shared by every spawn, its content does not matter
+    vendor_inventory = {f'Item {item_id}': (Item(name=f'Item {item_id}', item_id=item_id, buy_price=1, sell_price=1), 5)
+                        for item_id in range(1, 11)}
+    static_fields = dict(level=3, health=45, mana=0, armor=150, min_damage=1, max_damage=4, quest_relation_id=0,
+                         loot_table=loot_table, gossip='Grr!', respawnable=True)
+
+    return {'monster': CreatureTemplate(entry=1, name='Timber Wolf', creature_type='monster', xp_to_give=50,
+                                        gold_to_give_range=(2, 5), vendor_inventory={}, **static_fields),
+            'fnpc': CreatureTemplate(entry=2, name='Lumberjack Joe', creature_type='fnpc', xp_to_give=0,
+                                     gold_to_give_range=(0, 0), vendor_inventory={}, **static_fields),
+            'vendor': CreatureTemplate(entry=3, name='Meatseller Jack', creature_type='vendor', xp_to_give=0,
+                                       gold_to_give_range=(0, 0), vendor_inventory=vendor_inventory, **static_fields)}
+
+
+def run_benchmark(spawns_count: int) -> {str: (float, float)}:
+    """
+    :return: A dictionary Key: the creature type, Value: Tuple(1,2)
+        1 - the count of spawns per second
+        2 - the count of bytes a spawn holds
+    """
+    results = {}
+    for creature_type, creature_template in create_creature_templates().items():
+        start = time.perf_counter()
+        for _ in range(spawns_count):
+            creature_template.spawn()
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        spawns = [creature_template.spawn() for _ in range(spawns_count)]
+        allocated_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del spawns
+
+        results[creature_type] = (spawns_count / elapsed, allocated_bytes / spawns_count)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the time and memory spawning a creature takes.')
+    parser.add_argument('--spawns', type=int, default=DEFAULT_SPAWNS_COUNT,
+                        help='the count of spawns of each creature type')
+    args = parser.parse_args()
+
+    results = run_benchmark(args.spawns)
+
+    print(f'{args.spawns} spawns per creature type:')
+    print(f'{"":>8} {"spawns/s":>10} {"bytes/spawn":>12}')
+    for creature_type, (spawns_per_second, bytes_per_spawn) in results.items():
+        print(f'{creature_type:>8} {spawns_per_second:10.0f} {bytes_per_spawn:12.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+This module reports how long it takes to cold import the game (or any other module of it),
+using the output of python's -X importtime option.
+
+Usage:
+    python -m utils.startup_report [module] [--budget MILLISECONDS] [--top COUNT]
+    ex: python -m utils.startup_report main --budget 500
+
+It prints the slowest imports and exits with a status code of 1 if the total import time is over the budget,
+so that it can be used as a check that startup does not regress.
+"""
+import argparse
+import subprocess
+import sys
+from typing import NamedTuple
+
+STARTUP_IMPORT_BUDGET_MS = 500
+IMPORT_TIME_LINE_PREFIX = 'import time:'
+
+
+class ImportTime(NamedTuple):
+    """
+    A single line of the -X importtime output
+        module - the name of the imported module
+        self_us - the microseconds spent importing the module itself
+        cumulative_us - the microseconds spent importing the module and everything it imports
+        depth - how deeply nested the import is, 0 meaning it is imported directly
+    """
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_import_times(output: str) -> [ImportTime]:
+    """
+    Parse the output of -X importtime, which is in the following format:
+        import time: self [us] | cumulative | imported package
+        import time:       102 |        102 |   _io
+        import time:      1301 |       1403 | main
+    The header and any line that is not from -X importtime are skipped.
+    """
+    import_times = []
+    for line in output.splitlines():
+        if not line.startswith(IMPORT_TIME_LINE_PREFIX):
+            continue
+
+        self_us, cumulative_us, module = line[len(IMPORT_TIME_LINE_PREFIX):].split('|')
+        try:
+            self_us, cumulative_us = int(self_us), int(cumulative_us)
+        except ValueError:
+            continue  # the header line
+
+        module_name = module.strip()
+        depth = (len(module.rstrip()) - len(module_name) - 1) // 2
+        import_times.append(ImportTime(module=module_name, self_us=self_us, cumulative_us=cumulative_us,
+                                       depth=depth))
+
+    return import_times
+
+
+def measure_import_times(module: str) -> [ImportTime]:
+    """ Import the given module in a fresh interpreter and return the time every import took """
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    if process.returncode != 0:
+        raise Exception(f'Importing {module} failed!\n{process.stderr}')
+
+    return parse_import_times(process.stderr)
+
+
+def get_total_import_time_us(import_times: [ImportTime], module: str) -> int:
+    """ Return the cumulative time it took to import the given top-level module """
+    for import_time in import_times:
+        if import_time.module == module and import_time.depth == 0:
+            return import_time.cumulative_us
+
+    raise Exception(f'{module} was not imported!')
+
+
+def print_report(import_times: [ImportTime], module: str, budget_ms: int, top_count: int) -> bool:
+    """
+    Print the total import time of the module and the slowest imports by their own (self) time
+    :return: a boolean indicating if the total import time is within the budget
+    """
+    total_ms = get_total_import_time_us(import_times, module) / 1000
+    is_within_budget = total_ms <= budget_ms
+
+    print(f'Importing {module} took {total_ms:.1f}ms (budget: {budget_ms}ms)')
+    print(f'Top {top_count} slowest imports (self time):')
+    for import_time in sorted(import_times, key=lambda imp_time: imp_time.self_us, reverse=True)[:top_count]:
+        print(f'    {import_time.self_us / 1000:8.1f}ms  {import_time.cumulative_us / 1000:8.1f}ms cumulative  '
+              f'{import_time.module}')
+
+    if not is_within_budget:
+        print(f'Importing {module} is {total_ms - budget_ms:.1f}ms over the budget!')
+
+    return is_within_budget
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report the cold import time of the game')
+    parser.add_argument('module', nargs='?', default='main', help='the module to import')
+    parser.add_argument('--budget', type=int, default=STARTUP_IMPORT_BUDGET_MS,
+                        help='the maximum allowed import time in milliseconds')
+    parser.add_argument('--top', type=int, default=15, help='the count of slowest imports to show')
+    args = parser.parse_args()
+
+    import_times = measure_import_times(args.module)
+    is_within_budget = print_report(import_times, args.module, args.budget, args.top)
+    sys.exit(0 if is_within_budget else 1)
+
+
+if __name__ == '__main__':
+    main()
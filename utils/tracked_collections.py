@@ -0,0 +1,183 @@
+"""
+This module holds collections which remember what has changed in them since they were last marked as clean.
+They are used for the character's progress, so that saving it writes only what has changed since the last save.
+"""
+_MISSING = object()  # marks a key which was not in a TrackedDict when it was marked as clean
+
+
+class TrackedSet(set):
+    """
+    A set which tracks the elements added to and removed from it since the last call of mark_clean()
+        added - the elements that are in the set now, but were not when it was marked as clean
+        removed - the elements that were in the set when it was marked as clean, but are not now
+    """
+    def __init__(self, iterable=()):
+        super().__init__(iterable)
+        self.added = set()
+        self.removed = set()
+
+    @property
+    def is_dirty(self) -> bool:
+        return bool(self.added or self.removed)
+
+    def mark_clean(self):
+        self.added = set()
+        self.removed = set()
+
+    def _track_add(self, element):
+        if element in self:
+            return
+        if element in self.removed:
+            self.removed.discard(element)
+        else:
+            self.added.add(element)
+
+    def _track_remove(self, element):
+        if element not in self:
+            return
+        if element in self.added:
+            self.added.discard(element)
+        else:
+            self.removed.add(element)
+
+    def add(self, element):
+        self._track_add(element)
+        super().add(element)
+
+    def discard(self, element):
+        self._track_remove(element)
+        super().discard(element)
+
+    def remove(self, element):
+        if element not in self:
+            raise KeyError(element)
+        self.discard(element)
+
+    def pop(self):
+        element = super().pop()
+        super().add(element)  # put it back for a moment, so that the removal gets tracked
+        self.discard(element)
+        return element
+
+    def clear(self):
+        for element in list(self):
+            self.discard(element)
+
+    def update(self, *iterables):
+        for iterable in iterables:
+            for element in iterable:
+                self.add(element)
+
+    def difference_update(self, *iterables):
+        for iterable in iterables:
+            for element in iterable:
+                self.discard(element)
+
+    def intersection_update(self, *iterables):
+        elements_to_keep = set(self).intersection(*iterables)
+        self.difference_update(set(self) - elements_to_keep)
+
+    def symmetric_difference_update(self, iterable):
+        for element in set(iterable):
+            if element in self:
+                self.discard(element)
+            else:
+                self.add(element)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __isub__(self, other):
+        self.difference_update(other)
+        return self
+
+    def __iand__(self, other):
+        self.intersection_update(other)
+        return self
+
+    def __ixor__(self, other):
+        self.symmetric_difference_update(other)
+        return self
+
+
+class TrackedDict(dict):
+    """
+    A dictionary which tracks the keys that were set or deleted since the last call of mark_clean().
+    For every changed key it remembers the value the key had when the dictionary was marked as clean,
+    so that the change can be described as (old value, new value).
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._original_values = {}  # Key: changed key, Value: its value when marked clean (or _MISSING)
+
+    def __reduce__(self):
+        # pickle would otherwise restore the items through __setitem__, before _original_values exists
+        return type(self), (dict(self),), self.__dict__
+
+    @property
+    def is_dirty(self) -> bool:
+        return bool(self.get_changes())
+
+    def mark_clean(self):
+        self._original_values = {}
+
+    def is_changed(self, key) -> bool:
+        return key in self.get_changes()
+
+    def get_changes(self) -> dict:
+        """
+        :return: A dictionary Key: a changed key, Value: Tuple(1,2)
+            1 - the value the key had when the dictionary was marked as clean, None if the key was missing
+            2 - the current value of the key, None if it was deleted
+        Keys which were changed back to their original value are skipped.
+        """
+        changes = {}
+        for key, original_value in self._original_values.items():
+            current_value = super().get(key, _MISSING)
+            if current_value is original_value:
+                continue
+            if original_value is not _MISSING and current_value is not _MISSING and current_value == original_value:
+                continue
+            changes[key] = (None if original_value is _MISSING else original_value,
+                            None if current_value is _MISSING else current_value)
+
+        return changes
+
+    def _track(self, key):
+        if key not in self._original_values:
+            self._original_values[key] = super().get(key, _MISSING)
+
+    def __setitem__(self, key, value):
+        self._track(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._track(key)
+        super().__delitem__(key)
+
+    def pop(self, key, *default):
+        if key in self:
+            self._track(key)
+        return super().pop(key, *default)
+
+    def popitem(self):
+        key, value = super().popitem()
+        super().__setitem__(key, value)  # put it back for a moment, so that the removal gets tracked
+        del self[key]
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        for key in list(self):
+            del self[key]
@@ -6,6 +6,8 @@ to have dead creatures stay dead, not be reloaded
 the cs in cs_alive_monsters and similar names stands for Current Subzone
 """
 from zones.zone import Zone, SubZone
+from zones.prefetcher import SubZonePrefetcher
+from database.main import session
 from constants import ZONE_MOVE_BLOCK_SPECIAL_KEY, GARRICK_PADFOOT_GUID
 from scripts.zones.northshire_abbey.a_peculiar_hut.haskel_paxton_conversation import (
     SCRIPT_NAME as A_PECULIAR_HUT_ENTRY_SCRIPT_NAME, script as A_PECULIAR_HUT_ENTRY_SCRIPT)
@@ -25,15 +27,19 @@ class NorthshireAbbey(Zone):
 
     def __init__(self, character):
         super().__init__()
-        subzone_object = NorthshireValley(name="Northshire Valley", parent_zone_name=self.zone_name,
-                                          zone_map=self.zone_map["Northshire Valley"],
-                                          character=character)
+        self.subzone_classes = {"Northshire Valley": NorthshireValley,
+                                "Northshire Vineyards": NorthshireVineyards,
+                                "A Peculiar Hut": PeculiarHut}
+        subzone_object = self.create_subzone("Northshire Valley", character)
         self.cs_alive_monsters, self.cs_monsters_guid_name_set = subzone_object.get_monsters()
         self.cs_alive_npcs, self.cs_npcs_guid_name_set = subzone_object.get_npcs()
         self.cs_available_quests = subzone_object.get_quests()
         self.cs_map = subzone_object.get_map_directions()
         self.curr_subzone = "Northshire Valley"
         self.loaded_zones["Northshire Valley"] = subzone_object
+        # start loading the subzones we can go to in the background
+        self.prefetcher = SubZonePrefetcher(self, character)
+        self.prefetcher.prefetch_neighbours(self.curr_subzone)
 
     def move_player(self, current_subzone: str, destination: str, character):
         """
@@ -62,6 +68,7 @@ class NorthshireAbbey(Zone):
 
                 # We move, therefore update our attributes
                 self._update_attributes(destination)
+                self.prefetcher.prefetch_neighbours(destination)
                 return True
 
         else:
@@ -69,24 +76,6 @@ class NorthshireAbbey(Zone):
 
         return False
 
-    def _load_zone(self, subzone: str, character):
-        # if we have not loaded the zone before, we need to initialize it's class and put it in the loaded_zones
-        if subzone == "Northshire Valley":
-            self.loaded_zones[subzone] = NorthshireValley(name=subzone,
-                                                          parent_zone_name=self.zone_name,
-                                                          zone_map=self.zone_map[subzone],
-                                                          character=character)
-        elif subzone == "Northshire Vineyards":
-            self.loaded_zones[subzone] = NorthshireVineyards(name=subzone,
-                                                             parent_zone_name=self.zone_name,
-                                                             zone_map=self.zone_map[subzone],
-                                                             character=character)
-        elif subzone == "A Peculiar Hut":
-            self.loaded_zones[subzone] = PeculiarHut(name=subzone,
-                                                     parent_zone_name=self.zone_name,
-                                                     zone_map=self.zone_map[subzone],
-                                                     character=character)
-
     def engage_zone_entered_script(self, character):
         subzone = character.current_subzone
 
@@ -108,8 +97,9 @@ class PeculiarHut(SubZone):
     GUID_BROTHER_PAXTON = 15
     GUID_BROTHER_HASKEL = 16
 
-    def __init__(self, name: str, parent_zone_name: str, zone_map: list, character):
-        super().__init__(name, parent_zone_name, zone_map, character)
+    def __init__(self, name: str, parent_zone_name: str, zone_map: list, character, db_session=session,
+                 to_print: bool=True):
+        super().__init__(name, parent_zone_name, zone_map, character, db_session, to_print)
 
     def load_on_zone_entry_script(self, character):
         A_PECULIAR_HUT_ENTRY_SCRIPT(self, character)
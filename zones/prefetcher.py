@@ -0,0 +1,93 @@
+"""
+This module holds the prefetcher, which loads the subzones around the player in the background,
+so that moving to a subzone does not block on the database.
+"""
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+
+import database.main
+from constants import SUBZONE_PREFETCH_DEPTH, SUBZONE_PREFETCH_WORKERS
+
+
+class SubZonePrefetcher:
+    """
+    Loads the subzones which can be reached from the player's subzone (according to the zone's zone_map)
+    on worker threads. Every load queries with its own DB session, which is created and closed on the worker thread.
+
+    The loaded subzones are kept here until the zone takes them, the zone's loaded_zones is only ever
+    modified by the main thread.
+        depth - how many moves away from the subzone its neighbours get loaded, 0 disables the prefetching
+        max_workers - the count of threads loading subzones at once
+    """
+    def __init__(self, zone: 'Zone', character, depth: int=SUBZONE_PREFETCH_DEPTH,
+                 max_workers: int=SUBZONE_PREFETCH_WORKERS):
+        self.zone = zone
+        self.character = character
+        self.depth = depth
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='SubZonePrefetcher') if depth > 0 else None
+        self._futures: {str: Future} = {}  # Key: subzone name, Value: the Future of its SubZone object
+
+    def prefetch_neighbours(self, subzone: str):
+        """ Start loading every subzone that is within self.depth moves of the given one and is not loaded yet """
+        if self._executor is None:
+            return
+
+        for neighbour in self._get_neighbours(subzone):
+            if self.zone.loaded_zones.get(neighbour) is None and neighbour not in self._futures:
+                self._futures[neighbour] = self._executor.submit(self._load_subzone, neighbour)
+
+    def is_prefetching(self, subzone: str) -> bool:
+        """ Returns a boolean indicating if the subzone is loaded or is being loaded in the background """
+        return subzone in self._futures
+
+    def take(self, subzone: str) -> 'SubZone' or None:
+        """
+        Return the prefetched SubZone object, waiting for it if it is still being loaded.
+        :return: the SubZone, or None if it was not prefetched or the prefetch failed,
+                 in which case the caller should load it by itself
+        """
+        future = self._futures.pop(subzone, None)
+        if future is None:
+            return None
+
+        try:
+            return future.result()
+        except Exception:
+            return None
+
+    def shutdown(self):
+        """ Wait for the running loads and close the worker threads """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._futures.clear()
+
+    def _get_neighbours(self, subzone: str) -> [str]:
+        """ Walk the zone map breadth-first and return the subzones that are within self.depth moves """
+        neighbours = []
+        visited = {subzone}
+        subzones_to_visit = deque([(subzone, 0)])
+
+        while subzones_to_visit:
+            current_subzone, distance = subzones_to_visit.popleft()
+            if distance == self.depth:
+                continue
+
+            for neighbour in self.zone.zone_map.get(current_subzone, []):
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    neighbours.append(neighbour)
+                    subzones_to_visit.append((neighbour, distance + 1))
+
+        return neighbours
+
+    def _load_subzone(self, subzone: str) -> 'SubZone':
+        """ Runs on a worker thread """
+        # a new session routes its queries to the engines in database.main, which might be changed at runtime (ex: tests)
+        db_session = database.main.Session()
+        try:
+            return self.zone.create_subzone(subzone, self.character, db_session=db_session, to_print=False)
+        finally:
+            # release the connection on the thread that opened it, the loaded objects stay usable
+            db_session.close()
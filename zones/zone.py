@@ -1,8 +1,11 @@
 """
 This is the base class for zones. Every zone in the game will inherit from this class.
 """
+from database.main import session
+from database.query_counter import QueryCounter
 from models.quests.loader import load_quests
-from models.creatures.loader import load_monsters, load_npcs
+from models.creatures.loader import load_subzone_creatures
+from utils.entity_index import EntityIndex
 
 
 class Zone:
@@ -11,10 +14,15 @@ class Zone:
     zone_name = "" # name of the zone
     starter_subzone = ""  # the subzone you start in
     loaded_zones = {}  # dictionary that will hold the subzone class objects
+    subzone_classes = {}  # type: dict - key: subzone name: str, value: the SubZone class of that subzone
+    prefetcher = None  # type: SubZonePrefetcher - loads the subzones around the player in the background
 
     #  the cs in cs_alive_monsters and similar names stands for Current Subzone
-    cs_alive_monsters, cs_monsters_guid_name_set = {}, set()
-    cs_alive_npcs, cs_npcs_guid_name_set = {}, set()
+    # the guid_name_sets are live views of the (GUID, name) pairs in the EntityIndex before them
+    cs_alive_monsters = EntityIndex()
+    cs_monsters_guid_name_set = cs_alive_monsters.guid_names
+    cs_alive_npcs = EntityIndex()
+    cs_npcs_guid_name_set = cs_alive_npcs.guid_names
     cs_available_quests = {}
     cs_map = []
     curr_subzone = ""
@@ -42,8 +50,29 @@ class Zone:
         # put it back in the loaded_zones dict
         self.loaded_zones[subzone] = temp_sz_object
 
-    def _load_zone(self, subzone: str, dead_monsters: set):
-        pass
+    def create_subzone(self, subzone: str, character, db_session=session, to_print: bool=True) -> 'SubZone':
+        """
+        Create the SubZone object of the given subzone, which loads everything in it from the DB
+        :param db_session: the session to load with, which is the game's session by default
+        :param to_print: A boolean indicating if we want to print the loading messages
+        """
+        return self.subzone_classes[subzone](name=subzone, parent_zone_name=self.zone_name,
+                                             zone_map=self.zone_map[subzone], character=character,
+                                             db_session=db_session, to_print=to_print)
+
+    def _load_zone(self, subzone: str, character):
+        """
+        Put the subzone's object in loaded_zones, taking it from the prefetcher if it has loaded it in the background
+        (waiting for it if it's still loading) or loading it right away otherwise
+        """
+        if subzone not in self.subzone_classes:
+            return
+
+        subzone_object = self.prefetcher.take(subzone) if self.prefetcher else None
+        if subzone_object is None:
+            subzone_object = self.create_subzone(subzone, character)
+
+        self.loaded_zones[subzone] = subzone_object
 
     def _update_attributes(self, subzone: str):
         subzone_object = self.loaded_zones[subzone]  # type: SubZone
@@ -92,14 +121,20 @@ class Zone:
 
 class SubZone:
 
-    def __init__(self, name: str, parent_zone_name: str, zone_map: list, character):
+    def __init__(self, name: str, parent_zone_name: str, zone_map: list, character, db_session=session,
+                 to_print: bool=True):
         self.name = name
         self.parent_zone_name = parent_zone_name
         self._map = zone_map  # the _map that shows us where we can go from here
 
-        self._alive_monsters, self._monster_guid_name_set = load_monsters(self.parent_zone_name, self.name, character)
-        self._alive_npcs, self._npc_guid_name_set = load_npcs(self.parent_zone_name, self.name)
-        self._quest_list = load_quests(self.parent_zone_name, self.name, character)
+        with QueryCounter(db_session.get_bind()) as query_counter:  # the engine the content is read through
+            (self._alive_monsters, self._monster_guid_name_set,
+             self._alive_npcs, self._npc_guid_name_set) = load_subzone_creatures(self.parent_zone_name, self.name,
+                                                                                  character, db_session=db_session,
+                                                                                  to_print=to_print)
+            self._quest_list = load_quests(self.parent_zone_name, self.name, character, db_session=db_session,
+                                           to_print=to_print)
+        self.load_query_count = query_counter.count  # the amount of SQL queries loading this subzone took
 
     def load_on_zone_entry_script(self, character):
         """
@@ -112,15 +147,15 @@ class SubZone:
     def get_monsters(self):
         """
         :return Tuple (1,2)
-        1 - A Dictionary holding information about the monster - Key: GUID, Value: Monster object from class Monster
-        2 - A Set holding tuples of (Monster GUID, Monster Name)"""
+        1 - An EntityIndex holding information about the monster - Key: GUID, Value: Monster object from class Monster
+        2 - A live Set holding tuples of (Monster GUID, Monster Name)"""
         return self._alive_monsters, self._monster_guid_name_set
 
     def get_npcs(self):
         """
         :return: A Tuple (1,2)
-        1 - A Dictionary holding information a bout the friendly npcs - Key: GUID, Value: object from class FriendlyNPC
-        2 - A Set holding tuples of (NPC GUID, NPC Name)
+        1 - An EntityIndex holding information about the friendly npcs - Key: GUID, Value: object from class FriendlyNPC
+        2 - A live Set holding tuples of (NPC GUID, NPC Name)
         """
         return self._alive_npcs, self._npc_guid_name_set
 